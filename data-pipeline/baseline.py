@@ -41,8 +41,10 @@ from src.db import (
 )
 from src.db.dolt_client import dolt, tables_for_phases
 from src.db.client import execute_query
+from src.llm.json_repair import parse_llm_json
 from src.llm.llm_client import LLMClient, LLMTask
 from src.llm.prompt_loader import PromptInfo, load_prompt
+from src.llm.schemas import BaselineNarrativeV2
 from src.parsers.charity_metrics_aggregator import CharityMetrics, CharityMetricsAggregator
 from src.scorers.v2_scorers import RUBRIC_VERSION, AmalScorerV2, impact_tier_from_amal_score
 from src.services.citation_service import CitationService
@@ -173,6 +175,9 @@ def _extract_narrative_text_fields(
 
 # Default AMAL lens parameters
 AMAL_RATIONALE_FIELD = "amal_score_rationale"
+# The baseline prompt's output shares only these fields with BaselineNarrativeV2;
+# they are checked while the response streams in (--llm-stream).
+BASELINE_STREAM_FIELDS = ("headline", "summary")
 AMAL_DIMENSION_KEYS = ["impact", "alignment"]
 
 
@@ -620,16 +625,21 @@ def generate_baseline_narrative(
     scores: Any,
     llm_client: LLMClient,
     ein: str,
+    citation_service: CitationService | None = None,
 ) -> tuple[dict | None, str | None, float]:
     """Generate baseline narrative using LLM with citation support.
 
+    Args:
+        citation_service: Service to build the citation registry with (defaults
+            to one reading the database directly)
+
     Returns:
         (narrative, error, cost_usd) - narrative dict on success, error message on failure, total LLM cost
     """
     total_cost = 0.0
 
     # Build citation registry from available sources
-    citation_service = CitationService()
+    citation_service = citation_service or CitationService()
     citation_registry = citation_service.build_registry(ein)
 
     # Format available sources for the prompt
@@ -644,21 +654,12 @@ def generate_baseline_narrative(
     valid_source_names = [s.source_name for s in citation_sources]  # Just names for validation
 
     def parse_llm_response(text: str) -> dict | None:
-        """Parse JSON from LLM response, handling markdown code blocks and leading text."""
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
-        text = text.strip()
-        # Handle cases where model outputs text before JSON (e.g., "thought\n{...")
-        if text and not text.startswith("{"):
-            # Find first { and parse from there
-            brace_idx = text.find("{")
-            if brace_idx != -1:
-                text = text[brace_idx:]
-        if not text:
-            raise json.JSONDecodeError("Empty after extraction", "", 0)
-        return json.loads(text)
+        """Parse JSON from LLM response, handling markdown code blocks and leading text.
+
+        A truncated narrative is not closed (it would pass as a shorter one);
+        json.JSONDecodeError makes the caller retry instead.
+        """
+        return parse_llm_json(text, start_chars="{", close_truncated=False)
 
     def ensure_citation_fields(narrative: dict) -> None:
         """Ensure all_citations exists and has required fields."""
@@ -682,6 +683,8 @@ def generate_baseline_narrative(
                 max_tokens=1500,
                 temperature=0.3,
                 prompt_version=prompt_info.version,
+                stream_schema=BaselineNarrativeV2,
+                stream_fields=BASELINE_STREAM_FIELDS,
             )
             total_cost += response.cost_usd
             if not response.text or not response.text.strip():
@@ -733,6 +736,8 @@ Generate the corrected narrative JSON:"""
             max_tokens=1500,
             temperature=0.3,
             prompt_version=prompt_info.version,
+            stream_schema=BaselineNarrativeV2,
+            stream_fields=BASELINE_STREAM_FIELDS,
         )
         total_cost += response.cost_usd
         narrative = parse_llm_response(response.text)
@@ -1163,7 +1168,13 @@ def evaluate_charity(
     # =========================================================================
     total_cost = 0.0
 
-    narrative, narrative_error, narrative_cost = generate_baseline_narrative(metrics, scores, llm_client, ein)
+    narrative, narrative_error, narrative_cost = generate_baseline_narrative(
+        metrics,
+        scores,
+        llm_client,
+        ein,
+        citation_service=CitationService(raw_repo=raw_repo, charity_repo=charity_repo),
+    )
     total_cost += narrative_cost
 
     if narrative is None:
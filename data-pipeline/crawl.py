@@ -161,6 +161,11 @@ def main():
         "--phase", type=str, default="P1:Collect", help="Pipeline phase identifier for logging (default: P1:Collect)"
     )
     parser.add_argument("--force", action="store_true", help="Force re-crawl even if cache is valid")
+    parser.add_argument(
+        "--concurrent-sources",
+        action="store_true",
+        help="Fetch each charity's sources (and website crawl) in parallel instead of one at a time",
+    )
 
     args = parser.parse_args()
 
@@ -196,6 +201,7 @@ def main():
         max_pdf_downloads=args.pdf_downloads,
         skip_sources=args.skip or [],
         include_sources=args.sources or [],
+        concurrent_sources=args.concurrent_sources,
     )
 
     # Load charities from file if not in single EIN mode
@@ -235,6 +241,8 @@ def main():
     print(f"DATA COLLECTION: {len(charities)} CHARITIES")
     print(f"  Sources: {sources_str}{skipped_str}")
     print(f"  Parallel workers: {args.workers}")
+    if args.concurrent_sources:
+        print("  Source fetch: concurrent (per charity)")
     print(f"  Database: DoltDB ({os.getenv('DOLT_HOST', '127.0.0.1')}:{os.getenv('DOLT_PORT', '3306')})")
     print("=" * 80)
 
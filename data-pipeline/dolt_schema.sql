@@ -262,6 +262,37 @@ CREATE TABLE `raw_scraped_data` (
   CONSTRAINT `fk_raw_charity` FOREIGN KEY (`charity_ein`) REFERENCES `charities` (`ein`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin;
 
+-- work_queue: defined in DoltWorkQueue.ensure_tables (src/db/work_queue.py) — operational lease state for distributed streaming runs (--queue), created lazily and never staged by dolt.commit
+CREATE TABLE `work_queue` (
+  `run_id` varchar(64) NOT NULL,
+  `charity_ein` varchar(12) NOT NULL,
+  `position` int NOT NULL,
+  `payload` json NOT NULL,
+  `state` varchar(10) NOT NULL DEFAULT 'pending',
+  `worker_id` varchar(128),
+  `lease_token` char(36),
+  `lease_expires_at` timestamp NULL,
+  `attempts` int NOT NULL DEFAULT '0',
+  `heartbeats` int NOT NULL DEFAULT '0',
+  `last_phase` varchar(20),
+  `phase_writes` int NOT NULL DEFAULT '0',
+  `success` tinyint(1),
+  `error` text,
+  `updated_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`run_id`,`charity_ein`),
+  KEY `idx_work_queue_claim` (`run_id`,`state`,`position`),
+  UNIQUE KEY `uq_work_queue_token` (`lease_token`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin;
+
+-- work_queue_runs: defined in DoltWorkQueue.ensure_tables (src/db/work_queue.py) — one row per distributed run, records which runner finalized it
+CREATE TABLE `work_queue_runs` (
+  `run_id` varchar(64) NOT NULL,
+  `created_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `finalized_by` varchar(128),
+  `finalized_at` timestamp NULL,
+  PRIMARY KEY (`run_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin;
+
 CREATE VIEW `charity_list` AS SELECT
   c.ein,
   c.name,
@@ -9,14 +9,18 @@ Usage:
     uv run python export.py --ein 95-4453134
     uv run python export.py --charities pilot_charities.txt
     uv run python export.py  # All charities with evaluations
+    uv run python export.py --bulk --prune  # Full rebuild: bulk reads, parallel build
+    uv run python export.py --incremental   # Only rebuild/rewrite changed charities
 """
 
 import argparse
 import hashlib
 import json
+import os
 import re
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -34,6 +38,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Sibling root module (data-pipeline is sys.path-bootstrapped above). No cycle:
 # judge_phase never imports export.
 from judge_phase import compute_judge_content_hash
+from src.config import get_data_dir
 from src.db import (
     CharityDataRepository,
     CharityRepository,
@@ -48,6 +53,7 @@ from src.judges.schemas.verdict import Severity
 from src.llm.prompt_loader import load_prompt
 from src.utils.cause_area import derive_cause_area
 from src.utils.display_name import to_display_name
+from src.utils.phase_fingerprint import compute_code_fingerprint
 
 # Output directory
 WEBSITE_DATA_DIR = Path(__file__).parent.parent / "website" / "data"
@@ -121,15 +127,59 @@ def _display_name_for(charity: dict) -> str:
     return _apply_curation_override(ein, "name", to_display_name(raw), _CURATION_OVERRIDES["names"])
 
 
-def _mirror_export_to_public_data(output_dir: Path) -> None:
-    """Mirror website/data exports to website/public/data for the frontend runtime."""
+def _mirror_export_to_public_data(output_dir: Path, incremental: bool = False) -> None:
+    """Mirror website/data exports to website/public/data for the frontend runtime.
+
+    incremental=True copies only files whose size/mtime differ and removes
+    files gone from output_dir, instead of replacing the whole tree.
+    """
     if output_dir.resolve() != WEBSITE_DATA_DIR.resolve():
         return
+    if incremental and WEBSITE_PUBLIC_DATA_DIR.exists():
+        _sync_tree(output_dir, WEBSITE_PUBLIC_DATA_DIR)
+        return
     if WEBSITE_PUBLIC_DATA_DIR.exists():
         shutil.rmtree(WEBSITE_PUBLIC_DATA_DIR)
     shutil.copytree(output_dir, WEBSITE_PUBLIC_DATA_DIR)
 
 
+def _sync_tree(src: Path, dst: Path) -> tuple[int, int]:
+    """rsync-style one-way sync keyed on size + mtime. Returns (copied, removed)."""
+    copied = removed = 0
+    src_files = {p.relative_to(src) for p in src.rglob("*") if p.is_file()}
+    for rel in sorted(src_files):
+        source, target = src / rel, dst / rel
+        src_stat = source.stat()
+        if target.exists():
+            dst_stat = target.stat()
+            if dst_stat.st_size == src_stat.st_size and int(dst_stat.st_mtime) == int(src_stat.st_mtime):
+                continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+        copied += 1
+    for target in dst.rglob("*"):
+        if target.is_file() and target.relative_to(dst) not in src_files:
+            target.unlink()
+            removed += 1
+    return copied, removed
+
+
+def _atomic_write_text(path: Path, text: str) -> bool:
+    """Write via temp file + rename; leave the file untouched if content is identical.
+
+    Returns:
+        True if the file was (re)written
+    """
+    if path.exists() and path.read_text() == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return True
+
+
 def prune_charity_detail_files(output_dir: Path, keep_eins: set[str]) -> int:
     """Remove stale per-charity detail files not present in the current export set."""
     charities_dir = output_dir / "charities"
@@ -1874,48 +1924,41 @@ def build_charity_detail(
     return detail
 
 
-def export_charity(
+def _raw_sources_from_rows(raw_data: list[dict]) -> dict[str, dict]:
+    """Map source -> parsed_json for successful raw rows."""
+    raw_sources: dict[str, dict] = {}
+    for rd in raw_data:
+        if rd.get("success") and rd.get("parsed_json"):
+            raw_sources[rd["source"]] = rd["parsed_json"]
+    return raw_sources
+
+
+def build_export_payload(
     ein: str,
-    charity_repo: CharityRepository,
-    raw_repo: RawDataRepository,
-    data_repo: CharityDataRepository,
-    eval_repo: EvaluationRepository,
-    output_dir: Path,
+    charity: dict,
+    charity_data: dict | None,
+    evaluation: dict | None,
+    raw_sources: dict[str, dict],
     ui_signals_config: dict[str, Any],
     config_hash: str,
     hide_from_curated: bool = False,
     pilot_name: str | None = None,
 ) -> dict[str, Any]:
-    """Export a single charity to JSON files."""
-    result = {"ein": ein, "success": False}
+    """Build summary and detail payloads for one charity from preloaded rows.
 
-    # Get charity
-    charity = charity_repo.get(ein)
-    if not charity:
-        result["error"] = "Charity not found"
-        return result
+    Pure (no DB or filesystem access) so bulk export can run it in worker
+    processes. On success the result carries "summary" and "detail".
+    """
+    result = {"ein": ein, "success": False}
 
     # Fix missing name: if name is absent or equals the EIN, use pilot_charities.txt name
     current_name = charity.get("name")
     if (not current_name or current_name == ein or current_name == ein.replace("-", "")) and pilot_name:
         charity["name"] = pilot_name
 
-    # Get synthesized data
-    charity_data = data_repo.get(ein)
-
-    # Get evaluation
-    evaluation = eval_repo.get(ein)
-
     # Build deterministic qualitative UI signals from scored fields
     ui_signals_v1 = _derive_ui_signals_v1(charity, charity_data, evaluation, ui_signals_config, config_hash)
 
-    # Get raw sources for detail view
-    raw_data = raw_repo.get_for_charity(ein)
-    raw_sources: dict[str, dict] = {}
-    for rd in raw_data:
-        if rd.get("success") and rd.get("parsed_json"):
-            raw_sources[rd["source"]] = rd["parsed_json"]
-
     # Build summary
     summary = build_charity_summary(
         charity,
@@ -1945,22 +1988,184 @@ def export_charity(
         ui_signals_v1=ui_signals_v1,
     )
 
-    # Write individual charity file
-    charities_dir = output_dir / "charities"
-    charities_dir.mkdir(parents=True, exist_ok=True)
-
-    charity_file = charities_dir / f"charity-{ein}.json"
-    with open(charity_file, "w") as f:
-        json.dump(detail, f, indent=2, default=str)
-
     result["summary"] = summary
     result["quality_issues"] = quality_issues
-    result["detail_file"] = str(charity_file)
+    result["detail"] = detail
     result["tier"] = summary["tier"]
     result["success"] = True
     return result
 
 
+def _write_detail_file(output_dir: Path, ein: str, detail: dict | str) -> Path:
+    """Atomically write charities/charity-{ein}.json (detail dict, or its pre-serialized JSON)."""
+    charity_file = output_dir / "charities" / f"charity-{ein}.json"
+    text = detail if isinstance(detail, str) else json.dumps(detail, indent=2, default=str)
+    _atomic_write_text(charity_file, text)
+    return charity_file
+
+
+def compute_export_input_hash(
+    charity: dict,
+    charity_data: dict | None,
+    evaluation: dict | None,
+    raw_sources: dict[str, dict],
+    config_hash: str,
+    hide_from_curated: bool = False,
+    pilot_name: str | None = None,
+    *,
+    code_fingerprint: str,
+) -> str:
+    """Hash every input that determines a charity's summary and detail payloads.
+
+    code_fingerprint is the export phase's code fingerprint, computed once per
+    run (ExportManifest.code_fingerprint): editing any export code invalidates
+    the manifest.
+    """
+    ein = charity.get("ein")
+    payload = json.dumps(
+        {
+            "charity": charity,
+            "charity_data": charity_data,
+            "evaluation": evaluation,
+            "raw_sources": raw_sources,
+            "config_hash": config_hash,
+            "hide_from_curated": hide_from_curated,
+            "pilot_name": pilot_name,
+            "overrides": {k: v.get(ein) if isinstance(v, dict) else ein in v for k, v in _CURATION_OVERRIDES.items()},
+            "code": code_fingerprint,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return f"sha256:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class ExportManifest:
+    """Per-output-dir record of what each charity detail file was built from.
+
+    Each entry stores the input hash, the sha256 of the written detail file,
+    and the summary/tier/quality issues, so an unchanged charity can be
+    skipped entirely and still appear in charities.json. Lives under the
+    data dir (not in website/data) so it is never mirrored or committed.
+    """
+
+    def __init__(self, output_dir: Path, path: Path | None = None):
+        self.output_dir = output_dir
+        if path is None:
+            key = hashlib.sha256(str(output_dir.resolve()).encode()).hexdigest()[:16]
+            path = get_data_dir() / "export_manifests" / f"{key}.json"
+        self.path = path
+        self.code_fingerprint = compute_code_fingerprint("export", Path(__file__).parent)
+        self.entries: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text()).get("entries", {})
+            except (json.JSONDecodeError, OSError):
+                self.entries = {}
+
+    def lookup(self, ein: str, input_hash: str) -> dict[str, Any] | None:
+        """Cached export result if inputs match and the detail file is intact on disk."""
+        entry = self.entries.get(ein)
+        if not entry or entry.get("input_hash") != input_hash:
+            return None
+        detail_file = self.output_dir / "charities" / f"charity-{ein}.json"
+        if not detail_file.exists():
+            return None
+        if hashlib.sha256(detail_file.read_bytes()).hexdigest() != entry.get("output_sha256"):
+            return None
+        return {
+            "ein": ein,
+            "success": True,
+            "summary": entry["summary"],
+            "quality_issues": entry.get("quality_issues", []),
+            "tier": entry["tier"],
+            "detail_file": str(detail_file),
+            "unchanged": True,
+        }
+
+    def record(self, result: dict[str, Any], input_hash: str) -> None:
+        """Remember a successful export result."""
+        detail_file = Path(result["detail_file"])
+        self.entries[result["ein"]] = {
+            "input_hash": input_hash,
+            "output_sha256": hashlib.sha256(detail_file.read_bytes()).hexdigest(),
+            # Round-trip through JSON now so cached summaries serialize exactly as fresh ones
+            "summary": json.loads(json.dumps(result["summary"], default=str)),
+            "quality_issues": result.get("quality_issues", []),
+            "tier": result["tier"],
+        }
+
+    def forget(self, eins: set[str]) -> None:
+        for ein in eins:
+            self.entries.pop(ein, None)
+
+    def save(self) -> None:
+        _atomic_write_text(self.path, json.dumps({"entries": self.entries}, sort_keys=True))
+
+
+def export_charity(
+    ein: str,
+    charity_repo: CharityRepository,
+    raw_repo: RawDataRepository,
+    data_repo: CharityDataRepository,
+    eval_repo: EvaluationRepository,
+    output_dir: Path,
+    ui_signals_config: dict[str, Any],
+    config_hash: str,
+    hide_from_curated: bool = False,
+    pilot_name: str | None = None,
+    manifest: ExportManifest | None = None,
+) -> dict[str, Any]:
+    """Export a single charity to JSON files.
+
+    With a manifest (incremental export), a charity whose inputs and detail
+    file are unchanged since the last run is neither rebuilt nor rewritten.
+    """
+    # Get charity
+    charity = charity_repo.get(ein)
+    if not charity:
+        return {"ein": ein, "success": False, "error": "Charity not found"}
+
+    # Get synthesized data, evaluation, and raw sources for detail view
+    charity_data = data_repo.get(ein)
+    evaluation = eval_repo.get(ein)
+    raw_sources = _raw_sources_from_rows(raw_repo.get_for_charity(ein, columns=("success", "parsed_json")))
+
+    input_hash = None
+    if manifest is not None:
+        input_hash = compute_export_input_hash(
+            charity,
+            charity_data,
+            evaluation,
+            raw_sources,
+            config_hash,
+            hide_from_curated,
+            pilot_name,
+            code_fingerprint=manifest.code_fingerprint,
+        )
+        cached = manifest.lookup(ein, input_hash)
+        if cached:
+            return cached
+
+    result = build_export_payload(
+        ein,
+        charity,
+        charity_data,
+        evaluation,
+        raw_sources,
+        ui_signals_config,
+        config_hash,
+        hide_from_curated=hide_from_curated,
+        pilot_name=pilot_name,
+    )
+    if result["success"]:
+        # Write individual charity file
+        result["detail_file"] = str(_write_detail_file(output_dir, ein, result.pop("detail")))
+        if manifest is not None:
+            manifest.record(result, input_hash)
+    return result
+
+
 @dataclass
 class PilotCharityFlags:
     """Flags parsed from pilot_charities.txt for a charity."""
@@ -1969,6 +2174,99 @@ class PilotCharityFlags:
     name: str | None = None  # Name from pilot_charities.txt for fallback
 
 
+def _build_export_payload_task(task: tuple) -> dict[str, Any]:
+    """Process-pool entry point: build payloads and pre-serialize the detail JSON."""
+    result = build_export_payload(*task)
+    if result["success"]:
+        result["detail"] = json.dumps(result["detail"], indent=2, default=str)
+    return result
+
+
+def export_charities_bulk(
+    eins: list[str],
+    pilot_flags: dict[str, "PilotCharityFlags"],
+    charity_repo: CharityRepository,
+    raw_repo: RawDataRepository,
+    data_repo: CharityDataRepository,
+    eval_repo: EvaluationRepository,
+    output_dir: Path,
+    ui_signals_config: dict[str, Any],
+    config_hash: str,
+    workers: int | None = None,
+    manifest: ExportManifest | None = None,
+) -> list[dict[str, Any]]:
+    """Export many charities: chunked bulk reads, pooled builds, concurrent writes.
+
+    Loads the four tables with a few `IN (...)` queries instead of four
+    queries per EIN, builds payloads in a process pool, and writes detail
+    files from a thread pool. Results come back in `eins` order and match
+    what export_charity() returns per EIN, so charities.json is unchanged.
+    With a manifest, unchanged charities are skipped as in export_charity().
+    """
+    charities = charity_repo.get_many(eins)
+    charity_data = data_repo.get_many(eins)
+    evaluations = eval_repo.get_many(eins)
+    raw_rows = raw_repo.get_for_charities(eins, columns=("success", "parsed_json"))
+
+    results: dict[str, dict[str, Any]] = {}
+    input_hashes: dict[str, str] = {}
+    tasks = []
+    for ein in eins:
+        charity = charities.get(ein)
+        if not charity:
+            results[ein] = {"ein": ein, "success": False, "error": "Charity not found"}
+            continue
+        flags = pilot_flags.get(ein, PilotCharityFlags())
+        raw_sources = _raw_sources_from_rows(raw_rows.get(ein, []))
+        if manifest is not None:
+            input_hashes[ein] = compute_export_input_hash(
+                charity,
+                charity_data.get(ein),
+                evaluations.get(ein),
+                raw_sources,
+                config_hash,
+                flags.hide_from_curated,
+                flags.name,
+                code_fingerprint=manifest.code_fingerprint,
+            )
+            cached = manifest.lookup(ein, input_hashes[ein])
+            if cached:
+                results[ein] = cached
+                continue
+        tasks.append(
+            (
+                ein,
+                dict(charity),
+                charity_data.get(ein),
+                evaluations.get(ein),
+                raw_sources,
+                ui_signals_config,
+                config_hash,
+                flags.hide_from_curated,
+                flags.name,
+            )
+        )
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            built = list(pool.map(_build_export_payload_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        built = [_build_export_payload_task(task) for task in tasks]
+
+    def write(result: dict[str, Any]) -> None:
+        result["detail_file"] = str(_write_detail_file(output_dir, result["ein"], result.pop("detail")))
+
+    with ThreadPoolExecutor(max_workers=min(32, max(1, workers * 2))) as io_pool:
+        list(io_pool.map(write, [r for r in built if r["success"]]))
+
+    for result in built:
+        results[result["ein"]] = result
+        if manifest is not None and result["success"]:
+            manifest.record(result, input_hashes[result["ein"]])
+    return [results[ein] for ein in eins]
+
+
 # =============================================================================
 # PROMPT EXPORT
 # =============================================================================
@@ -2276,6 +2574,22 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Escape hatch: publish regardless of judge errors / content-hash freshness",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Bulk-load all tables up front and build/write charities in parallel (full rebuilds)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip charities whose inputs are unchanged since the last export; mirror only changed files",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --bulk (default: CPU count)",
+    )
     return parser
 
 
@@ -2447,10 +2761,14 @@ def main():
     tier_counts = {"baseline": 0, "rich": 0, "hidden": 0}
     failed_charities: list[tuple[str, str]] = []
 
-    for i, ein in enumerate(eins, 1):
-        flags = pilot_flags.get(ein, PilotCharityFlags())
-        result = export_charity(
-            ein,
+    # Incremental mode: skip charities whose inputs haven't changed since the last run
+    manifest = ExportManifest(output_dir) if args.incremental else None
+    unchanged_count = 0
+
+    if args.bulk:
+        results = export_charities_bulk(
+            eins,
+            pilot_flags,
             charity_repo,
             raw_repo,
             data_repo,
@@ -2458,10 +2776,31 @@ def main():
             output_dir,
             ui_signals_config=ui_signals_config,
             config_hash=config_hash,
-            hide_from_curated=flags.hide_from_curated,
-            pilot_name=flags.name,
+            workers=args.workers,
+            manifest=manifest,
         )
+    else:
+
+        def export_one(ein: str) -> dict[str, Any]:
+            flags = pilot_flags.get(ein, PilotCharityFlags())
+            return export_charity(
+                ein,
+                charity_repo,
+                raw_repo,
+                data_repo,
+                eval_repo,
+                output_dir,
+                ui_signals_config=ui_signals_config,
+                config_hash=config_hash,
+                hide_from_curated=flags.hide_from_curated,
+                pilot_name=flags.name,
+                manifest=manifest,
+            )
+
+        # Lazy so progress prints as each charity finishes
+        results = map(export_one, eins)
 
+    for i, (ein, result) in enumerate(zip(eins, results), 1):
         if result["success"]:
             summary = result["summary"]
             quality_passed, quality_issues = run_export_quality_check(summary)
@@ -2477,7 +2816,11 @@ def main():
             success_count += 1
             tier = result["tier"]
             tier_counts[tier] = tier_counts.get(tier, 0) + 1
-            print(f"[{i}/{len(eins)}] ✓ {ein} ({tier})")
+            if result.get("unchanged"):
+                unchanged_count += 1
+                print(f"[{i}/{len(eins)}] = {ein} ({tier}, unchanged)")
+            else:
+                print(f"[{i}/{len(eins)}] ✓ {ein} ({tier})")
         else:
             error = result.get("error", "Unknown")
             failed_charities.append((ein, error))
@@ -2489,19 +2832,21 @@ def main():
 
     # Write charities.json summary file
     charities_file = output_dir / "charities.json"
-    with open(charities_file, "w") as f:
-        json.dump(
-            {"source_commit": source_commit, "charities": summaries},
-            f,
-            indent=2,
-            default=str,
-        )
+    _atomic_write_text(
+        charities_file,
+        json.dumps({"source_commit": source_commit, "charities": summaries}, indent=2, default=str),
+    )
 
     if args.prune:
         kept_eins = {summary.get("ein") for summary in summaries if summary.get("ein")}
         removed_details = prune_charity_detail_files(output_dir, kept_eins)
         if removed_details:
             print(f"  Pruned {removed_details} stale charity detail files")
+        if manifest is not None:
+            manifest.forget(set(manifest.entries) - kept_eins)
+
+    if manifest is not None:
+        manifest.save()
 
     # Write calibration report
     calibration_report = _build_calibration_report(
@@ -2511,8 +2856,7 @@ def main():
         source_commit=source_commit,
     )
     calibration_file = output_dir / "calibration-report.json"
-    with open(calibration_file, "w") as f:
-        json.dump(calibration_report, f, indent=2, default=str)
+    _atomic_write_text(calibration_file, json.dumps(calibration_report, indent=2, default=str))
 
     # Editorial queue: warnings never gate publication — they surface here for
     # human review (internal artifact under data-pipeline/reports/, gitignored).
@@ -2522,7 +2866,7 @@ def main():
     print("\n  Exporting prompts...")
     prompts_result = export_prompts(output_dir)
     print(f"    Exported {prompts_result['exported']} prompts to {prompts_result['output_dir']}")
-    _mirror_export_to_public_data(output_dir)
+    _mirror_export_to_public_data(output_dir, incremental=args.incremental)
     if output_dir.resolve() == WEBSITE_DATA_DIR.resolve():
         print(f"  Synced website runtime data to {WEBSITE_PUBLIC_DATA_DIR}")
     if calibration_report.get("warnings"):
@@ -2535,6 +2879,8 @@ def main():
     print("EXPORT COMPLETE")
     print(f"{'=' * 60}")
     print(f"  Charities: {success_count}/{len(eins)}")
+    if manifest is not None:
+        print(f"  Unchanged (skipped): {unchanged_count}")
     print(f"  Tiers: baseline={tier_counts['baseline']}, rich={tier_counts['rich']}, hidden={tier_counts['hidden']}")
     print(f"  Prompts: {prompts_result['exported']} exported")
     if failed_charities:
@@ -238,10 +238,10 @@ def main():
     repo = RawDataRepository()
     if args.force:
         # Get all rows (including already parsed)
-        rows = repo.get_all(eins=eins)
+        rows = repo.get_all(eins=eins, include_raw_content=True)
     else:
         # Get only unparsed rows
-        rows = repo.get_unparsed(eins=eins)
+        rows = repo.get_unparsed(eins=eins, include_raw_content=True)
 
     # Filter by source if specified
     if args.source:
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Recompress raw_scraped_data.raw_content with the raw_content codec.
+
+Rewrites every stored raw_content in the target encoding (--codec, default
+RAW_CONTENT_COMPRESSION) and commits the table to Dolt. Rows already in the
+target encoding are skipped, so an interrupted run can simply be repeated.
+--codec none decompresses everything back to plain text.
+
+--stats only prints stored vs decoded size per source; it reads (and
+decodes) the whole column but writes nothing.
+
+Usage:
+  uv run python migrations/compress_raw_content.py --stats
+  RAW_CONTENT_COMPRESSION=zstd uv run python migrations/compress_raw_content.py
+  uv run python migrations/compress_raw_content.py --codec gzip
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.dolt_client import dolt
+from src.db.raw_codec import CODECS, configured_codec
+from src.db.repository import RawDataRepository
+
+
+def print_stats(repo: RawDataRepository) -> None:
+    stats = repo.get_compression_stats()
+    print(f"{'source':<24} {'rows':>7} {'compressed':>10} {'stored MB':>10} {'original MB':>12} {'ratio':>6}")
+    for source, s in sorted(stats.items()):
+        print(
+            f"{source:<24} {s['rows']:>7} {s['compressed_rows']:>10} "
+            f"{s['stored_bytes'] / 1e6:>10.1f} {s['original_bytes'] / 1e6:>12.1f} {s['ratio']:>5.2f}x"
+        )
+    stored = sum(s["stored_bytes"] for s in stats.values())
+    original = sum(s["original_bytes"] for s in stats.values())
+    if stored:
+        print(f"{'total':<24} {'':>7} {'':>10} {stored / 1e6:>10.1f} {original / 1e6:>12.1f} {original / stored:>5.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stats", action="store_true", help="Print per-source compression stats and exit")
+    parser.add_argument("--codec", choices=(*CODECS, "none"), help="Target codec (default: RAW_CONTENT_COMPRESSION)")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    repo = RawDataRepository()
+    if args.stats:
+        print_stats(repo)
+        return 0
+
+    codec = configured_codec() if args.codec is None else (None if args.codec == "none" else args.codec)
+    if args.codec is None and codec is None:
+        print("RAW_CONTENT_COMPRESSION is not set; pass --codec (or --codec none to decompress)")
+        return 1
+
+    result = repo.recompress_raw_content(codec, batch_size=args.batch_size)
+    print(f"Scanned {result['scanned']} rows, rewrote {result['rewritten']} ({codec or 'plain text'})")
+    if result["rewritten"]:
+        dolt.commit(
+            f"Migration: re-encode raw_scraped_data.raw_content ({codec or 'plain text'})",
+            tables=("raw_scraped_data",),
+        )
+    print_stats(repo)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
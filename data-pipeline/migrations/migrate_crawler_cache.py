@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Move the crawler cache from one html/{md5}.json file per URL into SQLite.
+
+Reads every legacy JSON entry under <cache-dir>/html, writes it to
+<cache-dir>/pages.sqlite3 in batched transactions, and removes each file
+once its batch is committed (pass --keep to leave them). Unreadable files
+are counted and left in place. Safe to re-run; entries not yet migrated
+are also imported lazily the first time the crawler reads them.
+
+Usage: uv run python migrations/migrate_crawler_cache.py [--cache-dir PATH] [--keep]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.crawler_cache import CrawlerCache
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "shared" / "crawler_cache"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--keep", action="store_true", help="Keep legacy JSON files after import")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    cache = CrawlerCache(cache_dir=args.cache_dir, backend="sqlite")
+    try:
+        result = cache.migrate_legacy_files(delete=not args.keep, batch_size=args.batch_size)
+        stats = cache.get_cache_stats()
+    finally:
+        cache.close()
+
+    print(f"Migrated {result['migrated']} entries ({result['failed']} unreadable left in place)")
+    print(f"SQLite cache now holds {stats['cached_pages']} pages, {stats['total_cache_size_mb']:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -34,13 +34,24 @@ TABLE_ANNOTATIONS = {
         "exist in the live DB yet; DDL below is hardcoded from that canonical "
         "source and is superseded by the live SHOW CREATE TABLE once it exists"
     ),
+    "work_queue": (
+        "-- work_queue: defined in DoltWorkQueue.ensure_tables (src/db/work_queue.py) — "
+        "operational lease state for distributed streaming runs (--queue), created lazily "
+        "and never staged by dolt.commit"
+    ),
+    "work_queue_runs": (
+        "-- work_queue_runs: defined in DoltWorkQueue.ensure_tables (src/db/work_queue.py) — "
+        "one row per distributed run, records which runner finalized it"
+    ),
 }
 
 # export_exclusions is created lazily (ExportExclusionRepository.ensure_table,
 # src/db/repository.py) on the first write, so it may not exist in the live DB
-# yet. Hardcode its canonical DDL here so a fresh bootstrap always includes it;
-# once the table exists live, generate_schema_sql() prefers the live
-# SHOW CREATE TABLE output over this fallback.
+# yet (likewise work_queue / work_queue_runs, DoltWorkQueue.ensure_tables in
+# src/db/work_queue.py). Hardcode their canonical DDL here so a fresh
+# bootstrap always includes them; once a table exists live,
+# generate_schema_sql() prefers the live SHOW CREATE TABLE output over this
+# fallback.
 FALLBACK_DDL = {
     "export_exclusions": """CREATE TABLE `export_exclusions` (
   `charity_ein` varchar(12) NOT NULL,
@@ -48,6 +59,33 @@ FALLBACK_DDL = {
   `reason` text,
   `excluded_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (`charity_ein`,`excluded_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin""",
+    "work_queue": """CREATE TABLE `work_queue` (
+  `run_id` varchar(64) NOT NULL,
+  `charity_ein` varchar(12) NOT NULL,
+  `position` int NOT NULL,
+  `payload` json NOT NULL,
+  `state` varchar(10) NOT NULL DEFAULT 'pending',
+  `worker_id` varchar(128),
+  `lease_token` char(36),
+  `lease_expires_at` timestamp NULL,
+  `attempts` int NOT NULL DEFAULT '0',
+  `heartbeats` int NOT NULL DEFAULT '0',
+  `last_phase` varchar(20),
+  `phase_writes` int NOT NULL DEFAULT '0',
+  `success` tinyint(1),
+  `error` text,
+  `updated_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`run_id`,`charity_ein`),
+  KEY `idx_work_queue_claim` (`run_id`,`state`,`position`),
+  UNIQUE KEY `uq_work_queue_token` (`lease_token`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin""",
+    "work_queue_runs": """CREATE TABLE `work_queue_runs` (
+  `run_id` varchar(64) NOT NULL,
+  `created_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  `finalized_by` varchar(128),
+  `finalized_at` timestamp NULL,
+  PRIMARY KEY (`run_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin""",
 }
 
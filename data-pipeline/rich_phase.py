@@ -19,7 +19,13 @@ from typing import Any
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.db import EvaluationRepository, PhaseCacheRepository
+from src.db import (
+    CharityDataRepository,
+    CharityRepository,
+    EvaluationRepository,
+    PhaseCacheRepository,
+    RawDataRepository,
+)
 from src.judges.base_judge import JudgeConfig
 from src.judges.rich_quality_judge import RichQualityJudge
 from src.judges.schemas.verdict import Severity
@@ -31,6 +37,9 @@ def generate_rich_for_pipeline(
     ein: str,
     eval_repo: EvaluationRepository,
     force: bool = False,
+    data_repo: CharityDataRepository | None = None,
+    raw_repo: RawDataRepository | None = None,
+    charity_repo: CharityRepository | None = None,
 ) -> dict[str, Any]:
     """Generate rich narrative for streaming pipeline.
 
@@ -38,8 +47,10 @@ def generate_rich_for_pipeline(
 
     Args:
         ein: Charity EIN
-        eval_repo: Evaluation repository (for re-entrancy check)
+        eval_repo: Evaluation repository (re-entrancy check, and the generator's reads/writes)
         force: If True, regenerate even if rich narrative exists
+        data_repo, raw_repo, charity_repo: Repositories for the generator to read
+            through (e.g. CharityWorkingSet views); fresh ones if None
 
     Returns:
         {
@@ -61,7 +72,12 @@ def generate_rich_for_pipeline(
             return result
 
     try:
-        generator = RichNarrativeGenerator()
+        generator = RichNarrativeGenerator(
+            eval_repo=eval_repo,
+            charity_data_repo=data_repo,
+            raw_data_repo=raw_repo,
+            charity_repo=charity_repo,
+        )
 
         rich_narrative = generator.generate(ein, force=force)
 
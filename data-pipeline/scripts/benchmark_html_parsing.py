@@ -0,0 +1,115 @@
+"""
+Benchmark HTML parse time per collector: html.parser vs lxml, and the shared DOM cache.
+
+Corpus: the collector fixtures under tests/fixtures ({source}_*.html), the
+website pages stored in the crawler cache, and optionally --html-dir
+(one subdirectory per collector, e.g. html/bbb/*.html).
+
+For every collector it reports the time to build one BeautifulSoup tree per
+page with each builder. For website pages it also compares the old per-page
+work (three html.parser trees for the crawl loop, _extract_page_data and PDF
+discovery, plus extruct's own lxml parse) with the shared path (one lxml
+BeautifulSoup tree and one lxml tree from DomCache).
+
+Usage:
+    uv run python scripts/benchmark_html_parsing.py [--cache PATH] [--html-dir DIR] [--repeat 3]
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.constants import WEBSITE_DOM_CACHE_MAX_PAGES
+from src.utils.html_parser import HAS_LXML, DomCache, make_lxml_tree
+
+ROOT = Path(__file__).parent.parent
+FIXTURES_DIR = ROOT / "tests" / "fixtures"
+DEFAULT_CACHE = ROOT.parent / "shared" / "crawler_cache" / "pages.sqlite3"
+COLLECTORS = ("charity_navigator", "candid", "bbb", "causeiq", "form990_grants", "website")
+
+
+def load_corpus(cache_path: Path, html_dir: Path | None) -> dict[str, list[str]]:
+    corpus: dict[str, list[str]] = defaultdict(list)
+    for path in sorted(FIXTURES_DIR.glob("*.html")):
+        source = next((c for c in COLLECTORS if path.name.startswith(c + "_")), None)
+        if source:
+            corpus[source].append(path.read_text(errors="ignore"))
+    if cache_path.exists():
+        conn = sqlite3.connect(str(cache_path))
+        for (blob,) in conn.execute("SELECT html FROM pages"):
+            html = zlib.decompress(blob).decode("utf-8", errors="ignore")
+            if html.strip():
+                corpus["website"].append(html)
+        conn.close()
+    if html_dir:
+        for path in sorted(html_dir.glob("*/*.html")):
+            corpus[path.parent.name].append(path.read_text(errors="ignore"))
+    return corpus
+
+
+def timed(fn, pages: list[str], repeat: int) -> float:
+    """Best-of-repeat milliseconds for running fn over every page."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def old_website_path(html: str) -> None:
+    for _ in range(3):
+        BeautifulSoup(html, "html.parser")
+    make_lxml_tree(html)
+
+
+def shared_website_path(html: str) -> None:
+    page = DomCache(WEBSITE_DOM_CACHE_MAX_PAGES).get(html)
+    page.soup
+    page.tree
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing per collector")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="Crawler cache database")
+    parser.add_argument("--html-dir", type=Path, help="Extra pages, one subdirectory per collector")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not HAS_LXML:
+        print("lxml is not installed; nothing to compare")
+        return 1
+    corpus = load_corpus(args.cache, args.html_dir)
+    if not corpus:
+        print("No HTML found")
+        return 1
+
+    print(f"{'collector':<20} {'pages':>6} {'KB':>8} {'html.parser ms':>15} {'lxml ms':>9} {'speedup':>8}")
+    for source, pages in sorted(corpus.items()):
+        kb = sum(len(p) for p in pages) / 1024
+        slow = timed(lambda h: BeautifulSoup(h, "html.parser"), pages, args.repeat)
+        fast = timed(lambda h: BeautifulSoup(h, "lxml"), pages, args.repeat)
+        print(f"{source:<20} {len(pages):>6} {kb:>8.0f} {slow:>15.1f} {fast:>9.1f} {slow / fast:>7.1f}x")
+
+    pages = corpus.get("website")
+    if pages:
+        old = timed(old_website_path, pages, args.repeat)
+        new = timed(shared_website_path, pages, args.repeat)
+        print(
+            f"\nwebsite crawl, per-page parsing: old path {old:.1f} ms, "
+            f"shared DOM {new:.1f} ms ({old / new:.1f}x) over {len(pages)} pages"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
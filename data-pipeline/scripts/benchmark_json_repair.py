@@ -0,0 +1,124 @@
+"""
+Benchmark src.llm.json_repair against the regex repair it replaced.
+
+Corpus: responses recorded in the LLM response cache (if present) plus the
+narratives stored under src/benchmarks/results. Each response is tried as
+recorded, wrapped in a ```json fence with a preamble, with trailing commas,
+and truncated at 60% / 90% of its length.
+
+For every variant and method it reports the time taken and how many
+responses produced parseable JSON.
+
+Usage:
+    uv run python scripts/benchmark_json_repair.py [--cache PATH] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.json_repair import repair_json_text
+from src.llm.response_cache import get_default_cache_path
+
+RESULTS_DIR = Path(__file__).parent.parent / "src" / "benchmarks" / "results"
+
+
+def legacy_repair_json(json_str: str) -> str:
+    """The regex repair previously copied into website_extractor / annual_report_parser."""
+    json_str = json_str.strip()
+    json_str = re.sub(r",\s*}", "}", json_str)
+    json_str = re.sub(r",\s*]", "]", json_str)
+    json_str = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", json_str)
+    open_braces = json_str.count("{") - json_str.count("}")
+    open_brackets = json_str.count("[") - json_str.count("]")
+    if open_braces > 0 or open_brackets > 0:
+        stripped = json_str.rstrip()
+        if stripped and stripped[-1] not in '{}[],":\n':
+            if len(re.findall(r'(?<!\\)"', json_str)) % 2 == 1:
+                json_str += '"'
+        json_str += "]" * open_brackets
+        json_str += "}" * open_braces
+    return json_str
+
+
+def legacy_parse(text: str):
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0]
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(legacy_repair_json(text))
+
+
+def new_parse(text: str):
+    return repair_json_text(text).loads()
+
+
+def load_corpus(cache_path: Path) -> list[str]:
+    texts = []
+    if cache_path.exists():
+        conn = sqlite3.connect(str(cache_path))
+        for (response_json,) in conn.execute("SELECT response_json FROM llm_responses"):
+            text = (json.loads(response_json).get("text") or "").strip()
+            if "{" in text:
+                texts.append(text)
+        conn.close()
+    for evaluations in sorted(RESULTS_DIR.glob("*/evaluations.json")):
+        for evaluation in json.loads(evaluations.read_text()):
+            if evaluation.get("baseline_narrative"):
+                texts.append(json.dumps(evaluation["baseline_narrative"], indent=2))
+    return texts
+
+
+VARIANTS = {
+    "as recorded": lambda t: t,
+    "fenced + preamble": lambda t: f"Here is the JSON:\n```json\n{t}\n```\nLet me know if you need more.",
+    "trailing commas": lambda t: re.sub(r"(\S)(\s*[}\]])", r"\1,\2", t, count=20),
+    "truncated 90%": lambda t: t[: int(len(t) * 0.9)],
+    "truncated 60%": lambda t: t[: int(len(t) * 0.6)],
+}
+
+
+def run(texts: list[str], parse, repeat: int) -> tuple[float, int]:
+    ok = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        ok = 0
+        for text in texts:
+            try:
+                parse(text)
+                ok += 1
+            except (json.JSONDecodeError, ValueError):
+                pass
+    return (time.perf_counter() - start) / repeat, ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark LLM JSON repair")
+    parser.add_argument("--cache", type=Path, default=get_default_cache_path(), help="LLM response cache database")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.cache)
+    if not corpus:
+        print("No recorded responses found")
+        return 1
+    total_kb = sum(len(t) for t in corpus) / 1024
+    print(f"{len(corpus)} responses, {total_kb:.0f} KB\n")
+    print(f"{'variant':<20} {'legacy ms':>10} {'legacy ok':>10} {'new ms':>8} {'new ok':>7}")
+    for name, make in VARIANTS.items():
+        texts = [make(t) for t in corpus]
+        legacy_s, legacy_ok = run(texts, legacy_parse, args.repeat)
+        new_s, new_ok = run(texts, new_parse, args.repeat)
+        print(f"{name:<20} {legacy_s * 1000:>10.1f} {legacy_ok:>10} {new_s * 1000:>8.1f} {new_ok:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
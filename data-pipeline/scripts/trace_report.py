@@ -0,0 +1,61 @@
+"""
+Latency report for a streaming_runner trace (--trace / PIPELINE_TRACE).
+
+Prints p50/p95/p99 per phase, source, crawl step, model, DB statement,
+rate-limited domain and contended lock, then the critical-path share and
+the slowest charities' critical paths.
+
+Usage:
+    uv run python scripts/trace_report.py logs/traces/run-2026-10-16-120000.jsonl [--top 15] [--charities 10]
+    uv run python scripts/trace_report.py TRACE --json > summary.json
+    uv run python scripts/trace_report.py TRACE --ein 12-3456789
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.tracing import format_trace_report, load_trace, summarize_trace
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize a pipeline trace")
+    parser.add_argument("trace", type=Path, help="Trace JSONL file")
+    parser.add_argument("--top", type=int, default=10, help="Rows per table")
+    parser.add_argument("--charities", type=int, default=5, help="Slowest charities to show")
+    parser.add_argument("--ein", help="Print one charity's full critical path")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    if not args.trace.exists():
+        print(f"No such trace: {args.trace}")
+        return 1
+    spans = load_trace(args.trace)
+    if not spans:
+        print("Trace is empty")
+        return 1
+    summary = summarize_trace(spans)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    if args.ein:
+        entry = summary["charities"].get(args.ein)
+        if entry is None:
+            print(f"{args.ein} is not in this trace")
+            return 1
+        print(f"{args.ein}: {entry['ms'] / 1000:.1f}s")
+        for step in entry["critical_path"]:
+            print(f"  {step['kind'] + ':' + step['name']:<48} {step['ms'] / 1000:>8.2f}s")
+        return 0
+
+    print(f"{len(spans)} spans, {len(summary['charities'])} charities")
+    print(format_trace_report(summary, top=args.top, charities=args.charities))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
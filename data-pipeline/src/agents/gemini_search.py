@@ -17,12 +17,14 @@ from google.genai import types
 
 from ..llm.budget_tracker import add_cost as _budget_add_cost
 from ..llm.budget_tracker import check_budget as _budget_check
+from ..llm.json_repair import RepairResult, repair_json_text
 from ..llm.llm_client import MODEL_REGISTRY
 from ..models.agent_discovery import (
     GroundingChunk,
     GroundingMetadata,
     GroundingSupport,
 )
+from ..utils.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +41,10 @@ def extract_json_from_response(text: str) -> Optional[str]:
     - Plain JSON
     - JSON wrapped in markdown code blocks
     - JSON with trailing content after closing brace
-    - Truncated JSON (attempts repair)
+    - Truncated JSON (cut back to the last complete value, then closed)
+
+    Mismatched brackets are not fixed: a structurally wrong grounded
+    response is treated as no data.
 
     Args:
         text: Raw response text from LLM
@@ -47,140 +52,33 @@ def extract_json_from_response(text: str) -> Optional[str]:
     Returns:
         Extracted JSON string, or None if no valid JSON found
     """
-    text = text.strip()
-
-    # Handle markdown code blocks
-    if "```json" in text:
-        text = text.split("```json")[1].split("```")[0].strip()
-    elif "```" in text:
-        parts = text.split("```")
-        if len(parts) >= 2:
-            text = parts[1].strip()
-
-    # Find the JSON object boundaries
-    # Look for the first { and last matching }
-    start = text.find("{")
-    if start == -1:
-        return None
-
-    # Count braces to find matching closing brace
-    depth = 0
-    in_string = False
-    escape_next = False
-    end = -1
-
-    for i, char in enumerate(text[start:], start):
-        if escape_next:
-            escape_next = False
-            continue
-        if char == "\\":
-            escape_next = True
-            continue
-        # D-001: Removed redundant `not escape_next` check - by this point
-        # escape_next is always False (handled above with continue)
-        if char == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
-
-    if end == -1:
-        # No matching closing brace - try to repair truncated JSON
-        return _repair_truncated_json(text[start:])
-
-    return text[start:end]
+    return _valid_json_text(repair_json_text(text, start_chars="{", fix_brackets=False))
 
 
 def _repair_truncated_json(json_str: str) -> Optional[str]:
     """
     Attempt to repair truncated JSON by closing open structures.
 
-    Handles truncation anywhere — inside strings, arrays, nested objects.
-
-    Strategy: collect every comma position outside strings, then try
-    truncating at each (right-to-left) and closing open structures
-    until json.loads succeeds.  This preserves the maximum amount of data.
+    Keeps every complete value before the truncation point and drops the
+    partial one (see src.llm.json_repair).
     """
     if not json_str or json_str[0] != "{":
         return None
+    return _valid_json_text(repair_json_text(json_str, start_chars="{", fix_brackets=False))
 
-    # Collect comma positions and closing-structure positions outside strings.
-    # Any of these is a candidate truncation point.
-    in_string = False
-    escape_next = False
-    cut_candidates: list[int] = []
-
-    for i, char in enumerate(json_str):
-        if escape_next:
-            escape_next = False
-            continue
-        if char == "\\":
-            if in_string:
-                escape_next = True
-            continue
-        if char == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if char == ",":
-            cut_candidates.append(i)
-        elif char in ("}", "]"):
-            cut_candidates.append(i + 1)
-
-    # Try each candidate from rightmost (most data) to leftmost
-    closers = {"[": "]", "{": "}"}
-    for pos in reversed(cut_candidates):
-        truncated = json_str[:pos].rstrip().rstrip(",")
-        if not truncated:
-            continue
-
-        # Recount open structures on the truncated fragment
-        in_str = False
-        esc = False
-        stack: list[str] = []
-        for char in truncated:
-            if esc:
-                esc = False
-                continue
-            if char == "\\":
-                if in_str:
-                    esc = True
-                continue
-            if char == '"':
-                in_str = not in_str
-                continue
-            if in_str:
-                continue
-            if char == "{":
-                stack.append("{")
-            elif char == "}":
-                if stack and stack[-1] == "{":
-                    stack.pop()
-            elif char == "[":
-                stack.append("[")
-            elif char == "]":
-                if stack and stack[-1] == "[":
-                    stack.pop()
-
-        suffix = "".join(closers[s] for s in reversed(stack))
-        repaired = truncated + suffix
-
-        try:
-            json.loads(repaired)
-            return repaired
-        except json.JSONDecodeError:
-            continue
 
-    logger.warning(f"Repaired JSON still invalid: {json_str[:100]}...")
-    return None
+def _valid_json_text(result: RepairResult) -> Optional[str]:
+    """Repaired text if it parses, else None."""
+    if result.text is None:
+        return None
+    try:
+        result.loads()
+    except json.JSONDecodeError:
+        logger.warning(f"Repaired JSON still invalid: {result.text[:100]}...")
+        return None
+    if result.truncated:
+        logger.debug(f"Repaired truncated JSON ({result.describe()})")
+    return result.text
 
 
 def calculate_grounding_confidence(result: "SearchGroundingResult") -> float:
@@ -328,11 +226,12 @@ class GeminiSearchClient:
         try:
             # H9: same budget tracker as LLMClient — discovery spend counts too
             _budget_check()
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=contents,
-                config=config,
-            )
+            with trace_span("llm", self.model, op="search"):
+                response = self.client.models.generate_content(
+                    model=self.model,
+                    contents=contents,
+                    config=config,
+                )
 
             # Extract response text
             text = response.text if response.text else ""
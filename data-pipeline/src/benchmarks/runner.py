@@ -16,6 +16,7 @@ from ..db import (
     CharityRepository,
     RawDataRepository,
 )
+from ..llm.json_repair import parse_llm_json
 from ..llm.llm_client import LLMClient, LLMResponse
 from ..llm.prompt_loader import load_prompt
 from ..parsers.charity_metrics_aggregator import CharityMetrics, CharityMetricsAggregator
@@ -27,38 +28,6 @@ from .storage import BenchmarkRun, BenchmarkStorage, CharityEvaluation
 logger = logging.getLogger(__name__)
 
 
-def _repair_json_brackets(text: str) -> str:
-    """Attempt to repair JSON with mismatched brackets.
-
-    Some models (like Haiku) confuse ] and } when closing objects.
-    This tries to fix that by tracking what was opened.
-    """
-    # Track bracket stack to identify mismatches
-    stack = []
-    chars = list(text)
-
-    for i, char in enumerate(chars):
-        if char == '{':
-            stack.append(('{', i))
-        elif char == '[':
-            stack.append(('[', i))
-        elif char == '}':
-            if stack and stack[-1][0] == '{':
-                stack.pop()
-            elif stack and stack[-1][0] == '[':
-                # Mismatch: ] was expected but } found - this is fine
-                stack.pop()
-        elif char == ']':
-            if stack and stack[-1][0] == '[':
-                stack.pop()
-            elif stack and stack[-1][0] == '{':
-                # Mismatch: } was expected but ] found - fix it!
-                chars[i] = '}'
-                stack.pop()
-
-    return ''.join(chars)
-
-
 @dataclass
 class RunConfig:
     """Configuration for a benchmark run."""
@@ -431,10 +400,10 @@ Return ONLY a valid JSON object:
 
         except json.JSONDecodeError as e:
             # Try to repair common bracket confusion (] vs } for objects)
-            # This is a known issue with smaller models like Haiku
+            # This is a known issue with smaller models like Haiku.
+            # Truncated narratives are not closed - they are incomplete, not malformed.
             try:
-                repaired = _repair_json_brackets(text)
-                narrative = json.loads(repaired)
+                narrative = parse_llm_json(text, close_truncated=False)
                 return narrative, total_cost, None
             except (json.JSONDecodeError, Exception):
                 pass  # Repair failed, return original error
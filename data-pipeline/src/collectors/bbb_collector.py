@@ -21,6 +21,8 @@ from typing import Any, Dict, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.html_parser import make_soup
+from ..utils.http_pool import get_session
 from ..utils.logger import PipelineLogger
 from ..utils.rate_limiter import global_rate_limiter
 from ..validators.bbb_validator import BBBProfile
@@ -174,12 +176,12 @@ class BBBCollector(BaseCollector):
             try:
                 # BBB WGA uses /search?term= for search
                 search_url = f"{self.SEARCH_URL}?term={term}"
-                response = requests.get(search_url, headers=self.headers, timeout=30)
+                response = get_session().get(search_url, headers=self.headers, timeout=30)
 
                 if response.status_code != 200:
                     continue
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = make_soup(response.text, source="bbb")
 
                 # Look for charity review links in search results
                 # Pattern: /charity-reviews/{category}/{charity-slug}-in-{city}-{state}-{bbb-id}
@@ -258,7 +260,7 @@ class BBBCollector(BaseCollector):
         self._rate_limit()
 
         try:
-            response = requests.get(review_url, headers=self.headers, timeout=30)
+            response = get_session().get(review_url, headers=self.headers, timeout=30)
 
             if response.status_code != 200:
                 return FetchResult(
@@ -314,7 +316,7 @@ class BBBCollector(BaseCollector):
                 "source_business_id": source_id,
             }
 
-            ajax_response = requests.post(
+            ajax_response = get_session().post(
                 f"{self.BASE_URL}/wp-admin/admin-ajax.php",
                 headers={
                     **self.headers,
@@ -442,7 +444,7 @@ class BBBCollector(BaseCollector):
             # FIX #23: Check content substance before parsing
             self._check_content_substance(html, ein)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, source="bbb")
 
             # Extract data from page
             profile_dict = self._extract_profile(soup, ein, review_url or "")
@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 
+from ..utils.html_parser import make_soup
+from ..utils.http_pool import get_session
 from ..utils.logger import PipelineLogger
 from ..utils.rate_limiter import global_rate_limiter
 from ..validators.candid_validator import CandidProfile
@@ -1045,7 +1047,7 @@ class CandidCollector(BaseCollector):
 
         try:
             # Fetch HTML
-            response = requests.get(
+            response = get_session().get(
                 url,
                 headers=self.headers,
                 timeout=self.timeout,
@@ -1151,7 +1153,7 @@ class CandidCollector(BaseCollector):
 
         try:
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(raw_data, "html.parser")
+            soup = make_soup(raw_data, source="candid")
 
             # Extract all fields
             org_name = self._extract_organization_name(soup)
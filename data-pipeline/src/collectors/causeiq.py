@@ -22,6 +22,7 @@ import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from ..utils.html_parser import make_soup
 from ..utils.logger import PipelineLogger
 from ..validators.causeiq_validator import CauseIQProfile
 
@@ -130,7 +131,7 @@ class CauseIQCollector:
                 return False
 
             # Parse login page to extract CSRF token
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text, source="causeiq")
             csrf_input = soup.find("input", {"name": "csrfmiddlewaretoken"})
 
             if not csrf_input:
@@ -690,7 +691,7 @@ class CauseIQCollector:
                         self.logger.warning(f"Failed to save debug HTML: {e}")
 
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = make_soup(html_content, source="causeiq")
 
             # Extract all fields
             org_name_extracted = self._extract_organization_name(soup)
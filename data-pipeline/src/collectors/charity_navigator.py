@@ -19,6 +19,8 @@ from bs4 import BeautifulSoup
 
 from ..llm.llm_client import LLMClient, LLMTask
 from ..llm.prompt_loader import load_prompt
+from ..utils.html_parser import make_soup
+from ..utils.http_pool import get_session
 from ..utils.logger import PipelineLogger
 from ..utils.rate_limiter import global_rate_limiter
 from ..validators.charity_navigator_validator import CharityNavigatorProfile
@@ -172,7 +174,7 @@ class CharityNavigatorCollector(BaseCollector):
         self._rate_limit()
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=30, allow_redirects=True)
+            response = get_session().get(url, headers=self.headers, timeout=30, allow_redirects=True)
 
             if response.status_code == 404:
                 return FetchResult(
@@ -323,7 +325,7 @@ class CharityNavigatorCollector(BaseCollector):
                     error=f"cn_format_drift: missing critical markers: {', '.join(missing_critical)}",
                 )
 
-            soup = BeautifulSoup(raw_data, "html.parser")
+            soup = make_soup(raw_data, source="charity_navigator")
 
             # Extract all data
             profile_data = self._extract_all_data(soup, ein, raw_data)
@@ -12,15 +12,15 @@ Data flow:
 """
 
 import re
-import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
 
+from ..utils.html_parser import make_soup
+from ..utils.http_pool import get_session
 from ..utils.logger import PipelineLogger
 from ..utils.rate_limiter import global_rate_limiter
 from ..validators.form990_grants_validator import Form990GrantsProfile
@@ -109,13 +109,13 @@ class Form990GrantsCollector(BaseCollector):
         self._rate_limit()
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = get_session().get(url, headers=self.headers, timeout=self.timeout)
             if response.status_code == 404:
                 return []
             response.raise_for_status()
 
             # Parse HTML to find XML download links
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text, source="form990_grants")
 
             # Find all XML download links - they contain object_id
             xml_links = soup.find_all("a", href=re.compile(r"download-xml\?object_id="))
@@ -212,7 +212,7 @@ class Form990GrantsCollector(BaseCollector):
 
         try:
             # Follow redirects to S3
-            response = requests.get(
+            response = get_session().get(
                 url,
                 headers=self.headers,
                 timeout=self.timeout,
@@ -221,11 +221,15 @@ class Form990GrantsCollector(BaseCollector):
 
             # Handle rate limiting
             if response.status_code == 429:
+                # Pause the shared ProPublica bucket; the retry waits out the pause.
+                pause = global_rate_limiter.report_rate_limited(
+                    "propublica", response.headers.get("Retry-After", "65")
+                )
                 if self.logger:
-                    self.logger.warning("Rate limited by ProPublica (429). Waiting 65s...")
-                time.sleep(65)
+                    self.logger.warning(f"Rate limited by ProPublica (429). Waiting {pause:.0f}s...")
+                self._rate_limit()
                 # Retry once
-                response = requests.get(
+                response = get_session().get(
                     url,
                     headers=self.headers,
                     timeout=self.timeout,
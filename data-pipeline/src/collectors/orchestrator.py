@@ -6,6 +6,7 @@ Manages the complete data collection pipeline and stores results in DoltDB.
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -24,6 +25,7 @@ from ..db.repository import Charity
 from ..parsers.charity_metrics_aggregator import CharityMetrics, CharityMetricsAggregator
 from ..utils.charity_loader import normalize_website_url
 from ..utils.logger import PipelineLogger
+from ..utils.tracing import bind, trace_span
 from .bbb_collector import BBBCollector
 from .candid_beautifulsoup import CandidCollector
 from .charity_navigator import CharityNavigatorCollector
@@ -189,6 +191,7 @@ class DataCollectionOrchestrator:
         max_pdf_downloads: int = 0,
         skip_sources: Optional[List[str]] = None,
         include_sources: Optional[List[str]] = None,
+        concurrent_sources: bool = False,
     ):
         """
         Initialize orchestrator.
@@ -200,10 +203,13 @@ class DataCollectionOrchestrator:
             max_pdf_downloads: Max PDFs to download per charity (default 0 = disabled)
             skip_sources: List of source names to skip (e.g., ['causeiq', 'website'])
             include_sources: Frozen sources to re-enable for this run (e.g. ['bbb'])
+            concurrent_sources: Fetch independent sources (and the website crawl)
+                in parallel within fetch_charity_data instead of one at a time
         """
         self.logger = logger or PipelineLogger(name="orchestrator")
         self.skip_sources = resolve_skip_sources(skip_sources, include_sources)
         self.frozen_sources = FROZEN_SOURCES - set(include_sources or [])
+        self.concurrent_sources = concurrent_sources
 
         # H5: CAPTCHA/anti-bot blocked sites collected for the run-end report
         self.blocked_sites: List[Dict[str, Any]] = []
@@ -291,7 +297,7 @@ class DataCollectionOrchestrator:
         Returns:
             True if data exists and is within TTL, False otherwise
         """
-        row = self.raw_data_repo.get_by_source(ein, source)
+        row = self.raw_data_repo.get_by_source(ein, source, columns=("success", "scraped_at"))
         if not row or not row.get("success"):
             return False
 
@@ -325,7 +331,11 @@ class DataCollectionOrchestrator:
         Returns:
             Tuple of (should_skip, reason)
         """
-        row = self.raw_data_repo.get_by_source(ein, source)
+        row = self.raw_data_repo.get_by_source(
+            ein,
+            source,
+            columns=("success", "retry_count", "scraped_at", "error_message", "last_failure_reason"),
+        )
         if not row:
             return False, ""
 
@@ -463,7 +473,7 @@ class DataCollectionOrchestrator:
         if not ein:
             return None
 
-        row = self.raw_data_repo.get_by_source(ein, "candid")
+        row = self.raw_data_repo.get_by_source(ein, "candid", columns=("success", "scraped_at", "parsed_json"))
 
         if not row or not row.get("success"):
             return None
@@ -596,6 +606,8 @@ class DataCollectionOrchestrator:
         Fetch raw data from all sources WITHOUT parsing.
 
         This is Phase 1 of the pipeline - fetch only. Parsing happens in extract.py.
+        With concurrent_sources enabled, the sources and the website crawl run
+        at the same time; the returned report is the same as a serial run.
 
         Args:
             ein: EIN in format XX-XXXXXXX (required)
@@ -635,91 +647,6 @@ class DataCollectionOrchestrator:
         ein = self._get_or_create_charity(ein, charity_name, website_url)
         report["ein"] = ein
 
-        # Define sources with their fetch functions
-        # Note: Website uses collect_multi_page (combined) - see docstring
-        sources = [
-            ("propublica", lambda: self.propublica.fetch(ein)),
-            ("charity_navigator", lambda: self.charity_navigator.fetch(ein)),
-            ("candid", lambda: self.candid.fetch(ein)),
-            ("form990_grants", lambda: self.form990_grants.fetch(ein)),
-            ("bbb", lambda: self.bbb.fetch(ein, charity_name=charity_name)),
-        ]
-
-        for source_name, fetch_func in sources:
-            # Skip if source is in skip list
-            if source_name in self.skip_sources:
-                label = "frozen" if source_name in self.frozen_sources else "--skip flag"
-                self.logger.info(f"Skipping {source_name} ({label})")
-                report["sources_skipped"] = report.get("sources_skipped", [])
-                report["sources_skipped"].append(source_name)
-                continue
-
-            # Check TTL - skip if data is fresh
-            if self._is_data_fresh(ein, source_name):
-                self.logger.debug(f"Skipping {source_name} - data is fresh (within TTL)")
-                report["sources_skipped"] = report.get("sources_skipped", [])
-                report["sources_skipped"].append(f"{source_name} (cached)")
-                report["sources_succeeded"].append(source_name)
-                continue
-
-            # Check backoff for failed sources
-            should_skip, skip_reason = self._should_skip_failed_source(ein, source_name)
-            if should_skip:
-                self.logger.debug(f"Skipping {source_name}: {skip_reason}")
-                report["sources_failed"][source_name] = skip_reason
-                continue
-
-            report["sources_attempted"].append(source_name)
-
-            # Retry loop with exponential backoff
-            max_retries = CRAWL_MAX_RETRIES
-            last_error = None
-
-            for attempt in range(max_retries + 1):
-                try:
-                    fetch_result = fetch_func()
-
-                    if fetch_result.success:
-                        # FIX #2 + #14: Store raw_content only if it has substance and DB write succeeds
-                        stored = self._store_raw_content_only(ein, source_name, fetch_result.raw_data, fetch_result.content_type)
-                        if stored:
-                            report["sources_succeeded"].append(source_name)
-                            report["timestamps"][source_name] = datetime.now().isoformat()
-                            self.logger.log_data_source_fetch(0, ein, source_name, success=True)
-                        else:
-                            report["sources_failed"][source_name] = "empty or failed to store content"
-                            self.logger.log_data_source_fetch(0, ein, source_name, success=False, error="empty/shell content or DB write failed")
-                        break
-
-                    # Failed - check if retryable
-                    last_error = fetch_result.error
-                    if self._is_retryable_error(last_error) and attempt < max_retries:
-                        backoff = CRAWL_INITIAL_BACKOFF_SECONDS * (2**attempt)
-                        self.logger.warning(
-                            f"Retry {attempt + 1}/{max_retries} for {source_name} "
-                            f"after {backoff:.1f}s (error: {last_error})"
-                        )
-                        time.sleep(backoff)
-                        continue
-
-                    # Non-retryable or exhausted retries
-                    report["sources_failed"][source_name] = last_error
-                    self.raw_data_repo.increment_retry_count(ein, source_name, last_error)
-                    self.logger.log_data_source_fetch(0, ein, source_name, success=False, error=last_error)
-                    break
-
-                except Exception as e:
-                    last_error = str(e)
-                    if attempt < max_retries:
-                        backoff = CRAWL_INITIAL_BACKOFF_SECONDS * (2**attempt)
-                        self.logger.warning(f"Retry {attempt + 1}/{max_retries} for {source_name}: {e}")
-                        time.sleep(backoff)
-                        continue
-
-                    report["sources_failed"][source_name] = last_error
-                    self.raw_data_repo.increment_retry_count(ein, source_name, last_error)
-                    self.logger.error(f"Source {source_name} failed", exception=e, ein=ein)
-
         # Website: Use combined collect_multi_page (LLM extraction is expensive, do once)
         # TODO: Add fetch_multi_page() for proper separation in Phase 2
         # If website_url not provided, look it up from the charities table
@@ -735,45 +662,38 @@ class DataCollectionOrchestrator:
                     self.logger.debug(f"Using website URL from charities table: {website_url}")
 
         website_url = normalize_website_url(website_url)
+
+        # Define sources with their fetch functions
+        # Note: Website uses collect_multi_page (combined) - see docstring
+        sources = [
+            ("propublica", lambda: self.propublica.fetch(ein)),
+            ("charity_navigator", lambda: self.charity_navigator.fetch(ein)),
+            ("candid", lambda: self.candid.fetch(ein)),
+            ("form990_grants", lambda: self.form990_grants.fetch(ein)),
+            ("bbb", lambda: self.bbb.fetch(ein, charity_name=charity_name)),
+        ]
+
+        # Each task returns a report fragment; fragments are merged in source
+        # order so the report is identical whether sources ran serially or not.
+        tasks = [
+            (source_name, lambda name=source_name, func=fetch_func: self._fetch_source(ein, name, func))
+            for source_name, fetch_func in sources
+        ]
         if website_url and "website" not in self.skip_sources:
-            should_skip_site, site_skip_reason = self._should_skip_failed_source(ein, "website")
-            if should_skip_site:
-                report["sources_failed"]["website"] = site_skip_reason
-                report.setdefault("sources_skipped", []).append(f"website ({site_skip_reason})")
-            elif not self._is_data_fresh(ein, "website"):
-                report["sources_attempted"].append("website")
-                try:
-                    success, data, error = self.website.collect_multi_page(website_url, ein)
-                    if success:
-                        # FIX #14: Only mark as succeeded if DB write confirms
-                        stored = self._store_raw_data(ein, "website", data)
-                        if stored:
-                            report["raw_data"]["website"] = data
-                            report["sources_succeeded"].append("website")
-                            report["timestamps"]["website"] = datetime.now().isoformat()
-                            self.logger.log_data_source_fetch(0, ein, "website", success=True)
-                        else:
-                            report["sources_failed"]["website"] = "empty data or DB write failed"
-                            self.logger.log_data_source_fetch(0, ein, "website", success=False, error="empty data or DB write failed")
-                    else:
-                        report["sources_failed"]["website"] = error
-                        self.logger.log_data_source_fetch(0, ein, "website", success=False, error=error)
-                        # Store failed attempt in DB to track captcha blocking.
-                        # upsert(success=False) already increments retry_count and
-                        # records last_failure_reason (Task 1) — no explicit
-                        # increment_retry_count here or retry_count advances twice.
-                        self._store_failed_crawl(ein, "website", error or "Unknown error")
-                        self._record_blocked_site(ein, website_url, error)
-                except Exception as e:
-                    report["sources_failed"]["website"] = str(e)
-                    self.logger.error("Website fetch failed", exception=e, ein=ein)
-                    # Store failed attempt in DB (upsert increments retry_count once)
-                    self._store_failed_crawl(ein, "website", str(e))
-                    self._record_blocked_site(ein, website_url, str(e))
-            else:
-                report["sources_skipped"] = report.get("sources_skipped", [])
-                report["sources_skipped"].append("website (cached)")
-                report["sources_succeeded"].append("website")
+            tasks.append(("website", lambda: self._fetch_website(ein, website_url)))
+
+        if self.concurrent_sources and len(tasks) > 1:
+            # Sources hit different hosts, so they overlap freely; per-source
+            # retry/backoff stays inside each task and same-host politeness is
+            # still enforced by global_rate_limiter (e.g. ProPublica + 990 grants).
+            with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix=f"crawl-{ein}") as executor:
+                futures = [executor.submit(bind(self._traced_fetch), name, task) for name, task in tasks]
+                fragments = [future.result() for future in futures]
+        else:
+            fragments = [self._traced_fetch(name, task) for name, task in tasks]
+
+        for fragment in fragments:
+            self._merge_source_fragment(report, fragment)
 
         # Strict completeness requirement:
         # crawl is successful only when all required sources succeed.
@@ -800,6 +720,184 @@ class DataCollectionOrchestrator:
         report["data_quality"] = "complete"
         return True, report
 
+    @staticmethod
+    def _traced_fetch(source_name: str, task) -> Dict[str, Any]:
+        """Run one source task inside a "source" trace span."""
+        with trace_span("source", source_name) as span:
+            fragment = task()
+            span.set(
+                succeeded=source_name in fragment["sources_succeeded"],
+                skipped=bool(fragment["sources_skipped"]),
+            )
+            return fragment
+
+    @staticmethod
+    def _new_source_fragment() -> Dict[str, Any]:
+        """Empty per-source slice of the fetch report (merged by _merge_source_fragment)."""
+        return {
+            "sources_attempted": [],
+            "sources_succeeded": [],
+            "sources_failed": {},
+            "sources_skipped": [],
+            "timestamps": {},
+            "raw_data": {},
+        }
+
+    @staticmethod
+    def _merge_source_fragment(report: Dict[str, Any], fragment: Dict[str, Any]) -> None:
+        """Fold one source's fragment into the fetch report, preserving key order."""
+        report["sources_attempted"].extend(fragment["sources_attempted"])
+        report["sources_succeeded"].extend(fragment["sources_succeeded"])
+        report["sources_failed"].update(fragment["sources_failed"])
+        if fragment["sources_skipped"]:
+            report.setdefault("sources_skipped", []).extend(fragment["sources_skipped"])
+        report["timestamps"].update(fragment["timestamps"])
+        report["raw_data"].update(fragment["raw_data"])
+
+    def _fetch_source(self, ein: str, source_name: str, fetch_func) -> Dict[str, Any]:
+        """
+        Fetch one API/scrape source with TTL, backoff and in-run retry handling.
+
+        Args:
+            ein: Normalized charity EIN
+            source_name: Source name (propublica, candid, ...)
+            fetch_func: Zero-arg callable returning a FetchResult
+
+        Returns:
+            Report fragment for this source
+        """
+        fragment = self._new_source_fragment()
+
+        # Skip if source is in skip list
+        if source_name in self.skip_sources:
+            label = "frozen" if source_name in self.frozen_sources else "--skip flag"
+            self.logger.info(f"Skipping {source_name} ({label})")
+            fragment["sources_skipped"].append(source_name)
+            return fragment
+
+        # Check TTL - skip if data is fresh
+        if self._is_data_fresh(ein, source_name):
+            self.logger.debug(f"Skipping {source_name} - data is fresh (within TTL)")
+            fragment["sources_skipped"].append(f"{source_name} (cached)")
+            fragment["sources_succeeded"].append(source_name)
+            return fragment
+
+        # Check backoff for failed sources
+        should_skip, skip_reason = self._should_skip_failed_source(ein, source_name)
+        if should_skip:
+            self.logger.debug(f"Skipping {source_name}: {skip_reason}")
+            fragment["sources_failed"][source_name] = skip_reason
+            return fragment
+
+        fragment["sources_attempted"].append(source_name)
+
+        # Retry loop with exponential backoff
+        max_retries = CRAWL_MAX_RETRIES
+        last_error = None
+
+        for attempt in range(max_retries + 1):
+            try:
+                fetch_result = fetch_func()
+
+                if fetch_result.success:
+                    # FIX #2 + #14: Store raw_content only if it has substance and DB write succeeds
+                    stored = self._store_raw_content_only(ein, source_name, fetch_result.raw_data, fetch_result.content_type)
+                    if stored:
+                        fragment["sources_succeeded"].append(source_name)
+                        fragment["timestamps"][source_name] = datetime.now().isoformat()
+                        self.logger.log_data_source_fetch(0, ein, source_name, success=True)
+                    else:
+                        fragment["sources_failed"][source_name] = "empty or failed to store content"
+                        self.logger.log_data_source_fetch(0, ein, source_name, success=False, error="empty/shell content or DB write failed")
+                    break
+
+                # Failed - check if retryable
+                last_error = fetch_result.error
+                if self._is_retryable_error(last_error) and attempt < max_retries:
+                    backoff = CRAWL_INITIAL_BACKOFF_SECONDS * (2**attempt)
+                    self.logger.warning(
+                        f"Retry {attempt + 1}/{max_retries} for {source_name} "
+                        f"after {backoff:.1f}s (error: {last_error})"
+                    )
+                    time.sleep(backoff)
+                    continue
+
+                # Non-retryable or exhausted retries
+                fragment["sources_failed"][source_name] = last_error
+                self.raw_data_repo.increment_retry_count(ein, source_name, last_error)
+                self.logger.log_data_source_fetch(0, ein, source_name, success=False, error=last_error)
+                break
+
+            except Exception as e:
+                last_error = str(e)
+                if attempt < max_retries:
+                    backoff = CRAWL_INITIAL_BACKOFF_SECONDS * (2**attempt)
+                    self.logger.warning(f"Retry {attempt + 1}/{max_retries} for {source_name}: {e}")
+                    time.sleep(backoff)
+                    continue
+
+                fragment["sources_failed"][source_name] = last_error
+                self.raw_data_repo.increment_retry_count(ein, source_name, last_error)
+                self.logger.error(f"Source {source_name} failed", exception=e, ein=ein)
+
+        return fragment
+
+    def _fetch_website(self, ein: str, website_url: str) -> Dict[str, Any]:
+        """
+        Crawl the charity website (combined fetch + LLM extraction).
+
+        Args:
+            ein: Normalized charity EIN
+            website_url: Normalized website URL
+
+        Returns:
+            Report fragment for the website source
+        """
+        fragment = self._new_source_fragment()
+
+        should_skip_site, site_skip_reason = self._should_skip_failed_source(ein, "website")
+        if should_skip_site:
+            fragment["sources_failed"]["website"] = site_skip_reason
+            fragment["sources_skipped"].append(f"website ({site_skip_reason})")
+            return fragment
+
+        if self._is_data_fresh(ein, "website"):
+            fragment["sources_skipped"].append("website (cached)")
+            fragment["sources_succeeded"].append("website")
+            return fragment
+
+        fragment["sources_attempted"].append("website")
+        try:
+            success, data, error = self.website.collect_multi_page(website_url, ein)
+            if success:
+                # FIX #14: Only mark as succeeded if DB write confirms
+                stored = self._store_raw_data(ein, "website", data)
+                if stored:
+                    fragment["raw_data"]["website"] = data
+                    fragment["sources_succeeded"].append("website")
+                    fragment["timestamps"]["website"] = datetime.now().isoformat()
+                    self.logger.log_data_source_fetch(0, ein, "website", success=True)
+                else:
+                    fragment["sources_failed"]["website"] = "empty data or DB write failed"
+                    self.logger.log_data_source_fetch(0, ein, "website", success=False, error="empty data or DB write failed")
+            else:
+                fragment["sources_failed"]["website"] = error
+                self.logger.log_data_source_fetch(0, ein, "website", success=False, error=error)
+                # Store failed attempt in DB to track captcha blocking.
+                # upsert(success=False) already increments retry_count and
+                # records last_failure_reason (Task 1) — no explicit
+                # increment_retry_count here or retry_count advances twice.
+                self._store_failed_crawl(ein, "website", error or "Unknown error")
+                self._record_blocked_site(ein, website_url, error)
+        except Exception as e:
+            fragment["sources_failed"]["website"] = str(e)
+            self.logger.error("Website fetch failed", exception=e, ein=ein)
+            # Store failed attempt in DB (upsert increments retry_count once)
+            self._store_failed_crawl(ein, "website", str(e))
+            self._record_blocked_site(ein, website_url, str(e))
+
+        return fragment
+
     def _get_or_create_charity(self, ein: str, name: Optional[str] = None, website: Optional[str] = None) -> str:
         """
         Get or create charity record in database.
@@ -1357,7 +1455,9 @@ class DataCollectionOrchestrator:
             candidates.append(error)
 
         # Backoff/permanent-failure skip paths may hide the original BBB error text.
-        row = self.raw_data_repo.get_by_source(ein, "bbb")
+        row = self.raw_data_repo.get_by_source(
+            ein, "bbb", columns=("error_message", "last_failure_reason")
+        )
         if isinstance(row, dict):
             for field in ("last_failure_reason", "error_message"):
                 value = row.get(field)
@@ -1378,7 +1478,9 @@ class DataCollectionOrchestrator:
             candidates.append(error)
 
         # Backoff/permanent-failure skip paths may hide the original website error text.
-        row = self.raw_data_repo.get_by_source(ein, "website")
+        row = self.raw_data_repo.get_by_source(
+            ein, "website", columns=("error_message", "last_failure_reason")
+        )
         if isinstance(row, dict):
             for field in ("last_failure_reason", "error_message"):
                 value = row.get(field)
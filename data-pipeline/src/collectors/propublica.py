@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional, Tuple
 
 import requests
 
+from ..utils.http_pool import get_session
 from ..utils.logger import PipelineLogger
 from ..utils.rate_limiter import global_rate_limiter
 from ..validators.propublica_validator import ProPublica990Profile
@@ -171,7 +172,7 @@ class ProPublicaCollector(BaseCollector):
         self._rate_limit()
 
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = get_session().get(url, timeout=self.timeout)
 
             if response.status_code == 404:
                 return FetchResult(
@@ -184,6 +185,8 @@ class ProPublicaCollector(BaseCollector):
             # C-003: Handle rate limiting (429) explicitly
             if response.status_code == 429:
                 retry_after = response.headers.get("Retry-After", "60")
+                # Pause and slow down every worker sharing the ProPublica bucket
+                global_rate_limiter.report_rate_limited("propublica", retry_after)
                 if self.logger:
                     self.logger.warning(f"ProPublica rate limited (429). Retry-After: {retry_after}s")
                 return FetchResult(
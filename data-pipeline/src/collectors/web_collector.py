@@ -14,6 +14,7 @@ import random
 import re
 import threading
 import time
+import weakref
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
@@ -31,7 +32,13 @@ try:
 except ImportError:
     HAS_CURL_CFFI = False
 
-from ..constants import CRAWL_JITTER_RANGE_SECONDS, PER_DOMAIN_CONCURRENCY
+from ..constants import (
+    ASYNC_CRAWL_TIMEOUT_GRACE_SECONDS,
+    CRAWL_JITTER_RANGE_SECONDS,
+    PER_DOMAIN_CONCURRENCY,
+    WEBSITE_DOM_CACHE_MAX_PAGES,
+    WEBSITE_PAGE_STORE_MAX_BYTES,
+)
 from ..extractors.deterministic import DeterministicExtractor
 from ..extractors.page_classifier import PageClassifier
 from ..extractors.structured_data import StructuredDataExtractor
@@ -39,13 +46,19 @@ from ..llm.website_extractor import WebsiteExtractor
 from ..parsers.annual_report_parser import AnnualReportParser
 from ..parsers.form_990_parser import Form990Parser
 from ..parsers.sitemap_parser import SitemapParser
+from ..utils.async_loop import get_crawl_loop
+from ..utils.crawl_scheduler import crawl_scheduler
 from ..utils.crawler_cache import CrawlerCache
+from ..utils.html_parser import DomCache, make_soup
+from ..utils.http_pool import get_async_client, get_session
 from ..utils.logger import PipelineLogger
 from ..utils.merge_strategy import MergeStrategy
+from ..utils.page_store import PageStore
 from ..utils.pdf_downloader import PDFDownloader
 from ..utils.rate_limiter import global_rate_limiter
 from ..utils.robots_checker import RobotsChecker
 from ..utils.text_cleaner import TextCleaner
+from ..utils.tracing import record_span
 from ..validators.website_validator import WebsiteProfile
 
 
@@ -54,6 +67,12 @@ def _normalize_ein(ein: str) -> str:
     return ein.replace("-", "").replace(" ", "").strip()
 
 
+# Per-domain crawl semaphores: {event loop: {limit: {domain: Semaphore}}} (see _per_domain_semaphores)
+_domain_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[int, Dict[str, asyncio.Semaphore]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_domain_semaphores_lock = threading.Lock()
+
 # Crawler configuration - per spec: 50 pages max, 5 min timeout
 CRAWLER_CONFIG = {
     "max_depth": 3,  # Deeper crawl to find evidence/impact pages
@@ -171,7 +190,7 @@ class WebsiteCollector(BaseCollector):
 
         Args:
             logger: Logger instance
-            rate_limit_delay: Seconds between requests (default 2.0)
+            rate_limit_delay: Unused; requests are paced per host by src/utils/crawl_scheduler.py
             timeout: Request timeout
             use_llm: Use LLM for enhanced extraction (default True)
             llm_provider: LLM provider - "gemini" (cheapest), "claude", "openai" (default "gemini")
@@ -195,6 +214,12 @@ class WebsiteCollector(BaseCollector):
         # Track captcha/anti-bot errors for reporting
         self._last_captcha_error: Optional[str] = None
 
+        # Pages downloaded by the current crawl, reused by later collect_multi_page
+        # stages (LLM extraction, homepage enrichment) instead of re-fetching
+        self._page_store = PageStore(WEBSITE_PAGE_STORE_MAX_BYTES)
+        # Parsed trees of recently seen pages, shared by the crawl loop and extractors
+        self._dom_cache = DomCache(WEBSITE_DOM_CACHE_MAX_PAGES)
+
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -338,10 +363,9 @@ class WebsiteCollector(BaseCollector):
         if self.logger:
             self.logger.debug(f"Fetching website: {url}")
 
-        self._rate_limit()
-
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
+            with self._host_slot(url):
+                response = get_session().get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
 
             if response.status_code != 200:
                 return FetchResult(
@@ -389,7 +413,7 @@ class WebsiteCollector(BaseCollector):
             return ParseResult(success=False, parsed_data=None, error="URL required for parsing")
 
         try:
-            soup = BeautifulSoup(raw_data, "html.parser")
+            soup = make_soup(raw_data, source="website")
 
             # Comprehensive extraction (same as old collect method)
             extracted_ein = self._extract_ein(soup)
@@ -434,28 +458,25 @@ class WebsiteCollector(BaseCollector):
     # Internal methods
     # ─────────────────────────────────────────────────────────────────────────────
 
-    def _run_async(self, coro):
+    def _run_async(self, coro, timeout: Optional[float] = None, on_timeout: Any = None):
         """
-        Safely run async coroutine, handling nested event loop scenarios.
+        Run a coroutine on the shared crawl loop (src/utils/async_loop.py) and wait for it.
 
-        Fixes C-002: asyncio.run() crashes if already in an async context
-        (e.g., Jupyter notebooks, nested async calls).
+        Works the same from plain threads and from code already inside an event
+        loop (C-002). The coroutines bound their own time with asyncio.wait_for;
+        timeout is a backstop after which the coroutine is cancelled and
+        on_timeout returned.
         """
         try:
-            asyncio.get_running_loop()
-            # Already in an async context - run in thread pool to avoid blocking
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, coro)
-                return future.result()
-        except RuntimeError:
-            # No running loop, safe to use asyncio.run()
-            return asyncio.run(coro)
+            return get_crawl_loop().run(coro, timeout=timeout)
+        except TimeoutError:
+            if self.logger:
+                self.logger.warning(f"Async crawl cancelled after {timeout}s")
+            return on_timeout
 
-    def _rate_limit(self):
-        """Enforce rate limiting (global, thread-safe)."""
-        global_rate_limiter.wait("website", self.rate_limit_delay)
+    def _host_slot(self, url: str):
+        """Per-host politeness gate for one request (see src/utils/crawl_scheduler.py)."""
+        return crawl_scheduler.slot(url, robots=self.robots_checker)
 
     def _is_bot_challenge_html(self, html: str) -> bool:
         """Detect anti-bot challenge pages that are sometimes returned with HTTP 200."""
@@ -477,6 +498,26 @@ class WebsiteCollector(BaseCollector):
 
         return False
 
+    def _remember_page(self, url: str, html: str, final_url: Optional[str]) -> None:
+        """Keep a crawled page for later stages of the current crawl."""
+        self._page_store.put(self._normalize_url(url), html, final_url)
+
+    def _fetch_crawled_page(self, url: str) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+        """
+        Get a page from the current crawl's page store, fetching it only on a miss.
+
+        Returns:
+            Same tuple as _fetch_url: (success, html, final_url, error)
+        """
+        stored = self._page_store.get(self._normalize_url(url))
+        if stored is not None:
+            html, final_url = stored
+            return True, html, final_url, None
+        success, html, final_url, error = self._fetch_url(url)
+        if success and html:
+            self._remember_page(url, html, final_url)
+        return success, html, final_url, error
+
     def _fetch_url(
         self, url: str, force: bool = False, _recursion_depth: int = 0
     ) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
@@ -499,9 +540,6 @@ class WebsiteCollector(BaseCollector):
             Tuple of (success, html_content, final_url, error_message)
             final_url is the URL after redirects
         """
-        # Prevent infinite recursion (C-010 fix)
-        if _recursion_depth > 1:
-            return False, None, None, "Max recursion depth reached in _fetch_url"
         # Check if we should refetch (based on age, schema version, etc.)
         if not force:
             should_fetch, reason = self.cache.should_refetch(url, force=False)
@@ -517,6 +555,22 @@ class WebsiteCollector(BaseCollector):
                             self.logger.debug(f"Cache hit ({reason}): {url}")
                         return True, cached["html"], cached["final_url"], None
 
+        return self._fetch_url_uncached(url, force, _recursion_depth)
+
+    def _fetch_url_uncached(
+        self, url: str, force: bool, _recursion_depth: int
+    ) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+        """
+        Network half of _fetch_url.
+
+        Each HTTP attempt takes the host's crawl slot (and its politeness token)
+        on its own; the slot is released before any backoff sleep or retry, so
+        one host's curl_cffi profile loop doesn't pin a slot other fetches need.
+        """
+        # Prevent infinite recursion (C-010 fix)
+        if _recursion_depth > 1:
+            return False, None, None, "Max recursion depth reached in _fetch_url"
+
         # Get stored HTTP headers for conditional request
         cached_headers = self.cache.get_http_headers(url)
 
@@ -537,7 +591,8 @@ class WebsiteCollector(BaseCollector):
             profile = self.cloudflare_domains[domain]
             try:
                 # Don't pass custom headers - let curl_cffi use browser's exact headers
-                response = curl_requests.get(url, timeout=self.timeout, impersonate=profile)
+                with self._host_slot(url):
+                    response = curl_requests.get(url, timeout=self.timeout, impersonate=profile)
 
                 if response.status_code == 200:
                     if self._is_bot_challenge_html(response.text):
@@ -566,7 +621,8 @@ class WebsiteCollector(BaseCollector):
 
         # Try regular requests first
         try:
-            response = requests.get(url, headers=request_headers, timeout=self.timeout, allow_redirects=True)
+            with self._host_slot(url):
+                response = get_session().get(url, headers=request_headers, timeout=self.timeout, allow_redirects=True)
 
             if response.status_code == 200:
                 if self._is_bot_challenge_html(response.text):
@@ -596,7 +652,7 @@ class WebsiteCollector(BaseCollector):
                     return True, cached["html"], cached["final_url"], None
                 else:
                     # No cache but got 304, fetch fresh (with recursion limit)
-                    return self._fetch_url(url, force=True, _recursion_depth=_recursion_depth + 1)
+                    return self._fetch_url_uncached(url, force=True, _recursion_depth=_recursion_depth + 1)
             elif response.status_code in (403, 202, 503) and HAS_CURL_CFFI:
                 # Bot protection detected (403 = blocked, 202 = JS challenge pending, 503 = challenge page)
                 # Try curl_cffi with multiple browser profiles
@@ -615,7 +671,8 @@ class WebsiteCollector(BaseCollector):
                         self.logger.debug(f"Attempting {profile} for {url}")
                     try:
                         # Don't pass custom headers - let curl_cffi use browser's exact headers
-                        response = curl_requests.get(url, timeout=self.timeout, impersonate=profile)
+                        with self._host_slot(url):
+                            response = curl_requests.get(url, timeout=self.timeout, impersonate=profile)
 
                         if self.logger:
                             self.logger.debug(f"{profile} got status code: {response.status_code}")
@@ -653,6 +710,8 @@ class WebsiteCollector(BaseCollector):
                     self.logger.debug(f"All {len(profiles_to_try)} profiles failed for {url}")
                 return False, None, None, f"HTTP {original_status} (even with curl_cffi)"
             else:
+                if response.status_code == 429:
+                    crawl_scheduler.report_rate_limited(url, response.headers.get("Retry-After"))
                 return False, None, None, f"HTTP {response.status_code}"
 
         except requests.Timeout:
@@ -919,16 +978,14 @@ class WebsiteCollector(BaseCollector):
             if self.logger:
                 self.logger.debug(f"Crawling [{i}/{len(urls)}]: {url}")
 
-            # Rate limit
-            self._rate_limit()
-
-            # Fetch page
+            # Fetch page (politeness wait happens inside, only on a cache miss)
             success, html, final_url, error = self._fetch_url(url)
 
             if not success:
                 if self.logger:
                     self.logger.warning(f"Failed to fetch {url}: {error}")
                 continue
+            self._remember_page(url, html, final_url)
 
             try:
                 # Extract data from this page using smart extractors
@@ -988,8 +1045,21 @@ class WebsiteCollector(BaseCollector):
 
     @staticmethod
     def _per_domain_semaphores(limit: int = PER_DOMAIN_CONCURRENCY):
-        """Return a getter mapping URL -> per-domain asyncio.Semaphore (politeness, H5)."""
-        sems: Dict[str, asyncio.Semaphore] = {}
+        """
+        Return a getter mapping URL -> per-domain asyncio.Semaphore (politeness, H5).
+
+        Semaphores are kept per event loop; crawls all run on the shared crawl
+        loop, so the limit holds across charities, not just within one crawl.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            sems: Dict[str, asyncio.Semaphore] = {}
+        else:
+            with _domain_semaphores_lock:
+                sems = _domain_semaphores.setdefault(loop, {}).setdefault(limit, {})
 
         def get_sem(url: str) -> asyncio.Semaphore:
             domain = urlparse(url).netloc.lower()
@@ -1018,8 +1088,8 @@ class WebsiteCollector(BaseCollector):
         """
         async with semaphore:
             try:
-                # Check cache first (sync operation but fast)
-                cached = self.cache.get_cached_html(url)
+                # Check cache first; the cache is sync disk I/O, keep it off the shared crawl loop
+                cached = await asyncio.to_thread(self.cache.get_cached_html, url)
                 if cached:
                     if self._is_bot_challenge_html(cached.get("html", "")):
                         if self.logger:
@@ -1033,24 +1103,27 @@ class WebsiteCollector(BaseCollector):
                     return url, False, None, None, "robots.txt disallowed"
                 await asyncio.sleep(random.uniform(*CRAWL_JITTER_RANGE_SECONDS))
 
-                response = await client.get(
-                    url,
-                    follow_redirects=True,
-                    timeout=15.0,
-                )
+                async with crawl_scheduler.slot_async(url, robots=self.robots_checker):
+                    response = await client.get(
+                        url,
+                        headers=self.headers,
+                        follow_redirects=True,
+                        timeout=15.0,
+                    )
 
                 if response.status_code == 200:
                     if self._is_bot_challenge_html(response.text):
                         return url, False, None, None, "CAPTCHA_BLOCKED: challenge page (HTTP 200)"
                     html = response.text
                     final_url = str(response.url)
-                    # Cache the result (sync but fast)
-                    self.cache.cache_html(url, html, final_url, "", "")
+                    await asyncio.to_thread(self.cache.cache_html, url, html, final_url, "", "")
                     return url, True, html, final_url, None
                 else:
                     # Detect captcha/anti-bot blocking
                     error_msg = f"HTTP {response.status_code}"
                     is_captcha = False
+                    if response.status_code == 429:
+                        crawl_scheduler.report_rate_limited(url, response.headers.get("Retry-After"))
                     if response.status_code in (202, 403, 429, 503):
                         # Treat these statuses as potential anti-bot blocks and try curl_cffi fallback.
                         is_captcha = True
@@ -1180,31 +1253,30 @@ class WebsiteCollector(BaseCollector):
         get_sem = self._per_domain_semaphores()
         results: Dict[str, Tuple[bool, Optional[str], Optional[str], Optional[str]]] = {}
 
-        async with httpx.AsyncClient(
-            headers=self.headers,
-            follow_redirects=True,
-            timeout=httpx.Timeout(15.0, connect=10.0),
-        ) as client:
-            tasks = [self._fetch_url_async(client, url, get_sem(url)) for url in urls]
+        # Pooled client shared by every BFS level and by content scoring (keep-alive)
+        client = get_async_client()
+        tasks = [self._fetch_url_async(client, url, get_sem(url)) for url in urls]
 
-            # Use asyncio.wait_for for overall timeout
-            try:
-                completed = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=timeout_total,
-                )
+        # Use asyncio.wait_for for overall timeout
+        try:
+            completed = await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True),
+                timeout=timeout_total,
+            )
 
-                for result in completed:
-                    if isinstance(result, Exception):
-                        continue
-                    url, success, html, final_url, error = result
-                    results[url] = (success, html, final_url, error)
+            for result in completed:
+                if isinstance(result, Exception):
+                    continue
+                url, success, html, final_url, error = result
+                results[url] = (success, html, final_url, error)
+                if success and html:
+                    self._remember_page(url, html, final_url)
 
-            except asyncio.TimeoutError:
-                if self.logger:
-                    self.logger.warning(
-                        f"Async crawl timeout after {timeout_total}s, got {len(results)}/{len(urls)} pages"
-                    )
+        except asyncio.TimeoutError:
+            if self.logger:
+                self.logger.warning(
+                    f"Async crawl timeout after {timeout_total}s, got {len(results)}/{len(urls)} pages"
+                )
 
         return results
 
@@ -1232,23 +1304,24 @@ class WebsiteCollector(BaseCollector):
             async with get_sem(str(page_score.url)):
                 try:
                     # Check cache first
-                    cached = self.cache.get_cached_html(str(page_score.url))
+                    cached = await asyncio.to_thread(self.cache.get_cached_html, str(page_score.url))
                     if cached:
                         html = cached["html"]
                     else:
                         await asyncio.sleep(random.uniform(*CRAWL_JITTER_RANGE_SECONDS))
-                        async with httpx.AsyncClient(
+                        response = await get_async_client().get(
+                            str(page_score.url),
                             headers=self.headers,
-                            follow_redirects=True,
                             timeout=httpx.Timeout(10.0, connect=5.0),
-                        ) as client:
-                            response = await client.get(str(page_score.url))
-                            if response.status_code == 200:
-                                html = response.text
-                                # Cache it
-                                self.cache.cache_html(str(page_score.url), html, str(response.url), "", "")
-                            else:
-                                return page_score  # Keep original score
+                        )
+                        if response.status_code == 200:
+                            html = response.text
+                            # Cache it
+                            await asyncio.to_thread(
+                                self.cache.cache_html, str(page_score.url), html, str(response.url), "", ""
+                            )
+                        else:
+                            return page_score  # Keep original score
 
                     # Apply content boost
                     boosted = self.page_classifier.apply_content_boost(page_score, html)
@@ -1297,7 +1370,11 @@ class WebsiteCollector(BaseCollector):
             self.logger.info(f"Async content scoring: {len(candidates)} pages (max 15 concurrent)")
 
         start = time.time()
-        results = self._run_async(self._score_content_async(candidates, timeout_total))
+        results = self._run_async(
+            self._score_content_async(candidates, timeout_total),
+            timeout=timeout_total + ASYNC_CRAWL_TIMEOUT_GRACE_SECONDS,
+            on_timeout=candidates,
+        )
 
         if self.logger:
             elapsed = time.time() - start
@@ -1326,7 +1403,11 @@ class WebsiteCollector(BaseCollector):
             self.logger.info(f"Async crawling {len(urls)} URLs (max 10 concurrent)")
 
         # Run async crawl
-        fetch_results = self._run_async(self._crawl_urls_async(urls, max_concurrent=10, timeout_total=timeout_total))
+        fetch_results = self._run_async(
+            self._crawl_urls_async(urls, max_concurrent=10, timeout_total=timeout_total),
+            timeout=timeout_total + ASYNC_CRAWL_TIMEOUT_GRACE_SECONDS,
+            on_timeout={},
+        )
 
         fetch_time = time.time() - start_time
         if self.logger:
@@ -1414,9 +1495,6 @@ class WebsiteCollector(BaseCollector):
             if self.logger:
                 self.logger.debug(f"Crawling [{len(visited)}/{max_pages}] depth={depth}: {current_url}")
 
-            # Rate limit
-            self._rate_limit()
-
             # Fetch page (with curl_cffi fallback for Cloudflare)
             success, html, final_url, error = self._fetch_url(current_url)
 
@@ -1424,9 +1502,10 @@ class WebsiteCollector(BaseCollector):
                 if self.logger:
                     self.logger.warning(f"Failed to fetch {current_url}: {error}")
                 continue
+            self._remember_page(current_url, html, final_url)
 
             try:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = self._dom_cache.soup(html)
 
                 # Extract data from this page using smart extractors (004-smart-crawler)
                 # Use LLM only for high-value pages (T059)
@@ -1563,72 +1642,93 @@ class WebsiteCollector(BaseCollector):
             remaining_time = max(10, timeout_total - int(time.time() - start_time))
             fetch_results = await self._crawl_urls_async(url_list, max_concurrent=10, timeout_total=remaining_time)
 
-            # Process fetched pages and collect links for next level
-            next_level: List[Tuple[str, int]] = []
+            # Page extraction (parsing, possibly LLM calls) is blocking work; keep it
+            # off the shared crawl loop so other charities' fetches keep moving.
+            next_level = await asyncio.to_thread(
+                self._process_bfs_level, urls_to_fetch, fetch_results, results, visited, max_depth
+            )
+
+            # Move to next level
+            current_level = next_level
 
-            for url, depth in urls_to_fetch:
-                if url not in fetch_results:
-                    continue
+        if self.logger:
+            elapsed = time.time() - start_time
+            self.logger.debug(
+                f"Async BFS complete: visited {len(visited)} pages, found data on {len(results)} in {elapsed:.1f}s"
+            )
 
-                success, html, final_url, error = fetch_results[url]
-                if not success or not html:
-                    if self.logger and error:
-                        self.logger.debug(f"Failed to fetch {url}: {error}")
-                    # Track captcha errors for reporting
-                    if error and "CAPTCHA_BLOCKED" in error and not self._last_captcha_error:
-                        self._last_captcha_error = error
-                    continue
+        return results
 
-                try:
-                    soup = BeautifulSoup(html, "html.parser")
+    def _process_bfs_level(
+        self,
+        urls_to_fetch: List[Tuple[str, int]],
+        fetch_results: Dict[str, Tuple[bool, Optional[str], Optional[str], Optional[str]]],
+        results: Dict[str, Dict[str, Any]],
+        visited: Set[str],
+        max_depth: int,
+    ) -> List[Tuple[str, int]]:
+        """
+        Extract data from one fetched BFS level into results.
 
-                    # Extract data - use LLM only for first few pages or zakat pages
-                    is_zakat_page = any(kw in url.lower() for kw in ["zakat", "zakaat", "zakah"])
-                    use_llm_for_page = self.use_llm and (len(results) < 5 or is_zakat_page)
-                    page_data = self._extract_page_data(html, final_url or url, use_llm=use_llm_for_page)
+        Returns:
+            (url, depth) links for the next level
+        """
+        next_level: List[Tuple[str, int]] = []
 
-                    extraction_methods = ["deterministic", "async"]
-                    if use_llm_for_page:
-                        extraction_methods.append("llm")
+        for url, depth in urls_to_fetch:
+            if url not in fetch_results:
+                continue
 
-                    # Update cache
-                    had_data = page_data.get("had_data", False)
-                    failure_reason = page_data.get("extraction_failure_reason")
-                    self.cache.update_had_data(
-                        url,
-                        had_data,
-                        extraction_methods,
-                        js_rendering_needed=page_data.get("js_rendering_needed", False),
-                        extraction_failure_reason=failure_reason,
-                    )
+            success, html, final_url, error = fetch_results[url]
+            if not success or not html:
+                if self.logger and error:
+                    self.logger.debug(f"Failed to fetch {url}: {error}")
+                # Track captcha errors for reporting
+                if error and "CAPTCHA_BLOCKED" in error and not self._last_captcha_error:
+                    self._last_captcha_error = error
+                continue
 
-                    # Store results
-                    if any(v for v in page_data.values() if v):
-                        results[url] = page_data
+            try:
+                soup = self._dom_cache.soup(html)
 
-                    # Extract links for next level (if not at max depth)
-                    if depth < max_depth:
-                        links = self._extract_links(soup, final_url or url)
-                        for link in links:
-                            if link not in visited:
-                                next_level.append((link, depth + 1))
+                # Extract data - use LLM only for first few pages or zakat pages
+                is_zakat_page = any(kw in url.lower() for kw in ["zakat", "zakaat", "zakah"])
+                use_llm_for_page = self.use_llm and (len(results) < 5 or is_zakat_page)
+                page_data = self._extract_page_data(html, final_url or url, use_llm=use_llm_for_page)
 
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Error processing {url}: {str(e)}")
-                    self.cache.update_had_data(url, False, ["deterministic", "async"])
-                    continue
+                extraction_methods = ["deterministic", "async"]
+                if use_llm_for_page:
+                    extraction_methods.append("llm")
 
-            # Move to next level
-            current_level = next_level
+                # Update cache
+                had_data = page_data.get("had_data", False)
+                failure_reason = page_data.get("extraction_failure_reason")
+                self.cache.update_had_data(
+                    url,
+                    had_data,
+                    extraction_methods,
+                    js_rendering_needed=page_data.get("js_rendering_needed", False),
+                    extraction_failure_reason=failure_reason,
+                )
 
-        if self.logger:
-            elapsed = time.time() - start_time
-            self.logger.debug(
-                f"Async BFS complete: visited {len(visited)} pages, found data on {len(results)} in {elapsed:.1f}s"
-            )
+                # Store results
+                if any(v for v in page_data.values() if v):
+                    results[url] = page_data
 
-        return results
+                # Extract links for next level (if not at max depth)
+                if depth < max_depth:
+                    links = self._extract_links(soup, final_url or url)
+                    for link in links:
+                        if link not in visited:
+                            next_level.append((link, depth + 1))
+
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error processing {url}: {str(e)}")
+                self.cache.update_had_data(url, False, ["deterministic", "async"])
+                continue
+
+        return next_level
 
     def _crawl_with_bfs_async(
         self, start_url: str, max_depth: int, max_pages: int, timeout_total: int
@@ -1647,7 +1747,11 @@ class WebsiteCollector(BaseCollector):
         Returns:
             Dictionary mapping URL -> extracted data
         """
-        return self._run_async(self._crawl_bfs_async(start_url, max_depth, max_pages, timeout_total))
+        return self._run_async(
+            self._crawl_bfs_async(start_url, max_depth, max_pages, timeout_total),
+            timeout=timeout_total + ASYNC_CRAWL_TIMEOUT_GRACE_SECONDS,
+            on_timeout={},
+        )
 
     def _merge_llm_data(self, regex_data: Dict[str, Any], llm_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2144,7 +2248,7 @@ class WebsiteCollector(BaseCollector):
             # For Form 990 PDFs, try deterministic parser first (bullet-proof, no LLM cost)
             if doc_type == "form_990":
                 try:
-                    form_data = form_990_parser.parse_pdf(pdf_path)
+                    form_data = form_990_parser.parse_pdf(pdf_path, file_hash=pdf_info.get("file_hash"))
                     if form_data and form_data.program_expense_ratio:
                         # Successfully extracted expense data - build result dict
                         result = {
@@ -2175,7 +2279,7 @@ class WebsiteCollector(BaseCollector):
                     # Fall through to LLM extraction
 
             # Use LLM extraction (for non-990s or when Form990Parser fails)
-            report_data, cost = self.annual_report_parser.parse_pdf(pdf_path)
+            report_data, cost = self.annual_report_parser.parse_pdf(pdf_path, file_hash=pdf_info.get("file_hash"))
 
             if not report_data:
                 return (None, cost, pdf_info)
@@ -2307,8 +2411,10 @@ class WebsiteCollector(BaseCollector):
         if self.logger:
             self.logger.debug(f"Starting multi-page crawl: {url}")
 
-        # Reset captcha error tracking for this crawl
+        # Reset captcha error tracking, the page store and parsed pages for this crawl
         self._last_captcha_error = None
+        self._page_store = PageStore(WEBSITE_PAGE_STORE_MAX_BYTES)
+        self._dom_cache = DomCache(WEBSITE_DOM_CACHE_MAX_PAGES)
 
         # Timing trackers
         timing = {
@@ -2331,6 +2437,7 @@ class WebsiteCollector(BaseCollector):
             sitemap_start = time.time()
             sitemap_success, sitemap_urls = self._discover_urls_from_sitemap(url, max_pages=CRAWLER_CONFIG["max_pages"])
             timing["sitemap_discovery"] = round(time.time() - sitemap_start, 1)
+            record_span("crawl", "sitemap_discovery", sitemap_start, urls=len(sitemap_urls or []))
             if sitemap_success and sitemap_urls:
                 sitemap_used = True
                 target_urls = sitemap_urls
@@ -2358,6 +2465,7 @@ class WebsiteCollector(BaseCollector):
                     timeout_total=CRAWLER_CONFIG["timeout_total"],
                 )
             timing["page_crawling"] = round(time.time() - crawl_phase_start, 1)
+            record_span("crawl", "page_crawling", crawl_phase_start, pages=len(crawl_results or {}))
 
             if not crawl_results:
                 # Return specific captcha error if detected, otherwise generic message
@@ -2375,8 +2483,8 @@ class WebsiteCollector(BaseCollector):
                     # Collect HTML pages for LLM
                     pages_for_llm = []
                     for page_url, page_data in list(crawl_results.items())[:10]:  # Max 10 pages
-                        # Re-fetch to get HTML (crawl_results only has extracted data)
-                        success, html, final_url, error = self._fetch_url(page_url)
+                        # crawl_results only has extracted data; HTML comes from the page store
+                        success, html, final_url, error = self._fetch_crawled_page(page_url)
                         if success and html:
                             pages_for_llm.append((page_url, html))
 
@@ -2398,14 +2506,14 @@ class WebsiteCollector(BaseCollector):
                     if self.logger:
                         self.logger.warning(f"LLM extraction failed: {e}. Using regex-only data.")
             timing["llm_extraction"] = round(time.time() - llm_extraction_start, 1)
+            record_span("crawl", "llm_extraction", llm_extraction_start)
 
             # Step 3: Get homepage content for raw_html
             homepage_html = None
             try:
-                self._rate_limit()
-                success, homepage_html, final_url, error = self._fetch_url(url)
+                success, homepage_html, final_url, error = self._fetch_crawled_page(url)
                 if success and homepage_html:
-                    soup = BeautifulSoup(homepage_html, "html.parser")
+                    soup = self._dom_cache.soup(homepage_html)
 
                     # Extract additional fields from homepage (name, mission, programs)
                     # Only extract if not already populated by LLM
@@ -2443,6 +2551,7 @@ class WebsiteCollector(BaseCollector):
                     max_downloads=self.max_pdf_downloads,
                 )
                 timing["pdf_download"] = round(time.time() - pdf_download_start, 1)
+                record_span("crawl", "pdf_download", pdf_download_start, pdfs=pdfs_downloaded)
                 if self.logger and pdfs_downloaded > 0:
                     self.logger.info(f"Downloaded {pdfs_downloaded}/{pdf_count} priority PDFs")
 
@@ -2452,6 +2561,7 @@ class WebsiteCollector(BaseCollector):
                 if pdfs_downloaded > 0:
                     pdf_data_extracted, pdf_llm_cost = self._extract_pdf_data(pdf_documents)
                     timing["pdf_extraction"] = round(time.time() - pdf_extraction_start, 1)
+                    record_span("crawl", "pdf_extraction", pdf_extraction_start)
                     # Add PDF extraction cost to total
                     total_llm_cost += pdf_llm_cost
 
@@ -2590,6 +2700,8 @@ class WebsiteCollector(BaseCollector):
                     "sitemap_used": sitemap_used,  # T047
                     "pages_scored": pages_scored,  # T047
                     "pages_crawled": len(crawl_results),  # T063
+                    "page_store": self._page_store.get_stats(),  # Pages reused instead of re-fetched
+                    "dom_cache": self._dom_cache.get_stats(),  # Parsed trees shared across extractors
                     "pdfs_discovered": pdf_count,  # T076: Number of PDFs found
                     "pdfs_downloaded": pdfs_downloaded,  # T068-T074: Number of PDFs downloaded
                     "timing": timing,  # Latency breakdown for each step
@@ -2647,16 +2759,15 @@ class WebsiteCollector(BaseCollector):
         if self.logger:
             self.logger.debug(f"Fetching website: {url}")
 
-        self._rate_limit()
-
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
+            with self._host_slot(url):
+                response = get_session().get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
 
             if response.status_code != 200:
                 return False, None, f"HTTP {response.status_code}"
 
             html = response.text
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, source="website")
 
             # Comprehensive extraction
             extracted_ein = self._extract_ein(soup)
@@ -2726,8 +2837,11 @@ class WebsiteCollector(BaseCollector):
             Plus extraction_results array with provenance tracking
             Plus llm_data if use_llm=True
         """
+        # One parse of this page, shared with the crawl loop and PDF discovery
+        page = self._dom_cache.get(html)
+
         # T056: Extract structured data (JSON-LD, Open Graph, microdata)
-        structured_data = self.structured_extractor.extract(html, url)
+        structured_data = self.structured_extractor.extract(html, url, tree=page.tree)
 
         # Extract deterministic fields (regex-based)
         ein = self.deterministic_extractor.extract_ein(html)
@@ -2739,7 +2853,7 @@ class WebsiteCollector(BaseCollector):
         address = self._extract_address_from_structured_data(structured_data)
 
         # Extract tax deductible from text
-        soup = BeautifulSoup(html, "html.parser")
+        soup = page.soup
         tax_deductible = self._extract_tax_deductible(soup)
 
         # Build extraction results with provenance (T028)
@@ -2916,7 +3030,7 @@ class WebsiteCollector(BaseCollector):
         # T075: Discover PDF documents on this page
         pdf_links = []
         try:
-            pdf_links = self.pdf_downloader.identify_pdfs(html, url)
+            pdf_links = self.pdf_downloader.identify_pdfs(html, url, soup=soup)
             if pdf_links and self.logger:
                 self.logger.debug(f"Found {len(pdf_links)} PDF documents on {url}")
         except Exception as e:
@@ -15,9 +15,34 @@ WRITE_QUEUE_INITIAL_BACKOFF_SECONDS = 0.5  # Initial backoff for retry logic
 SHUTDOWN_TIMEOUT_SECONDS = 10  # Thread shutdown timeout
 EXTENDED_SHUTDOWN_TIMEOUT_SECONDS = 5  # Extended shutdown timeout
 
+# LLM response cache (opt-in: --llm-cache / LLM_RESPONSE_CACHE=1)
+LLM_RESPONSE_CACHE_MAX_BYTES = 512 * 1024 * 1024  # LRU-evict above 512 MB of stored responses
+LLM_RESPONSE_CACHE_MAX_AGE_DAYS = 30  # Entries older than this are re-generated
+
+# Streamed LLM generation with early validation (opt-in: --llm-stream / LLM_STREAMING=1)
+LLM_STREAM_MAX_PREAMBLE_CHARS = 2000  # Cancel a JSON stream that has not opened its object by then
+
 # Network and Timeouts
 CONNECTION_TIMEOUT_SECONDS = 30  # Network connection timeout
 DEFAULT_REQUEST_TIMEOUT_SECONDS = 120  # Default HTTP request timeout
+HTTP_POOL_MAX_HOSTS = 50  # Per-host connection pools kept by the shared HTTP clients
+HTTP_POOL_PER_HOST = 20  # Max pooled connections per host (one per worker)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30  # Idle async connections are closed after this
+
+# Per-source request rate limits: (sustained requests/second, burst size).
+# Enforced by the shared token-bucket limiter in src/utils/rate_limiter.py; a
+# source missing here falls back to the collector's rate_limit_delay with no burst.
+# Charity websites are paced per host instead (WEBSITE_HOST_RATE_LIMIT below).
+SOURCE_RATE_LIMITS = {
+    "propublica": (0.5, 3),         # Shared by propublica + form990_grants collectors
+    "charity_navigator": (1.0, 3),
+    "candid": (1.0, 3),
+    "bbb": (0.5, 2),
+    "gemini": (12.0, 12),           # ~12 QPS quota for URL-scoring calls
+}
+RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS = 60  # Pause after a 429 that carries no Retry-After
+RATE_LIMIT_MIN_RATE_FACTOR = 0.125  # 429s halve the rate, down to 1/8 of the configured rate
+RATE_LIMIT_RECOVERY_SECONDS = 120  # Each 429-free interval this long doubles the rate back
 
 # Crawl Retry Configuration
 CRAWL_MAX_RETRIES = 3  # Maximum retries for failed source crawls
@@ -50,6 +75,19 @@ FAILURE_TTL_DAYS = 30
 # H5: Crawl politeness
 PER_DOMAIN_CONCURRENCY = 2  # Max simultaneous requests per website domain
 CRAWL_JITTER_RANGE_SECONDS = (0.5, 1.5)  # Random pre-request delay for uncached fetches
+ASYNC_CRAWL_TIMEOUT_GRACE_SECONDS = 30  # Backstop past a crawl's own timeout before the shared loop cancels it
+WEBSITE_HOST_RATE_LIMIT = (1.0, 3)  # (requests/second, burst) per registrable domain (src/utils/crawl_scheduler.py)
+WEBSITE_MAX_CRAWL_DELAY_SECONDS = 30.0  # robots.txt Crawl-delay is honoured up to this
+WEBSITE_MAX_CONCURRENT_REQUESTS = 32  # Website requests in flight across all hosts and workers
+WEBSITE_SLOT_POLL_SECONDS = 0.05  # How often async fetches re-check for a free request slot
+WEBSITE_PAGE_STORE_MAX_BYTES = 32 * 1024 * 1024  # Crawled HTML kept in memory per charity crawl
+WEBSITE_DOM_CACHE_MAX_PAGES = 8  # Parsed pages shared by the extractors of one crawl (see src/utils/html_parser.py)
+
+# PDF text extraction (pdfplumber) runs in its own process pool, see src/utils/pdf_text.py
+PDF_EXTRACTION_WORKERS = 2  # Worker processes (0 = extract inline on the calling thread)
+PDF_EXTRACTION_TIMEOUT_SECONDS = 60.0  # Per-document budget; remaining pages are skipped
+PDF_EXTRACTION_MAX_PAGES = 150  # Default pages read per document (callers may ask for more)
+FORM_990_MAX_PAGES = 1000  # Form 990s are read whole: Schedules O/I sit at the end of long returns
 
 # H5: Terminal failure classes — CAPTCHA walls and hard 404s don't heal in days.
 # Skip retries for TERMINAL_FAILURE_TTL_DAYS instead of the normal FAILURE_TTL_DAYS.
@@ -62,6 +100,31 @@ MIN_DATA_COMPLETENESS_THRESHOLD = 0.5  # Minimum 50% data completeness required
 # Database
 DEFAULT_TABLE_NAME_PATTERN = r"^[a-zA-Z_][a-zA-Z0-9_]*$"  # Valid table name regex
 
+# raw_scraped_data.raw_content compression (opt-in via RAW_CONTENT_COMPRESSION, see src/db/raw_codec.py)
+RAW_CONTENT_COMPRESSION_MIN_BYTES = 1024  # Smaller payloads are stored as plain text
+RAW_CONTENT_COMPRESSION_LEVELS = {"gzip": 9, "zstd": 19}
+
+# Search-grounded discovery services used by the streaming runner's discover phase
+DISCOVERY_MODEL = "gemini-2.5-flash"
+
+# Per-charity working set shared across streaming-runner phases (see src/db/working_set.py)
+WORKING_SET_MAX_BYTES = 64 * 1024 * 1024  # Rows cached per charity; a table past this is read through
+
+# Stage-decoupled streaming runner (--staged, see src/utils/stage_pipeline.py)
+STAGED_CRAWL_WORKERS = 40  # Charities crawling at once (network-bound; hosts are paced by crawl_scheduler)
+STAGED_CPU_WORKERS = 4  # Charities in extract/synthesize at once
+STAGED_LLM_WORKERS = 8  # Charities in an LLM stage at once, per model (one pool per model the stages call)
+STAGED_EXPORT_WORKERS = 4  # Charities exporting at once
+STAGED_QUEUE_SIZE = 8  # Charities waiting in front of each stage before upstream stages block
+
+# Distributed streaming runs (--queue, see src/db/work_queue.py)
+WORK_QUEUE_LEASE_SECONDS = 900  # A claimed charity is reclaimable this long after its runner's last heartbeat
+WORK_QUEUE_MAX_ATTEMPTS = 3  # Leases a charity may expire under before it is marked failed
+WORK_QUEUE_POLL_SECONDS = 15  # Idle runner re-checks for expired leases while other runners finish
+WORK_QUEUE_CALL_RETRIES = 6  # Tries per queue call (claim, complete, ...) across database errors
+WORK_QUEUE_RETRY_SECONDS = 1.0  # Base of the jittered exponential backoff between those tries
+WORK_QUEUE_RETRY_MAX_SECONDS = 30.0  # Longest single wait between tries
+
 # Quality Thresholds
 AUTO_APPROVE_SCORE_THRESHOLD = 85  # Min score for auto-approval
 AUTO_REJECT_SCORE_THRESHOLD = 60  # Max score for auto-rejection
@@ -24,6 +24,17 @@ from .repository import (
     PhaseCacheRepository,
     RawDataRepository,
 )
+from .work_queue import (
+    DoltWorkQueue,
+    Lease,
+    LeasedPhaseCache,
+    LeaseKeeper,
+    LeaseLostError,
+    LocalWorkQueue,
+    WorkQueue,
+    retry_call,
+)
+from .working_set import CharityWorkingSet
 
 __all__ = [
     # Client
@@ -53,4 +64,15 @@ __all__ = [
     "ExportExclusionRepository",
     "PhaseCacheRepository",
     "RawDataRepository",
+    # Per-charity read cache
+    "CharityWorkingSet",
+    # Distributed-run work queue
+    "WorkQueue",
+    "DoltWorkQueue",
+    "LocalWorkQueue",
+    "Lease",
+    "LeaseKeeper",
+    "LeaseLostError",
+    "LeasedPhaseCache",
+    "retry_call",
 ]
@@ -6,6 +6,7 @@ Dolt handles concurrency natively; versioning is via stored procedures.
 """
 
 import os
+import re
 import threading
 from contextlib import contextmanager
 from functools import lru_cache
@@ -14,7 +15,10 @@ from typing import Any, Generator
 import pymysql
 from pymysql.cursors import DictCursor
 
+from ..utils.tracing import trace_span
+
 _thread_local = threading.local()
+_TABLE_PATTERN = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE)\s+`?(\w+)", re.IGNORECASE)
 
 
 @lru_cache(maxsize=1)
@@ -102,6 +106,15 @@ def get_cursor(dictionary: bool = True) -> Generator[Any, None, None]:
             yield cursor
 
 
+@lru_cache(maxsize=512)
+def _statement_label(sql: str) -> str:
+    """Trace span name for a statement: verb plus first table, e.g. "SELECT charities"."""
+    words = sql.split(None, 1)
+    verb = words[0].upper() if words else "?"
+    table = _TABLE_PATTERN.search(sql)
+    return f"{verb} {table.group(1)}" if table else verb
+
+
 def execute_query(sql: str, params: tuple | None = None, fetch: str = "all") -> list[dict] | dict | None:
     """Execute a query and return results.
 
@@ -123,7 +136,7 @@ def execute_query(sql: str, params: tuple | None = None, fetch: str = "all") ->
         # No fetch (INSERT/UPDATE)
         execute_query("UPDATE charities SET name = %s WHERE ein = %s", (name, ein), fetch="none")
     """
-    with get_cursor() as cursor:
+    with trace_span("db", _statement_label(sql)), get_cursor() as cursor:
         cursor.execute(sql, params or ())
 
         if fetch == "all":
@@ -149,11 +162,26 @@ def execute_many(sql: str, params_list: list[tuple]) -> int:
             [("12-3456789", "Charity A"), ("98-7654321", "Charity B")]
         )
     """
-    with get_cursor() as cursor:
+    with trace_span("db", _statement_label(sql), rows=len(params_list)), get_cursor() as cursor:
         cursor.executemany(sql, params_list)
         return cursor.rowcount
 
 
+def execute_update(sql: str, params: tuple | None = None) -> int:
+    """Execute an INSERT/UPDATE/DELETE and return the number of rows it changed.
+
+    For conditional writes whose outcome matters (e.g. claiming a row with
+    UPDATE ... WHERE state = 'pending'): 0 means another writer got there first.
+
+    Example:
+        if execute_update("UPDATE work_queue SET state = 'done' WHERE lease_token = %s", (token,)) != 1:
+            ...  # lease was lost
+    """
+    with trace_span("db", _statement_label(sql)), get_cursor() as cursor:
+        cursor.execute(sql, params or ())
+        return cursor.rowcount
+
+
 def check_connection() -> bool:
     """Test database connectivity.
 
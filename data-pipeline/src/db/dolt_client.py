@@ -24,6 +24,12 @@ VALID_TABLES = frozenset({
     "judge_verdicts", "export_exclusions",
 })
 
+# Operational state that lives in the database but is never versioned: the
+# distributed-run lease queue (src/db/work_queue.py) changes on every claim
+# and heartbeat. commit() never stages these and they don't make the working
+# set dirty for head_commit_if_clean().
+UNVERSIONED_TABLES = frozenset({"work_queue", "work_queue_runs"})
+
 # Which tables each pipeline phase writes — the explicit DOLT_ADD list.
 # Keep in sync with the phase scripts; commit() warns when a modified
 # table was left unstaged (i.e., this map has a gap). Phases that track
@@ -152,7 +158,8 @@ class DoltVersionControl:
         """
         with get_cursor() as cursor:
             cursor.execute("SELECT * FROM dolt_status")
-            status = cursor.fetchall()
+            rows = cursor.fetchall()
+            status = [row for row in rows if row["table_name"] not in UNVERSIONED_TABLES]
             if not status:
                 return None  # No changes to commit
 
@@ -168,7 +175,7 @@ class DoltVersionControl:
                     cursor.execute("CALL DOLT_ADD(%s)", (table,))
                 # Guard: surface writes outside this phase's add-list.
                 cursor.execute("SELECT table_name FROM dolt_status WHERE staged = 0")
-                unstaged = sorted({row["table_name"] for row in cursor.fetchall()})
+                unstaged = sorted({row["table_name"] for row in cursor.fetchall()} - UNVERSIONED_TABLES)
                 if unstaged:
                     print(f"⚠ dolt.commit: modified but not staged (not in this phase's add-list): {unstaged}")
                 cursor.execute("SELECT COUNT(*) AS n FROM dolt_status WHERE staged = 1")
@@ -177,6 +184,8 @@ class DoltVersionControl:
                     return None  # Nothing staged for these tables
             elif add_all:
                 cursor.execute("CALL DOLT_ADD('-A')")
+                for table in sorted({row["table_name"] for row in rows} & UNVERSIONED_TABLES):
+                    cursor.execute("CALL DOLT_RESET(%s)", (table,))
 
             cursor.execute(
                 "CALL DOLT_COMMIT('--author', %s, '-m', %s)",
@@ -379,9 +388,10 @@ class DoltVersionControl:
         row = execute_query("SELECT COUNT(*) AS n FROM dolt_status", fetch="one")
         if row and row["n"]:
             dirty = execute_query("SELECT DISTINCT table_name FROM dolt_status") or []
-            tables = sorted({r["table_name"] for r in dirty})
-            print(f"⚠ dolt working set dirty ({tables}); stamping source_commit=NULL")
-            return None
+            tables = sorted({r["table_name"] for r in dirty} - UNVERSIONED_TABLES)
+            if tables:
+                print(f"⚠ dolt working set dirty ({tables}); stamping source_commit=NULL")
+                return None
         row = execute_query("SELECT HASHOF(active_branch()) AS commit_hash", fetch="one")
         return row["commit_hash"] if row else None
 
@@ -0,0 +1,113 @@
+"""Compression codec for raw_scraped_data.raw_content.
+
+raw_content holds full website HTML and concatenated 990 XML filings, which
+every Dolt commit and clone carries. When RAW_CONTENT_COMPRESSION is set,
+RawDataRepository compresses the text on write and decodes it on read, so
+callers always see plain text.
+
+The column stays LONGTEXT: an encoded value is a marker, the codec name and
+base64 of the compressed bytes ("\\x1fgzip:H4sI..."). Plain rows written
+before compression was enabled are returned unchanged, so old and new rows
+can coexist and the codec can be switched on (or off) at any time.
+
+RAW_CONTENT_COMPRESSION values:
+  - none (default): store plain text
+  - gzip: stdlib gzip
+  - zstd: zstandard if installed, otherwise gzip
+  - auto: zstd when available, else gzip
+"""
+
+import base64
+import gzip
+import os
+
+from ..constants import RAW_CONTENT_COMPRESSION_LEVELS, RAW_CONTENT_COMPRESSION_MIN_BYTES
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+CODECS = ("gzip", "zstd")
+_MARKER = "\x1f"
+
+
+def configured_codec() -> str | None:
+    """Codec selected by RAW_CONTENT_COMPRESSION, or None for plain text."""
+    name = os.environ.get("RAW_CONTENT_COMPRESSION", "none").strip().lower()
+    if name in ("", "none", "off"):
+        return None
+    if name == "auto":
+        return "zstd" if HAS_ZSTD else "gzip"
+    if name not in CODECS:
+        raise ValueError(f"Unknown RAW_CONTENT_COMPRESSION codec: {name}")
+    if name == "zstd" and not HAS_ZSTD:
+        return "gzip"
+    return name
+
+
+def is_encoded(value: str | None) -> bool:
+    """True if value was produced by encode_raw_content with a codec."""
+    return isinstance(value, str) and value.startswith(_MARKER) and value.find(":", 1) > 1
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    level = RAW_CONTENT_COMPRESSION_LEVELS[codec]
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if not HAS_ZSTD:
+            raise RuntimeError("raw_content is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "gzip":
+        return gzip.decompress(data)
+    raise ValueError(f"Unknown raw_content codec: {codec}")
+
+
+def encode_raw_content(text: str | None, codec: str | None = "configured") -> str | None:
+    """Compress text for storage.
+
+    Args:
+        text: Plain raw content
+        codec: "gzip", "zstd", None for no compression, or "configured" to
+            use RAW_CONTENT_COMPRESSION
+
+    Returns:
+        Encoded string, or text unchanged if compression is off, the text is
+        small, or compressing wouldn't make it smaller
+    """
+    if codec == "configured":
+        codec = configured_codec()
+    if not text or codec is None or is_encoded(text):
+        return text
+    if codec == "zstd" and not HAS_ZSTD:
+        codec = "gzip"
+    raw = text.encode("utf-8")
+    if len(raw) < RAW_CONTENT_COMPRESSION_MIN_BYTES:
+        return text
+
+    encoded = f"{_MARKER}{codec}:{base64.b64encode(_compress(raw, codec)).decode('ascii')}"
+    return encoded if len(encoded) < len(raw) else text
+
+
+def decode_raw_content(value: str | bytes | None) -> str | None:
+    """Return plain text for a stored raw_content value (encoded or not)."""
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    if not is_encoded(value):
+        return value
+    codec, _, payload = value[1:].partition(":")
+    return _decompress(base64.b64decode(payload), codec).decode("utf-8")
+
+
+def stored_codec(value: str | None) -> str | None:
+    """Codec a stored value was encoded with, or None for plain text."""
+    if not is_encoded(value):
+        return None
+    return value[1:].partition(":")[0]
@@ -9,9 +9,10 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from .client import execute_query
+from .client import execute_many, execute_query
+from .raw_codec import decode_raw_content, encode_raw_content, stored_codec
 
 
 def _json_default(obj: Any) -> Any:
@@ -46,6 +47,16 @@ def _generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
+# Max EINs per `IN (...)` list for bulk reads
+BULK_READ_CHUNK_SIZE = 500
+
+
+def _chunked(items: list, size: int = BULK_READ_CHUNK_SIZE) -> Iterable[list]:
+    """Yield successive chunks of items."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
 @dataclass
 class Charity:
     """Charity record."""
@@ -216,6 +227,16 @@ class CharityRepository:
             fetch="one",
         )
 
+    def get_many(self, eins: list[str]) -> dict[str, dict]:
+        """Get charities for many EINs in chunked queries, keyed by EIN."""
+        result: dict[str, dict] = {}
+        for chunk in _chunked(list(dict.fromkeys(eins))):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            rows = execute_query(f"SELECT * FROM charities WHERE ein IN ({placeholders})", tuple(chunk)) or []
+            for row in rows:
+                result[row["ein"]] = row
+        return result
+
     def get_all(self, eins: list[str] | None = None) -> list[dict]:
         """Get all charities, optionally filtered by EINs."""
         if eins:
@@ -239,12 +260,65 @@ class CharityRepository:
         return result is not None
 
 
+class RawDataRow(dict):
+    """A raw_scraped_data row whose raw_content blob is fetched on first access.
+
+    Reads skip raw_content by default (it can be multi-MB of HTML/XML).
+    row["raw_content"] and row.get("raw_content") still work: the blob is
+    loaded with one extra query the first time either is used.
+    """
+
+    def __init__(self, row: dict, loader: Callable[[], str | None]):
+        super().__init__(row)
+        self._loader = loader
+
+    def _load_raw_content(self) -> str | None:
+        value = self._loader()
+        self["raw_content"] = value
+        return value
+
+    def __missing__(self, key: str) -> Any:
+        if key == "raw_content":
+            return self._load_raw_content()
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "raw_content" and key not in self:
+            value = self._load_raw_content()
+            return default if value is None else value
+        return super().get(key, default)
+
+
 class RawDataRepository:
-    """Raw scraped data operations."""
+    """Raw scraped data operations.
+
+    Reads never transfer raw_content unless include_raw_content=True; rows
+    come back as RawDataRow, which fetches the blob lazily if a caller
+    touches it. Pass columns=(...) to project further (charity_ein and
+    source are always included).
+
+    raw_content is compressed on write when RAW_CONTENT_COMPRESSION is set
+    and always decoded on read (see raw_codec).
+    """
 
     # JSON columns that need serialization
     JSON_COLUMNS = {"parsed_json"}
 
+    # All columns; everything but raw_content is cheap to read
+    COLUMNS = (
+        "id",
+        "charity_ein",
+        "source",
+        "raw_content",
+        "parsed_json",
+        "scraped_at",
+        "success",
+        "error_message",
+        "retry_count",
+        "last_failure_reason",
+    )
+    METADATA_COLUMNS = tuple(c for c in COLUMNS if c != "raw_content")
+
     def upsert(
         self,
         charity_ein: str,
@@ -255,14 +329,19 @@ class RawDataRepository:
         raw_content: str | None = None,
         reset_retry: bool = True,
     ) -> None:
-        """Insert or update raw data for a source.
+        """Insert or update raw data for a source in one statement.
 
         Failure writes (success=False) never overwrite parsed_json or
         raw_content of a previously successful row: the failure is recorded
         via success/error_message/last_failure_reason/retry_count while the
         last-good content is preserved (C1 data-safety fix).
+
+        The guard and the retry_count arithmetic run inside the
+        ON DUPLICATE KEY UPDATE, so concurrent workers can't race between a
+        read and the write.
         """
         data = {
+            "id": _generate_uuid(),
             "charity_ein": charity_ein,
             "source": source,
             "parsed_json": _serialize_json(parsed_json),
@@ -270,66 +349,56 @@ class RawDataRepository:
             "error_message": error_message,
         }
         if raw_content:
-            data["raw_content"] = raw_content
+            data["raw_content"] = encode_raw_content(raw_content)
         if success and reset_retry:
             data["retry_count"] = 0
         if not success:
+            data["retry_count"] = 1
             data["last_failure_reason"] = error_message
 
-        # Check if row exists
-        existing = self.get_by_source(charity_ein, source)
-
-        if existing:
-            if not success:
-                data["retry_count"] = (existing.get("retry_count") or 0) + 1
-                if existing.get("success"):
-                    # Never clobber last-good content with a failure record
-                    data.pop("parsed_json", None)
-                    data.pop("raw_content", None)
-            # Update existing row
-            set_clause = ", ".join([f"{k} = %s" for k in data.keys() if k not in ("charity_ein", "source")])
-            values = [v for k, v in data.items() if k not in ("charity_ein", "source")]
-            values.extend([charity_ein, source])
-
-            execute_query(
-                f"UPDATE raw_scraped_data SET {set_clause}, scraped_at = CURRENT_TIMESTAMP WHERE charity_ein = %s AND source = %s",
-                tuple(values),
-                fetch="none",
-            )
-        else:
-            if not success:
-                data["retry_count"] = 1
-            # Insert new row
-            data["id"] = _generate_uuid()
-            columns = list(data.keys())
-            placeholders = ", ".join(["%s"] * len(columns))
+        # MySQL applies assignments left to right, so the content guards must
+        # read `success` before it is overwritten below.
+        updates = []
+        for col in ("parsed_json", "raw_content"):
+            if col not in data:
+                continue
+            if success:
+                updates.append(f"{col} = VALUES({col})")
+            else:
+                # Never clobber last-good content with a failure record
+                updates.append(f"{col} = IF(success, {col}, VALUES({col}))")
+        if not success:
+            updates.append("retry_count = COALESCE(retry_count, 0) + 1")
+        elif "retry_count" in data:
+            updates.append("retry_count = 0")
+        updates.extend(
+            f"{col} = VALUES({col})"
+            for col in ("success", "error_message", "last_failure_reason")
+            if col in data
+        )
+        updates.append("scraped_at = CURRENT_TIMESTAMP")
 
-            execute_query(
-                f"INSERT INTO raw_scraped_data ({', '.join(columns)}) VALUES ({placeholders})",
-                tuple(data.values()),
-                fetch="none",
-            )
+        columns = list(data.keys())
+        placeholders = ", ".join(["%s"] * len(columns))
+        execute_query(
+            f"INSERT INTO raw_scraped_data ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON DUPLICATE KEY UPDATE {', '.join(updates)}",
+            tuple(data.values()),
+            fetch="none",
+        )
 
     def increment_retry_count(self, ein: str, source: str, error_message: str) -> int:
         """Increment retry count for a failed source and return new count."""
-        existing = self.get_by_source(ein, source)
-        current_count = (existing.get("retry_count") or 0) if existing else 0
-        new_count = current_count + 1
-
-        if existing:
-            execute_query(
-                "UPDATE raw_scraped_data SET retry_count = %s, success = FALSE, error_message = %s, last_failure_reason = %s WHERE charity_ein = %s AND source = %s",
-                (new_count, error_message, error_message, ein, source),
-                fetch="none",
-            )
-        else:
-            execute_query(
-                "INSERT INTO raw_scraped_data (id, charity_ein, source, success, error_message, last_failure_reason, retry_count, parsed_json) VALUES (%s, %s, %s, FALSE, %s, %s, %s, %s)",
-                (_generate_uuid(), ein, source, error_message, error_message, new_count, "{}"),
-                fetch="none",
-            )
-
-        return new_count
+        execute_query(
+            "INSERT INTO raw_scraped_data (id, charity_ein, source, success, error_message, last_failure_reason, retry_count, parsed_json) "
+            "VALUES (%s, %s, %s, FALSE, %s, %s, 1, %s) "
+            "ON DUPLICATE KEY UPDATE retry_count = COALESCE(retry_count, 0) + 1, success = FALSE, "
+            "error_message = VALUES(error_message), last_failure_reason = VALUES(last_failure_reason)",
+            (_generate_uuid(), ein, source, error_message, error_message, "{}"),
+            fetch="none",
+        )
+        row = self.get_by_source(ein, source, columns=("retry_count",))
+        return (row.get("retry_count") or 0) if row else 1
 
     def reset_retry_count(self, ein: str, source: str) -> None:
         """Reset retry count for a source, allowing re-fetch after failure TTL expiry."""
@@ -348,34 +417,40 @@ class RawDataRepository:
         error_message: str | None = None,
     ) -> None:
         """Store raw fetched content (fetch phase only)."""
-        existing = self.get_by_source(charity_ein, source)
+        updates = ["raw_content = VALUES(raw_content)", "success = VALUES(success)", "scraped_at = CURRENT_TIMESTAMP"]
+        if error_message is not None:
+            updates.append("error_message = VALUES(error_message)")
+        if success:
+            updates.append("retry_count = 0")
 
-        if existing:
-            update_parts = ["raw_content = %s", "success = %s", "scraped_at = CURRENT_TIMESTAMP"]
-            values = [raw_content, success]
-
-            if error_message is not None:
-                update_parts.append("error_message = %s")
-                values.append(error_message)
-            if success:
-                update_parts.append("retry_count = 0")
-
-            values.extend([charity_ein, source])
-            execute_query(
-                f"UPDATE raw_scraped_data SET {', '.join(update_parts)} WHERE charity_ein = %s AND source = %s",
-                tuple(values),
-                fetch="none",
-            )
-        else:
-            execute_query(
-                "INSERT INTO raw_scraped_data (id, charity_ein, source, raw_content, success, error_message, retry_count) VALUES (%s, %s, %s, %s, %s, %s, %s)",
-                (_generate_uuid(), charity_ein, source, raw_content, success, error_message, 0 if success else None),
-                fetch="none",
-            )
+        execute_query(
+            "INSERT INTO raw_scraped_data (id, charity_ein, source, raw_content, success, error_message, retry_count) "
+            f"VALUES (%s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE {', '.join(updates)}",
+            (
+                _generate_uuid(),
+                charity_ein,
+                source,
+                encode_raw_content(raw_content),
+                success,
+                error_message,
+                0 if success else None,
+            ),
+            fetch="none",
+        )
 
-    def get_unparsed(self, eins: list[str] | None = None) -> list[dict]:
-        """Get rows with raw_content but no parsed_json (need extraction)."""
-        sql = "SELECT * FROM raw_scraped_data WHERE success = TRUE AND raw_content IS NOT NULL AND parsed_json IS NULL"
+    def get_unparsed(
+        self,
+        eins: list[str] | None = None,
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> list[dict]:
+        """Get rows with raw_content but no parsed_json (need extraction).
+
+        Extraction callers should pass include_raw_content=True so the blobs
+        arrive in the same query instead of one lazy fetch per row.
+        """
+        select = self._select_list(include_raw_content, columns)
+        sql = f"SELECT {select} FROM raw_scraped_data WHERE success = TRUE AND raw_content IS NOT NULL AND parsed_json IS NULL"
         params: tuple = ()
 
         if eins:
@@ -386,9 +461,15 @@ class RawDataRepository:
         rows = execute_query(sql, params) or []
         return [self._deserialize_row(r) for r in rows]
 
-    def get_all(self, eins: list[str] | None = None) -> list[dict]:
+    def get_all(
+        self,
+        eins: list[str] | None = None,
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> list[dict]:
         """Get all rows with raw_content (for force re-extraction)."""
-        sql = "SELECT * FROM raw_scraped_data WHERE success = TRUE AND raw_content IS NOT NULL"
+        select = self._select_list(include_raw_content, columns)
+        sql = f"SELECT {select} FROM raw_scraped_data WHERE success = TRUE AND raw_content IS NOT NULL"
         params: tuple = ()
 
         if eins:
@@ -414,7 +495,7 @@ class RawDataRepository:
         Returns:
             True if a row was invalidated, False if no row existed
         """
-        existing = self.get_by_source(ein, source)
+        existing = self.get_by_source(ein, source, columns=("id",))
         if not existing:
             return False
 
@@ -425,26 +506,138 @@ class RawDataRepository:
         )
         return True
 
-    def get_for_charity(self, ein: str) -> list[dict]:
+    def get_for_charity(
+        self,
+        ein: str,
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> list[dict]:
         """Get all raw data for a charity."""
+        select = self._select_list(include_raw_content, columns)
         rows = (
             execute_query(
-                "SELECT * FROM raw_scraped_data WHERE charity_ein = %s",
+                f"SELECT {select} FROM raw_scraped_data WHERE charity_ein = %s",
                 (ein,),
             )
             or []
         )
         return [self._deserialize_row(r) for r in rows]
 
-    def get_by_source(self, ein: str, source: str) -> dict | None:
+    def get_by_source(
+        self,
+        ein: str,
+        source: str,
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> dict | None:
         """Get raw data for specific source."""
+        select = self._select_list(include_raw_content, columns)
         row = execute_query(
-            "SELECT * FROM raw_scraped_data WHERE charity_ein = %s AND source = %s",
+            f"SELECT {select} FROM raw_scraped_data WHERE charity_ein = %s AND source = %s",
             (ein, source),
             fetch="one",
         )
         return self._deserialize_row(row) if row else None
 
+    def get_for_charities(
+        self,
+        eins: list[str],
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> dict[str, list[dict]]:
+        """Get raw data for many charities in chunked queries, keyed by EIN."""
+        select = self._select_list(include_raw_content, columns)
+        result: dict[str, list[dict]] = {}
+        for chunk in _chunked(list(dict.fromkeys(eins))):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            rows = (
+                execute_query(
+                    f"SELECT {select} FROM raw_scraped_data WHERE charity_ein IN ({placeholders})",
+                    tuple(chunk),
+                )
+                or []
+            )
+            for row in rows:
+                result.setdefault(row["charity_ein"], []).append(self._deserialize_row(row))
+        return result
+
+    def get_raw_content(self, ein: str, source: str) -> str | None:
+        """Fetch only the raw_content blob for one source."""
+        row = execute_query(
+            "SELECT raw_content FROM raw_scraped_data WHERE charity_ein = %s AND source = %s",
+            (ein, source),
+            fetch="one",
+        )
+        return decode_raw_content(row.get("raw_content")) if row else None
+
+    def _iter_stored_raw_content(self, batch_size: int) -> Iterable[list[dict]]:
+        """Yield pages of (id, source, stored raw_content) rows in id order."""
+        last_id = ""
+        while True:
+            rows = (
+                execute_query(
+                    "SELECT id, source, raw_content FROM raw_scraped_data "
+                    "WHERE raw_content IS NOT NULL AND id > %s ORDER BY id LIMIT %s",
+                    (last_id, batch_size),
+                )
+                or []
+            )
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1]["id"]
+
+    def recompress_raw_content(self, codec: str | None = "configured", batch_size: int = 200) -> dict[str, int]:
+        """Re-encode every stored raw_content with codec (None decompresses).
+
+        Rows already in the target encoding are left alone, so the migration
+        can be interrupted and re-run.
+
+        Returns:
+            Dict with scanned/rewritten row counts
+        """
+        scanned = rewritten = 0
+        for rows in self._iter_stored_raw_content(batch_size):
+            updates = []
+            for row in rows:
+                scanned += 1
+                stored = row["raw_content"]
+                if isinstance(stored, bytes):
+                    stored = stored.decode("utf-8")
+                encoded = encode_raw_content(decode_raw_content(stored), codec)
+                if encoded != stored:
+                    updates.append((encoded, row["id"]))
+            if updates:
+                execute_many("UPDATE raw_scraped_data SET raw_content = %s WHERE id = %s", updates)
+                rewritten += len(updates)
+        return {"scanned": scanned, "rewritten": rewritten}
+
+    def get_compression_stats(self, batch_size: int = 200) -> dict[str, dict[str, int | float]]:
+        """Stored vs decoded raw_content size per source.
+
+        Decodes every row, so this reads the whole column; meant for the
+        stats command, not the pipeline.
+
+        Returns:
+            {source: {rows, compressed_rows, stored_bytes, original_bytes, ratio}}
+        """
+        stats: dict[str, dict[str, int | float]] = {}
+        for rows in self._iter_stored_raw_content(batch_size):
+            for row in rows:
+                stored = row["raw_content"]
+                if isinstance(stored, bytes):
+                    stored = stored.decode("utf-8")
+                entry = stats.setdefault(
+                    row["source"], {"rows": 0, "compressed_rows": 0, "stored_bytes": 0, "original_bytes": 0}
+                )
+                entry["rows"] += 1
+                entry["compressed_rows"] += stored_codec(stored) is not None
+                entry["stored_bytes"] += len(stored.encode("utf-8"))
+                entry["original_bytes"] += len(decode_raw_content(stored).encode("utf-8"))
+        for entry in stats.values():
+            entry["ratio"] = round(entry["original_bytes"] / entry["stored_bytes"], 2) if entry["stored_bytes"] else 0.0
+        return stats
+
     def get_successful_sources(self, ein: str) -> list[str]:
         """Get list of sources that succeeded for a charity."""
         rows = (
@@ -456,10 +649,30 @@ class RawDataRepository:
         )
         return [r["source"] for r in rows]
 
+    def _select_list(self, include_raw_content: bool, columns: Iterable[str] | None) -> str:
+        """Build the SELECT column list for a read."""
+        if columns is None:
+            selected = list(self.COLUMNS if include_raw_content else self.METADATA_COLUMNS)
+        else:
+            selected = ["charity_ein", "source"]
+            for col in columns:
+                if col not in self.COLUMNS:
+                    raise ValueError(f"Unknown raw_scraped_data column: {col}")
+                if col not in selected:
+                    selected.append(col)
+            if include_raw_content and "raw_content" not in selected:
+                selected.append("raw_content")
+        return ", ".join(selected)
+
     def _deserialize_row(self, row: dict) -> dict:
-        """Deserialize JSON columns in a row."""
+        """Deserialize JSON columns in a row; defer raw_content if it wasn't selected."""
         if row and "parsed_json" in row:
             row["parsed_json"] = _deserialize_json(row["parsed_json"])
+        if row and row.get("raw_content") is not None:
+            row["raw_content"] = decode_raw_content(row["raw_content"])
+        if row and "raw_content" not in row and "charity_ein" in row and "source" in row:
+            ein, source = row["charity_ein"], row["source"]
+            row = RawDataRow(row, lambda: self.get_raw_content(ein, source))
         return row
 
 
@@ -612,6 +825,19 @@ class CharityDataRepository:
         )
         return self._deserialize_row(row) if row else None
 
+    def get_many(self, eins: list[str]) -> dict[str, dict]:
+        """Get synthesized data for many charities in chunked queries, keyed by EIN."""
+        result: dict[str, dict] = {}
+        for chunk in _chunked(list(dict.fromkeys(eins))):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            rows = (
+                execute_query(f"SELECT * FROM charity_data WHERE charity_ein IN ({placeholders})", tuple(chunk))
+                or []
+            )
+            for row in rows:
+                result[row["charity_ein"]] = self._deserialize_row(row)
+        return result
+
     def _deserialize_row(self, row: dict) -> dict:
         """Deserialize JSON columns in a row."""
         if row:
@@ -708,6 +934,19 @@ class EvaluationRepository:
         )
         return self._deserialize_row(row) if row else None
 
+    def get_many(self, eins: list[str]) -> dict[str, dict]:
+        """Get evaluations for many charities in chunked queries, keyed by EIN."""
+        result: dict[str, dict] = {}
+        for chunk in _chunked(list(dict.fromkeys(eins))):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            rows = (
+                execute_query(f"SELECT * FROM evaluations WHERE charity_ein IN ({placeholders})", tuple(chunk))
+                or []
+            )
+            for row in rows:
+                result[row["charity_ein"]] = self._deserialize_row(row)
+        return result
+
     def get_by_state(self, state: str) -> list[dict]:
         """Get all evaluations in a given state."""
         rows = (
@@ -1082,17 +1321,13 @@ class JudgeVerdictRepository:
     # JSON columns
     JSON_COLUMNS = {"issues"}
 
-    def save_verdict(
-        self, verdict: JudgeVerdict | dict, charity_ein: str | None = None, commit_hash: str | None = None
-    ) -> None:
-        """Save a judge verdict.
+    _KEY_COLUMNS = ("id", "charity_ein", "commit_hash", "judge_name")
 
-        Args:
-            verdict: JudgeVerdict dataclass or dict with verdict data
-            charity_ein: Override charity EIN (for dict input)
-            commit_hash: Override commit hash (for dict input)
-        """
-        data = verdict.__dict__ if isinstance(verdict, JudgeVerdict) else dict(verdict)
+    def _verdict_row(
+        self, verdict: JudgeVerdict | dict, charity_ein: str | None = None, commit_hash: str | None = None
+    ) -> dict:
+        """Normalize a verdict into a judge_verdicts row (JSON serialized, id generated)."""
+        data = dict(verdict.__dict__) if isinstance(verdict, JudgeVerdict) else dict(verdict)
 
         # Allow overrides for flexibility
         if charity_ein:
@@ -1111,33 +1346,54 @@ class JudgeVerdictRepository:
         # Generate ID if not provided
         if "id" not in data:
             data["id"] = _generate_uuid()
+        return data
 
-        columns = list(data.keys())
+    def _upsert_sql(self, columns: list[str]) -> str:
         placeholders = ", ".join(["%s"] * len(columns))
-        update_clause = ", ".join(
-            [
-                f"{col} = VALUES({col})"
-                for col in columns
-                if col not in ("id", "charity_ein", "commit_hash", "judge_name")
-            ]
-        )
-
-        sql = f"""
+        update_clause = ", ".join([f"{col} = VALUES({col})" for col in columns if col not in self._KEY_COLUMNS])
+        return f"""
             INSERT INTO judge_verdicts ({", ".join(columns)})
             VALUES ({placeholders})
             ON DUPLICATE KEY UPDATE {update_clause}, validated_at = CURRENT_TIMESTAMP
         """
-        execute_query(sql, tuple(data.values()), fetch="none")
 
-    def save_verdicts_batch(self, verdicts: list[JudgeVerdict | dict], commit_hash: str) -> None:
+    def save_verdict(
+        self, verdict: JudgeVerdict | dict, charity_ein: str | None = None, commit_hash: str | None = None
+    ) -> None:
+        """Save a judge verdict.
+
+        Args:
+            verdict: JudgeVerdict dataclass or dict with verdict data
+            charity_ein: Override charity EIN (for dict input)
+            commit_hash: Override commit hash (for dict input)
+        """
+        data = self._verdict_row(verdict, charity_ein, commit_hash)
+        execute_query(self._upsert_sql(list(data.keys())), tuple(data.values()), fetch="none")
+
+    def save_verdicts_batch(self, verdicts: list[JudgeVerdict | dict], commit_hash: str) -> int:
         """Save multiple verdicts for the same commit.
 
+        Rows are written as multi-row upserts (one statement per chunk of
+        BULK_READ_CHUNK_SIZE rows with the same column set) instead of one
+        round trip per verdict.
+
         Args:
             verdicts: List of verdict data
             commit_hash: The commit hash for all verdicts
+
+        Returns:
+            Number of verdicts written
         """
+        groups: dict[tuple[str, ...], list[tuple]] = {}
         for v in verdicts:
-            self.save_verdict(v, commit_hash=commit_hash)
+            row = self._verdict_row(v, commit_hash=commit_hash)
+            groups.setdefault(tuple(row.keys()), []).append(tuple(row.values()))
+
+        for columns, params in groups.items():
+            sql = self._upsert_sql(list(columns))
+            for chunk in _chunked(params):
+                execute_many(sql, chunk)
+        return sum(len(params) for params in groups.values())
 
     def get_verdict(self, ein: str, commit_hash: str, judge_name: str) -> dict | None:
         """Get a specific verdict.
@@ -1392,6 +1648,16 @@ class PhaseCacheRepository:
     to determine if phases can be skipped.
     """
 
+    # Shared with DoltWorkQueue.record_phase, which runs it inside a lease-fenced transaction.
+    UPSERT_SQL = """
+        INSERT INTO phase_cache (charity_ein, phase, code_fingerprint, ran_at, cost_usd)
+        VALUES (%s, %s, %s, CURRENT_TIMESTAMP, %s)
+        ON DUPLICATE KEY UPDATE
+            code_fingerprint = VALUES(code_fingerprint),
+            ran_at = CURRENT_TIMESTAMP,
+            cost_usd = VALUES(cost_usd)
+    """
+
     def get(self, ein: str, phase: str) -> dict | None:
         """Get cache entry for a charity/phase.
 
@@ -1408,6 +1674,23 @@ class PhaseCacheRepository:
             fetch="one",
         )
 
+    def get_many(self, eins: list[str]) -> dict[tuple[str, str], dict]:
+        """Get every cache entry for many charities in chunked queries.
+
+        Args:
+            eins: Charity EINs
+
+        Returns:
+            Dict keyed by (ein, phase)
+        """
+        result: dict[tuple[str, str], dict] = {}
+        for chunk in _chunked(list(dict.fromkeys(eins))):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            rows = execute_query(f"SELECT * FROM phase_cache WHERE charity_ein IN ({placeholders})", tuple(chunk)) or []
+            for row in rows:
+                result[(row["charity_ein"], row["phase"])] = row
+        return result
+
     def upsert(
         self,
         ein: str,
@@ -1423,18 +1706,7 @@ class PhaseCacheRepository:
             code_fingerprint: SHA256 hash of code files
             cost_usd: LLM cost for this phase run
         """
-        execute_query(
-            """
-            INSERT INTO phase_cache (charity_ein, phase, code_fingerprint, ran_at, cost_usd)
-            VALUES (%s, %s, %s, CURRENT_TIMESTAMP, %s)
-            ON DUPLICATE KEY UPDATE
-                code_fingerprint = VALUES(code_fingerprint),
-                ran_at = CURRENT_TIMESTAMP,
-                cost_usd = VALUES(cost_usd)
-            """,
-            (ein, phase, code_fingerprint, cost_usd),
-            fetch="none",
-        )
+        execute_query(self.UPSERT_SQL, (ein, phase, code_fingerprint, cost_usd), fetch="none")
 
     def delete(self, ein: str, phase: str) -> None:
         """Delete cache entry for a charity/phase (for invalidation).
@@ -1509,16 +1781,42 @@ class PhaseCacheRepository:
         Returns:
             Tuple of (is_valid, reason)
         """
-        cache_entry = self.get(ein, phase)
+        return self.evaluate_entry(phase, self.get(ein, phase), current_fingerprint, ttl_days)
 
+    @staticmethod
+    def evaluate_entry(
+        phase: str,
+        cache_entry: dict | None,
+        current_fingerprint: str,
+        ttl_days: float = float("inf"),
+    ) -> tuple[bool, str]:
+        """is_valid() on an already-loaded cache entry (for bulk planning).
+
+        Args:
+            phase: Phase name
+            cache_entry: phase_cache row, or None if there is none
+            current_fingerprint: Current code fingerprint
+            ttl_days: Max age in days (inf = no time limit)
+
+        Returns:
+            Tuple of (is_valid, reason)
+        """
         if not cache_entry:
             return False, "No cache entry"
 
         # Check code change
         if cache_entry["code_fingerprint"] != current_fingerprint:
+            from src.utils.phase_fingerprint import PHASE_CODE_FILES, explain_fingerprint_change
+
             old_fp = cache_entry["code_fingerprint"][:8]
             new_fp = current_fingerprint[:8]
-            return False, f"Code changed ({old_fp}→{new_fp})"
+            reason = f"Code changed ({old_fp}→{new_fp})"
+            if phase in PHASE_CODE_FILES:
+                changed = explain_fingerprint_change(phase, cache_entry["code_fingerprint"])
+                if changed:
+                    shown = ", ".join(changed[:3]) + (f" +{len(changed) - 3} more" if len(changed) > 3 else "")
+                    reason += f": {shown}"
+            return False, reason
 
         # Check TTL
         if ttl_days != float("inf"):
@@ -0,0 +1,672 @@
+"""Lease-based work queue so several streaming runners can drain one charity list.
+
+Problem: streaming_runner takes its charity list from a file and works
+through it on local threads, so a run is bounded by one machine. Two
+runners started on the same list process every charity twice, and a runner
+that dies mid-run leaves its charities half done with nobody to pick them up.
+
+Solution: a run's charities go into a queue keyed by run_id; runners claim
+them one at a time under time-limited leases.
+- enqueue() is idempotent: every runner joining a run enqueues its list and
+  only charities not queued yet are added
+- claim() hands out the next pending charity, or one whose lease expired
+  (its runner crashed or stalled); a charity whose lease expired
+  max_attempts times is marked failed instead of being handed out again
+- a LeaseKeeper thread heartbeats held leases; a heartbeat that finds the
+  lease gone (reclaimed by another runner) marks it lost
+- every lease carries a fresh token, and record_phase() writes the
+  phase_cache row in the same transaction as a check that the token still
+  holds the charity, so a phase is recorded exactly once even when a slow
+  runner finishes work whose lease was already handed to someone else
+- finalize() is won by exactly one runner, once nothing is pending or
+  leased: that runner tags the run and rebuilds the export
+
+DoltWorkQueue keeps the queue in the work_queue / work_queue_runs tables of
+the shared Dolt server (operational state: never staged by dolt.commit).
+LocalWorkQueue has the same semantics in memory, for tests and single-host
+runs.
+
+Usage:
+    queue = DoltWorkQueue()
+    queue.enqueue(run_id, charities)
+    with LeaseKeeper(queue) as keeper:
+        while (lease := queue.claim(run_id, worker_id)) is not None:
+            keeper.track(lease)
+            process(lease.charity, LeasedPhaseCache(cache_repo, queue, lease))
+            keeper.untrack(lease)
+            queue.complete(lease, success=True)
+    if queue.finalize(run_id, worker_id):
+        tag_and_export()
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, TypeVar
+
+import pymysql
+
+from ..constants import WORK_QUEUE_LEASE_SECONDS, WORK_QUEUE_MAX_ATTEMPTS
+from .client import execute_many, execute_query, execute_update, get_cursor
+from .repository import PhaseCacheRepository
+
+logger = logging.getLogger(__name__)
+
+# Dolt reports a write that conflicts with a concurrently committed
+# transaction as a serialization failure; those are retried. Many runners
+# starting together all claim at once, so claims back off with jitter.
+_CONFLICT_ERRNOS = frozenset({1213})
+_CLAIM_RETRIES = 10
+_CLAIM_BACKOFF_SECONDS = 0.05
+_CLAIM_BACKOFF_MAX_SECONDS = 2.0
+
+T = TypeVar("T")
+
+OPEN_STATES = ("pending", "leased")
+
+
+class LeaseLostError(Exception):
+    """The runner's lease on a charity expired and was claimed by another runner."""
+
+
+@dataclass
+class Lease:
+    """A runner's claim on one charity of a run; token fences every write made under it."""
+
+    run_id: str
+    ein: str
+    token: str
+    worker_id: str
+    charity: dict
+    position: int
+    attempts: int
+    lost: bool = False
+
+
+def _is_conflict(error: Exception) -> bool:
+    return isinstance(error, pymysql.MySQLError) and bool(error.args) and error.args[0] in _CONFLICT_ERRNOS
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: a random delay up to min(cap, base * 2**attempt)."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def retry_call(
+    call: Callable[[], T],
+    attempts: int,
+    base: float,
+    cap: float,
+    on_error: Callable[[int, Exception], None] | None = None,
+) -> T:
+    """Run call, retrying any exception with jittered exponential backoff; the last failure is raised.
+
+    on_error(attempt, error) is called for every failure before the wait.
+    """
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            if on_error is not None:
+                on_error(attempt, e)
+            if attempt == attempts - 1:
+                raise
+            time.sleep(backoff_delay(attempt, base, cap))
+    raise ValueError("attempts must be >= 1")
+
+
+def _empty_stats() -> dict[str, int]:
+    return {"pending": 0, "leased": 0, "done": 0, "failed": 0, "succeeded": 0, "total": 0}
+
+
+class WorkQueue(ABC):
+    """A run's charities, handed out to runners under time-limited leases."""
+
+    def __init__(self, max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS):
+        """
+        Args:
+            max_attempts: Leases a charity may expire under before it is marked failed
+        """
+        self.max_attempts = max_attempts
+
+    @abstractmethod
+    def enqueue(self, run_id: str, charities: Iterable[dict]) -> int:
+        """Add charities (dicts with ein/name/website) to a run; returns how many were new."""
+
+    @abstractmethod
+    def claim(self, run_id: str, worker_id: str, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS) -> Lease | None:
+        """Lease the next pending (or expired) charity, or None if none can be claimed right now."""
+
+    @abstractmethod
+    def heartbeat(self, lease: Lease, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS) -> bool:
+        """Extend a lease; False if it is no longer held."""
+
+    @abstractmethod
+    def holds(self, lease: Lease) -> bool:
+        """Whether the lease still holds its charity."""
+
+    @abstractmethod
+    def record_phase(self, lease: Lease, phase: str, code_fingerprint: str, cost_usd: float = 0.0) -> bool:
+        """Write the charity's phase_cache row if the lease still holds; False (nothing written) otherwise."""
+
+    @abstractmethod
+    def complete(self, lease: Lease, success: bool, error: str | None = None) -> bool:
+        """Mark the leased charity done; False if the lease was lost first."""
+
+    @abstractmethod
+    def release(self, lease: Lease) -> bool:
+        """Hand a leased charity back unprocessed (e.g. budget exhausted); it does not count as an attempt."""
+
+    @abstractmethod
+    def get_stats(self, run_id: str) -> dict[str, int]:
+        """Counts of pending, leased, done and failed charities, plus succeeded and total."""
+
+    @abstractmethod
+    def finalize(self, run_id: str, worker_id: str) -> bool:
+        """Claim the end-of-run work (tag, export rebuild); True for exactly one runner, once the run is drained."""
+
+
+class DoltWorkQueue(WorkQueue):
+    """Work queue in the shared Dolt database; every runner points DOLT_HOST at the same server.
+
+    Tables are created lazily (memoized per process); the same DDL must
+    appear in the generated dolt_schema.sql.
+    """
+
+    _tables_ensured = False
+
+    def ensure_tables(self) -> None:
+        if DoltWorkQueue._tables_ensured:
+            return
+        execute_query(
+            """
+            CREATE TABLE IF NOT EXISTS work_queue (
+                run_id VARCHAR(64) NOT NULL,
+                charity_ein VARCHAR(12) NOT NULL,
+                position INT NOT NULL,
+                payload JSON NOT NULL,
+                state VARCHAR(10) NOT NULL DEFAULT 'pending',
+                worker_id VARCHAR(128),
+                lease_token CHAR(36),
+                lease_expires_at TIMESTAMP NULL,
+                attempts INT NOT NULL DEFAULT 0,
+                heartbeats INT NOT NULL DEFAULT 0,
+                last_phase VARCHAR(20),
+                phase_writes INT NOT NULL DEFAULT 0,
+                success TINYINT(1),
+                error TEXT,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_id, charity_ein),
+                KEY idx_work_queue_claim (run_id, state, position),
+                UNIQUE KEY uq_work_queue_token (lease_token)
+            )
+            """,
+            fetch="none",
+        )
+        execute_query(
+            """
+            CREATE TABLE IF NOT EXISTS work_queue_runs (
+                run_id VARCHAR(64) NOT NULL,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                finalized_by VARCHAR(128),
+                finalized_at TIMESTAMP NULL,
+                PRIMARY KEY (run_id)
+            )
+            """,
+            fetch="none",
+        )
+        DoltWorkQueue._tables_ensured = True
+
+    def enqueue(self, run_id: str, charities: Iterable[dict]) -> int:
+        self.ensure_tables()
+        execute_query("INSERT IGNORE INTO work_queue_runs (run_id) VALUES (%s)", (run_id,), fetch="none")
+        rows = [
+            (
+                run_id,
+                charity["ein"],
+                position,
+                json.dumps({key: charity.get(key) for key in ("ein", "name", "website")}),
+            )
+            for position, charity in enumerate(charities)
+        ]
+        if not rows:
+            return 0
+        return execute_many(
+            "INSERT IGNORE INTO work_queue (run_id, charity_ein, position, payload) VALUES (%s, %s, %s, %s)",
+            rows,
+        )
+
+    def claim(self, run_id: str, worker_id: str, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS) -> Lease | None:
+        self.ensure_tables()
+        token = str(uuid.uuid4())
+        for attempt in range(_CLAIM_RETRIES):
+            try:
+                execute_update(
+                    """
+                    UPDATE work_queue
+                    SET state = 'failed', lease_token = NULL, success = 0,
+                        error = CONCAT('lease expired ', attempts, ' times (last held by ', worker_id, ')')
+                    WHERE run_id = %s AND state = 'leased'
+                      AND lease_expires_at < CURRENT_TIMESTAMP AND attempts >= %s
+                    """,
+                    (run_id, self.max_attempts),
+                )
+                # Resetting last_phase/phase_writes also makes a reclaim conflict with a
+                # concurrent record_phase() by the previous holder: both write those cells.
+                claimed = execute_update(
+                    """
+                    UPDATE work_queue
+                    SET state = 'leased', worker_id = %s, lease_token = %s,
+                        lease_expires_at = DATE_ADD(CURRENT_TIMESTAMP, INTERVAL %s SECOND),
+                        attempts = attempts + 1, last_phase = NULL, phase_writes = 0
+                    WHERE run_id = %s
+                      AND (state = 'pending' OR (state = 'leased' AND lease_expires_at < CURRENT_TIMESTAMP))
+                    ORDER BY position
+                    LIMIT 1
+                    """,
+                    (worker_id, token, int(lease_seconds), run_id),
+                )
+                break
+            except pymysql.MySQLError as e:
+                if not _is_conflict(e) or attempt == _CLAIM_RETRIES - 1:
+                    raise
+                time.sleep(backoff_delay(attempt, _CLAIM_BACKOFF_SECONDS, _CLAIM_BACKOFF_MAX_SECONDS))
+        if not claimed:
+            return None
+
+        row = execute_query("SELECT * FROM work_queue WHERE lease_token = %s", (token,), fetch="one")
+        if row is None:
+            return None
+        payload = row["payload"]
+        return Lease(
+            run_id=run_id,
+            ein=row["charity_ein"],
+            token=token,
+            worker_id=worker_id,
+            charity=json.loads(payload) if isinstance(payload, (str, bytes)) else payload,
+            position=row["position"],
+            attempts=row["attempts"],
+        )
+
+    def heartbeat(self, lease: Lease, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS) -> bool:
+        # heartbeats always changes, so the affected-row count says whether the token still holds.
+        return (
+            execute_update(
+                """
+                UPDATE work_queue
+                SET lease_expires_at = DATE_ADD(CURRENT_TIMESTAMP, INTERVAL %s SECOND), heartbeats = heartbeats + 1
+                WHERE lease_token = %s AND state = 'leased'
+                """,
+                (int(lease_seconds), lease.token),
+            )
+            == 1
+        )
+
+    def holds(self, lease: Lease) -> bool:
+        row = execute_query(
+            "SELECT 1 AS held FROM work_queue WHERE lease_token = %s AND state = 'leased'",
+            (lease.token,),
+            fetch="one",
+        )
+        return row is not None
+
+    def record_phase(self, lease: Lease, phase: str, code_fingerprint: str, cost_usd: float = 0.0) -> bool:
+        with get_cursor() as cursor:
+            cursor.execute("START TRANSACTION")
+            try:
+                cursor.execute(
+                    """
+                    UPDATE work_queue SET last_phase = %s, phase_writes = phase_writes + 1
+                    WHERE lease_token = %s AND state = 'leased'
+                    """,
+                    (phase, lease.token),
+                )
+                if cursor.rowcount != 1:
+                    cursor.execute("ROLLBACK")
+                    return False
+                cursor.execute(
+                    PhaseCacheRepository.UPSERT_SQL,
+                    (lease.ein, phase, code_fingerprint, cost_usd),
+                )
+                cursor.execute("COMMIT")
+                return True
+            except pymysql.MySQLError as e:
+                cursor.execute("ROLLBACK")
+                if _is_conflict(e):
+                    # Lost a race with a reclaim of this charity.
+                    return False
+                raise
+
+    def complete(self, lease: Lease, success: bool, error: str | None = None) -> bool:
+        return (
+            execute_update(
+                """
+                UPDATE work_queue
+                SET state = 'done', success = %s, error = %s, lease_token = NULL, lease_expires_at = NULL
+                WHERE lease_token = %s AND state = 'leased'
+                """,
+                (1 if success else 0, error, lease.token),
+            )
+            == 1
+        )
+
+    def release(self, lease: Lease) -> bool:
+        return (
+            execute_update(
+                """
+                UPDATE work_queue
+                SET state = 'pending', worker_id = NULL, lease_token = NULL, lease_expires_at = NULL,
+                    attempts = attempts - 1
+                WHERE lease_token = %s AND state = 'leased'
+                """,
+                (lease.token,),
+            )
+            == 1
+        )
+
+    def get_stats(self, run_id: str) -> dict[str, int]:
+        self.ensure_tables()
+        rows = execute_query(
+            """
+            SELECT state, COUNT(*) AS n, COALESCE(SUM(success), 0) AS succeeded
+            FROM work_queue WHERE run_id = %s GROUP BY state
+            """,
+            (run_id,),
+        )
+        stats = _empty_stats()
+        for row in rows or []:
+            stats[row["state"]] = int(row["n"])
+            stats["total"] += int(row["n"])
+            if row["state"] == "done":
+                stats["succeeded"] = int(row["succeeded"])
+        return stats
+
+    def finalize(self, run_id: str, worker_id: str) -> bool:
+        self.ensure_tables()
+        try:
+            execute_update(
+                """
+                UPDATE work_queue_runs SET finalized_by = %s, finalized_at = CURRENT_TIMESTAMP
+                WHERE run_id = %s AND finalized_by IS NULL
+                  AND NOT EXISTS (
+                      SELECT 1 FROM work_queue WHERE run_id = %s AND state IN ('pending', 'leased')
+                  )
+                """,
+                (worker_id, run_id, run_id),
+            )
+        except pymysql.MySQLError as e:
+            if not _is_conflict(e):
+                raise
+        row = execute_query("SELECT finalized_by FROM work_queue_runs WHERE run_id = %s", (run_id,), fetch="one")
+        return row is not None and row["finalized_by"] == worker_id
+
+
+class LocalWorkQueue(WorkQueue):
+    """In-memory work queue with DoltWorkQueue's semantics; runners must share the process.
+
+    phase_cache rows go to cache_repo (or are only counted when it is None).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS,
+        cache_repo: Any = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_attempts: Leases a charity may expire under before it is marked failed
+            cache_repo: Repository whose upsert() record_phase writes through
+            clock: Seconds source for lease expiry (tests pass a fake)
+        """
+        super().__init__(max_attempts)
+        self.cache_repo = cache_repo
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._runs: dict[str, dict[str, dict[str, Any]]] = {}
+        self._finalized: dict[str, str] = {}
+
+    def _entry(self, lease: Lease) -> dict[str, Any] | None:
+        entry = self._runs.get(lease.run_id, {}).get(lease.ein)
+        if entry is None or entry["state"] != "leased" or entry["lease_token"] != lease.token:
+            return None
+        return entry
+
+    def enqueue(self, run_id: str, charities: Iterable[dict]) -> int:
+        added = 0
+        with self._lock:
+            entries = self._runs.setdefault(run_id, {})
+            for position, charity in enumerate(charities):
+                if charity["ein"] in entries:
+                    continue
+                entries[charity["ein"]] = {
+                    "charity": {key: charity.get(key) for key in ("ein", "name", "website")},
+                    "position": position,
+                    "state": "pending",
+                    "worker_id": None,
+                    "lease_token": None,
+                    "lease_expires_at": None,
+                    "attempts": 0,
+                    "heartbeats": 0,
+                    "last_phase": None,
+                    "phase_writes": 0,
+                    "success": None,
+                    "error": None,
+                }
+                added += 1
+        return added
+
+    def claim(self, run_id: str, worker_id: str, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS) -> Lease | None:
+        with self._lock:
+            now = self.clock()
+            claimable = []
+            for ein, entry in self._runs.get(run_id, {}).items():
+                expired = entry["state"] == "leased" and entry["lease_expires_at"] < now
+                if expired and entry["attempts"] >= self.max_attempts:
+                    entry.update(
+                        state="failed",
+                        lease_token=None,
+                        success=False,
+                        error=f"lease expired {entry['attempts']} times (last held by {entry['worker_id']})",
+                    )
+                elif expired or entry["state"] == "pending":
+                    claimable.append((entry["position"], ein))
+            if not claimable:
+                return None
+
+            _, ein = min(claimable)
+            entry = self._runs[run_id][ein]
+            entry.update(
+                state="leased",
+                worker_id=worker_id,
+                lease_token=str(uuid.uuid4()),
+                lease_expires_at=now + lease_seconds,
+                attempts=entry["attempts"] + 1,
+                last_phase=None,
+                phase_writes=0,
+            )
+            return Lease(
+                run_id=run_id,
+                ein=ein,
+                token=entry["lease_token"],
+                worker_id=worker_id,
+                charity=dict(entry["charity"]),
+                position=entry["position"],
+                attempts=entry["attempts"],
+            )
+
+    def heartbeat(self, lease: Lease, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS) -> bool:
+        with self._lock:
+            entry = self._entry(lease)
+            if entry is None:
+                return False
+            entry["lease_expires_at"] = self.clock() + lease_seconds
+            entry["heartbeats"] += 1
+            return True
+
+    def holds(self, lease: Lease) -> bool:
+        with self._lock:
+            return self._entry(lease) is not None
+
+    def record_phase(self, lease: Lease, phase: str, code_fingerprint: str, cost_usd: float = 0.0) -> bool:
+        with self._lock:
+            entry = self._entry(lease)
+            if entry is None:
+                return False
+            if self.cache_repo is not None:
+                self.cache_repo.upsert(lease.ein, phase, code_fingerprint, cost_usd)
+            entry["last_phase"] = phase
+            entry["phase_writes"] += 1
+            return True
+
+    def complete(self, lease: Lease, success: bool, error: str | None = None) -> bool:
+        with self._lock:
+            entry = self._entry(lease)
+            if entry is None:
+                return False
+            entry.update(state="done", success=success, error=error, lease_token=None, lease_expires_at=None)
+            return True
+
+    def release(self, lease: Lease) -> bool:
+        with self._lock:
+            entry = self._entry(lease)
+            if entry is None:
+                return False
+            entry.update(
+                state="pending",
+                worker_id=None,
+                lease_token=None,
+                lease_expires_at=None,
+                attempts=entry["attempts"] - 1,
+            )
+            return True
+
+    def get_stats(self, run_id: str) -> dict[str, int]:
+        stats = _empty_stats()
+        with self._lock:
+            for entry in self._runs.get(run_id, {}).values():
+                stats[entry["state"]] += 1
+                stats["total"] += 1
+                if entry["state"] == "done" and entry["success"]:
+                    stats["succeeded"] += 1
+        return stats
+
+    def finalize(self, run_id: str, worker_id: str) -> bool:
+        with self._lock:
+            if any(entry["state"] in OPEN_STATES for entry in self._runs.get(run_id, {}).values()):
+                return False
+            winner = self._finalized.setdefault(run_id, worker_id)
+            return winner == worker_id
+
+    def get_entry(self, run_id: str, ein: str) -> dict[str, Any]:
+        """Copy of one charity's queue row (tests and debugging)."""
+        with self._lock:
+            return dict(self._runs[run_id][ein])
+
+
+class LeaseKeeper:
+    """Background thread that heartbeats held leases; a lease it cannot extend is marked lost."""
+
+    def __init__(self, queue: WorkQueue, lease_seconds: float = WORK_QUEUE_LEASE_SECONDS):
+        """
+        Args:
+            queue: Queue the leases came from
+            lease_seconds: Lease length; leases are extended every third of it
+        """
+        self.queue = queue
+        self.lease_seconds = lease_seconds
+        self.interval = lease_seconds / 3
+        self._leases: dict[str, Lease] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, lease: Lease) -> None:
+        with self._lock:
+            self._leases[lease.token] = lease
+
+    def untrack(self, lease: Lease) -> None:
+        with self._lock:
+            self._leases.pop(lease.token, None)
+
+    def beat(self) -> None:
+        """Extend every tracked lease once."""
+        with self._lock:
+            leases = list(self._leases.values())
+        for lease in leases:
+            try:
+                held = self.queue.heartbeat(lease, self.lease_seconds)
+            except Exception as e:
+                # A database blip is not a lost lease: retry on the next beat.
+                logger.warning(f"Heartbeat for {lease.ein} failed: {e}")
+                continue
+            if not held:
+                lease.lost = True
+                self.untrack(lease)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.beat()
+
+    def start(self) -> "LeaseKeeper":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="lease-keeper", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "LeaseKeeper":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+class LeasedPhaseCache:
+    """PhaseCacheRepository whose writes only land while the lease holds the charity.
+
+    upsert() goes through WorkQueue.record_phase (fenced, exactly once per
+    lease); deletes check the lease first. Reads pass straight through.
+    Raises LeaseLostError when the lease is gone, which stops the charity.
+    """
+
+    def __init__(self, repo: PhaseCacheRepository, queue: WorkQueue, lease: Lease):
+        self._repo = repo
+        self._queue = queue
+        self._lease = lease
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    def _lost(self) -> LeaseLostError:
+        self._lease.lost = True
+        return LeaseLostError(f"Lease on {self._lease.ein} lost (run {self._lease.run_id})")
+
+    def _check(self) -> None:
+        if self._lease.lost or not self._queue.holds(self._lease):
+            raise self._lost()
+
+    def upsert(self, ein: str, phase: str, code_fingerprint: str, cost_usd: float = 0.0) -> None:
+        if ein != self._lease.ein:
+            raise ValueError(f"Lease is for {self._lease.ein}, not {ein}")
+        if self._lease.lost or not self._queue.record_phase(self._lease, phase, code_fingerprint, cost_usd):
+            raise self._lost()
+
+    def delete(self, ein: str, phase: str) -> None:
+        self._check()
+        self._repo.delete(ein, phase)
+
+    def delete_downstream(self, ein: str, phase: str) -> list[str]:
+        self._check()
+        return self._repo.delete_downstream(ein, phase)
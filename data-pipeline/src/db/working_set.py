@@ -0,0 +1,239 @@
+"""Per-charity working set shared by every phase of one streaming-runner pass.
+
+Problem: process_charity_full re-read the same rows at nearly every phase.
+raw_scraped_data for the charity was selected for the crawl, extract and
+discover quality checks, synthesize_charity, evaluate_charity, both
+citation registries, judge_charity and export_charity, and the charities /
+charity_data / evaluations rows were re-read by each phase as well.
+
+Solution: CharityWorkingSet loads each of one charity's tables once and
+hands out copies. Its repository views (charity_repo, raw_repo, data_repo,
+eval_repo) have the same methods as the repositories they wrap, so phase
+functions take them unchanged: reads of the working set's EIN come from
+memory, everything else passes straight through.
+
+Invalidation rules:
+- A write through a view (upsert, update_judge_result, ...) drops that
+  table. The next read reloads it, so DB defaults, timestamps and JSON
+  round-trips are exactly what the database holds.
+- Writes the views can't see (the crawl orchestrator, extract_row, the
+  rich generator's own repositories) are listed in PHASE_WRITES; call
+  after_phase(phase) once such a phase has run.
+- Reads for other EINs, and reads with include_raw_content=True, always go
+  to the database.
+
+Memory: a table is sized (JSON-encoded length) when loaded; one that would
+push the set past max_bytes is not kept and is read through instead.
+
+Usage:
+    ws = CharityWorkingSet(ein, charity_repo, raw_repo, data_repo, eval_repo)
+    synthesize_charity(ein, ws.raw_repo, ws.charity_repo)
+    ws.after_phase("extract")
+"""
+
+import copy
+import json
+from typing import Any, Callable, Iterable
+
+from ..constants import WORKING_SET_MAX_BYTES
+
+# Tables each phase may write, including writes that bypass the views.
+PHASE_WRITES: dict[str, tuple[str, ...]] = {
+    "crawl": ("charity", "raw"),
+    "extract": ("raw",),
+    "discover": ("raw",),
+    "synthesize": ("data",),
+    "reconcile": ("data",),
+    "baseline": ("evaluation",),
+    "rich": ("evaluation",),
+    "judge": ("evaluation",),
+    "export": (),
+}
+
+TABLES = ("charity", "raw", "data", "evaluation")
+
+
+def _approx_bytes(value: Any) -> int:
+    return len(json.dumps(value, default=str))
+
+
+class _RepositoryView:
+    """Pass-through to a repository; writes named in _writes invalidate the view's table."""
+
+    _table = ""
+    _writes: frozenset[str] = frozenset()
+
+    def __init__(self, working_set: "CharityWorkingSet", repo: Any):
+        self._ws = working_set
+        self._repo = repo
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repo, name)
+        if name not in self._writes or not callable(attr):
+            return attr
+        working_set, table = self._ws, self._table
+
+        def write(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                working_set.invalidate(table)
+
+        return write
+
+
+class _CharityView(_RepositoryView):
+    _table = "charity"
+    _writes = frozenset({"upsert"})
+
+    def get(self, ein: str) -> dict | None:
+        return self._ws._read("charity", ein, lambda: self._repo.get(ein))
+
+
+class _RawDataView(_RepositoryView):
+    """raw_scraped_data metadata rows; raw_content stays lazy (RawDataRow)."""
+
+    _table = "raw"
+    _writes = frozenset(
+        {
+            "upsert",
+            "store_raw",
+            "invalidate",
+            "increment_retry_count",
+            "reset_retry_count",
+            "recompress_raw_content",
+        }
+    )
+
+    def _rows(self, ein: str) -> list[dict]:
+        return self._ws._read("raw", ein, lambda: self._repo.get_for_charity(ein))
+
+    def get_for_charity(
+        self,
+        ein: str,
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> list[dict]:
+        """Cached rows carry every metadata column; columns only narrows a database read."""
+        if include_raw_content or ein != self._ws.ein:
+            return self._repo.get_for_charity(ein, include_raw_content=include_raw_content, columns=columns)
+        return self._rows(ein)
+
+    def get_by_source(
+        self,
+        ein: str,
+        source: str,
+        include_raw_content: bool = False,
+        columns: Iterable[str] | None = None,
+    ) -> dict | None:
+        if include_raw_content or ein != self._ws.ein:
+            return self._repo.get_by_source(ein, source, include_raw_content=include_raw_content, columns=columns)
+        return next((row for row in self._rows(ein) if row.get("source") == source), None)
+
+    def get_successful_sources(self, ein: str) -> list[str]:
+        if ein != self._ws.ein:
+            return self._repo.get_successful_sources(ein)
+        return [row["source"] for row in self._rows(ein) if row.get("success")]
+
+
+class _CharityDataView(_RepositoryView):
+    _table = "data"
+    _writes = frozenset({"upsert"})
+
+    def get(self, ein: str) -> dict | None:
+        return self._ws._read("data", ein, lambda: self._repo.get(ein))
+
+
+class _EvaluationView(_RepositoryView):
+    _table = "evaluation"
+    _writes = frozenset(
+        {
+            "upsert",
+            "set_state",
+            "set_narrative",
+            "update_judge_result",
+            "update_llm_cost",
+            "clear_rich_narrative",
+        }
+    )
+
+    def get(self, ein: str) -> dict | None:
+        return self._ws._read("evaluation", ein, lambda: self._repo.get(ein))
+
+
+class CharityWorkingSet:
+    """One charity's rows, loaded once per table and shared across phases.
+
+    Not thread-safe: a working set belongs to the worker processing its
+    charity (the --staged runner hands it from pool to pool, one thread at a
+    time). Every read returns a deep copy, so a phase that mutates what it
+    was given cannot leak changes into the next phase.
+    """
+
+    def __init__(
+        self,
+        ein: str,
+        charity_repo: Any,
+        raw_repo: Any,
+        data_repo: Any,
+        eval_repo: Any,
+        max_bytes: int = WORKING_SET_MAX_BYTES,
+    ):
+        """
+        Args:
+            ein: Charity EIN this working set caches
+            charity_repo, raw_repo, data_repo, eval_repo: Repositories to read through
+            max_bytes: Cap on cached rows (JSON-encoded size)
+        """
+        self.ein = ein
+        self.max_bytes = max_bytes
+        self.charity_repo = _CharityView(self, charity_repo)
+        self.raw_repo = _RawDataView(self, raw_repo)
+        self.data_repo = _CharityDataView(self, data_repo)
+        self.eval_repo = _EvaluationView(self, eval_repo)
+        self._rows: dict[str, Any] = {}
+        self._sizes: dict[str, int] = {}
+        self._stats = {"loads": 0, "hits": 0, "read_through": 0, "invalidations": 0, "peak_bytes": 0}
+
+    @property
+    def cached_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def _read(self, table: str, ein: str, load: Callable[[], Any]) -> Any:
+        """Serve a table for ein from memory, loading it on first use."""
+        if ein != self.ein:
+            return load()
+        if table in self._rows:
+            self._stats["hits"] += 1
+            return copy.deepcopy(self._rows[table])
+
+        value = load()
+        self._stats["loads"] += 1
+        size = _approx_bytes(value)
+        if self.cached_bytes + size > self.max_bytes:
+            self._stats["read_through"] += 1
+            return value
+        self._rows[table] = value
+        self._sizes[table] = size
+        self._stats["peak_bytes"] = max(self._stats["peak_bytes"], self.cached_bytes)
+        return copy.deepcopy(value)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop cached tables (all of them when none are named)."""
+        for table in tables or TABLES:
+            if table not in TABLES:
+                raise ValueError(f"Unknown working-set table: {table}")
+            if table in self._rows:
+                del self._rows[table]
+                del self._sizes[table]
+                self._stats["invalidations"] += 1
+
+    def after_phase(self, phase: str) -> None:
+        """Invalidate every table the phase may have written (see PHASE_WRITES)."""
+        tables = PHASE_WRITES[phase]
+        if tables:
+            self.invalidate(*tables)
+
+    def get_stats(self) -> dict[str, int]:
+        """Loads, cache hits, read-throughs, invalidations and current/peak cached bytes."""
+        return {**self._stats, "cached_bytes": self.cached_bytes}
@@ -53,13 +53,15 @@ class StructuredDataExtractor:
     - RDFa (optional)
     """
 
-    def extract(self, html: str, base_url: str) -> dict[str, list[dict[str, Any]]]:
+    def extract(self, html: str, base_url: str, tree: Any = None) -> dict[str, list[dict[str, Any]]]:
         """
         Extract all structured data formats from HTML.
 
         Args:
             html: HTML content
             base_url: Base URL for resolving relative URLs
+            tree: Already-parsed lxml.html tree of html (see src/utils/html_parser.py);
+                saves extruct a second parse of the page
 
         Returns:
             Dict with keys: json-ld, opengraph, microdata
@@ -70,7 +72,11 @@ class StructuredDataExtractor:
         import extruct
 
         try:
-            data = extruct.extract(html, base_url=base_url, syntaxes=["json-ld", "opengraph", "microdata"])
+            data = extruct.extract(
+                tree if tree is not None else html,
+                base_url=base_url,
+                syntaxes=["json-ld", "opengraph", "microdata"],
+            )
 
             # Normalize the output
             og_data = data.get("opengraph", {})
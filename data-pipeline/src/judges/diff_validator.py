@@ -177,6 +177,7 @@ class DiffValidator:
     # Thresholds (now multi-tier via ScoreChangeSeverity)
     SCORE_CHANGE_THRESHOLD = 10  # Flag score changes > 10 points (legacy)
     SCORE_HISTORY_LIMIT = 5  # Number of historical scores to analyze
+    SCORE_HISTORY_BATCH_SIZE = 500  # EINs per windowed dolt_history query
 
     def __init__(
         self,
@@ -214,15 +215,23 @@ class DiffValidator:
             f"{report.charities_removed} removed"
         )
 
-        # Step 2: Enrich with score history and severity classification
+        # Step 2: Enrich with score history and severity classification.
+        # History for every modified EIN is loaded up front in a few windowed
+        # queries; dolt_history scans are too expensive to repeat per change.
+        histories: dict[str, list[int]] = {}
+        if self.include_score_history:
+            histories = self._load_score_histories(
+                [c.ein for c in changes if c.score_delta is not None and c.diff_type == 'modified']
+            )
+
         for change in changes:
             if change.score_delta is not None:
                 # Classify severity based on magnitude
                 change.severity = _classify_score_change_severity(change.score_delta)
 
-                # Optionally fetch score history for trend analysis
+                # Optionally attach score history for trend analysis
                 if self.include_score_history and change.diff_type == 'modified':
-                    history = self._get_score_history(change.ein)
+                    history = histories.get(change.ein, [])
                     change.score_history = history
                     if len(history) >= 2:
                         change.score_trend = _analyze_score_trend(history)
@@ -256,8 +265,59 @@ class DiffValidator:
 
         return report
 
+    def _load_score_histories(self, eins: list[str], limit: int | None = None) -> dict[str, list[int]]:
+        """Load recent score history for many EINs with windowed dolt_history queries.
+
+        One query per SCORE_HISTORY_BATCH_SIZE EINs keeps the latest ``limit``
+        scores per charity (ROW_NUMBER over commit_date). If the windowed query
+        fails, falls back to per-EIN queries.
+
+        Args:
+            eins: Charity EINs
+            limit: Max number of historical scores per EIN (default: SCORE_HISTORY_LIMIT)
+
+        Returns:
+            Dict of EIN -> scores from oldest to newest (EINs without history omitted)
+        """
+        limit = limit or self.SCORE_HISTORY_LIMIT
+        unique = list(dict.fromkeys(eins))
+        histories: dict[str, list[int]] = {}
+
+        for start in range(0, len(unique), self.SCORE_HISTORY_BATCH_SIZE):
+            chunk = unique[start : start + self.SCORE_HISTORY_BATCH_SIZE]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            query = f"""
+            SELECT charity_ein, amal_score
+            FROM (
+                SELECT charity_ein, amal_score, commit_date, commit_hash,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY charity_ein ORDER BY commit_date DESC, commit_hash ASC
+                       ) AS rn
+                FROM dolt_history_evaluations
+                WHERE charity_ein IN ({placeholders}) AND amal_score IS NOT NULL
+            ) recent
+            WHERE rn <= %s
+            ORDER BY charity_ein ASC, rn DESC
+            """
+            try:
+                rows = db_query(query, (*chunk, limit)) or []
+            except Exception as e:
+                logger.debug(f"Windowed score history query failed, falling back to per-EIN: {e}")
+                for ein in chunk:
+                    history = self._get_score_history(ein, limit)
+                    if history:
+                        histories[ein] = history
+                continue
+
+            for row in rows:
+                histories.setdefault(row['charity_ein'], []).append(row['amal_score'])
+
+        return histories
+
     def _get_score_history(self, ein: str, limit: int | None = None) -> list[int]:
-        """Query dolt_history_evaluations for score trend analysis.
+        """Query dolt_history_evaluations for one charity's score trend.
+
+        validate() uses _load_score_histories(); this is the per-EIN fallback.
 
         Args:
             ein: Charity EIN
@@ -6,12 +6,22 @@ Handles:
 3. Aggregation of results into final report
 4. Diff-based validation using DoltDB versioning
 5. Verdict persistence for regression detection
+
+Execution is two-level: up to ``max_concurrent_charities`` charities are
+validated at once, and within a charity every LLM judge call (including each
+narrative variant) is submitted to one shared executor, capped per judge
+model by ``llm_concurrency_per_model``. Deterministic judges run inline, or on
+a process pool when ``deterministic_workers`` > 0. Verdicts are always
+assembled in judge order and results in sample order, so output does not
+depend on scheduling.
 """
 
 from __future__ import annotations
 
 import logging
 import random
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -48,6 +58,9 @@ from .zakat_judge import ZakatJudge
 
 logger = logging.getLogger(__name__)
 
+# Verdict rows buffered before a batched write to judge_verdicts
+_VERDICT_FLUSH_ROWS = 200
+
 
 def _get_current_commit_hash() -> str | None:
     """Get the current HEAD commit hash from DoltDB.
@@ -67,6 +80,51 @@ def _get_current_commit_hash() -> str | None:
         return None
 
 
+def _judge_failure_verdict(judge_label: str, error: Exception) -> JudgeVerdict:
+    """Verdict recorded when a judge raises instead of returning."""
+    return JudgeVerdict(
+        passed=False,
+        judge_name=judge_label,
+        issues=[
+            ValidationIssue(
+                severity=Severity.ERROR,
+                field="judge_execution",
+                message=f"Judge execution failed: {str(error)[:100]}",
+            )
+        ],
+    )
+
+
+def _run_judge(judge: BaseJudge, output: dict[str, Any], context: dict[str, Any], ein: str, prefix: str = "") -> JudgeVerdict:
+    """Run one judge, prefixing its name for non-AMAL variants and converting failures to verdicts."""
+    try:
+        verdict = judge.validate(output, context)
+        # Prefix the judge name for non-AMAL variants
+        if prefix:
+            verdict = JudgeVerdict(
+                passed=verdict.passed,
+                judge_name=f"{prefix}{verdict.judge_name}",
+                issues=verdict.issues,
+                skipped=verdict.skipped,
+                skip_reason=verdict.skip_reason,
+                cost_usd=verdict.cost_usd,
+                metadata=verdict.metadata,
+            )
+        return verdict
+    except Exception as e:
+        judge_label = f"{prefix}{judge.name}" if prefix else judge.name
+        logger.error(f"Judge {judge_label} failed for {ein}: {e}")
+        return _judge_failure_verdict(judge_label, e)
+
+
+def _run_deterministic_judges(
+    config: JudgeConfig, judge_classes: list[type], charity: dict[str, Any], context: dict[str, Any]
+) -> list[JudgeVerdict]:
+    """Process-pool entry point: run deterministic judges for one charity."""
+    ein = charity.get("ein", "unknown")
+    return [_run_judge(cls(config), charity, context, ein) for cls in judge_classes]
+
+
 @dataclass
 class BatchResult:
     """Result from validating a batch of charities.
@@ -199,6 +257,11 @@ class JudgeOrchestrator:
         self._judges: Optional[list[BaseJudge]] = None
         self._verdict_repo: Optional["JudgeVerdictRepository"] = None
 
+        self._executor_lock = threading.Lock()
+        self._llm_executor: Optional[ThreadPoolExecutor] = None
+        self._deterministic_pool: Optional[ProcessPoolExecutor] = None
+        self._model_semaphores: dict[str, threading.BoundedSemaphore] = {}
+
     def _get_verdict_repo(self) -> "JudgeVerdictRepository":
         """Lazy-load verdict repository."""
         if self._verdict_repo is None:
@@ -207,6 +270,41 @@ class JudgeOrchestrator:
             self._verdict_repo = JudgeVerdictRepository()
         return self._verdict_repo
 
+    def _get_llm_executor(self) -> ThreadPoolExecutor:
+        """Shared executor for LLM judge calls across all in-flight charities."""
+        with self._executor_lock:
+            if self._llm_executor is None:
+                self._llm_executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.config.llm_concurrency_per_model) * 2,
+                    thread_name_prefix="llm-judge",
+                )
+            return self._llm_executor
+
+    def _get_deterministic_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for deterministic judges, or None to run them inline."""
+        if self.config.deterministic_workers <= 0:
+            return None
+        with self._executor_lock:
+            if self._deterministic_pool is None:
+                self._deterministic_pool = ProcessPoolExecutor(max_workers=self.config.deterministic_workers)
+            return self._deterministic_pool
+
+    def _model_semaphore(self, judge: BaseJudge) -> threading.BoundedSemaphore:
+        """Per-model cap on concurrent LLM judge calls."""
+        model = judge.config.judge_model
+        with self._executor_lock:
+            if model not in self._model_semaphores:
+                self._model_semaphores[model] = threading.BoundedSemaphore(
+                    max(1, self.config.llm_concurrency_per_model)
+                )
+            return self._model_semaphores[model]
+
+    def _run_llm_judge(
+        self, judge: BaseJudge, output: dict[str, Any], context: dict[str, Any], ein: str, prefix: str
+    ) -> JudgeVerdict:
+        with self._model_semaphore(judge):
+            return _run_judge(judge, output, context, ein, prefix)
+
     def get_url_verifier(self) -> URLVerifier:
         """Get or create shared URL verifier."""
         if self._url_verifier is None:
@@ -335,13 +433,12 @@ class JudgeOrchestrator:
             f"{len(deterministic_judges)} deterministic judges, {len(llm_judges)} LLM judges"
         )
 
-        # Step 3: Validate each sampled charity
-        results = []
-        total_cost = 0.0
+        # Step 3: Validate sampled charities concurrently (results keep sample order)
+        persist = self.persist_verdicts and bool(current_commit)
+        pending_rows: list[dict[str, Any]] = []
 
-        for charity in sample:
+        def validate_one(charity: dict[str, Any]) -> CharityValidationResult:
             ein = charity.get("ein", "unknown")
-            name = charity.get("name", "Unknown")
 
             # Get context for this charity
             context = {}
@@ -351,21 +448,32 @@ class JudgeOrchestrator:
                 except Exception as e:
                     logger.warning(f"Failed to get context for {ein}: {e}")
 
-            # Validate this charity
-            result = self._validate_single(charity, context)
-            results.append(result)
-            total_cost += result.total_cost_usd
+            return self._validate_single(charity, context)
 
-            # Log progress
-            status = "PASS" if result.passed else "FLAGGED"
-            logger.info(
-                f"Validated {ein} ({name}): {status} "
-                f"({len(result.all_errors)} errors, {len(result.all_warnings)} warnings)"
-            )
+        results = []
+        total_cost = 0.0
+        workers = max(1, min(self.config.max_concurrent_charities, len(sample) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="judge-charity") as pool:
+            for charity, result in zip(sample, pool.map(validate_one, sample)):
+                results.append(result)
+                total_cost += result.total_cost_usd
+
+                # Log progress
+                status = "PASS" if result.passed else "FLAGGED"
+                logger.info(
+                    f"Validated {result.ein} ({charity.get('name', 'Unknown')}): {status} "
+                    f"({len(result.all_errors)} errors, {len(result.all_warnings)} warnings)"
+                )
 
-            # Persist verdicts if enabled
-            if self.persist_verdicts and current_commit:
-                self._persist_verdicts(result, current_commit)
+                # Persist verdicts in batches for this commit
+                if persist:
+                    pending_rows.extend(self._verdict_rows(result))
+                    if len(pending_rows) >= _VERDICT_FLUSH_ROWS:
+                        self._save_verdict_rows(pending_rows, current_commit)
+                        pending_rows = []
+
+        if persist and pending_rows:
+            self._save_verdict_rows(pending_rows, current_commit)
 
         # Step 4: Create batch result
         batch_result = BatchResult(
@@ -389,6 +497,30 @@ class JudgeOrchestrator:
 
         return batch_result
 
+    @staticmethod
+    def _verdict_rows(result: CharityValidationResult) -> list[dict[str, Any]]:
+        """judge_verdicts rows for one charity's result."""
+        return [
+            {
+                "charity_ein": result.ein,
+                "judge_name": verdict.judge_name,
+                "passed": verdict.passed,
+                "error_count": len(verdict.errors),
+                "warning_count": len(verdict.warnings),
+                "issues": [i.to_dict() for i in verdict.issues],
+                "cost_usd": verdict.cost_usd,
+            }
+            for verdict in result.verdicts
+        ]
+
+    def _save_verdict_rows(self, rows: list[dict[str, Any]], commit_hash: str) -> None:
+        """Write buffered verdict rows for a commit in one batch."""
+        try:
+            self._get_verdict_repo().save_verdicts_batch(rows, commit_hash)
+        except Exception as e:
+            eins = sorted({r["charity_ein"] for r in rows})
+            logger.error(f"Failed to persist verdicts for {len(eins)} charities ({', '.join(eins[:5])}...): {e}")
+
     def _persist_verdicts(self, result: CharityValidationResult, commit_hash: str) -> None:
         """Persist judge verdicts to the database.
 
@@ -396,23 +528,7 @@ class JudgeOrchestrator:
             result: Validation result for a charity
             commit_hash: Current commit hash
         """
-        try:
-            verdict_repo = self._get_verdict_repo()
-            for verdict in result.verdicts:
-                verdict_repo.save_verdict(
-                    {
-                        "charity_ein": result.ein,
-                        "commit_hash": commit_hash,
-                        "judge_name": verdict.judge_name,
-                        "passed": verdict.passed,
-                        "error_count": len(verdict.errors),
-                        "warning_count": len(verdict.warnings),
-                        "issues": [i.to_dict() for i in verdict.issues],
-                        "cost_usd": verdict.cost_usd,
-                    }
-                )
-        except Exception as e:
-            logger.error(f"Failed to persist verdicts for {result.ein}: {e}")
+        self._save_verdict_rows(self._verdict_rows(result), commit_hash)
 
     def _stratified_sample(self, charities: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Sample charities with stratification by score tier.
@@ -497,6 +613,7 @@ class JudgeOrchestrator:
 
         LLM judges (citation, factual, score) run once per narrative variant
         (AMAL, then strategic if present). Deterministic judges run once.
+        LLM calls run concurrently; verdicts keep judge order.
 
         Args:
             charity: Exported charity data
@@ -508,74 +625,38 @@ class JudgeOrchestrator:
         ein = charity.get("ein", "unknown")
         name = charity.get("name", "Unknown")
 
-        verdicts: list[JudgeVerdict] = []
-        total_cost = 0.0
-
         judges = self.get_judges()
         variants = self._build_narrative_variants(charity)
 
+        # One slot per verdict, in judge order; each slot is a finished verdict or a Future
+        slots: list[JudgeVerdict | Future | None] = []
+        deterministic: list[tuple[int, BaseJudge]] = []
+        llm_executor = None
+
         for judge in judges:
-            is_variant_judge = (
-                judge.judge_type == JudgeType.LLM
-                and judge.name in self._VARIANT_JUDGE_NAMES
-            )
+            if judge.judge_type != JudgeType.LLM:
+                deterministic.append((len(slots), judge))
+                slots.append(None)
+                continue
 
-            if is_variant_judge:
-                # Run per-variant LLM judges once per narrative variant
-                for prefix, variant_output in variants:
-                    try:
-                        verdict = judge.validate(variant_output, context)
-                        # Prefix the judge name for non-AMAL variants
-                        if prefix:
-                            verdict = JudgeVerdict(
-                                passed=verdict.passed,
-                                judge_name=f"{prefix}{verdict.judge_name}",
-                                issues=verdict.issues,
-                                skipped=verdict.skipped,
-                                skip_reason=verdict.skip_reason,
-                                cost_usd=verdict.cost_usd,
-                                metadata=verdict.metadata,
-                            )
-                        verdicts.append(verdict)
-                        total_cost += verdict.cost_usd
-                    except Exception as e:
-                        judge_label = f"{prefix}{judge.name}" if prefix else judge.name
-                        logger.error(f"Judge {judge_label} failed for {ein}: {e}")
-                        verdicts.append(
-                            JudgeVerdict(
-                                passed=False,
-                                judge_name=f"{prefix}{judge.name}" if prefix else judge.name,
-                                issues=[
-                                    ValidationIssue(
-                                        severity=Severity.ERROR,
-                                        field="judge_execution",
-                                        message=f"Judge execution failed: {str(e)[:100]}",
-                                    )
-                                ],
-                            )
-                        )
+            if llm_executor is None:
+                llm_executor = self._get_llm_executor()
+            if judge.name in self._VARIANT_JUDGE_NAMES:
+                # Per-variant LLM judges run once per narrative variant
+                runs = variants
             else:
-                # Non-variant judges run once on the full charity data
-                # (deterministic judges + LLM judges like zakat, narrative_quality, cross_lens)
-                try:
-                    verdict = judge.validate(charity, context)
-                    verdicts.append(verdict)
-                    total_cost += verdict.cost_usd
-                except Exception as e:
-                    logger.error(f"Judge {judge.name} failed for {ein}: {e}")
-                    verdicts.append(
-                        JudgeVerdict(
-                            passed=False,
-                            judge_name=judge.name,
-                            issues=[
-                                ValidationIssue(
-                                    severity=Severity.ERROR,
-                                    field="judge_execution",
-                                    message=f"Judge execution failed: {str(e)[:100]}",
-                                )
-                            ],
-                        )
-                    )
+                # Other LLM judges (zakat, narrative_quality, cross_lens) run once on the full data
+                runs = [("", charity)]
+            for prefix, variant_output in runs:
+                slots.append(llm_executor.submit(self._run_llm_judge, judge, variant_output, context, ein, prefix))
+
+        # Deterministic judges run while the LLM calls are in flight
+        if deterministic:
+            for (index, _), verdict in zip(deterministic, self._run_deterministic(deterministic, charity, context)):
+                slots[index] = verdict
+
+        verdicts: list[JudgeVerdict] = [slot.result() if isinstance(slot, Future) else slot for slot in slots]
+        total_cost = sum(v.cost_usd for v in verdicts)
 
         # Aggregate results
         all_passed = all(v.passed for v in verdicts if not v.skipped)
@@ -588,6 +669,22 @@ class JudgeOrchestrator:
             total_cost_usd=total_cost,
         )
 
+    def _run_deterministic(
+        self, judges: list[tuple[int, BaseJudge]], charity: dict[str, Any], context: dict[str, Any]
+    ) -> list[JudgeVerdict]:
+        """Run deterministic judges inline or, if configured, on the process pool."""
+        ein = charity.get("ein", "unknown")
+        pool = self._get_deterministic_pool()
+        if pool is not None:
+            try:
+                future = pool.submit(
+                    _run_deterministic_judges, self.config, [type(j) for _, j in judges], charity, context
+                )
+                return future.result()
+            except Exception as e:
+                logger.warning(f"Deterministic judge pool failed for {ein}, running inline: {e}")
+        return [_run_judge(judge, charity, context, ein) for _, judge in judges]
+
     def validate_single(
         self, charity: dict[str, Any], context: Optional[dict[str, Any]] = None
     ) -> CharityValidationResult:
@@ -614,6 +711,12 @@ class JudgeOrchestrator:
 
     def close(self) -> None:
         """Clean up resources."""
+        if self._llm_executor:
+            self._llm_executor.shutdown(wait=True)
+            self._llm_executor = None
+        if self._deterministic_pool:
+            self._deterministic_pool.shutdown(wait=True)
+            self._deterministic_pool = None
         if self._url_verifier:
             self._url_verifier.close()
             self._url_verifier = None
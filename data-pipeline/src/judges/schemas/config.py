@@ -32,6 +32,9 @@ class JudgeConfig:
         enable_factual_judge: Run factual claim validation
         enable_score_judge: Run score rationale validation
         enable_zakat_judge: Run zakat classification validation
+        max_concurrent_charities: Charities validated at once in validate_batch
+        llm_concurrency_per_model: Max in-flight LLM judge calls per judge model
+        deterministic_workers: Process-pool size for deterministic judges (0 = run inline)
     """
 
     # Sampling configuration
@@ -73,6 +76,13 @@ class JudgeConfig:
     enable_narrative_quality_judge: bool = True  # Assesses specificity, actionability, genuineness
     enable_cross_lens_judge: bool = True   # Finds contradictions across narrative lenses
 
+    # Execution — charities run concurrently; LLM judges fan out on a shared
+    # executor capped per model; deterministic judges are cheap enough to run
+    # inline unless a process pool is requested
+    max_concurrent_charities: int = 4
+    llm_concurrency_per_model: int = 8
+    deterministic_workers: int = 0
+
     # Stratified sampling options
     ensure_tier_coverage: bool = True  # Sample from all score tiers
     escalate_flagged: bool = True  # 100% validation for flagged charities
@@ -15,7 +15,8 @@ from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+from ..utils.html_parser import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -299,7 +300,7 @@ class URLVerifier:
 
         Removes scripts, styles, and extracts main content.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html, source="url_verifier")
 
         # Remove non-content elements
         for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
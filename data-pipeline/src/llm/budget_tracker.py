@@ -14,6 +14,9 @@ Usage:
     add_cost(resp.cost_usd)
 
 With no budget set (the default), check_budget() is a no-op.
+
+Responses served from the LLM response cache cost nothing; their original
+cost is recorded with add_saved() so the run summary can report it.
 """
 
 import threading
@@ -27,14 +30,16 @@ class BudgetExceededError(Exception):
 _lock = threading.Lock()
 _limit_usd: Optional[float] = None
 _spent_usd: float = 0.0
+_saved_usd: float = 0.0
 
 
 def set_budget(limit_usd: Optional[float]) -> None:
     """Set (or clear, with None) the budget cap and reset spend."""
-    global _limit_usd, _spent_usd
+    global _limit_usd, _spent_usd, _saved_usd
     with _lock:
         _limit_usd = limit_usd
         _spent_usd = 0.0
+        _saved_usd = 0.0
 
 
 def add_cost(cost_usd: float) -> None:
@@ -46,6 +51,15 @@ def add_cost(cost_usd: float) -> None:
         _spent_usd += cost_usd
 
 
+def add_saved(cost_usd: float) -> None:
+    """Record spend avoided by serving an LLM call from the response cache."""
+    global _saved_usd
+    if not cost_usd:
+        return
+    with _lock:
+        _saved_usd += cost_usd
+
+
 def check_budget() -> None:
     """Raise BudgetExceededError if the cap is set and already reached."""
     with _lock:
@@ -64,3 +78,8 @@ def get_spent() -> float:
 def get_limit() -> Optional[float]:
     with _lock:
         return _limit_usd
+
+
+def get_saved() -> float:
+    with _lock:
+        return _saved_usd
@@ -0,0 +1,394 @@
+"""
+Tolerant, incremental JSON repair for LLM output.
+
+One left-to-right pass over the response turns what models actually emit
+into strict JSON for json.loads, and records every change it made:
+
+- leading_text: prose or a ```json fence before the first { / [
+- trailing_text: anything after the top-level value closes
+- trailing_comma / duplicate_comma: "[1, 2,]", "{"a": 1,, "b": 2}"
+- control_char: raw newlines/tabs inside strings (escaped), other control
+  characters (dropped)
+- invalid_escape: a backslash before a character JSON can't escape ("\\$")
+- mismatched_bracket: "]" closing an object or "}" closing an array
+- python_literal: True / False / None
+- truncated: the response stopped mid-value; it is cut back to the last
+  complete value and the open containers are closed, so a half-written
+  string, number, key or list item never reaches the caller
+
+The parser is incremental: StreamingJsonRepairer.feed() accepts chunks as
+they stream in, reports which top-level keys are complete, and snapshot()
+returns the object parsed so far, so callers can validate a response
+before the last token arrives.
+
+Usage:
+    from src.llm.json_repair import parse_llm_json, repair_json_text
+
+    data = parse_llm_json(response.text)          # raises json.JSONDecodeError
+
+    result = repair_json_text(response.text)
+    if result.repairs:
+        logger.info(f"Repaired LLM JSON: {result.describe()}")
+    data = result.loads()
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+_CLOSERS = {"{": "}", "[": "]"}
+_STRING_RUN = re.compile(r'[^"\\\x00-\x1f]+')
+_WHITESPACE_RUN = re.compile(r"[ \t\n\r]+")
+_SCALAR_RUN = re.compile(r'[^\s,:\[\]{}"\x00-\x1f]+')
+_JSON_LITERALS = {"true", "false", "null"}
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_VALID_ESCAPES = set('"\\/bfnrtu')
+
+
+@dataclass
+class Repair:
+    """One change made to the input. position is the offset in the original text."""
+
+    kind: str
+    position: int
+    detail: str = ""
+
+
+@dataclass
+class RepairResult:
+    """Repaired JSON text (None if the input had no JSON value) and the repairs made."""
+
+    text: Optional[str]
+    repairs: List[Repair] = field(default_factory=list)
+    truncated: bool = False
+
+    def loads(self) -> Any:
+        """Parse the repaired text; raises json.JSONDecodeError like json.loads."""
+        if self.text is None:
+            raise json.JSONDecodeError("No JSON value found", "", 0)
+        return json.loads(self.text)
+
+    def describe(self) -> str:
+        """Short human-readable summary, e.g. 'trailing_comma@120, truncated@4051'."""
+        return ", ".join(f"{r.kind}@{r.position}" for r in self.repairs) or "none"
+
+
+class StreamingJsonRepairer:
+    """
+    Single-pass JSON repairer that accepts input in chunks.
+
+    Args:
+        start_chars: Characters that may open the top-level value
+        close_truncated: Close a truncated response at its last complete
+            value. With False the unclosed text is returned as-is (so
+            json.loads fails and the caller can retry the request).
+        fix_brackets: Replace a mismatched closing bracket. With False it is
+            kept, so a structurally wrong response stays unparseable.
+    """
+
+    def __init__(self, start_chars: str = "{[", close_truncated: bool = True, fix_brackets: bool = True):
+        self.start_chars = start_chars
+        self.close_truncated = close_truncated
+        self.fix_brackets = fix_brackets
+        self.repairs: List[Repair] = []
+
+        self._pending = ""  # Input not yet consumed (an unfinished scalar or escape)
+        self._offset = 0  # Input offset of _pending[0]
+        self._out: List[str] = []
+        self._out_len = 0
+        self._joined: Optional[str] = None
+
+        self._started = False
+        self._done = False
+        self._stack: List[str] = []
+        self._expect_key = False
+        self._in_string = False
+        self._string_is_key = False
+        self._pending_comma = False
+        self._comma_space = ""  # Whitespace after a pending comma, emitted with it
+        self._leading = ""
+        self._trailing: List[str] = []
+        self._trailing_at = 0
+
+        # Last point where everything emitted so far forms complete values
+        self._safe_len = 0
+        self._safe_closers = ""
+
+        # Top-level object keys, for early validation
+        self._key_parts: Optional[List[str]] = None
+        self._current_key: Optional[str] = None
+        self._completed_keys: List[str] = []
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    @property
+    def done(self) -> bool:
+        """True once the top-level value has closed."""
+        return self._done
+
+    @property
+    def completed_keys(self) -> List[str]:
+        """Top-level object keys whose values are complete, in arrival order."""
+        return list(self._completed_keys)
+
+    def snapshot(self) -> Any:
+        """Parse everything complete so far (open containers closed); None if nothing parses yet."""
+        if not self._started:
+            return None
+        text = self._text() if self._done else self._text()[: self._safe_len] + self._safe_closers
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+
+    # ----------------------------------------------------------------- output
+
+    def _emit(self, piece: str) -> None:
+        self._out.append(piece)
+        self._out_len += len(piece)
+        self._joined = None
+
+    def _text(self) -> str:
+        if self._joined is None:
+            self._joined = "".join(self._out)
+            self._out = [self._joined]
+        return self._joined
+
+    def _repair(self, kind: str, position: int, detail: str = "") -> None:
+        self.repairs.append(Repair(kind, position, detail))
+
+    def _flush_comma(self) -> None:
+        if self._pending_comma:
+            self._emit("," + self._comma_space)
+            self._pending_comma = False
+            self._comma_space = ""
+
+    def _value_complete(self) -> None:
+        self._safe_len = self._out_len
+        self._safe_closers = "".join(_CLOSERS[c] for c in reversed(self._stack))
+        if len(self._stack) == 1 and self._current_key is not None:
+            self._completed_keys.append(self._current_key)
+            self._current_key = None
+
+    # ---------------------------------------------------------------- parsing
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consume the next piece of the response.
+
+        Returns:
+            Top-level keys whose values completed within this chunk
+        """
+        before = len(self._completed_keys)
+        self._pending += chunk
+        self._process(final=False)
+        return self._completed_keys[before:]
+
+    def _process(self, final: bool) -> None:
+        s = self._pending
+        n = len(s)
+        i = 0
+
+        while i < n:
+            if self._done:
+                self._trailing.append(s[i:])
+                i = n
+                break
+
+            if not self._started:
+                starts = [p for p in (s.find(c, i) for c in self.start_chars) if p != -1]
+                if not starts:
+                    skipped = s[i:]
+                    i = n
+                else:
+                    j = min(starts)
+                    skipped = s[i:j]
+                    i = j
+                if len(self._leading) < 40:
+                    self._leading += skipped[:40]
+                if i == n:
+                    break
+                if self._leading.strip():
+                    self._repair("leading_text", 0, self._leading.strip()[:40])
+                c = s[i]
+                self._started = True
+                self._stack.append(c)
+                self._expect_key = c == "{"
+                self._emit(c)
+                self._value_complete()
+                i += 1
+                continue
+
+            if self._in_string:
+                m = _STRING_RUN.match(s, i)
+                if m:
+                    self._emit(m.group())
+                    if self._key_parts is not None:
+                        self._key_parts.append(m.group())
+                    i = m.end()
+                    continue
+                c = s[i]
+                if c == '"':
+                    self._emit(c)
+                    self._in_string = False
+                    i += 1
+                    if self._string_is_key:
+                        self._expect_key = False
+                        if self._key_parts is not None:
+                            self._current_key = json.loads('"' + "".join(self._key_parts) + '"')
+                            self._key_parts = None
+                    else:
+                        self._value_complete()
+                elif c == "\\":
+                    if i + 1 == n and not final:
+                        break  # Wait for the escaped character
+                    nxt = s[i + 1] if i + 1 < n else ""
+                    if nxt and nxt in _VALID_ESCAPES:
+                        piece = c + nxt
+                    else:
+                        self._repair("invalid_escape", self._offset + i, repr(nxt))
+                        piece = "\\\\"
+                        nxt = ""
+                    self._emit(piece)
+                    if self._key_parts is not None:
+                        self._key_parts.append(piece)
+                    i += 1 + len(nxt)
+                else:
+                    escaped = _CONTROL_ESCAPES.get(c, "")
+                    self._repair("control_char", self._offset + i, repr(c))
+                    if escaped:
+                        self._emit(escaped)
+                        if self._key_parts is not None:
+                            self._key_parts.append(escaped)
+                    i += 1
+                continue
+
+            m = _WHITESPACE_RUN.match(s, i)
+            if m:
+                if self._pending_comma:
+                    self._comma_space += m.group()
+                else:
+                    self._emit(m.group())
+                i = m.end()
+                continue
+
+            c = s[i]
+            if c == '"':
+                self._flush_comma()
+                self._in_string = True
+                self._string_is_key = self._expect_key and self._stack[-1] == "{"
+                self._key_parts = [] if self._string_is_key and len(self._stack) == 1 else None
+                self._emit(c)
+                i += 1
+            elif c in "{[":
+                # Not a safe point: a container cut off before its first complete
+                # value is dropped rather than closed as an empty {} / []
+                self._flush_comma()
+                self._stack.append(c)
+                self._expect_key = c == "{"
+                self._emit(c)
+                i += 1
+            elif c in "}]":
+                if self._pending_comma:
+                    self._pending_comma = False
+                    self._comma_space = ""
+                    self._repair("trailing_comma", self._offset + i)
+                expected = _CLOSERS[self._stack[-1]]
+                if c != expected and self.fix_brackets:
+                    self._repair("mismatched_bracket", self._offset + i, f"{c} -> {expected}")
+                    c = expected
+                self._stack.pop()
+                self._emit(c)
+                self._expect_key = False
+                i += 1
+                if self._stack:
+                    self._value_complete()
+                else:
+                    self._done = True
+                    self._trailing_at = self._offset + i
+            elif c == ",":
+                if self._pending_comma:
+                    self._repair("duplicate_comma", self._offset + i)
+                self._pending_comma = True
+                self._expect_key = self._stack[-1] == "{"
+                i += 1
+            elif c == ":":
+                self._emit(c)
+                i += 1
+            elif c < " ":
+                self._repair("control_char", self._offset + i, repr(c))
+                i += 1
+            else:
+                m = _SCALAR_RUN.match(s, i)
+                if m.end() == n and not final:
+                    break  # The scalar may continue in the next chunk
+                token = m.group()
+                self._flush_comma()
+                if token in _PYTHON_LITERALS:
+                    self._repair("python_literal", self._offset + i, token)
+                    token = _PYTHON_LITERALS[token]
+                self._emit(token)
+                # A scalar cut off by the end of input may be incomplete ("12" of "125")
+                if m.end() < n or token in _JSON_LITERALS:
+                    self._value_complete()
+                i = m.end()
+
+        self._pending = s[i:]
+        self._offset += i
+
+    def finish(self) -> RepairResult:
+        """Process the remaining input and return the repaired text."""
+        self._process(final=True)
+        if not self._started:
+            return RepairResult(text=None, repairs=self.repairs)
+
+        if self._done:
+            trailing = "".join(self._trailing).strip().strip("`").strip()
+            if trailing:
+                self._repair("trailing_text", self._trailing_at, trailing[:40])
+            return RepairResult(text=self._text(), repairs=self.repairs)
+
+        text = self._text()
+        if not self.close_truncated:
+            return RepairResult(text=text, repairs=self.repairs, truncated=True)
+        dropped = len(text) - self._safe_len
+        self._repair(
+            "truncated",
+            self._offset,
+            f"dropped {dropped} chars, closed {self._safe_closers}" if dropped else f"closed {self._safe_closers}",
+        )
+        return RepairResult(text=text[: self._safe_len] + self._safe_closers, repairs=self.repairs, truncated=True)
+
+
+def repair_json_text(
+    text: str, start_chars: str = "{[", close_truncated: bool = True, fix_brackets: bool = True
+) -> RepairResult:
+    """Repair a complete LLM response in one pass (see StreamingJsonRepairer)."""
+    # Fast path: most responses are already strict JSON
+    stripped = (text or "").strip()
+    if stripped and stripped[0] in start_chars:
+        try:
+            json.loads(stripped)
+            return RepairResult(text=stripped)
+        except json.JSONDecodeError:
+            pass
+    repairer = StreamingJsonRepairer(start_chars=start_chars, close_truncated=close_truncated, fix_brackets=fix_brackets)
+    repairer.feed(text or "")
+    return repairer.finish()
+
+
+def parse_llm_json(text: str, start_chars: str = "{[", close_truncated: bool = True) -> Any:
+    """Parse JSON out of an LLM response; raises json.JSONDecodeError if nothing usable is found."""
+    return repair_json_text(text, start_chars=start_chars, close_truncated=close_truncated).loads()
+
+
+def repair_json(json_str: str) -> str:
+    """Repaired JSON text for json.loads (the input unchanged if it has no JSON value)."""
+    result = repair_json_text(json_str)
+    return result.text if result.text is not None else json_str
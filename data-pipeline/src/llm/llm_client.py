@@ -19,16 +19,22 @@ Usage:
 import hashlib
 import logging
 import os
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 import litellm
-from litellm import completion, completion_cost
+from litellm import completion, completion_cost, stream_chunk_builder
+from pydantic import BaseModel
 
+from ..utils.tracing import trace_span
 from .budget_tracker import add_cost as _budget_add_cost
+from .budget_tracker import add_saved as _budget_add_saved
 from .budget_tracker import check_budget as _budget_check
+from .response_cache import LLMResponseCache, compute_cache_key, get_response_cache
+from .stream_validation import StreamingSchemaValidator, StreamValidationError, streaming_enabled
 
 # Suppress verbose LiteLLM logging
 litellm.set_verbose = False
@@ -311,6 +317,17 @@ class LLMResponse:
 # =============================================================================
 
 
+def _close_stream(stream: Any) -> None:
+    """Close a LiteLLM stream wrapper and the provider stream beneath it (best effort)."""
+    for target in (stream, getattr(stream, "completion_stream", None)):
+        close = getattr(target, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
+
+
 class LLMClient:
     """
     Unified LLM client with task-based model selection and automatic fallback.
@@ -320,6 +337,9 @@ class LLMClient:
     - Automatic fallback on transient errors
     - Full tracking of (model_version, prompt_version, db_snapshot_version)
     - Cost tracking
+    - Optional persistent response cache (see src/llm/response_cache.py)
+    - Optional streamed generation with early schema validation
+      (see src/llm/stream_validation.py)
 
     Usage:
         # Task-based (recommended)
@@ -336,6 +356,7 @@ class LLMClient:
         api_keys: Optional[Dict[str, str]] = None,
         db_snapshot_version: Optional[str] = None,
         logger=None,
+        response_cache: Optional[LLMResponseCache] = None,
     ):
         """
         Initialize LLM client.
@@ -346,11 +367,14 @@ class LLMClient:
             api_keys: Dict of provider -> API key
             db_snapshot_version: Current database version for tracking
             logger: Optional logger instance
+            response_cache: Response cache to use (default: the process-wide
+                cache, which is None unless enabled via --llm-cache / LLM_RESPONSE_CACHE)
         """
         self.logger = logger
         self.api_keys = api_keys or {}
         self.db_snapshot_version = db_snapshot_version
         self.task = task
+        self.response_cache = response_cache if response_cache is not None else get_response_cache()
 
         self._setup_api_keys()
 
@@ -447,10 +471,22 @@ class LLMClient:
         json_schema: Optional[Dict] = None,
         prompt_version: Optional[str] = None,
         retry_on_error: bool = True,
+        use_cache: bool = True,
+        stream_schema: Optional[Type[BaseModel]] = None,
+        stream_fields: Optional[Sequence[str]] = None,
     ) -> LLMResponse:
         """
         Generate text using the configured model with automatic fallback.
 
+        When a response cache is configured, an identical earlier request
+        (same model, prompts, temperature, JSON settings and max_tokens) is
+        served from it at zero cost; the avoided spend is recorded as saved.
+
+        With streaming enabled (--llm-stream / LLM_STREAMING) and a
+        stream_schema given, the response is streamed and checked as it
+        arrives; a definite schema violation cancels the stream and moves on
+        to the fallback model. Time-to-first-token is recorded in metadata.
+
         Args:
             prompt: User prompt
             system_prompt: Optional system instructions
@@ -460,6 +496,9 @@ class LLMClient:
             json_schema: Optional JSON schema for structured output
             prompt_version: Version string for this prompt template
             retry_on_error: Automatic retry on failures
+            use_cache: Consult/populate the response cache (if one is configured)
+            stream_schema: Pydantic model to validate a streamed JSON response against
+            stream_fields: Top-level fields of stream_schema to check (default: all)
 
         Returns:
             LLMResponse with text, tracking metadata, and cost
@@ -467,26 +506,67 @@ class LLMClient:
         models_to_try = [self.model_name] + self.fallback_models
         last_error = None
         prompt_hash = self._compute_prompt_hash(prompt, system_prompt)
+        cache = self.response_cache if use_cache else None
 
         for model_name in models_to_try:
+            cache_key = None
+            if cache is not None:
+                cache_key = compute_cache_key(
+                    model_name, prompt, system_prompt, temperature, json_mode, json_schema, max_tokens
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return self._response_from_cache(cached, prompt_version, prompt_hash)
+
             # Budget guardrail: hard-stop BEFORE spending. Checked per attempt
             # (not via LiteLLM callbacks, which swallow raised exceptions).
             _budget_check()
+            stream_validator = None
+            if stream_schema is not None and streaming_enabled():
+                stream_validator = StreamingSchemaValidator(stream_schema, fields=stream_fields)
             try:
-                response = self._generate_with_model(
-                    model_name=model_name,
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    json_mode=json_mode,
-                    json_schema=json_schema,
-                    prompt_version=prompt_version,
-                    prompt_hash=prompt_hash,
-                    retry_on_error=retry_on_error,
-                )
+                with trace_span("llm", model_name, op="generate", task=self.task.value if self.task else None) as span:
+                    response = self._generate_with_model(
+                        model_name=model_name,
+                        prompt=prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        json_mode=json_mode,
+                        json_schema=json_schema,
+                        prompt_version=prompt_version,
+                        prompt_hash=prompt_hash,
+                        retry_on_error=retry_on_error,
+                        stream_validator=stream_validator,
+                    )
+                    span.set(
+                        input_tokens=response.input_tokens,
+                        output_tokens=response.output_tokens,
+                        cost_usd=response.cost_usd,
+                        time_to_first_token_ms=response.metadata.get("time_to_first_token_ms"),
+                    )
                 _budget_add_cost(response.cost_usd)
+                if cache_key is not None:
+                    try:
+                        cache.put(cache_key, asdict(response), prompt_hash=prompt_hash)
+                    except Exception as cache_error:
+                        # The cache is an optimization; never fail a paid-for call over it.
+                        if self.logger:
+                            self.logger.warning(f"LLM response cache write failed: {cache_error}")
                 return response
+            except StreamValidationError as e:
+                # Checked before _is_permanent_error: the message mentions the schema,
+                # but a cancelled stream is a bad sample, not a bad request.
+                last_error = e
+                _budget_add_cost(e.cost_usd)
+                if self.logger:
+                    self.logger.warning(
+                        f"Cancelled {model_name} stream after {e.chars_seen} chars "
+                        f"(${e.cost_usd:.6f} spent): {e}"
+                    )
+                if model_name == models_to_try[-1]:
+                    raise
+                continue
             except Exception as e:
                 last_error = e
 
@@ -522,6 +602,40 @@ class LLMClient:
 
         raise RuntimeError(f"All models failed. Last error: {last_error}")
 
+    def _response_from_cache(
+        self, cached: Dict[str, Any], prompt_version: Optional[str], prompt_hash: str
+    ) -> LLMResponse:
+        """Rebuild an LLMResponse from a cache entry. Costs nothing; original cost counts as saved."""
+        saved_cost = cached.get("cost_usd") or 0.0
+        _budget_add_saved(saved_cost)
+
+        response = LLMResponse(
+            text=cached.get("text", ""),
+            model=cached.get("model", ""),
+            provider=cached.get("provider", ""),
+            input_tokens=cached.get("input_tokens", 0),
+            output_tokens=cached.get("output_tokens", 0),
+            cost_usd=0.0,
+            finish_reason=cached.get("finish_reason"),
+            model_version=cached.get("model_version", ""),
+            prompt_version=prompt_version or get_prompt_version(self.task.value if self.task else "unknown"),
+            prompt_hash=prompt_hash,
+            db_snapshot_version=self.db_snapshot_version,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            task=self.task.value if self.task else None,
+            metadata={
+                **(cached.get("metadata") or {}),
+                "cache_hit": True,
+                "cached_at": cached.get("timestamp"),
+                "saved_cost_usd": saved_cost,
+            },
+        )
+
+        if self.logger:
+            self.logger.debug(f"LLM cache hit: {response.model} | saved ${saved_cost:.6f}")
+
+        return response
+
     def _generate_with_model(
         self,
         model_name: str,
@@ -534,6 +648,7 @@ class LLMClient:
         prompt_version: Optional[str],
         prompt_hash: str,
         retry_on_error: bool,
+        stream_validator: Optional[StreamingSchemaValidator] = None,
     ) -> LLMResponse:
         """Internal method to generate with a specific model."""
         model_config = MODEL_REGISTRY[model_name]
@@ -601,7 +716,11 @@ class LLMClient:
         litellm.drop_params = True
 
         # Make the call
-        response = completion(**kwargs)
+        time_to_first_token_ms = None
+        if stream_validator is not None:
+            response, time_to_first_token_ms = self._stream_completion(kwargs, stream_validator)
+        else:
+            response = completion(**kwargs)
 
         # Validate response structure (LiteLLM/API might return empty choices)
         if not response.choices or len(response.choices) == 0:
@@ -677,16 +796,62 @@ class LLMClient:
                 "response_ms": response_ms,
             },
         )
+        if stream_validator is not None:
+            llm_response.metadata["streamed"] = True
+            llm_response.metadata["time_to_first_token_ms"] = time_to_first_token_ms
 
         if self.logger:
+            ttft_str = f" | TTFT: {time_to_first_token_ms:.0f}ms" if time_to_first_token_ms is not None else ""
             self.logger.debug(
                 f"LLM call: {model_name} | "
                 f"Tokens: {llm_response.input_tokens}->{llm_response.output_tokens} | "
-                f"Cost: ${llm_response.cost_usd:.6f}"
+                f"Cost: ${llm_response.cost_usd:.6f}{ttft_str}"
             )
 
         return llm_response
 
+    def _stream_completion(
+        self, kwargs: Dict[str, Any], validator: StreamingSchemaValidator
+    ) -> Tuple[Any, Optional[float]]:
+        """
+        Stream a completion through validator and rebuild a regular response from the chunks.
+
+        Returns:
+            (response, time_to_first_token_ms)
+
+        Raises:
+            StreamValidationError: On the first definite violation; the stream is
+                closed and the error carries the cost of the tokens received.
+        """
+        start = time.monotonic()
+        time_to_first_token_ms = None
+        chunks = []
+        stream = completion(**kwargs, stream=True, stream_options={"include_usage": True})
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                if time_to_first_token_ms is None:
+                    time_to_first_token_ms = (time.monotonic() - start) * 1000
+                validator.feed(delta)
+        except StreamValidationError as e:
+            _close_stream(stream)
+            e.time_to_first_token_ms = time_to_first_token_ms
+            try:
+                e.cost_usd = completion_cost(
+                    completion_response=stream_chunk_builder(chunks, messages=kwargs["messages"])
+                )
+            except Exception:
+                e.cost_usd = 0.0  # Partial streams without usage data can't always be priced
+            raise
+
+        response = stream_chunk_builder(chunks, messages=kwargs["messages"])
+        if response is None:
+            raise RuntimeError(f"LLM API returned an empty stream. Model: {kwargs['model']}")
+        return response, time_to_first_token_ms
+
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the currently configured model."""
         return {
@@ -0,0 +1,289 @@
+"""
+Persistent, content-addressed cache for LLM responses.
+
+Opt-in: a `--force-phase baseline` rerun or an autoprompt sweep sends many
+byte-identical prompts. With the cache enabled, LLMClient.generate() serves
+those from disk instead of paying for them again.
+
+Entries are keyed on (model, full prompt, temperature, json_mode,
+json_schema, max_tokens) and stored in a single SQLite file (WAL mode) so
+concurrent workers and processes can share it. Eviction is by age and by
+total stored bytes (least-recently-used first).
+
+Usage:
+    from src.llm.response_cache import configure_response_cache
+
+    configure_response_cache(enabled=True)   # streaming_runner --llm-cache
+    # or: LLM_RESPONSE_CACHE=1 uv run python baseline.py ...
+
+A repeated request for a key that was already served from the cache in
+this process is treated as a caller retry (e.g. "invalid JSON, try again")
+and goes to the model, overwriting the stored entry.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import get_data_dir
+from ..constants import LLM_RESPONSE_CACHE_MAX_AGE_DAYS, LLM_RESPONSE_CACHE_MAX_BYTES
+
+# Responses ending this way are not worth replaying.
+_UNCACHEABLE_FINISH_REASONS = {"length", "max_tokens", "content_filter", "safety"}
+
+
+def get_default_cache_path() -> Path:
+    """Default location of the response cache database."""
+    return get_data_dir() / "llm_cache" / "responses.sqlite3"
+
+
+def compute_cache_key(
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    json_mode: bool,
+    json_schema: Optional[Dict],
+    max_tokens: Optional[int],
+) -> str:
+    """SHA256 over every input that changes what the model returns."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": system_prompt or "",
+            "prompt": prompt,
+            "temperature": temperature,
+            "json_mode": bool(json_mode),
+            "json_schema": json_schema,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LLM response cache with size/age eviction and counters.
+
+    Thread-safe: one connection guarded by a lock (SQLite serializes writes
+    anyway). Safe across processes thanks to WAL mode.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: int = LLM_RESPONSE_CACHE_MAX_BYTES,
+        max_age_days: float = LLM_RESPONSE_CACHE_MAX_AGE_DAYS,
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path: SQLite file (default: ~/.amal-metric-data/llm_cache/responses.sqlite3)
+            max_bytes: Evict least-recently-used entries above this many stored bytes
+            max_age_days: Entries older than this are treated as misses and evicted
+        """
+        self.path = Path(path) if path else get_default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 86400
+
+        self._lock = threading.Lock()
+        self._served_keys: set[str] = set()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "retries_bypassed": 0}
+        self._saved_usd = 0.0
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                prompt_hash TEXT,
+                response_json TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                cost_usd REAL NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses(last_accessed)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_created ON llm_responses(created_at)")
+        self._conn.commit()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored response.
+
+        Returns:
+            The stored response dict, or None on miss/expiry/caller retry
+        """
+        now = time.time()
+        with self._lock:
+            if cache_key in self._served_keys:
+                # Same request again in this process: the caller is retrying
+                # a response it rejected, so don't hand it back.
+                self._served_keys.discard(cache_key)
+                self._counters["retries_bypassed"] += 1
+                self._counters["misses"] += 1
+                return None
+
+            row = self._conn.execute(
+                "SELECT response_json, cost_usd, created_at FROM llm_responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                self._counters["misses"] += 1
+                return None
+
+            response_json, cost_usd, created_at = row
+            if now - created_at > self.max_age_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                self._conn.commit()
+                self._counters["evictions"] += 1
+                self._counters["misses"] += 1
+                return None
+
+            self._conn.execute("UPDATE llm_responses SET last_accessed = ? WHERE cache_key = ?", (now, cache_key))
+            self._conn.commit()
+            self._served_keys.add(cache_key)
+            self._counters["hits"] += 1
+            self._saved_usd += cost_usd or 0.0
+
+        try:
+            return json.loads(response_json)
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, cache_key: str, response: Dict[str, Any], prompt_hash: str = "") -> bool:
+        """
+        Store a response. Truncated, filtered or empty responses are skipped.
+
+        Returns:
+            True if the response was stored
+        """
+        text = response.get("text") or ""
+        if not text.strip() or response.get("finish_reason") in _UNCACHEABLE_FINISH_REASONS:
+            return False
+
+        response_json = json.dumps(response, default=str)
+        size = len(response_json.encode())
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses
+                    (cache_key, model, prompt_hash, response_json, size_bytes, cost_usd, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (cache_key, response.get("model", ""), prompt_hash, response_json, size, response.get("cost_usd") or 0.0, now, now),
+            )
+            self._conn.commit()
+            self._served_keys.discard(cache_key)
+            self._counters["stores"] += 1
+            self._evict_locked(now)
+        return True
+
+    def _evict_locked(self, now: float) -> None:
+        """Drop expired entries, then LRU entries until under max_bytes. Caller holds the lock."""
+        cursor = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (now - self.max_age_seconds,)
+        )
+        evicted = cursor.rowcount or 0
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+        if total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT cache_key, size_bytes FROM llm_responses ORDER BY last_accessed ASC"
+            ).fetchall()
+            doomed = []
+            for cache_key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((cache_key,))
+                total -= size
+            self._conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", doomed)
+            evicted += len(doomed)
+
+        if evicted:
+            self._conn.commit()
+            self._counters["evictions"] += evicted
+
+    def clear(self) -> int:
+        """Delete every entry. Returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self._served_keys.clear()
+            return cursor.rowcount or 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus on-disk totals."""
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+            ).fetchone()
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "saved_usd": self._saved_usd,
+                "entries": entries,
+                "total_bytes": total_bytes,
+                "max_bytes": self.max_bytes,
+                "path": str(self.path),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide cache used by LLMClient when none is passed explicitly.
+_cache_lock = threading.Lock()
+_global_cache: Optional[LLMResponseCache] = None
+_global_enabled: Optional[bool] = None
+
+
+def configure_response_cache(
+    enabled: bool,
+    path: Optional[Path] = None,
+    max_bytes: int = LLM_RESPONSE_CACHE_MAX_BYTES,
+    max_age_days: float = LLM_RESPONSE_CACHE_MAX_AGE_DAYS,
+) -> Optional[LLMResponseCache]:
+    """Enable (or disable, with enabled=False) the process-wide response cache."""
+    global _global_cache, _global_enabled
+    with _cache_lock:
+        if _global_cache is not None:
+            _global_cache.close()
+            _global_cache = None
+        _global_enabled = enabled
+        if enabled:
+            _global_cache = LLMResponseCache(path=path, max_bytes=max_bytes, max_age_days=max_age_days)
+        return _global_cache
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    The process-wide response cache, or None when caching is off.
+
+    Unless configure_response_cache() was called, the LLM_RESPONSE_CACHE
+    environment variable ("1"/"true") decides.
+    """
+    global _global_cache, _global_enabled
+    with _cache_lock:
+        if _global_enabled is None:
+            _global_enabled = os.environ.get("LLM_RESPONSE_CACHE", "").lower() in ("1", "true", "yes")
+            if _global_enabled:
+                _global_cache = LLMResponseCache()
+        return _global_cache
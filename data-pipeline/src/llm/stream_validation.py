@@ -0,0 +1,167 @@
+"""
+Early validation of streamed JSON LLM responses.
+
+Narrative prompts can take a minute or more to generate. When a response is
+already structurally wrong a few hundred tokens in, waiting for the rest only
+adds latency and cost before the caller retries. With streaming enabled,
+LLMClient.generate() feeds each chunk into a StreamingSchemaValidator, which
+raises StreamValidationError on the first definite violation so the client
+can close the stream and move on to the fallback model.
+
+A violation is definite only when more tokens cannot fix it:
+- no JSON object has opened after LLM_STREAM_MAX_PREAMBLE_CHARS characters
+- a closing bracket does not match its opener
+- a completed top-level field has the wrong type for the pydantic schema
+  (a string where the schema has an object, a list of strings where it has
+  a list of models, ...)
+
+Length and range constraints (max_length, ge/le, enums) are NOT treated as
+violations: the generators sanitize or tolerate those downstream, and some
+schema limits lag behind the prompts.
+
+Usage:
+    from src.llm.stream_validation import configure_streaming
+
+    configure_streaming(enabled=True)   # streaming_runner --llm-stream
+    # or: LLM_STREAMING=1 uv run python baseline.py ...
+
+    client.generate(prompt, json_mode=True, stream_schema=RichNarrativeV2)
+"""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Sequence, Set, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ..constants import LLM_STREAM_MAX_PREAMBLE_CHARS
+from .json_repair import StreamingJsonRepairer
+
+
+class StreamValidationError(ValueError):
+    """A streamed response was cancelled because it cannot become valid."""
+
+    def __init__(self, message: str, chars_seen: int = 0, partial_text: str = ""):
+        super().__init__(message)
+        self.chars_seen = chars_seen
+        self.partial_text = partial_text
+        # Filled in by LLMClient once the stream is closed
+        self.cost_usd = 0.0
+        self.time_to_first_token_ms: Optional[float] = None
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(schema: Type[BaseModel], field_name: str) -> TypeAdapter:
+    field_info = schema.model_fields[field_name]
+    return TypeAdapter(Annotated[field_info.annotation, field_info])
+
+
+def _is_definite(error: dict) -> bool:
+    """Type/shape errors are definite; constraint errors and nulls are left to the caller."""
+    if error.get("input") is None:
+        return False
+    return error["type"].endswith(("_type", "_parsing"))
+
+
+class StreamingSchemaValidator:
+    """
+    Incrementally checks a streamed JSON object against a pydantic schema.
+
+    Args:
+        schema: Pydantic model the response should follow
+        fields: Top-level fields to check (default: every field of the schema).
+            Keys outside this set are ignored.
+        max_preamble_chars: Characters allowed before the JSON object opens
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        fields: Optional[Sequence[str]] = None,
+        max_preamble_chars: int = LLM_STREAM_MAX_PREAMBLE_CHARS,
+    ):
+        self.schema = schema
+        self.fields: Set[str] = set(fields) if fields is not None else set(schema.model_fields)
+        unknown = self.fields - set(schema.model_fields)
+        if unknown:
+            raise ValueError(f"{schema.__name__} has no fields {sorted(unknown)}")
+        self.max_preamble_chars = max_preamble_chars
+        self.chars_seen = 0
+        self.validated_fields: list[str] = []
+
+        self._repairer = StreamingJsonRepairer(start_chars="{")
+        self._parts: list[str] = []
+        self._repairs_checked = 0
+
+    @property
+    def text(self) -> str:
+        """Everything received so far, unmodified."""
+        return "".join(self._parts)
+
+    def _fail(self, message: str) -> None:
+        raise StreamValidationError(message, chars_seen=self.chars_seen, partial_text=self.text)
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk; raises StreamValidationError on a definite violation."""
+        self._parts.append(chunk)
+        self.chars_seen += len(chunk)
+        completed = self._repairer.feed(chunk)
+
+        if not self._repairer.started and self.chars_seen > self.max_preamble_chars:
+            self._fail(f"No JSON object after {self.chars_seen} characters")
+
+        repairs = self._repairer.repairs
+        for repair in repairs[self._repairs_checked :]:
+            if repair.kind == "mismatched_bracket":
+                self._fail(f"Mismatched bracket at offset {repair.position}")
+        self._repairs_checked = len(repairs)
+
+        to_check = [key for key in completed if key in self.fields]
+        if not to_check:
+            return
+        snapshot = self._repairer.snapshot()
+        if not isinstance(snapshot, dict):
+            return
+        for key in to_check:
+            self._check_field(key, snapshot.get(key))
+
+    def _check_field(self, key: str, value: Any) -> None:
+        try:
+            _field_adapter(self.schema, key).validate_python(value)
+        except ValidationError as e:
+            definite = [err for err in e.errors() if _is_definite(err)]
+            if definite:
+                err = definite[0]
+                location = ".".join(str(part) for part in (key, *err["loc"]))
+                self._fail(f"{self.schema.__name__}.{location}: {err['msg']}")
+        self.validated_fields.append(key)
+
+
+# =============================================================================
+# PROCESS-WIDE SWITCH
+# =============================================================================
+
+_streaming_lock = threading.Lock()
+_streaming_enabled: Optional[bool] = None
+
+
+def configure_streaming(enabled: bool) -> None:
+    """Enable (or disable) streamed generation for calls that pass a stream_schema."""
+    global _streaming_enabled
+    with _streaming_lock:
+        _streaming_enabled = enabled
+
+
+def streaming_enabled() -> bool:
+    """
+    Whether LLMClient streams schema-checked calls.
+
+    Unless configure_streaming() was called, the LLM_STREAMING environment
+    variable ("1"/"true") decides.
+    """
+    global _streaming_enabled
+    with _streaming_lock:
+        if _streaming_enabled is None:
+            _streaming_enabled = os.environ.get("LLM_STREAMING", "").lower() in ("1", "true", "yes")
+        return _streaming_enabled
@@ -11,10 +11,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from bs4 import BeautifulSoup
 from pydantic import BaseModel
 
+from ..utils.html_parser import make_soup
 from ..validators.llm_responses import PAGE_TYPE_SCHEMAS
+from .json_repair import repair_json_text
 from .llm_client import MODEL_GEMINI_31_PRO, MODEL_GPT52, LLMClient, LLMTask
 
 
@@ -27,40 +28,6 @@ def _is_empty(val: Any) -> bool:
     return False
 
 
-def repair_json(json_str: str) -> str:
-    """
-    Attempt to repair common JSON syntax errors from LLM output.
-
-    Handles:
-    - Trailing commas before } or ]
-    - Control characters in strings
-    - Truncated JSON (attempts to close brackets)
-    """
-    json_str = json_str.strip()
-
-    # Remove trailing commas before closing brackets
-    json_str = re.sub(r",\s*}", "}", json_str)
-    json_str = re.sub(r",\s*]", "]", json_str)
-
-    # Remove control characters except valid whitespace
-    json_str = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", json_str)
-
-    # Try to close unclosed brackets
-    open_braces = json_str.count("{") - json_str.count("}")
-    open_brackets = json_str.count("[") - json_str.count("]")
-
-    if open_braces > 0 or open_brackets > 0:
-        stripped = json_str.rstrip()
-        if stripped and stripped[-1] not in '{}[],":\n':
-            quote_count = len(re.findall(r'(?<!\\)"', json_str))
-            if quote_count % 2 == 1:
-                json_str += '"'
-        json_str += "]" * open_brackets
-        json_str += "}" * open_braces
-
-    return json_str
-
-
 class WebsiteExtractor:
     """
     Extract structured data from charity websites using LLMs.
@@ -272,8 +239,7 @@ class WebsiteExtractor:
             try:
                 data = json.loads(json_str)
             except json.JSONDecodeError:
-                repaired = repair_json(json_str)
-                data = json.loads(repaired)
+                data = repair_json_text(json_str).loads()
 
             return data, llm_response.cost_usd
 
@@ -416,7 +382,7 @@ class WebsiteExtractor:
         page_contents = []
 
         for url, html in pages[:10]:  # Limit to 10 pages max
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, source="website_extractor")
 
             # Remove non-content elements
             for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
@@ -692,11 +658,13 @@ Return ONLY the JSON object, no additional text."""
                 data = json.loads(json_str)
             except json.JSONDecodeError as first_error:
                 # Try repairing common LLM JSON errors
-                repaired_str = repair_json(json_str)
+                repaired = repair_json_text(json_str)
                 try:
-                    data = json.loads(repaired_str)
+                    data = repaired.loads()
                     if self.logger:
-                        self.logger.info(f"JSON repaired successfully (original error: {first_error})")
+                        self.logger.info(
+                            f"JSON repaired successfully ({repaired.describe()}; original error: {first_error})"
+                        )
                 except json.JSONDecodeError:
                     if self.logger:
                         self.logger.error(f"JSON repair failed. Raw response (first 500 chars): {json_str[:500]}")
@@ -800,10 +768,10 @@ Return ONLY the JSON object, no additional text."""
                     try:
                         response_data = json.loads(response_text)
                     except json.JSONDecodeError:
-                        repaired = repair_json(response_text)
-                        response_data = json.loads(repaired)
+                        repaired = repair_json_text(response_text)
+                        response_data = repaired.loads()
                         if self.logger:
-                            self.logger.info(f"JSON repaired successfully for {page_type}")
+                            self.logger.info(f"JSON repaired successfully for {page_type} ({repaired.describe()})")
 
                     validated_response = schema_class(**response_data)
                     if self.logger:
@@ -12,54 +12,12 @@ uses LLM to extract structured information including:
 """
 
 import json
-import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import pdfplumber
-
-
-def repair_json(json_str: str) -> str:
-    """
-    Attempt to repair common JSON syntax errors from LLM output.
-
-    Handles:
-    - Trailing commas before } or ]
-    - Unescaped newlines in strings
-    - Truncated JSON (attempts to close brackets)
-    - Control characters in strings
-    """
-    # Remove any leading/trailing whitespace
-    json_str = json_str.strip()
-
-    # Remove trailing commas before closing brackets
-    json_str = re.sub(r",\s*}", "}", json_str)
-    json_str = re.sub(r",\s*]", "]", json_str)
-
-    # Remove control characters except valid whitespace
-    json_str = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", json_str)
-
-    # Try to close unclosed brackets (for truncated output)
-    open_braces = json_str.count("{") - json_str.count("}")
-    open_brackets = json_str.count("[") - json_str.count("]")
-
-    if open_braces > 0 or open_brackets > 0:
-        # Find if we're inside a string (rough heuristic)
-        # If last non-whitespace char is a letter/number, we might be mid-value
-        stripped = json_str.rstrip()
-        if stripped and stripped[-1] not in '{}[],":\n':
-            # Likely mid-value, try to close with quote if in string context
-            # Check if we have an odd number of unescaped quotes
-            quote_count = len(re.findall(r'(?<!\\)"', json_str))
-            if quote_count % 2 == 1:
-                json_str += '"'
-
-        # Close brackets in reverse order of typical nesting
-        json_str += "]" * open_brackets
-        json_str += "}" * open_braces
-
-    return json_str
+from ..llm.json_repair import repair_json_text
+from ..utils.pdf_text import get_pdf_text_extractor
 
 
 @dataclass
@@ -181,28 +139,25 @@ class AnnualReportParser:
             self._llm_client = LLMClient(task=task, logger=self.logger)
         return self._llm_client
 
-    def parse_pdf(self, pdf_path: Path) -> Tuple[Optional[AnnualReportData], float]:
+    def parse_pdf(self, pdf_path: Path, file_hash: Optional[str] = None) -> Tuple[Optional[AnnualReportData], float]:
         """
         Parse annual report PDF and extract data using LLM.
 
         Args:
             pdf_path: Path to PDF file
+            file_hash: SHA-256 of the file if already computed (text cache key)
 
         Returns:
             Tuple of (AnnualReportData, cost_in_usd) or (None, 0.0) if failed
         """
         try:
             # Extract text from PDF
-            text = self._extract_pdf_text(pdf_path)
+            text, page_count = self._extract_pdf_text(pdf_path, file_hash=file_hash)
             if not text:
                 if self.logger:
                     self.logger.warning(f"No text extracted from {pdf_path}")
                 return None, 0.0
 
-            # Count pages
-            with pdfplumber.open(pdf_path) as pdf:
-                page_count = len(pdf.pages)
-
             # Use LLM to extract structured data
             data, cost = self._extract_with_llm(text, page_count)
 
@@ -219,21 +174,16 @@ class AnnualReportParser:
                 self.logger.error(f"Failed to parse annual report {pdf_path}: {e}")
             return None, 0.0
 
-    def _extract_pdf_text(self, pdf_path: Path, max_pages: int = 30) -> str:
-        """Extract text from PDF, limiting to first N pages."""
-        try:
-            text_parts = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages[:max_pages]):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"--- PAGE {i + 1} ---\n{page_text}")
-
-            return "\n\n".join(text_parts)
-        except Exception as e:
+    def _extract_pdf_text(
+        self, pdf_path: Path, max_pages: int = 30, file_hash: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """Extract text from PDF (first N pages) in the PDF process pool; returns (text, page_count)."""
+        result = get_pdf_text_extractor().extract(pdf_path, max_pages=max_pages, file_hash=file_hash)
+        if result.error and not result.pages:
             if self.logger:
-                self.logger.error(f"PDF text extraction failed: {e}")
-            return ""
+                self.logger.error(f"PDF text extraction failed: {result.error}")
+            return "", 0
+        return result.text(page_markers=True), result.page_count
 
     def _extract_with_llm(self, text: str, page_count: int) -> Tuple[Optional[AnnualReportData], float]:
         """Use LLM to extract structured data from report text."""
@@ -486,11 +436,13 @@ Return ONLY the JSON object, no additional text."""
                 extracted = json.loads(json_str)
             except json.JSONDecodeError as first_error:
                 # Try repairing common LLM JSON errors
-                repaired_str = repair_json(json_str)
+                repaired = repair_json_text(json_str)
                 try:
-                    extracted = json.loads(repaired_str)
+                    extracted = repaired.loads()
                     if self.logger:
-                        self.logger.info(f"JSON repaired successfully (original error: {first_error})")
+                        self.logger.info(
+                            f"JSON repaired successfully ({repaired.describe()}; original error: {first_error})"
+                        )
                 except json.JSONDecodeError:
                     # Log the raw response for debugging and re-raise original error
                     if self.logger:
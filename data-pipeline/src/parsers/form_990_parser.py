@@ -17,7 +17,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import pdfplumber
+from ..constants import FORM_990_MAX_PAGES
+from ..utils.pdf_text import get_pdf_text_extractor
 
 # Reasonable bounds for Form 990 financial values to catch parsing errors
 # Min values: small charities may have modest budgets, but zero is suspicious
@@ -181,7 +182,7 @@ class Form990Parser:
             return None
         return value
 
-    def parse_pdf(self, pdf_path: Path) -> Optional[Form990Data]:
+    def parse_pdf(self, pdf_path: Path, file_hash: Optional[str] = None) -> Optional[Form990Data]:
         """
         Parse Form 990 PDF and extract comprehensive data.
 
@@ -197,79 +198,89 @@ class Form990Parser:
 
         Args:
             pdf_path: Path to Form 990 PDF
+            file_hash: SHA-256 of the file if already computed (text cache key)
 
         Returns:
-            Form990Data with extracted information, or None if parsing failed
+            Form990Data with extracted information, or None if parsing failed or
+            the text extraction was partial (timed out or page-capped) - later
+            Parts and schedules would be silently missing, so callers fall back
+            to the LLM instead
         """
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                data = Form990Data(page_count=len(pdf.pages))
-
-                # Collect all text from PDF for comprehensive extraction
-                all_text = ""
-                page_texts = []
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    page_texts.append(text)
-                    all_text += text + "\n"
-
-                # Detect form variant (990, 990-EZ, 990-PF)
-                if "Form 990-EZ" in all_text:
-                    data.form_variant = "990-EZ"
-                elif "Form 990-PF" in all_text:
-                    data.form_variant = "990-PF"
-                else:
-                    data.form_variant = "990"
-
-                # Extract from first page (header + Part I)
-                if len(page_texts) > 0:
-                    self._extract_header(page_texts[0], data)
-                    self._extract_part_i(page_texts[0], data)
-
-                # Extract Part III - Program descriptions (usually pages 2-4)
-                for page_num in range(min(5, len(page_texts))):
-                    if "Part III" in page_texts[page_num]:
-                        self._extract_part_iii(page_texts[page_num], data)
-                        break
-
-                # Extract Part VII - Officers (scan several pages)
-                for page_num in range(min(10, len(page_texts))):
-                    if "Part VII" in page_texts[page_num] or "Officers" in page_texts[page_num]:
-                        self._extract_part_vii(page_texts[page_num], data)
-                        # May span multiple pages
-                        if page_num + 1 < len(page_texts) and "Section A" in page_texts[page_num + 1]:
-                            self._extract_part_vii(page_texts[page_num + 1], data)
-                        break
-
-                # Extract Part VIII - Revenue (usually around page 9-10)
-                for page_num in range(min(15, len(page_texts))):
-                    if "Part VIII" in page_texts[page_num] or "Statement of Revenue" in page_texts[page_num]:
-                        self._extract_part_viii(page_texts[page_num], data)
-                        break
-
-                # Extract Part IX - Expenses (usually around page 10-11)
-                for page_num in range(min(15, len(page_texts))):
-                    if "Part IX" in page_texts[page_num] or "Statement of Functional Expenses" in page_texts[page_num]:
-                        self._extract_part_ix(page_texts[page_num], data)
-                        break
-
-                # Extract Schedule O or I for geographic info
-                for page_num in range(len(page_texts)):
-                    if "Schedule O" in page_texts[page_num] or "Schedule I" in page_texts[page_num]:
-                        self._extract_schedule_o(page_texts[page_num], data)
-                        break
-
-                # Calculate efficiency ratios
-                data.calculate_ratios()
-
+            result = get_pdf_text_extractor().extract(pdf_path, max_pages=FORM_990_MAX_PAGES, file_hash=file_hash)
+            if result.error and not result.pages:
+                raise RuntimeError(result.error)
+            if not result.complete:
                 if self.logger:
-                    self.logger.debug(
-                        f"Parsed Form 990 ({data.form_variant}): {data.organization_name} "
-                        f"({data.ein}) - {len(data.officers)} officers, "
-                        f"program ratio: {data.program_expense_ratio}%"
+                    reason = "timed out" if result.timed_out else result.error or "page limit"
+                    self.logger.warning(
+                        f"Skipping Form 990 parse of {Path(pdf_path).name}: text extraction incomplete "
+                        f"({len(result.pages)}/{result.page_count} pages, {reason})"
                     )
+                return None
+            data = Form990Data(page_count=result.page_count)
+
+            # Collect all text from PDF for comprehensive extraction
+            page_texts = result.pages
+            all_text = result.text()
+
+            # Detect form variant (990, 990-EZ, 990-PF)
+            if "Form 990-EZ" in all_text:
+                data.form_variant = "990-EZ"
+            elif "Form 990-PF" in all_text:
+                data.form_variant = "990-PF"
+            else:
+                data.form_variant = "990"
+
+            # Extract from first page (header + Part I)
+            if len(page_texts) > 0:
+                self._extract_header(page_texts[0], data)
+                self._extract_part_i(page_texts[0], data)
+
+            # Extract Part III - Program descriptions (usually pages 2-4)
+            for page_num in range(min(5, len(page_texts))):
+                if "Part III" in page_texts[page_num]:
+                    self._extract_part_iii(page_texts[page_num], data)
+                    break
+
+            # Extract Part VII - Officers (scan several pages)
+            for page_num in range(min(10, len(page_texts))):
+                if "Part VII" in page_texts[page_num] or "Officers" in page_texts[page_num]:
+                    self._extract_part_vii(page_texts[page_num], data)
+                    # May span multiple pages
+                    if page_num + 1 < len(page_texts) and "Section A" in page_texts[page_num + 1]:
+                        self._extract_part_vii(page_texts[page_num + 1], data)
+                    break
+
+            # Extract Part VIII - Revenue (usually around page 9-10)
+            for page_num in range(min(15, len(page_texts))):
+                if "Part VIII" in page_texts[page_num] or "Statement of Revenue" in page_texts[page_num]:
+                    self._extract_part_viii(page_texts[page_num], data)
+                    break
+
+            # Extract Part IX - Expenses (usually around page 10-11)
+            for page_num in range(min(15, len(page_texts))):
+                if "Part IX" in page_texts[page_num] or "Statement of Functional Expenses" in page_texts[page_num]:
+                    self._extract_part_ix(page_texts[page_num], data)
+                    break
+
+            # Extract Schedule O or I for geographic info
+            for page_num in range(len(page_texts)):
+                if "Schedule O" in page_texts[page_num] or "Schedule I" in page_texts[page_num]:
+                    self._extract_schedule_o(page_texts[page_num], data)
+                    break
+
+            # Calculate efficiency ratios
+            data.calculate_ratios()
+
+            if self.logger:
+                self.logger.debug(
+                    f"Parsed Form 990 ({data.form_variant}): {data.organization_name} "
+                    f"({data.ein}) - {len(data.officers)} officers, "
+                    f"program ratio: {data.program_expense_ratio}%"
+                )
 
-                return data
+            return data
 
         except Exception as e:
             if self.logger:
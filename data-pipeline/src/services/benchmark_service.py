@@ -549,7 +549,7 @@ def get_filing_history(ein: str) -> list[dict]:
     raw_repo = RawDataRepository()
 
     # Get ProPublica data using DoltDB repository method
-    result = raw_repo.get_by_source(ein, "propublica")
+    result = raw_repo.get_by_source(ein, "propublica", include_raw_content=True)
 
     if not result:
         return []
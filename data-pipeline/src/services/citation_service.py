@@ -157,10 +157,19 @@ class CitationRegistry:
 class CitationService:
     """Service for building citation registries from stored data."""
 
-    def __init__(self):
-        self.raw_repo = RawDataRepository()
+    def __init__(
+        self,
+        raw_repo: Optional[RawDataRepository] = None,
+        charity_repo: Optional[CharityRepository] = None,
+    ):
+        """
+        Args:
+            raw_repo: Raw data repository (e.g. a CharityWorkingSet view); a fresh one if None
+            charity_repo: Charity repository; a fresh one if None
+        """
+        self.raw_repo = raw_repo or RawDataRepository()
         self.discovery_repo = AgentDiscoveryRepository()
-        self._charity_repo = CharityRepository()
+        self._charity_repo = charity_repo or CharityRepository()
 
     # Blocklist of sources known to be hostile/propaganda against Muslim charities
     # This list is shared across all discovery services
@@ -20,11 +20,13 @@ from typing import Any, Optional
 
 from ..db.repository import (
     CharityDataRepository,
+    CharityRepository,
     CitationRepository,
     EvaluationRepository,
     RawDataRepository,
 )
 from ..llm.llm_client import LLMClient, LLMTask
+from ..llm.schemas.rich_v2 import RichNarrativeV2
 from ..parsers.charity_metrics_aggregator import CharityMetrics, CharityMetricsAggregator
 from ..schemas.discovery import (
     SECTION_AWARDS,
@@ -128,12 +130,23 @@ def revenue_trajectory_guidance(
 class RichNarrativeGenerator:
     """Generates rich narratives with citation support."""
 
-    def __init__(self):
-        self.eval_repo = EvaluationRepository()
-        self.charity_data_repo = CharityDataRepository()
-        self.raw_data_repo = RawDataRepository()
+    def __init__(
+        self,
+        eval_repo: Optional[EvaluationRepository] = None,
+        charity_data_repo: Optional[CharityDataRepository] = None,
+        raw_data_repo: Optional[RawDataRepository] = None,
+        charity_repo: Optional[CharityRepository] = None,
+    ):
+        """
+        Args:
+            eval_repo, charity_data_repo, raw_data_repo, charity_repo: Repositories to
+                read/write through (e.g. CharityWorkingSet views); fresh ones if None
+        """
+        self.eval_repo = eval_repo or EvaluationRepository()
+        self.charity_data_repo = charity_data_repo or CharityDataRepository()
+        self.raw_data_repo = raw_data_repo or RawDataRepository()
         self.citation_repo = CitationRepository()
-        self.citation_service = CitationService()
+        self.citation_service = CitationService(raw_repo=self.raw_data_repo, charity_repo=charity_repo)
         self.reconciliation_engine = ReconciliationEngine()
         self.validator = ConsistencyValidator()
         self.llm_client = LLMClient(task=LLMTask.PREMIUM_NARRATIVE)
@@ -237,6 +250,7 @@ class RichNarrativeGenerator:
                 prompt=prompt,
                 temperature=0.3,  # Lower temp for consistency
                 json_mode=True,
+                stream_schema=RichNarrativeV2,
             )
             self.last_generation_cost = response.cost_usd
             rich_content = json.loads(response.text)
@@ -0,0 +1,169 @@
+"""
+One long-lived asyncio event loop for all async crawling.
+
+Problem: WebsiteCollector._run_async called asyncio.run() for every sitemap
+crawl, BFS crawl and content-scoring pass (or spun up a throwaway thread when
+a loop was already running). Each call built and tore down an event loop, an
+httpx.AsyncClient and its TLS connections, and async concurrency never
+spanned more than one charity's pages.
+
+Solution: AsyncLoopService runs a single event loop on a daemon thread and
+worker threads submit coroutines to it. Everything on that loop shares the
+loop's pooled httpx client (src/utils/http_pool.py) and per-domain
+semaphores, across charities.
+- timeouts/interrupts: if the caller stops waiting, the coroutine's task is
+  cancelled on the loop, so nothing keeps crawling for a caller that left
+- context: the caller's contextvars (e.g. the current trace span) are
+  carried into the task
+- close() cancels leftover tasks, closes the pooled client and stops the
+  loop; the next run() starts a fresh one
+
+Usage:
+    from src.utils.async_loop import get_crawl_loop
+
+    results = get_crawl_loop().run(self._crawl_urls_async(urls), timeout=120)
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Awaitable, Coroutine, Dict, Optional, TypeVar
+
+from .http_pool import close_async_client
+
+T = TypeVar("T")
+
+
+async def _in_context(coro: Awaitable[T], context: contextvars.Context) -> T:
+    """Await coro with the submitting thread's context variables set."""
+    for var, value in context.items():
+        var.set(value)
+    return await coro
+
+
+class AsyncLoopService:
+    """A background thread running one event loop for the whole process."""
+
+    def __init__(self, name: str = "crawl-loop"):
+        """
+        Args:
+            name: Name of the loop thread (shows up in traces and thread dumps)
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"submitted": 0, "timeouts": 0, "cancelled": 0, "loops_started": 0}
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(close_async_client())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first use (or after close())."""
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(target=self._serve, args=(loop, ready), name=self.name, daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+                self._stats["loops_started"] += 1
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        """True when called from the loop's own thread."""
+        return self._thread is threading.current_thread()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule coro on the loop without waiting for it.
+
+        Cancelling the returned future cancels the task on the loop.
+        """
+        loop = self._get_loop()
+        with self._lock:
+            self._stats["submitted"] += 1
+        return asyncio.run_coroutine_threadsafe(_in_context(coro, contextvars.copy_context()), loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run coro on the loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling it (None waits indefinitely)
+
+        Returns:
+            The coroutine's result; its exceptions propagate unchanged
+
+        Raises:
+            TimeoutError: The coroutine did not finish within timeout (it has been cancelled)
+            RuntimeError: Called from the loop thread, which would deadlock
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("AsyncLoopService.run() called from its own loop; await the coroutine instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException as e:
+            # future.done() means the coroutine itself raised; otherwise the
+            # caller gave up (timeout, KeyboardInterrupt) and the task must go.
+            if not future.done():
+                future.cancel()
+                with self._lock:
+                    self._stats["timeouts" if isinstance(e, TimeoutError) else "cancelled"] += 1
+            raise
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Cancel outstanding tasks, close the pooled HTTP client and stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["running"] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+
+_crawl_loop: Optional[AsyncLoopService] = None
+_crawl_loop_lock = threading.Lock()
+
+
+def get_crawl_loop() -> AsyncLoopService:
+    """Process-wide loop shared by all async website crawling."""
+    global _crawl_loop
+    with _crawl_loop_lock:
+        if _crawl_loop is None:
+            _crawl_loop = AsyncLoopService()
+        return _crawl_loop
+
+
+def close_crawl_loop() -> None:
+    """Stop the shared crawl loop if it was started (end of run, tests)."""
+    with _crawl_loop_lock:
+        loop = _crawl_loop
+    if loop is not None:
+        loop.close()
@@ -9,17 +9,305 @@ Features:
 - HTTP Last-Modified and ETag header storage for conditional fetching
 - Content hashing (SHA256) for detecting actual page changes
 - Schema version tracking for auto re-extraction
+
+Storage: pages live in a pluggable backend. The default is a single SQLite
+file (WAL mode) with indexed metadata columns and zlib-compressed HTML, so
+expiry is one range DELETE and stats are one aggregate query. The legacy
+layout (one html/{md5}.json file per URL) is still readable: entries are
+imported on first access, and migrate_legacy_files() (or
+migrations/migrate_crawler_cache.py) converts a whole directory at once.
 """
 
 import hashlib
 import json
+import os
+import sqlite3
+import zlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from .tracing import TracedLock
 
 # Current extraction schema version - increment when adding new fields
 CURRENT_SCHEMA_VERSION = "2.0"
 
+# Per-page fields stored alongside the HTML
+_JSON_LIST_FIELDS = ("extraction_methods_tried", "fields_extracted")
+_BOOL_FIELDS = ("had_data", "js_rendering_needed")
+_META_FIELDS = (
+    "url",
+    "final_url",
+    "cached_at",
+    "had_data",
+    "extraction_methods_tried",
+    "content_hash",
+    "last_modified",
+    "etag",
+    "fields_extracted",
+    "schema_version",
+    "js_rendering_needed",
+    "extraction_failure_reason",
+)
+
+
+def _url_to_cache_key(url: str) -> str:
+    """MD5 of the URL - the legacy cache filename and the SQLite primary key."""
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def _parse_cached_at(value: str) -> datetime:
+    """Parse a stored cached_at timestamp (old entries have no timezone)."""
+    cached_at = datetime.fromisoformat(value)
+    if cached_at.tzinfo is None:
+        cached_at = cached_at.replace(tzinfo=timezone.utc)
+    return cached_at
+
+
+class JsonFileCacheBackend:
+    """Legacy backend: one html/{md5}.json file per URL."""
+
+    name = "json"
+
+    def __init__(self, html_cache_dir: Path):
+        self.html_cache_dir = html_cache_dir
+
+    def path_for(self, url: str) -> Path:
+        return self.html_cache_dir / f"{_url_to_cache_key(url)}.json"
+
+    def exists(self, url: str) -> bool:
+        return self.path_for(url).exists()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self.path_for(url)
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def put(self, url: str, entry: Dict[str, Any]) -> None:
+        with open(self.path_for(url), "w") as f:
+            json.dump(entry, f)
+
+    def update(self, url: str, fields: Dict[str, Any]) -> bool:
+        entry = self.get(url)
+        if entry is None:
+            return False
+        entry.update(fields)
+        self.put(url, entry)
+        return True
+
+    def delete_before(self, cutoff: datetime) -> int:
+        cleared = 0
+        for cache_file in self.html_cache_dir.glob("*.json"):
+            try:
+                with open(cache_file, "r") as f:
+                    cached_data = json.load(f)
+                if _parse_cached_at(cached_data["cached_at"]) < cutoff:
+                    cache_file.unlink()
+                    cleared += 1
+            except Exception:
+                # If we can't read it, delete it
+                cache_file.unlink()
+                cleared += 1
+        return cleared
+
+    def count_and_size(self) -> Tuple[int, int]:
+        files = list(self.html_cache_dir.glob("*.json"))
+        return len(files), sum(f.stat().st_size for f in files)
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteCacheBackend:
+    """
+    SQLite backend: one row per URL, metadata in indexed columns, HTML zlib-compressed.
+
+    One connection per backend guarded by a lock; WAL mode lets crawler
+    processes sharing the cache directory read while another writes.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Path, legacy: Optional[JsonFileCacheBackend] = None):
+        """
+        Args:
+            db_path: SQLite database file
+            legacy: Legacy JSON backend to import entries from on a miss (read-through migration)
+        """
+        self.db_path = Path(db_path)
+        self.legacy = legacy
+        self._lock = TracedLock("crawler_cache")
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                cache_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                final_url TEXT,
+                cached_at TEXT NOT NULL,
+                cached_ts REAL NOT NULL,
+                had_data INTEGER NOT NULL DEFAULT 0,
+                extraction_methods_tried TEXT,
+                content_hash TEXT,
+                last_modified TEXT,
+                etag TEXT,
+                fields_extracted TEXT,
+                schema_version TEXT,
+                js_rendering_needed INTEGER NOT NULL DEFAULT 0,
+                extraction_failure_reason TEXT,
+                html BLOB NOT NULL,
+                stored_bytes INTEGER NOT NULL
+            )
+            """
+        )
+        for column in ("cached_ts", "content_hash", "etag", "had_data", "schema_version"):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_pages_{column} ON pages({column})")
+        self._conn.commit()
+
+    @staticmethod
+    def _row_values(url: str, entry: Dict[str, Any]) -> tuple:
+        html = zlib.compress((entry.get("html") or "").encode("utf-8"), 6)
+        cached_at = entry.get("cached_at") or datetime.now(timezone.utc).isoformat()
+        return (
+            _url_to_cache_key(url),
+            entry.get("url") or url,
+            entry.get("final_url"),
+            cached_at,
+            _parse_cached_at(cached_at).timestamp(),
+            int(bool(entry.get("had_data"))),
+            json.dumps(entry.get("extraction_methods_tried") or []),
+            entry.get("content_hash"),
+            entry.get("last_modified"),
+            entry.get("etag"),
+            json.dumps(entry.get("fields_extracted") or []),
+            entry.get("schema_version"),
+            int(bool(entry.get("js_rendering_needed"))),
+            entry.get("extraction_failure_reason"),
+            html,
+            len(html),
+        )
+
+    def _insert_many(self, rows: list) -> None:
+        """Insert rows built by _row_values. Caller holds the lock."""
+        self._conn.executemany(
+            """
+            INSERT OR REPLACE INTO pages
+                (cache_key, url, final_url, cached_at, cached_ts, had_data, extraction_methods_tried,
+                 content_hash, last_modified, etag, fields_extracted, schema_version,
+                 js_rendering_needed, extraction_failure_reason, html, stored_bytes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def _import_legacy(self, url: str) -> bool:
+        """Move a legacy JSON entry for url into SQLite. Caller holds the lock."""
+        if self.legacy is None:
+            return False
+        path = self.legacy.path_for(url)
+        if not path.exists():
+            return False
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            self._insert_many([self._row_values(url, entry)])
+            self._conn.commit()
+        except (OSError, ValueError, KeyError):
+            return False
+        path.unlink(missing_ok=True)
+        return True
+
+    def exists(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM pages WHERE cache_key = ?", (_url_to_cache_key(url),)).fetchone()
+            return row is not None or self._import_legacy(url)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        query = f"SELECT {', '.join(_META_FIELDS)}, html FROM pages WHERE cache_key = ?"
+        key = _url_to_cache_key(url)
+        with self._lock:
+            row = self._conn.execute(query, (key,)).fetchone()
+            if row is None and self._import_legacy(url):
+                row = self._conn.execute(query, (key,)).fetchone()
+        if row is None:
+            return None
+
+        entry = dict(zip(_META_FIELDS, row[:-1]))
+        entry["html"] = zlib.decompress(row[-1]).decode("utf-8")
+        for field in _JSON_LIST_FIELDS:
+            entry[field] = json.loads(entry[field]) if entry[field] else []
+        for field in _BOOL_FIELDS:
+            entry[field] = bool(entry[field])
+        return entry
+
+    def put(self, url: str, entry: Dict[str, Any]) -> None:
+        values = self._row_values(url, entry)
+        with self._lock:
+            self._insert_many([values])
+            self._conn.commit()
+
+    def update(self, url: str, fields: Dict[str, Any]) -> bool:
+        """Update metadata columns in place (the HTML is not rewritten)."""
+        assignments, params = [], []
+        for field, value in fields.items():
+            if field not in _META_FIELDS or field in ("url", "cached_at"):
+                raise ValueError(f"Cannot update crawler cache field: {field}")
+            if field in _JSON_LIST_FIELDS:
+                value = json.dumps(value or [])
+            elif field in _BOOL_FIELDS:
+                value = int(bool(value))
+            assignments.append(f"{field} = ?")
+            params.append(value)
+        if not assignments:
+            return self.exists(url)
+
+        key = _url_to_cache_key(url)
+        sql = f"UPDATE pages SET {', '.join(assignments)} WHERE cache_key = ?"
+        with self._lock:
+            updated = self._conn.execute(sql, (*params, key)).rowcount
+            if not updated and self._import_legacy(url):
+                updated = self._conn.execute(sql, (*params, key)).rowcount
+            self._conn.commit()
+        return bool(updated)
+
+    def delete_before(self, cutoff: datetime) -> int:
+        with self._lock:
+            cleared = self._conn.execute("DELETE FROM pages WHERE cached_ts < ?", (cutoff.timestamp(),)).rowcount
+            self._conn.commit()
+        return cleared or 0
+
+    def count_and_size(self) -> Tuple[int, int]:
+        with self._lock:
+            count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(stored_bytes), 0) FROM pages").fetchone()
+        return count, size
+
+    def import_entries(self, entries: Iterator[Tuple[str, Dict[str, Any]]], batch_size: int = 1000) -> int:
+        """Bulk-insert (url, entry) pairs in batched transactions. Returns the number imported."""
+        imported = 0
+        batch = []
+        for url, entry in entries:
+            batch.append(self._row_values(url, entry))
+            if len(batch) >= batch_size:
+                with self._lock:
+                    self._insert_many(batch)
+                    self._conn.commit()
+                imported += len(batch)
+                batch = []
+        if batch:
+            with self._lock:
+                self._insert_many(batch)
+                self._conn.commit()
+            imported += len(batch)
+        return imported
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
 
 class CrawlerCache:
     """
@@ -32,7 +320,9 @@ class CrawlerCache:
     4. Persist state across runs
     """
 
-    def __init__(self, cache_dir: Path, ttl_days: int = 180, logger=None):
+    DB_FILENAME = "pages.sqlite3"
+
+    def __init__(self, cache_dir: Path, ttl_days: int = 180, logger=None, backend: Optional[str] = None):
         """
         Initialize crawler cache.
 
@@ -40,6 +330,8 @@ class CrawlerCache:
             cache_dir: Directory for cache storage
             ttl_days: Time-to-live for cached responses in days (default 180)
             logger: Logger instance
+            backend: Page storage backend - "sqlite" (default) or "json" (legacy
+                file-per-URL). Falls back to the CRAWLER_CACHE_BACKEND env var.
         """
         self.cache_dir = Path(cache_dir)
         self.ttl_days = ttl_days
@@ -51,6 +343,15 @@ class CrawlerCache:
         self.html_cache_dir.mkdir(parents=True, exist_ok=True)
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+        backend = (backend or os.getenv("CRAWLER_CACHE_BACKEND") or "sqlite").lower()
+        legacy = JsonFileCacheBackend(self.html_cache_dir)
+        if backend == "json":
+            self.backend = legacy
+        elif backend == "sqlite":
+            self.backend = SqliteCacheBackend(self.cache_dir / self.DB_FILENAME, legacy=legacy)
+        else:
+            raise ValueError(f"Unknown crawler cache backend: {backend}")
+
         # In-memory tracking for current session
         self.pages_with_no_data: Set[str] = set()  # Tried but found nothing useful
         self.pages_with_data: Set[str] = set()  # Tried and found useful data
@@ -58,13 +359,62 @@ class CrawlerCache:
         self.pages_needing_js: Set[str] = set()  # Pages that likely need JS rendering
 
     def _url_to_cache_key(self, url: str) -> str:
-        """Convert URL to cache filename."""
-        return hashlib.md5(url.encode()).hexdigest()
+        """Convert URL to cache key."""
+        return _url_to_cache_key(url)
+
+    def close(self):
+        """Release the storage backend (closes the SQLite connection)."""
+        self.backend.close()
+
+    def migrate_legacy_files(self, delete: bool = True, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Import every legacy html/*.json entry into the SQLite backend.
+
+        Args:
+            delete: Remove each JSON file once its batch is committed
+            batch_size: Entries per transaction
 
-    def _get_cache_path(self, url: str) -> Path:
-        """Get cache file path for URL."""
-        cache_key = self._url_to_cache_key(url)
-        return self.html_cache_dir / f"{cache_key}.json"
+        Returns:
+            Dict with migrated/failed counts
+        """
+        if not isinstance(self.backend, SqliteCacheBackend):
+            raise ValueError("Legacy migration requires the sqlite backend")
+
+        failed = 0
+        migrated = 0
+        batch = []
+
+        def flush():
+            nonlocal migrated
+            migrated += self.backend.import_entries(((entry["url"], entry) for _, entry in batch), batch_size)
+            if delete:
+                for path, _ in batch:
+                    path.unlink(missing_ok=True)
+            batch.clear()
+
+        with os.scandir(self.html_cache_dir) as entries:
+            for dir_entry in entries:
+                if not dir_entry.name.endswith(".json"):
+                    continue
+                path = Path(dir_entry.path)
+                try:
+                    with open(path, "r") as f:
+                        entry = json.load(f)
+                    _parse_cached_at(entry["cached_at"])
+                    if not entry.get("url"):
+                        raise KeyError("url")
+                except (OSError, ValueError, KeyError, TypeError):
+                    failed += 1
+                    continue
+                batch.append((path, entry))
+                if len(batch) >= batch_size:
+                    flush()
+        if batch:
+            flush()
+
+        if self.logger:
+            self.logger.info(f"Migrated {migrated} crawler cache entries to SQLite ({failed} unreadable)")
+        return {"migrated": migrated, "failed": failed}
 
     def get_cached_html(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -76,20 +426,13 @@ class CrawlerCache:
         Returns:
             Dict with {html, final_url, cached_at} or None if not cached/expired
         """
-        cache_path = self._get_cache_path(url)
-
-        if not cache_path.exists():
-            return None
-
         try:
-            with open(cache_path, "r") as f:
-                cached_data = json.load(f)
+            cached_data = self.backend.get(url)
+            if cached_data is None:
+                return None
 
             # Check TTL
-            cached_at = datetime.fromisoformat(cached_data["cached_at"])
-            # Handle old cache entries without timezone info
-            if cached_at.tzinfo is None:
-                cached_at = cached_at.replace(tzinfo=timezone.utc)
+            cached_at = _parse_cached_at(cached_data["cached_at"])
             age = datetime.now(timezone.utc) - cached_at
 
             if age.days > self.ttl_days:
@@ -137,8 +480,6 @@ class CrawlerCache:
             js_rendering_needed: Whether page likely needs JavaScript rendering (Playwright)
             extraction_failure_reason: Why extraction failed (e.g., 'empty_content', 'too_short', 'js_heavy')
         """
-        cache_path = self._get_cache_path(url)
-
         # Calculate content hash for change detection
         content_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
 
@@ -161,8 +502,7 @@ class CrawlerCache:
         }
 
         try:
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f)
+            self.backend.put(url, cache_data)
 
             # Track based on whether we found data
             if had_data:
@@ -209,9 +549,22 @@ class CrawlerCache:
             js_rendering_needed: Whether page likely needs JavaScript rendering
             extraction_failure_reason: Why extraction failed (e.g., 'empty_content', 'js_heavy')
         """
-        cache_path = self._get_cache_path(url)
+        fields: Dict[str, Any] = {"had_data": had_data}
+        if extraction_methods_tried:
+            fields["extraction_methods_tried"] = extraction_methods_tried
+        if js_rendering_needed:
+            fields["js_rendering_needed"] = True
+        if extraction_failure_reason:
+            fields["extraction_failure_reason"] = extraction_failure_reason
+
+        try:
+            updated = self.backend.update(url, fields)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to update had_data for {url}: {e}")
+            return
 
-        if not cache_path.exists():
+        if not updated:
             # No cache entry exists, just track in memory
             if had_data:
                 self.pages_with_data.add(url)
@@ -224,45 +577,21 @@ class CrawlerCache:
             self.tried_urls.add(url)
             return
 
-        try:
-            # Read existing cache
-            with open(cache_path, "r") as f:
-                cached_data = json.load(f)
-
-            # Update had_data flag and extraction methods
-            cached_data["had_data"] = had_data
-            if extraction_methods_tried:
-                cached_data["extraction_methods_tried"] = extraction_methods_tried
-
-            # Update JS rendering tracking
-            if js_rendering_needed:
-                cached_data["js_rendering_needed"] = True
-            if extraction_failure_reason:
-                cached_data["extraction_failure_reason"] = extraction_failure_reason
+        # Update in-memory tracking
+        if had_data:
+            self.pages_with_data.add(url)
+            self.pages_with_no_data.discard(url)
+        else:
+            self.pages_with_no_data.add(url)
+            self.pages_with_data.discard(url)
 
-            # Write back
-            with open(cache_path, "w") as f:
-                json.dump(cached_data, f)
-
-            # Update in-memory tracking
-            if had_data:
-                self.pages_with_data.add(url)
-                self.pages_with_no_data.discard(url)
-            else:
-                self.pages_with_no_data.add(url)
-                self.pages_with_data.discard(url)
+        if js_rendering_needed:
+            self.pages_needing_js.add(url)
 
-            if js_rendering_needed:
-                self.pages_needing_js.add(url)
+        self.tried_urls.add(url)
 
-            self.tried_urls.add(url)
-
-            if self.logger:
-                self.logger.debug(f"Updated had_data={had_data}, js_needed={js_rendering_needed} for {url}")
-
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Failed to update had_data for {url}: {e}")
+        if self.logger:
+            self.logger.debug(f"Updated had_data={had_data}, js_needed={js_rendering_needed} for {url}")
 
     def should_retry_with_llm(self, url: str) -> bool:
         """
@@ -436,27 +765,8 @@ class CrawlerCache:
 
         Returns number of entries cleared.
         """
-        cleared = 0
         cutoff = datetime.now(timezone.utc) - timedelta(days=self.ttl_days)
-
-        for cache_file in self.html_cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, "r") as f:
-                    cached_data = json.load(f)
-
-                cached_at = datetime.fromisoformat(cached_data["cached_at"])
-                # Handle old cache entries without timezone info
-                if cached_at.tzinfo is None:
-                    cached_at = cached_at.replace(tzinfo=timezone.utc)
-
-                if cached_at < cutoff:
-                    cache_file.unlink()
-                    cleared += 1
-
-            except Exception:
-                # If we can't read it, delete it
-                cache_file.unlink()
-                cleared += 1
+        cleared = self.backend.delete_before(cutoff)
 
         if self.logger and cleared > 0:
             self.logger.info(f"Cleared {cleared} expired cache entries")
@@ -470,13 +780,12 @@ class CrawlerCache:
         Returns:
             Dict with cache stats
         """
-        html_cache_files = list(self.html_cache_dir.glob("*.json"))
+        cached_pages, total_size = self.backend.count_and_size()
         state_files = list(self.state_dir.glob("*.json"))
 
-        total_size = sum(f.stat().st_size for f in html_cache_files)
-
         return {
-            "cached_pages": len(html_cache_files),
+            "backend": self.backend.name,
+            "cached_pages": cached_pages,
             "tracked_charities": len(state_files),
             "total_cache_size_mb": total_size / (1024 * 1024),
             "pages_with_data_current": len(self.pages_with_data),
@@ -552,10 +861,7 @@ class CrawlerCache:
             return True, "not in cache"
 
         # Check TTL
-        cached_at = datetime.fromisoformat(cached["cached_at"])
-        # Handle old cache entries without timezone info
-        if cached_at.tzinfo is None:
-            cached_at = cached_at.replace(tzinfo=timezone.utc)
+        cached_at = _parse_cached_at(cached["cached_at"])
         age = datetime.now(timezone.utc) - cached_at
 
         if age.days > self.ttl_days:
@@ -621,19 +927,9 @@ class CrawlerCache:
             url: URL to update
             fields: List of field names extracted
         """
-        cache_path = self._get_cache_path(url)
-
-        if not cache_path.exists():
-            return
-
         try:
-            with open(cache_path, "r") as f:
-                cached_data = json.load(f)
-
-            cached_data["fields_extracted"] = fields
-
-            with open(cache_path, "w") as f:
-                json.dump(cached_data, f)
+            if not self.backend.update(url, {"fields_extracted": fields}):
+                return
 
             if self.logger:
                 self.logger.debug(f"Updated fields_extracted for {url}: {fields}")
@@ -0,0 +1,162 @@
+"""
+Shared HTML parsing for collectors and extractors.
+
+make_soup() builds BeautifulSoup trees with the lxml builder when lxml is
+installed (several times faster than the pure-Python "html.parser") and
+records parse time per collector, so crawl stats and
+scripts/benchmark_html_parsing.py can show where parsing time goes.
+
+DomCache keeps one parsed page per distinct HTML text for the duration of a
+website crawl. The crawl loop, _extract_page_data, structured-data
+extraction and PDF discovery all see the same HTML string, so they share one
+BeautifulSoup tree and one lxml tree instead of each re-parsing the page.
+
+Callers that mutate the tree (e.g. decompose() to strip scripts) must use
+make_soup() directly, never a tree from DomCache.
+
+Usage:
+    from src.utils.html_parser import DomCache, make_soup
+
+    soup = make_soup(response.text, source="bbb")
+
+    dom = DomCache(max_pages=8)
+    page = dom.get(html)
+    page.soup   # BeautifulSoup, parsed on first access
+    page.tree   # lxml.html tree (for extruct), parsed on first access
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+_stats_lock = threading.Lock()
+_parse_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _record(source: str, seconds: float, size: int) -> None:
+    with _stats_lock:
+        entry = _parse_stats.setdefault(source, {"parses": 0, "seconds": 0.0, "bytes": 0})
+        entry["parses"] += 1
+        entry["seconds"] += seconds
+        entry["bytes"] += size
+
+
+def get_parse_stats() -> Dict[str, Dict[str, float]]:
+    """Parse counters per source: {"website": {"parses": 12, "seconds": 0.8, "bytes": 1900000}, ...}"""
+    with _stats_lock:
+        return {source: dict(entry) for source, entry in _parse_stats.items()}
+
+
+def reset_parse_stats() -> None:
+    with _stats_lock:
+        _parse_stats.clear()
+
+
+def make_soup(markup: Any, source: str = "other", parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse HTML into a BeautifulSoup tree with the fastest available builder.
+
+    Args:
+        markup: HTML text (str or bytes)
+        source: Collector name the parse time is recorded under
+        parser: Override the builder (e.g. "html.parser" for comparisons)
+    """
+    start = time.perf_counter()
+    soup = BeautifulSoup(markup, parser or HTML_PARSER)
+    _record(source, time.perf_counter() - start, len(markup or ""))
+    return soup
+
+
+def make_lxml_tree(html: str, source: str = "other"):
+    """
+    Parse HTML into an lxml.html tree, as extruct does for a string input.
+
+    Returns:
+        The root element, or None when lxml is unavailable
+    """
+    if not HAS_LXML:
+        return None
+    start = time.perf_counter()
+    body = html.strip().replace("\x00", "").encode("utf-8", errors="replace")
+    tree = lxml.html.fromstring(body, parser=lxml.html.HTMLParser(encoding="utf-8"))
+    _record(source, time.perf_counter() - start, len(html))
+    return tree
+
+
+class ParsedPage:
+    """One page's HTML with lazily built, shared parse trees. Treat both as read-only."""
+
+    def __init__(self, html: str, source: str):
+        self.html = html
+        self.source = source
+        self._soup: Optional[BeautifulSoup] = None
+        self._tree = None
+        self._tree_built = False
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = make_soup(self.html, source=self.source)
+        return self._soup
+
+    @property
+    def tree(self):
+        """lxml.html root element, or None without lxml or for unparseable input."""
+        if not self._tree_built:
+            self._tree_built = True
+            try:
+                self._tree = make_lxml_tree(self.html, source=self.source)
+            except Exception:
+                self._tree = None
+        return self._tree
+
+
+class DomCache:
+    """
+    Thread-safe LRU of ParsedPage keyed on the HTML text.
+
+    Parsed trees are many times larger than the HTML, so the cache holds a
+    handful of pages; an evicted page is simply parsed again.
+    """
+
+    def __init__(self, max_pages: int, source: str = "website"):
+        self.max_pages = max_pages
+        self.source = source
+        self._pages: "OrderedDict[str, ParsedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, html: str) -> ParsedPage:
+        """The shared ParsedPage for this HTML (created on a miss; parsing stays lazy)."""
+        with self._lock:
+            page = self._pages.get(html)
+            if page is not None:
+                self._pages.move_to_end(html)
+                self._counters["hits"] += 1
+                return page
+            self._counters["misses"] += 1
+            page = ParsedPage(html, self.source)
+            self._pages[html] = page
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+                self._counters["evictions"] += 1
+            return page
+
+    def soup(self, html: str) -> BeautifulSoup:
+        return self.get(html).soup
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._counters, "pages": len(self._pages)}
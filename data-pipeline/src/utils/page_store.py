@@ -0,0 +1,71 @@
+"""
+Bounded in-memory store of pages fetched during one website crawl.
+
+The crawl stages download each page once; later stages of
+WebsiteCollector.collect_multi_page (LLM extraction, homepage enrichment)
+read the HTML back from here instead of fetching the same URLs again.
+
+Entries are evicted least-recently-used first once the stored HTML exceeds
+max_bytes, so a crawl of unusually large pages can't grow memory without
+bound; an evicted page is simply re-fetched by the caller.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class PageStore:
+    """Thread-safe LRU map of URL -> (html, final_url) with a byte cap."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._pages: "OrderedDict[str, Tuple[str, str, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def put(self, url: str, html: str, final_url: Optional[str] = None) -> bool:
+        """
+        Store a fetched page.
+
+        Returns:
+            False if the page alone exceeds max_bytes (not stored)
+        """
+        size = len(html.encode("utf-8", errors="ignore"))
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            old = self._pages.pop(url, None)
+            if old is not None:
+                self._total_bytes -= old[2]
+            self._pages[url] = (html, final_url or url, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._pages.popitem(last=False)
+                self._total_bytes -= evicted_size
+                self._counters["evictions"] += 1
+        return True
+
+    def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """Return (html, final_url) for a stored page, or None."""
+        with self._lock:
+            entry = self._pages.get(url)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._pages.move_to_end(url)
+            self._counters["hits"] += 1
+            return entry[0], entry[1]
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._pages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._counters, "pages": len(self._pages), "total_bytes": self._total_bytes}
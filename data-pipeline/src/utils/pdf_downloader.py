@@ -14,12 +14,13 @@ import re
 from datetime import datetime
 from pathlib import Path
 from threading import RLock
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
 
 from ..validators.charity_profile import PDFDocumentReference
+from .html_parser import make_soup
 
 # Local lock for thread-safe operations
 _global_conn_lock = RLock()
@@ -165,7 +166,7 @@ class PDFDownloader:
         # Create storage directory if it doesn't exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-    def identify_pdfs(self, html: str, base_url: str) -> List[dict]:
+    def identify_pdfs(self, html: str, base_url: str, soup: Optional[Any] = None) -> List[dict]:
         """
         Identify PDF links on a web page (T067).
 
@@ -177,13 +178,13 @@ class PDFDownloader:
         Args:
             html: HTML content of the page
             base_url: Base URL for resolving relative links
+            soup: Already-parsed tree of html, if the caller has one
 
         Returns:
             List of dicts with {url, anchor_text, context}
         """
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "html.parser")
+        if soup is None:
+            soup = make_soup(html, source="website")
         pdf_links = []
 
         # Find all links
@@ -389,7 +390,8 @@ class PDFDownloader:
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
 
-    def calculate_file_hash(self, file_path: Path) -> str:
+    @staticmethod
+    def calculate_file_hash(file_path: Path) -> str:
         """
         Calculate SHA256 hash of file for deduplication (T072).
 
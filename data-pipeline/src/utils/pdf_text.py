@@ -0,0 +1,321 @@
+"""
+PDF text extraction in a dedicated process pool.
+
+pdfplumber is pure Python and CPU-bound; run on a crawl worker thread it
+holds the GIL for seconds per large report and stalls every other worker in
+the runner. PdfTextExtractor runs it in separate processes instead, with:
+
+- a page limit per document (PDF_EXTRACTION_MAX_PAGES, or per call)
+- a per-document timeout: workers stop between pages once it passes and
+  return what they have; a worker stuck inside one page is killed and the
+  pool recycled. The timeout runs from when a worker starts the document,
+  so time spent queued behind other documents doesn't count against it
+- a disk cache keyed by the file's SHA-256 (PDFDownloader.calculate_file_hash),
+  so a PDF is parsed once no matter how many charities or runs reference it
+
+Usage:
+    from src.utils.pdf_text import get_pdf_text_extractor
+
+    result = get_pdf_text_extractor().extract(pdf_path, max_pages=30, file_hash=pdf_info.get("file_hash"))
+    text = result.text()
+"""
+
+import itertools
+import json
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pdfplumber
+
+from ..config import get_data_dir
+from ..constants import (
+    PDF_EXTRACTION_MAX_PAGES,
+    PDF_EXTRACTION_TIMEOUT_SECONDS,
+    PDF_EXTRACTION_WORKERS,
+)
+from .pdf_downloader import PDFDownloader
+
+# Extra time the parent waits beyond the cooperative deadline before killing a worker
+_HARD_TIMEOUT_GRACE_SECONDS = 10.0
+# Recycle worker processes periodically; pdfminer holds on to memory between documents
+_TASKS_PER_WORKER = 50
+# How often a waiting caller checks whether its document has overrun
+_WAIT_POLL_SECONDS = 0.5
+
+# Worker side: queue on which tasks report (task_id, start time) to the parent
+_started_queue: Optional["multiprocessing.Queue[Tuple[int, float]]"] = None
+
+
+@dataclass
+class PdfText:
+    """Text of a PDF, one string per extracted page."""
+
+    page_count: int = 0
+    pages: List[str] = field(default_factory=list)
+    timed_out: bool = False
+    error: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        """True if every page of the document was extracted."""
+        return self.error is None and not self.timed_out and len(self.pages) >= self.page_count
+
+    def text(self, max_pages: Optional[int] = None, page_markers: bool = False) -> str:
+        """Join page texts (first max_pages pages), optionally with '--- PAGE n ---' headers."""
+        pages = self.pages if max_pages is None else self.pages[:max_pages]
+        if page_markers:
+            return "\n\n".join(f"--- PAGE {i + 1} ---\n{text}" for i, text in enumerate(pages) if text)
+        return "".join(text + "\n" for text in pages)
+
+
+def _init_worker(started: "multiprocessing.Queue[Tuple[int, float]]") -> None:
+    global _started_queue
+    _started_queue = started
+
+
+def _timed_call(task_id: int, fn: Callable[..., Any], *args: Any) -> Any:
+    """Process-pool entry: tell the parent when the task starts, then run it."""
+    if _started_queue is not None:
+        _started_queue.put((task_id, time.time()))
+    return fn(*args)
+
+
+def _extract_pages(pdf_path: str, max_pages: int, timeout: float) -> Dict[str, Any]:
+    """Process-pool entry: extract up to max_pages page texts, stopping at the deadline."""
+    deadline = time.monotonic() + timeout
+    pages: List[str] = []
+    timed_out = False
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+        for page in pdf.pages[:max_pages]:
+            if time.monotonic() > deadline:
+                timed_out = True
+                break
+            pages.append(page.extract_text() or "")
+            page.close()
+    return {"page_count": page_count, "pages": pages, "timed_out": timed_out}
+
+
+class PdfTextExtractor:
+    """Process-pool pdfplumber text extraction with a file-hash cache."""
+
+    def __init__(
+        self,
+        workers: int = PDF_EXTRACTION_WORKERS,
+        timeout: float = PDF_EXTRACTION_TIMEOUT_SECONDS,
+        max_pages: int = PDF_EXTRACTION_MAX_PAGES,
+        cache_dir: Optional[Path] = None,
+        logger=None,
+    ):
+        """
+        Args:
+            workers: Worker processes; 0 extracts inline on the calling thread
+            timeout: Per-document extraction budget in seconds
+            max_pages: Default page limit per document
+            cache_dir: Directory for cached page texts (None disables the cache)
+            logger: Optional logger
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logger
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._started_queue: Optional["multiprocessing.Queue[Tuple[int, float]]"] = None
+        self._started: Dict[int, float] = {}
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = {"extracted": 0, "cache_hits": 0, "timeouts": 0, "errors": 0, "pool_restarts": 0}
+
+    # ------------------------------------------------------------------ pool
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: the runner process is multi-threaded, and forking it is unsafe
+                context = multiprocessing.get_context("spawn")
+                self._started_queue = context.Queue()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    max_tasks_per_child=_TASKS_PER_WORKER,
+                    initializer=_init_worker,
+                    initargs=(self._started_queue,),
+                )
+            return self._pool
+
+    def _started_at(self, task_id: int) -> Optional[float]:
+        """When a worker started the task (wall clock), or None while it is still queued."""
+        with self._lock:
+            while self._started_queue is not None:
+                try:
+                    started_id, started_at = self._started_queue.get_nowait()
+                except (queue.Empty, OSError, ValueError):
+                    break
+                self._started[started_id] = started_at
+            return self._started.get(task_id)
+
+    def _restart_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Kill the workers of a pool (a hung extraction can't be cancelled) and start fresh next time."""
+        with self._lock:
+            if self._pool is not pool:
+                return  # Another thread already restarted it
+            self._pool = None
+            self._started_queue = None
+            self._stats["pool_restarts"] += 1
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._started_queue = None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    # ----------------------------------------------------------------- cache
+
+    def _cache_path(self, file_hash: str) -> Optional[Path]:
+        return self.cache_dir / f"{file_hash}.json" if self.cache_dir else None
+
+    def _cache_get(self, file_hash: str, max_pages: int) -> Optional[PdfText]:
+        path = self._cache_path(file_hash)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Usable if it covers the requested pages or the whole document
+        if len(cached["pages"]) < min(max_pages, cached["page_count"]):
+            return None
+        return PdfText(page_count=cached["page_count"], pages=cached["pages"][:max_pages])
+
+    def _cache_put(self, file_hash: str, result: PdfText) -> None:
+        path = self._cache_path(file_hash)
+        if path is None or result.timed_out or result.error:
+            return  # Don't persist partial results; the next run may have more time
+        existing = self._cache_get(file_hash, result.page_count)
+        if existing and len(existing.pages) >= len(result.pages):
+            return
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"page_count": result.page_count, "pages": result.pages}, f)
+        tmp_path.replace(path)
+
+    # --------------------------------------------------------------- extract
+
+    def extract(self, pdf_path: Path, max_pages: Optional[int] = None, file_hash: Optional[str] = None) -> PdfText:
+        """
+        Extract page texts from a PDF.
+
+        Args:
+            pdf_path: PDF file
+            max_pages: Page limit (default: the extractor's max_pages; may exceed it)
+            file_hash: SHA-256 of the file if already known; computed otherwise
+
+        Returns:
+            PdfText; on failure error is set and pages may be empty
+        """
+        max_pages = max_pages or self.max_pages
+        if self.cache_dir and not file_hash:
+            file_hash = PDFDownloader.calculate_file_hash(pdf_path)
+
+        if file_hash:
+            cached = self._cache_get(file_hash, max_pages)
+            if cached is not None:
+                with self._lock:
+                    self._stats["cache_hits"] += 1
+                return cached
+
+        result = self._run(str(pdf_path), max_pages)
+        with self._lock:
+            self._stats["extracted"] += 1
+            self._stats["timeouts"] += result.timed_out
+            self._stats["errors"] += result.error is not None
+        if result.timed_out and self.logger:
+            self.logger.warning(
+                f"PDF extraction of {Path(pdf_path).name} hit the {self.timeout:.0f}s limit "
+                f"after {len(result.pages)}/{result.page_count} pages"
+            )
+        if file_hash:
+            self._cache_put(file_hash, result)
+        return result
+
+    def _run(self, pdf_path: str, max_pages: int) -> PdfText:
+        if self.workers <= 0:
+            try:
+                return PdfText(**_extract_pages(pdf_path, max_pages, self.timeout))
+            except Exception as e:
+                return PdfText(error=str(e))
+
+        for attempt in range(2):
+            try:
+                return PdfText(**self._call_in_pool(_extract_pages, pdf_path, max_pages, self.timeout))
+            except FutureTimeoutError:
+                return PdfText(timed_out=True, error=f"extraction exceeded {self.timeout:.0f}s")
+            except BrokenProcessPool:
+                # A worker died (or another document's timeout recycled the pool) - retry once
+                if attempt:
+                    return PdfText(error="PDF extraction worker crashed")
+            except Exception as e:
+                return PdfText(error=str(e))
+        return PdfText(error="PDF extraction worker crashed")
+
+    def _call_in_pool(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in the pool and return its result.
+
+        The hard limit (timeout + grace) counts from when a worker starts the
+        task, not from submit: a task waiting behind other documents is never
+        killed for it. Only a task that has itself run past the limit gets the
+        pool recycled, raising FutureTimeoutError.
+        """
+        pool = self._get_pool()
+        task_id = next(self._task_ids)
+        budget = self.timeout + _HARD_TIMEOUT_GRACE_SECONDS
+        try:
+            future = pool.submit(_timed_call, task_id, fn, *args)
+            while True:
+                try:
+                    return future.result(timeout=_WAIT_POLL_SECONDS)
+                except FutureTimeoutError:
+                    started_at = self._started_at(task_id)
+                    if started_at is not None and time.time() - started_at > budget:
+                        self._restart_pool(pool)
+                        raise
+        except BrokenProcessPool:
+            self._restart_pool(pool)
+            raise
+        finally:
+            with self._lock:
+                self._started.pop(task_id, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_extractor: Optional[PdfTextExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_pdf_text_extractor() -> PdfTextExtractor:
+    """Process-wide extractor, caching page texts under the data dir."""
+    global _extractor
+    with _extractor_lock:
+        if _extractor is None:
+            _extractor = PdfTextExtractor(cache_dir=get_data_dir() / "pdf_text_cache")
+        return _extractor
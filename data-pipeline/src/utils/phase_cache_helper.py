@@ -11,15 +11,14 @@ Key difference:
 from src.db.repository import PhaseCacheRepository
 from src.utils.phase_fingerprint import compute_code_fingerprint, get_ttl_days
 
-# Precompute code fingerprints at startup (shared across all callers)
-_fingerprint_cache: dict[str, str] = {}
-
 
 def get_phase_fingerprint(phase: str) -> str:
-    """Get cached code fingerprint for a phase."""
-    if phase not in _fingerprint_cache:
-        _fingerprint_cache[phase] = compute_code_fingerprint(phase)
-    return _fingerprint_cache[phase]
+    """Get code fingerprint for a phase.
+
+    compute_code_fingerprint memoizes on file (mtime_ns, size), so this is a
+    few stat() calls per phase and still notices files edited mid-run.
+    """
+    return compute_code_fingerprint(phase)
 
 
 def check_phase_cache(
@@ -2,11 +2,21 @@
 
 Computes code fingerprints to detect when phase logic has changed,
 enabling the pipeline to skip expensive LLM calls when code is unchanged.
+
+Fingerprints are memoized process-wide on each file's (path, mtime_ns,
+size), so repeated calls cost a handful of stat()s and an edited file is
+picked up automatically. Each fingerprint's per-file digests are recorded
+under the data dir so explain_fingerprint_change() can name the files
+behind a "Code changed" cache miss.
 """
 
 import hashlib
+import json
+import threading
 from pathlib import Path
 
+from src.config import get_data_dir
+
 # Map phases to the code files that define their behavior
 # Changes to these files should trigger re-running the phase
 #
@@ -131,6 +141,15 @@ PHASE_CODE_FILES: dict[str, list[str]] = {
         "src/judges/schemas/verdict.py",
         "src/judges/schemas/config.py",
     ],
+    "export": [
+        # Main file (payload shaping, UI signals, tiering)
+        "export.py",
+        # Helpers whose output lands in the exported JSON
+        "src/utils/cause_area.py",
+        "src/utils/display_name.py",
+        # Quality issues are stored alongside each export
+        "src/judges/export_quality_judge.py",
+    ],
 }
 
 # Default TTLs in days (float('inf') means code-only, no time expiry)
@@ -165,28 +184,25 @@ for phase, deps in PHASE_DEPENDENCIES.items():
         PHASE_DEPENDENTS[dep].append(phase)
 
 
-def compute_code_fingerprint(phase: str, base_path: Path | None = None) -> str:
-    """Compute SHA256 fingerprint of all code files for a phase.
+# (phase, base) -> (stat signature of every file, fingerprint, per-file digests)
+_fingerprint_memo: dict[tuple[str, Path], tuple[tuple, str, dict[str, str]]] = {}
+_fingerprint_lock = threading.Lock()
+# (phase, fingerprint) -> recorded per-file digests (None if never recorded)
+_digest_records: dict[tuple[str, str], dict[str, str] | None] = {}
 
-    Args:
-        phase: The phase name (crawl, extract, discover, etc.)
-        base_path: Base path for resolving file patterns (defaults to cwd)
-
-    Returns:
-        16-character hex fingerprint (truncated SHA256)
-    """
-    if phase not in PHASE_CODE_FILES:
-        raise ValueError(f"Unknown phase: {phase}")
 
+def _resolve_base(base_path: Path | None) -> Path:
     base = base_path or Path.cwd()
 
     # Handle case where we're in the data-pipeline directory
     if base.name != "data-pipeline" and (base / "data-pipeline").exists():
         base = base / "data-pipeline"
+    return base
 
-    hasher = hashlib.sha256()
-    files_found = 0
 
+def _phase_files(phase: str, base: Path) -> list[Path]:
+    """Existing files for a phase, in PHASE_CODE_FILES order."""
+    files = []
     for pattern in PHASE_CODE_FILES[phase]:
         # Handle glob patterns and direct files
         if "*" in pattern:
@@ -194,22 +210,114 @@ def compute_code_fingerprint(phase: str, base_path: Path | None = None) -> str:
         else:
             path = base / pattern
             paths = [path] if path.exists() else []
+        files.extend(path for path in paths if path.is_file())
+    return files
+
+
+def _stat_signature(files: list[Path]) -> tuple:
+    signature = []
+    for path in files:
+        try:
+            st = path.stat()
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def _fingerprint_record_path(phase: str, fingerprint: str) -> Path:
+    return get_data_dir() / "phase_fingerprints" / f"{phase}-{fingerprint}.json"
+
+
+def _record_file_digests(phase: str, fingerprint: str, digests: dict[str, str]) -> None:
+    """Persist per-file digests for a fingerprint (once) for later change explanations."""
+    path = _fingerprint_record_path(phase, fingerprint)
+    if path.exists():
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(digests, indent=2, sort_keys=True))
+    except OSError:
+        pass  # Explanations are best-effort
+
+
+def _compute(phase: str, base: Path) -> tuple[tuple, str, dict[str, str]]:
+    files = _phase_files(phase, base)
+    signature = _stat_signature(files)
+
+    with _fingerprint_lock:
+        memo = _fingerprint_memo.get((phase, base))
+    if memo and memo[0] == signature:
+        return memo
 
-        for path in paths:
-            if path.is_file():
-                try:
-                    hasher.update(path.read_bytes())
-                    files_found += 1
-                except OSError:
-                    # Skip unreadable files
-                    pass
+    hasher = hashlib.sha256()
+    digests: dict[str, str] = {}
+    for path in files:
+        try:
+            content = path.read_bytes()
+        except OSError:
+            # Skip unreadable files
+            continue
+        hasher.update(content)
+        digests[str(path.relative_to(base))] = hashlib.sha256(content).hexdigest()
 
-    if files_found == 0:
+    if not digests:
         # Return a sentinel value if no files found
         # This ensures the fingerprint changes if files are added later
-        return "0" * 16
+        fingerprint = "0" * 16
+    else:
+        fingerprint = hasher.hexdigest()[:16]
+        _record_file_digests(phase, fingerprint, digests)
+
+    memo = (signature, fingerprint, digests)
+    with _fingerprint_lock:
+        _fingerprint_memo[(phase, base)] = memo
+    return memo
+
+
+def compute_code_fingerprint(phase: str, base_path: Path | None = None) -> str:
+    """Compute SHA256 fingerprint of all code files for a phase.
+
+    Files are only re-read when their mtime or size changed since the last
+    call in this process.
 
-    return hasher.hexdigest()[:16]
+    Args:
+        phase: The phase name (crawl, extract, discover, etc.)
+        base_path: Base path for resolving file patterns (defaults to cwd)
+
+    Returns:
+        16-character hex fingerprint (truncated SHA256)
+    """
+    if phase not in PHASE_CODE_FILES:
+        raise ValueError(f"Unknown phase: {phase}")
+    return _compute(phase, _resolve_base(base_path))[1]
+
+
+def precompute_code_fingerprints(base_path: Path | None = None) -> dict[str, str]:
+    """Fingerprint every phase once (runner startup) so workers only stat files."""
+    return {phase: compute_code_fingerprint(phase, base_path) for phase in PHASE_CODE_FILES}
+
+
+def explain_fingerprint_change(phase: str, old_fingerprint: str, base_path: Path | None = None) -> list[str]:
+    """Files whose content differs between old_fingerprint and the current code.
+
+    Returns:
+        Relative paths that were added, removed or modified; empty if the old
+        fingerprint's per-file digests were never recorded on this machine
+    """
+    if phase not in PHASE_CODE_FILES:
+        raise ValueError(f"Unknown phase: {phase}")
+    key = (phase, old_fingerprint)
+    if key not in _digest_records:
+        try:
+            _digest_records[key] = json.loads(_fingerprint_record_path(phase, old_fingerprint).read_text())
+        except (OSError, json.JSONDecodeError):
+            _digest_records[key] = None
+    old_digests = _digest_records[key]
+    if old_digests is None:
+        return []
+    current = _compute(phase, _resolve_base(base_path))[2]
+    return sorted(path for path in set(old_digests) | set(current) if old_digests.get(path) != current.get(path))
 
 
 def get_downstream_phases(phase: str) -> list[str]:
@@ -2,9 +2,19 @@
 Global rate limiter for thread-safe API request throttling.
 
 Problem: When using parallel workers, each collector instance has its own
-rate limiter, causing N workers to make N simultaneous requests.
+rate limiter, causing N workers to make N simultaneous requests. A shared
+limiter that sleeps while holding a per-domain lock fixes that, but turns
+twenty workers into a convoy queued behind one sleeping thread.
 
-Solution: A shared, thread-safe rate limiter keyed by domain/API name.
+Solution: A shared token bucket per domain/API name. Callers reserve a token
+under a short lock and sleep *outside* it, so waiting workers are scheduled
+at the sustained rate instead of serialized on the lock, and an idle source
+can absorb a short burst. Rates/bursts come from SOURCE_RATE_LIMITS in
+src/constants.py.
+
+429 responses adapt the bucket: report_rate_limited() pauses the domain for
+the Retry-After interval and halves its rate; the rate doubles back after
+each 429-free RATE_LIMIT_RECOVERY_SECONDS.
 
 Usage:
     from src.utils.rate_limiter import global_rate_limiter
@@ -12,72 +22,260 @@ Usage:
     # In collector:
     global_rate_limiter.wait("propublica", delay=0.5)
     response = requests.get(url)
+    if response.status_code == 429:
+        global_rate_limiter.report_rate_limited("propublica", response.headers.get("Retry-After"))
+
+    # In async code:
+    await global_rate_limiter.acquire_async("website")
 """
 
-import threading
+import asyncio
 import time
-from typing import Dict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..constants import (
+    RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS,
+    RATE_LIMIT_MIN_RATE_FACTOR,
+    RATE_LIMIT_RECOVERY_SECONDS,
+    SOURCE_RATE_LIMITS,
+)
+from .tracing import TracedLock, trace_span
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header value (delta-seconds or HTTP-date).
+
+    Returns:
+        Seconds to wait, or None if the value is missing/unparseable
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class _Bucket:
+    """Token bucket state for one domain. Guarded by the limiter's lock."""
+
+    rate: float  # configured tokens/second
+    burst: float
+    tokens: float
+    updated_at: float
+    rate_factor: float = 1.0  # < 1 after 429s
+    paused_until: float = 0.0
+    last_rate_limited: float = 0.0
+    # Counters
+    acquisitions: int = 0
+    waits: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    rate_limited: int = 0
+
+    @property
+    def effective_rate(self) -> float:
+        return self.rate * self.rate_factor
 
 
-class GlobalRateLimiter:
+class TokenBucketRateLimiter:
     """
-    Thread-safe global rate limiter for API requests.
+    Thread-safe token-bucket rate limiter shared by all collectors.
 
-    Maintains per-domain rate limiting across all threads/workers.
+    Each domain has its own bucket. acquire() reserves the next token
+    (possibly driving the balance negative) and returns how long the caller
+    must wait for it; the wait itself happens without holding any lock.
     """
 
-    def __init__(self):
-        self._locks: Dict[str, threading.Lock] = {}
-        self._last_request: Dict[str, float] = {}
-        self._master_lock = threading.Lock()
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        """
+        Args:
+            limits: domain -> (requests/second, burst). Defaults to SOURCE_RATE_LIMITS.
+        """
+        self._limits = dict(SOURCE_RATE_LIMITS if limits is None else limits)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = TracedLock("rate_limiter")
+
+    def configure(self, domain: str, rate: float, burst: int = 1) -> None:
+        """Set (or replace) the rate and burst for a domain."""
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate limit for {domain}: rate={rate}, burst={burst}")
+        with self._lock:
+            self._limits[domain] = (rate, burst)
+            self._buckets.pop(domain, None)
+
+    def _get_bucket(self, domain: str, delay: Optional[float], now: float) -> _Bucket:
+        """Get or create a domain's bucket. Caller holds the lock."""
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            if domain in self._limits:
+                rate, burst = self._limits[domain]
+            elif delay and delay > 0:
+                # Unconfigured domain: same spacing as the old fixed-delay limiter.
+                rate, burst = 1.0 / delay, 1
+            else:
+                rate, burst = float("inf"), 1
+            bucket = _Bucket(rate=rate, burst=float(burst), tokens=float(burst), updated_at=now)
+            self._buckets[domain] = bucket
+        return bucket
 
-    def _get_domain_lock(self, domain: str) -> threading.Lock:
-        """Get or create a lock for a domain."""
-        with self._master_lock:
-            if domain not in self._locks:
-                self._locks[domain] = threading.Lock()
-                self._last_request[domain] = 0.0
-            return self._locks[domain]
+    def _reserve(self, domain: str, delay: Optional[float]) -> float:
+        """Take one token and return the seconds the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get_bucket(domain, delay, now)
+
+            # Recover from earlier 429s one doubling per quiet interval.
+            while bucket.rate_factor < 1.0 and now - bucket.last_rate_limited >= RATE_LIMIT_RECOVERY_SECONDS:
+                bucket.rate_factor = min(1.0, bucket.rate_factor * 2)
+                bucket.last_rate_limited += RATE_LIMIT_RECOVERY_SECONDS
+
+            # Nothing is granted before a 429 pause ends; the bucket's clock
+            # (updated_at) is pushed to the end of the pause so no tokens
+            # accrue during it.
+            start = max(now, bucket.paused_until)
+            rate = bucket.effective_rate
+            if rate == float("inf"):
+                wait_time = start - now
+            else:
+                if start > bucket.updated_at:
+                    bucket.tokens = min(bucket.burst, bucket.tokens + (start - bucket.updated_at) * rate)
+                    bucket.updated_at = start
+                bucket.tokens -= 1.0
+                wait_time = (start - now) + (-bucket.tokens / rate if bucket.tokens < 0 else 0.0)
+
+            bucket.acquisitions += 1
+            if wait_time > 0:
+                bucket.waits += 1
+                bucket.total_wait += wait_time
+                bucket.max_wait = max(bucket.max_wait, wait_time)
+            return wait_time
+
+    def acquire(self, domain: str, delay: Optional[float] = None) -> float:
+        """
+        Block until a request to the domain is allowed.
+
+        Args:
+            domain: API/domain identifier (e.g., "propublica", "candid")
+            delay: Fallback minimum seconds between requests for domains
+                without a SOURCE_RATE_LIMITS entry
+
+        Returns:
+            Seconds waited (0 if a token was available)
+        """
+        wait_time = self._reserve(domain, delay)
+        if wait_time > 0:
+            with trace_span("rate_limit", domain):
+                time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self, domain: str, delay: Optional[float] = None) -> float:
+        """asyncio counterpart of acquire(): awaits instead of blocking the event loop."""
+        wait_time = self._reserve(domain, delay)
+        if wait_time > 0:
+            with trace_span("rate_limit", domain):
+                await asyncio.sleep(wait_time)
+        return wait_time
 
     def wait(self, domain: str, delay: float) -> float:
         """
         Wait until it's safe to make a request to the given domain.
 
+        Kept for existing collectors; equivalent to acquire(domain, delay).
+
         Args:
             domain: API/domain identifier (e.g., "propublica", "candid")
-            delay: Minimum seconds between requests
+            delay: Minimum seconds between requests (used when the domain has no configured limit)
 
         Returns:
             Actual time waited (0 if no wait needed)
         """
-        lock = self._get_domain_lock(domain)
+        return self.acquire(domain, delay)
 
-        with lock:
-            now = time.time()
-            elapsed = now - self._last_request[domain]
+    def report_rate_limited(self, domain: str, retry_after: Any = None) -> float:
+        """
+        Record a 429 from the domain: pause it and halve its rate.
 
-            if elapsed < delay:
-                wait_time = delay - elapsed
-                time.sleep(wait_time)
-            else:
-                wait_time = 0.0
+        Args:
+            domain: API/domain identifier
+            retry_after: Retry-After header value (seconds or HTTP-date), if any
 
-            self._last_request[domain] = time.time()
-            return wait_time
+        Returns:
+            Seconds the domain is paused for
+        """
+        pause = parse_retry_after(retry_after)
+        if pause is None:
+            pause = float(RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get_bucket(domain, None, now)
+            bucket.rate_limited += 1
+            bucket.rate_factor = max(RATE_LIMIT_MIN_RATE_FACTOR, bucket.rate_factor / 2)
+            bucket.last_rate_limited = now
+            bucket.paused_until = max(bucket.paused_until, now + pause)
+            # Drop any saved-up burst so the resumed traffic starts slow.
+            bucket.tokens = min(bucket.tokens, 0.0)
+            bucket.updated_at = max(bucket.updated_at, bucket.paused_until)
+        return pause
+
+    def get_stats(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-domain wait counters.
+
+        Returns:
+            {domain: {...}} for all domains, or the single domain's dict
+        """
+        with self._lock:
+            now = time.monotonic()
+            stats = {
+                name: {
+                    "acquisitions": b.acquisitions,
+                    "waits": b.waits,
+                    "total_wait_seconds": round(b.total_wait, 3),
+                    "max_wait_seconds": round(b.max_wait, 3),
+                    "avg_wait_seconds": round(b.total_wait / b.acquisitions, 3) if b.acquisitions else 0.0,
+                    "rate_limited": b.rate_limited,
+                    "rate": b.effective_rate,
+                    "burst": b.burst,
+                    "paused_seconds_remaining": round(max(0.0, b.paused_until - now), 3),
+                }
+                for name, b in self._buckets.items()
+            }
+        if domain is not None:
+            return stats.get(domain, {})
+        return stats
 
     def reset(self, domain: str = None):
         """
-        Reset rate limiter state.
+        Reset rate limiter state (tokens, pauses, adaptation and counters).
 
         Args:
             domain: Specific domain to reset, or None to reset all
         """
-        with self._master_lock:
+        with self._lock:
             if domain:
-                self._last_request[domain] = 0.0
+                self._buckets.pop(domain, None)
             else:
-                self._last_request = {k: 0.0 for k in self._last_request}
+                self._buckets.clear()
+
 
+# Backwards-compatible name for the shared limiter class.
+GlobalRateLimiter = TokenBucketRateLimiter
 
 # Singleton instance - shared across all collectors
-global_rate_limiter = GlobalRateLimiter()
+global_rate_limiter = TokenBucketRateLimiter()
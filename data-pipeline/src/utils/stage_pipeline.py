@@ -0,0 +1,227 @@
+"""
+Stage-decoupled pipeline: bounded queues between stages, one concurrency cap per stage class.
+
+Problem: streaming_runner gives every charity one thread that runs crawl
+(network-bound), extract/synthesize (CPU-bound), discover/baseline/rich/judge
+(LLM-bound) and export in sequence, all sized by one --workers value. Too
+few workers starves the LLM stages while crawls wait on slow hosts; too many
+overloads the database and CPU with parsing, and throughput is set by
+whichever stage fits the knob worst.
+
+Solution: StagePipeline runs an ordered list of stages, each with its own
+worker threads and an input queue of at most queue_size items.
+- pools: every stage names a pool ("network", "cpu", "llm:<model>", ...);
+  a pool's size caps how many items its stages work on at once, so two CPU
+  stages share one CPU budget
+- backpressure: a worker whose next queue is full waits (without holding
+  its pool slot) until the downstream stage catches up, and the feeder stops
+  admitting new items the same way
+- a stage returns False to drop an item (finished early: failed, skipped);
+  dropped and completed items are both yielded by run() as they leave
+- a stage that raises drops the item too; run(on_error=...) gets the
+  exception first (by default it is logged with its traceback)
+- get_stats() reports per-stage throughput, busy time, time waiting for a
+  pool slot, time blocked on a full downstream queue and peak queue depth
+
+Usage:
+    pipeline = StagePipeline(
+        [Stage("crawl", crawl, pool="network"), Stage("extract", extract, pool="cpu")],
+        pool_sizes={"network": 40, "cpu": 4},
+        queue_size=8,
+    )
+    for item in pipeline.run(items):
+        record(item)
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """One step of the pipeline; run(item) returns False to drop the item."""
+
+    name: str
+    run: Callable[[Any], bool]
+    pool: str
+
+
+class StagePipeline:
+    """Runs items through stages on per-stage worker threads with bounded queues in between."""
+
+    def __init__(self, stages: List[Stage], pool_sizes: Dict[str, int], queue_size: int = 8):
+        """
+        Args:
+            stages: Stages in order; every item visits them until one drops it
+            pool_sizes: Concurrent items per pool name (every stage's pool must be listed)
+            queue_size: Max items waiting in front of each stage
+        """
+        if not stages:
+            raise ValueError("StagePipeline needs at least one stage")
+        missing = sorted({stage.pool for stage in stages} - set(pool_sizes))
+        if missing:
+            raise ValueError(f"No pool size for: {', '.join(missing)}")
+        if any(size < 1 for size in pool_sizes.values()) or queue_size < 1:
+            raise ValueError("Pool sizes and queue_size must be >= 1")
+
+        self.stages = stages
+        self.pool_sizes = dict(pool_sizes)
+        self.queue_size = queue_size
+        self._slots = {pool: threading.BoundedSemaphore(size) for pool, size in self.pool_sizes.items()}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _workers_for(self, stage: Stage) -> int:
+        return self.pool_sizes[stage.pool]
+
+    def _put(self, q: "queue.Queue[Any]", item: Any, stats: Optional[Dict[str, Any]]) -> None:
+        """Blocking put; time spent waiting on a full queue is charged to the producing stage."""
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            start = time.monotonic()
+            q.put(item)
+            if stats is not None:
+                with self._lock:
+                    stats["blocked_seconds"] += time.monotonic() - start
+
+    def _note_depth(self, index: int, q: "queue.Queue[Any]") -> None:
+        stats = self._stats[self.stages[index].name]
+        with self._lock:
+            stats["max_queued"] = max(stats["max_queued"], q.qsize())
+
+    def _work(
+        self,
+        index: int,
+        inbox: "queue.Queue[Any]",
+        outbox: "queue.Queue[Any]",
+        done: "queue.Queue[Any]",
+        on_error: Optional[Callable[[str, Any, Exception], None]],
+    ):
+        stage = self.stages[index]
+        stats = self._stats[stage.name]
+        slots = self._slots[stage.pool]
+        while True:
+            item = inbox.get()
+            if item is _STOP:
+                return
+            wait_start = time.monotonic()
+            with slots:
+                start = time.monotonic()
+                try:
+                    keep = stage.run(item)
+                    error = False
+                except Exception as e:
+                    keep, error = False, True
+                    self._report_error(stage, item, e, on_error)
+                end = time.monotonic()
+            with self._lock:
+                stats["slot_wait_seconds"] += start - wait_start
+                stats["busy_seconds"] += end - start
+                stats["processed"] += 1
+                if error:
+                    stats["errors"] += 1
+                elif not keep:
+                    stats["dropped"] += 1
+
+            if keep and outbox is not done:
+                self._put(outbox, item, stats)
+                self._note_depth(index + 1, outbox)
+            else:
+                done.put(item)
+
+    @staticmethod
+    def _report_error(
+        stage: Stage, item: Any, error: Exception, on_error: Optional[Callable[[str, Any, Exception], None]]
+    ) -> None:
+        """Hand a stage exception to on_error (or the log); a failing handler must not kill the worker."""
+        if on_error is None:
+            logger.exception(f"Stage {stage.name} failed")
+            return
+        try:
+            on_error(stage.name, item, error)
+        except Exception:
+            logger.exception(f"Error handler for stage {stage.name} failed")
+
+    def run(
+        self, items: Iterable[Any], on_error: Optional[Callable[[str, Any, Exception], None]] = None
+    ) -> Iterator[Any]:
+        """
+        Feed items through the stages and yield each one as it leaves the pipeline.
+
+        Items come out in completion order, whether they passed every stage or
+        were dropped on the way; stage exceptions count as drops.
+
+        Args:
+            items: Items to run
+            on_error: Called as on_error(stage_name, item, exception) on the
+                worker thread, inside the except block, when a stage raises;
+                default: log the exception with its traceback
+        """
+        items = list(items)
+        self._stats = {
+            stage.name: {
+                "pool": stage.pool,
+                "workers": self._workers_for(stage),
+                "processed": 0,
+                "dropped": 0,
+                "errors": 0,
+                "busy_seconds": 0.0,
+                "slot_wait_seconds": 0.0,
+                "blocked_seconds": 0.0,
+                "max_queued": 0,
+            }
+            for stage in self.stages
+        }
+        inboxes: List["queue.Queue[Any]"] = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        done: "queue.Queue[Any]" = queue.Queue()
+
+        threads: List[List[threading.Thread]] = []
+        for index, stage in enumerate(self.stages):
+            outbox = inboxes[index + 1] if index + 1 < len(self.stages) else done
+            workers = [
+                threading.Thread(
+                    target=self._work,
+                    args=(index, inboxes[index], outbox, done, on_error),
+                    name=f"{stage.name}-{n}",
+                    daemon=True,
+                )
+                for n in range(self._workers_for(stage))
+            ]
+            for thread in workers:
+                thread.start()
+            threads.append(workers)
+
+        def feed() -> None:
+            for item in items:
+                self._put(inboxes[0], item, None)
+                self._note_depth(0, inboxes[0])
+
+        feeder = threading.Thread(target=feed, name="stage-feeder", daemon=True)
+        feeder.start()
+        try:
+            for _ in range(len(items)):
+                yield done.get()
+        finally:
+            # Stop stage by stage: a stage's workers finish (and forward) what is
+            # queued in front of them before the next stage is told to stop, so
+            # nothing is stranded if the consumer gave up early.
+            feeder.join()
+            for inbox, workers in zip(inboxes, threads):
+                for _ in workers:
+                    inbox.put(_STOP)
+                for thread in workers:
+                    thread.join()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage counts and seconds busy, waiting for a pool slot and blocked downstream."""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
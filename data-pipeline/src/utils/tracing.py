@@ -0,0 +1,410 @@
+"""
+Run-level tracing: nested timing spans written as JSONL, and latency reports.
+
+The result dict of process_charity_full() and the website collector's
+`timing` dict say how long a phase took, not where the time went. With
+tracing enabled (streaming_runner --trace, or PIPELINE_TRACE=path) the
+runner, collectors, repositories and LLM clients open spans around phases,
+source fetches, crawl steps, DB round-trips, LLM calls, rate-limiter waits
+and contended locks. Each finished span is one JSON line:
+
+    {"trace": "12-3456789", "id": 17, "parent": 3, "kind": "llm", "name": "gemini-3-flash-preview",
+     "start": 1760600000.12, "ms": 5321.4, "status": "ok", "thread": "ThreadPoolExecutor-0_3",
+     "attrs": {"op": "generate", "output_tokens": 812}}
+
+The span name is what reports group by: the phase for "phase" spans, the
+source for "source", the model for "llm", the statement for "db", the
+domain for "rate_limit" and the lock for "lock".
+
+summarize_trace() turns a trace into p50/p95/p99 per kind and name plus a
+critical-path breakdown per charity; scripts/trace_report.py prints it for
+any earlier run.
+
+Spans nest through contextvars. asyncio tasks inherit the current span;
+work handed to another thread only attaches to it when wrapped in bind().
+With tracing off, trace_span() returns a shared no-op span.
+
+Usage:
+    from src.utils.tracing import configure_tracing, trace_span
+
+    configure_tracing("logs/traces/run.jsonl")
+
+    with trace_span("source", "bbb") as span:
+        result = fetch()
+        span.set(attempts=2)
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("trace_span", default=None)
+
+
+class Tracer:
+    """Appends finished spans to one JSONL file (thread-safe)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Span:
+    """
+    A timed unit of work. Becomes the current span when created; end() (or
+    leaving the `with` block) writes it out and restores the parent.
+    """
+
+    __slots__ = ("_tracer", "_token", "trace", "id", "parent", "kind", "name", "start", "attrs")
+
+    def __init__(self, tracer: Tracer, kind: str, name: str, trace: Optional[str], attrs: Dict[str, Any]):
+        parent = _current.get()
+        self._tracer = tracer
+        self.trace = trace or (parent.trace if parent else None)
+        self.id = tracer.next_id()
+        self.parent = parent.id if parent else None
+        self.kind = kind
+        self.name = name
+        self.attrs = attrs
+        self.start = time.time()
+        self._token = _current.set(self)
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes (token counts, row counts, outcome, ...)."""
+        self.attrs.update(attrs)
+
+    def end(self, status: str = "ok", **attrs: Any) -> None:
+        """Finish the span; later calls are ignored."""
+        if self._token is None:
+            return
+        try:
+            _current.reset(self._token)
+        except ValueError:
+            # Ended from a different context than it started in; nothing to restore.
+            pass
+        self._token = None
+        self.attrs.update(attrs)
+        self._tracer.write(
+            {
+                "trace": self.trace,
+                "id": self.id,
+                "parent": self.parent,
+                "kind": self.kind,
+                "name": self.name,
+                "start": round(self.start, 6),
+                "ms": round((time.time() - self.start) * 1000, 3),
+                "status": status,
+                "thread": threading.current_thread().name,
+                "attrs": self.attrs,
+            }
+        )
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.end()
+        else:
+            self.end(status="error", error=exc_type.__name__)
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def end(self, status: str = "ok", **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+# =============================================================================
+# PROCESS-WIDE SWITCH
+# =============================================================================
+
+_tracer_lock = threading.Lock()
+_tracer: Optional[Tracer] = None
+_resolved = False
+
+
+def configure_tracing(path: Optional[Union[str, Path]]) -> Optional[Tracer]:
+    """Start writing spans to path (truncating it), or stop tracing with None."""
+    global _tracer, _resolved
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.close()
+        _tracer = Tracer(path) if path else None
+        _resolved = True
+        return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """
+    The active tracer, or None when tracing is off.
+
+    Unless configure_tracing() was called, the PIPELINE_TRACE environment
+    variable (a JSONL path) decides.
+    """
+    global _tracer, _resolved
+    if not _resolved:
+        with _tracer_lock:
+            if not _resolved:
+                path = os.environ.get("PIPELINE_TRACE")
+                _tracer = Tracer(path) if path else None
+                _resolved = True
+    return _tracer
+
+
+def trace_span(kind: str, name: str, trace: Optional[str] = None, **attrs: Any) -> Union[Span, _NoopSpan]:
+    """
+    Start a span under the current one. Use as a context manager or call end().
+
+    Args:
+        kind: Span category (phase, source, crawl, llm, db, rate_limit, lock, ...)
+        name: What reports group by within the kind
+        trace: Trace id for a root span (the charity EIN); children inherit it
+        **attrs: Extra attributes recorded with the span
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(tracer, kind, name, trace, attrs)
+
+
+def record_span(kind: str, name: str, start: float, end: Optional[float] = None, **attrs: Any) -> None:
+    """Record an interval measured elsewhere (start/end are time.time() values) under the current span."""
+    tracer = get_tracer()
+    if tracer is None:
+        return
+    parent = _current.get()
+    tracer.write(
+        {
+            "trace": parent.trace if parent else None,
+            "id": tracer.next_id(),
+            "parent": parent.id if parent else None,
+            "kind": kind,
+            "name": name,
+            "start": round(start, 6),
+            "ms": round(((end if end is not None else time.time()) - start) * 1000, 3),
+            "status": "ok",
+            "thread": threading.current_thread().name,
+            "attrs": attrs,
+        }
+    )
+
+
+def bind(fn: Callable) -> Callable:
+    """Wrap fn to run under the caller's current span (for executor.submit)."""
+    if get_tracer() is None:
+        return fn
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+class TracedLock:
+    """threading.Lock that records a "lock" span whenever acquiring it has to wait."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(False):
+            return True
+        if not blocking:
+            return False
+        start = time.time()
+        acquired = self._lock.acquire(True, timeout)
+        record_span("lock", self.name, start, acquired=acquired)
+        return acquired
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+# =============================================================================
+# REPORTS
+# =============================================================================
+
+
+def load_trace(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read a trace file, skipping a torn last line from an interrupted run."""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+def _latency(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else 0.0,
+        "total": round(sum(values), 3),
+    }
+
+
+def critical_path(root: Dict[str, Any], children: Dict[int, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    The chain of spans that determined root's duration, with each span's own
+    time on that chain.
+
+    Walks back from the end of each span: the child that finished last is
+    on the path, then the latest child that finished before it started, and
+    so on; overlapping children that finished earlier ran in parallel and
+    are off the path. Time not covered by a chosen child is the span's own.
+    """
+    end = root["start"] + root["ms"] / 1000
+    chosen = []
+    cursor = end
+    for child in sorted(children.get(root["id"], []), key=lambda s: s["start"] + s["ms"] / 1000, reverse=True):
+        if child["start"] + child["ms"] / 1000 <= cursor + 1e-6:
+            chosen.append(child)
+            cursor = child["start"]
+    own = max(0.0, root["ms"] - sum(child["ms"] for child in chosen))
+    path = [{"kind": root["kind"], "name": root["name"], "ms": round(own, 3)}]
+    for child in reversed(chosen):
+        path.extend(critical_path(child, children))
+    return path
+
+
+def summarize_trace(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Latency percentiles and critical paths for one run.
+
+    Returns:
+        {
+            "latency": {kind: {name: {"count", "p50", "p95", "p99", "max", "total"}}},  # ms
+            "skipped": {"kind:name": count},       # cache skips (attrs.skipped), excluded from latency
+            "charities": {ein: {"ms": total, "critical_path": [{"kind", "name", "ms"}, ...]}},
+            "critical_path_share": {"kind:name": ms summed over charities},
+        }
+    """
+    by_kind: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    skipped: Dict[str, int] = defaultdict(int)
+    children: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    roots = []
+    for span in spans:
+        if span.get("parent") is not None:
+            children[span["parent"]].append(span)
+        if span["kind"] == "charity":
+            roots.append(span)
+        if span.get("attrs", {}).get("skipped"):
+            skipped[f"{span['kind']}:{span['name']}"] += 1
+            continue
+        by_kind[span["kind"]][span["name"]].append(span["ms"])
+
+    charities = {}
+    share: Dict[str, float] = defaultdict(float)
+    for root in roots:
+        merged: Dict[tuple, float] = defaultdict(float)
+        for step in critical_path(root, children):
+            merged[(step["kind"], step["name"])] += step["ms"]
+        path = [
+            {"kind": kind, "name": name, "ms": round(ms, 3)}
+            for (kind, name), ms in sorted(merged.items(), key=lambda item: item[1], reverse=True)
+        ]
+        charities[root["trace"] or root["name"]] = {"ms": root["ms"], "critical_path": path}
+        for step in path:
+            # A charity's own time (worker setup, bookkeeping) pools across charities.
+            key = "charity:(own time)" if step["kind"] == "charity" else f"{step['kind']}:{step['name']}"
+            share[key] += step["ms"]
+
+    return {
+        "latency": {
+            kind: {name: _latency(values) for name, values in names.items()} for kind, names in by_kind.items()
+        },
+        "skipped": dict(sorted(skipped.items())),
+        "charities": charities,
+        "critical_path_share": dict(sorted(share.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def format_trace_report(summary: Dict[str, Any], top: int = 10, charities: int = 5) -> str:
+    """Render summarize_trace() output as plain-text tables."""
+    lines = []
+    for kind in ("phase", "source", "crawl", "llm", "db", "rate_limit", "lock"):
+        names = summary["latency"].get(kind)
+        if not names:
+            continue
+        lines.append(f"\n{kind} latency (ms)")
+        lines.append(f"  {'name':<40} {'n':>6} {'p50':>10} {'p95':>10} {'p99':>10} {'total s':>9}")
+        ranked = sorted(names.items(), key=lambda item: item[1]["total"], reverse=True)
+        for name, st in ranked[:top]:
+            lines.append(
+                f"  {name[:40]:<40} {st['count']:>6} {st['p50']:>10.1f} {st['p95']:>10.1f} "
+                f"{st['p99']:>10.1f} {st['total'] / 1000:>9.1f}"
+            )
+        if len(ranked) > top:
+            lines.append(f"  ... and {len(ranked) - top} more")
+    if summary["skipped"]:
+        skipped = ", ".join(f"{key} ×{count}" for key, count in summary["skipped"].items())
+        lines.append(f"\ncache skips (not in latency): {skipped}")
+
+    share = summary["critical_path_share"]
+    if share:
+        total = sum(share.values()) or 1.0
+        lines.append("\ncritical path share (all charities)")
+        for key, ms in list(share.items())[:top]:
+            lines.append(f"  {key[:48]:<48} {ms / 1000:>9.1f}s {ms / total:>6.1%}")
+        slowest = sorted(summary["charities"].items(), key=lambda item: item[1]["ms"], reverse=True)
+        lines.append(f"\nslowest charities (critical path, top {min(charities, len(slowest))})")
+        for ein, entry in slowest[:charities]:
+            steps = ", ".join(f"{s['kind']}:{s['name']} {s['ms'] / 1000:.1f}s" for s in entry["critical_path"][:4])
+            lines.append(f"  {ein} {entry['ms'] / 1000:.1f}s: {steps}")
+    return "\n".join(lines)
@@ -10,23 +10,44 @@ Benefits over batch-per-phase:
 - Memory efficient (no large intermediate state)
 - Progress visible per-charity
 
+--staged runs the same phase steps on one worker pool per phase class
+(network: crawl, cpu: extract/synthesize, export) and one LLM pool per
+model that discover/baseline/rich/judge call ("llm:<model>"), with bounded
+queues in between, so each class is sized on its own
+(src/utils/stage_pipeline.py). Cache skips, the judge gate and checkpoints
+work the same in both modes.
+
+--queue RUN_ID lets several runners (processes or hosts sharing the Dolt
+server) drain one charity list: each enqueues its list under RUN_ID, then
+claims charities one at a time under heartbeated leases, so a crashed
+runner's charities are picked up by the others once its leases expire
+(src/db/work_queue.py). The last runner to finish tags the run and rebuilds
+the export.
+
 Usage:
     uv run python streaming_runner.py --charities pilot_charities.txt --workers 20
+    uv run python streaming_runner.py --charities pilot_charities.txt --staged --crawl-workers 40 --llm-workers 12
+    uv run python streaming_runner.py --charities pilot_charities.txt --queue run-2026-10-16  # on each host
     uv run python streaming_runner.py --ein 95-4453134  # Single charity
 """
 
 import argparse
+import contextvars
+import functools
 import json
 import os
+import queue
+import socket
 import subprocess
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any
+from typing import Any, Callable, Iterator, Sequence
 
 from dotenv import load_dotenv
 
@@ -43,27 +64,64 @@ from src.collectors.form990_grants import Form990GrantsCollector
 from src.collectors.orchestrator import DataCollectionOrchestrator
 from src.collectors.propublica import ProPublicaCollector
 from src.collectors.web_collector import WebsiteCollector
+from src.constants import (
+    DISCOVERY_MODEL,
+    STAGED_CPU_WORKERS,
+    STAGED_CRAWL_WORKERS,
+    STAGED_EXPORT_WORKERS,
+    STAGED_LLM_WORKERS,
+    STAGED_QUEUE_SIZE,
+    WORK_QUEUE_CALL_RETRIES,
+    WORK_QUEUE_LEASE_SECONDS,
+    WORK_QUEUE_POLL_SECONDS,
+    WORK_QUEUE_RETRY_MAX_SECONDS,
+    WORK_QUEUE_RETRY_SECONDS,
+)
 from src.db import (
     CharityDataRepository,
     CharityRepository,
+    CharityWorkingSet,
+    DoltWorkQueue,
     EvaluationRepository,
     ExportExclusionRepository,
+    Lease,
+    LeasedPhaseCache,
+    LeaseKeeper,
+    LeaseLostError,
     PhaseCacheRepository,
     RawDataRepository,
+    WorkQueue,
+    retry_call,
 )
 from src.db.dolt_client import dolt, tables_for_phases
-from src.llm.budget_tracker import BudgetExceededError, check_budget, get_limit, get_spent, set_budget
-from src.llm.llm_client import LLMClient
+from src.llm.budget_tracker import BudgetExceededError, check_budget, get_limit, get_saved, get_spent, set_budget
+from src.llm.llm_client import TASK_MODELS, LLMClient, LLMTask
+from src.llm.response_cache import configure_response_cache, get_response_cache
+from src.llm.stream_validation import configure_streaming
 from src.scorers.v2_scorers import AmalScorerV2
+from src.utils.async_loop import close_crawl_loop
 from src.utils.charity_loader import load_charities_from_file, normalize_website_url
+from src.utils.crawl_scheduler import crawl_scheduler
 from src.utils.ein_utils import validate_and_format
+from src.utils.http_pool import get_pool_stats
 from src.utils.logger import PipelineLogger
+from src.utils.pdf_text import get_pdf_text_extractor
 from src.utils.phase_cache_helper import (
     check_phase_cache,
     get_phase_fingerprint,
     update_phase_cache,
 )
-from src.utils.phase_fingerprint import get_ttl_days
+from src.utils.phase_fingerprint import get_ttl_days, precompute_code_fingerprints
+from src.utils.rate_limiter import global_rate_limiter
+from src.utils.stage_pipeline import Stage, StagePipeline
+from src.utils.tracing import (
+    configure_tracing,
+    format_trace_report,
+    get_tracer,
+    load_trace,
+    summarize_trace,
+    trace_span,
+)
 
 # Streaming runs write every phase's tables (phase_cache rides along via
 # the per-phase lists) plus Phase-7 export-exclusion audit rows.
@@ -128,6 +186,9 @@ progress = {"completed": 0, "failed": 0, "total": 0}
 
 DEFAULT_BUDGET_USD = 10.0
 
+# --concurrent-sources: per-worker orchestrators fetch a charity's sources in parallel
+CONCURRENT_SOURCE_FETCH = False
+
 
 def apply_budget_cap(budget_usd: float | None) -> None:
     """--budget semantics (H9): 0 disables the cap, negative is an error, else cap in USD."""
@@ -183,6 +244,7 @@ def _create_worker_resources(logger: PipelineLogger, llm_model: str) -> dict[str
         "orchestrator": DataCollectionOrchestrator(
             logger=logger,
             max_pdf_downloads=5,
+            concurrent_sources=CONCURRENT_SOURCE_FETCH,
         ),
         "collectors": _build_extract_collectors(logger),
         "charity_repo": CharityRepository(),
@@ -231,6 +293,13 @@ def _cleanup_worker_resources() -> None:
             except Exception:
                 pass
 
+    # All worker threads are done with the shared async crawl loop
+    close_crawl_loop()
+
+
+_RAW_ARTIFACT_PHASES = {"crawl", "extract"}
+_EVAL_ARTIFACT_PHASES = {"baseline", "rich", "judge"}
+
 
 def _phase_artifacts_exist(
     ein: str,
@@ -240,6 +309,25 @@ def _phase_artifacts_exist(
     eval_repo: EvaluationRepository,
 ) -> tuple[bool, str]:
     """Verify cached phase outputs still exist before allowing a cache skip."""
+    return _check_phase_artifacts(
+        ein,
+        phase,
+        raw_rows=raw_repo.get_for_charity(ein) if phase in _RAW_ARTIFACT_PHASES else None,
+        discovered=raw_repo.get_by_source(ein, "discovered") if phase == "discover" else None,
+        synth_data=data_repo.get(ein) if phase == "synthesize" else None,
+        evaluation=eval_repo.get(ein) if phase in _EVAL_ARTIFACT_PHASES else None,
+    )
+
+
+def _check_phase_artifacts(
+    ein: str,
+    phase: str,
+    raw_rows: list[dict] | None = None,
+    discovered: dict | None = None,
+    synth_data: dict | None = None,
+    evaluation: dict | None = None,
+) -> tuple[bool, str]:
+    """_phase_artifacts_exist() on already-loaded rows (shared with the bulk planner)."""
     from src.schemas.phase_contracts import (
         validate_discover_output,
         validate_extract_output,
@@ -247,21 +335,20 @@ def _phase_artifacts_exist(
     )
 
     if phase == "crawl":
-        rows = raw_repo.get_for_charity(ein) or []
+        rows = raw_rows or []
         has_successful_raw = any(row.get("success") for row in rows)
         if not has_successful_raw:
             return False, "no successful raw_scraped_data rows"
         return True, ""
 
     if phase == "extract":
-        rows = raw_repo.get_for_charity(ein) or []
+        rows = raw_rows or []
         contract = validate_extract_output(ein, rows)
         if not contract:
             return False, "; ".join(contract.errors) or "extract contract failed"
         return True, ""
 
     if phase == "discover":
-        discovered = raw_repo.get_by_source(ein, "discovered")
         parsed = discovered.get("parsed_json") if discovered else None
         profile = parsed.get("discovered_profile") if isinstance(parsed, dict) else None
         has_profile = isinstance(profile, dict) and bool(profile)
@@ -273,7 +360,6 @@ def _phase_artifacts_exist(
         return True, ""
 
     if phase == "synthesize":
-        synth_data = data_repo.get(ein)
         if not synth_data:
             return False, "missing charity_data row"
         contract = validate_synthesize_output(synth_data)
@@ -282,7 +368,6 @@ def _phase_artifacts_exist(
         return True, ""
 
     if phase == "baseline":
-        evaluation = eval_repo.get(ein)
         if not evaluation:
             return False, "missing evaluations row"
         if evaluation.get("amal_score") is None:
@@ -293,14 +378,12 @@ def _phase_artifacts_exist(
         return True, ""
 
     if phase == "rich":
-        evaluation = eval_repo.get(ein)
         rich_narrative = evaluation.get("rich_narrative") if evaluation else None
         if not isinstance(rich_narrative, dict) or not rich_narrative:
             return False, "missing rich_narrative"
         return True, ""
 
     if phase == "judge":
-        evaluation = eval_repo.get(ein)
         if not evaluation:
             return False, "missing evaluations row"
         if evaluation.get("judge_score") is None:
@@ -324,8 +407,26 @@ def should_run_phase_with_artifact_validation(
     force_all: bool = False,
     force_phases: list[str] | None = None,
     upstream_ran: set[str] | None = None,
+    plan: "RunPlan | None" = None,
 ) -> tuple[bool, str]:
-    """Run cache check plus artifact existence validation for robust skip decisions."""
+    """Run cache check plus artifact existence validation for robust skip decisions.
+
+    With a precomputed RunPlan, the cache and artifact checks come from the
+    plan instead of per-phase queries; force flags and in-session cascade
+    are still applied here.
+    """
+    decision = plan.get(ein, phase) if plan is not None else None
+    if decision is not None:
+        should_run, reason = should_run_phase(
+            ein, phase, cache_repo, force_all, force_phases, upstream_ran, cache_decision=decision.cache_decision
+        )
+        if should_run:
+            return True, reason
+        if decision.artifact_reason is None:
+            return False, reason
+        cache_repo.delete(ein, phase)
+        return True, f"Cached artifact missing: {decision.artifact_reason}"
+
     should_run, reason = should_run_phase(ein, phase, cache_repo, force_all, force_phases, upstream_ran)
     if should_run:
         return True, reason
@@ -505,6 +606,7 @@ def should_run_phase(
     force_all: bool = False,
     force_phases: list[str] | None = None,
     upstream_ran: set[str] | None = None,
+    cache_decision: tuple[bool, str] | None = None,
 ) -> tuple[bool, str]:
     """Determine if a phase should run or can be skipped.
 
@@ -518,6 +620,8 @@ def should_run_phase(
         force_all: If True, always run
         force_phases: List of phases to force rerun
         upstream_ran: Set of upstream phases that ran (triggers cascade)
+        cache_decision: Precomputed (should_run, reason) from a RunPlan,
+            used instead of querying phase_cache
 
     Returns:
         Tuple of (should_run, reason)
@@ -536,74 +640,137 @@ def should_run_phase(
             if dep in upstream_ran:
                 return True, f"Upstream {dep} ran"
 
+    if cache_decision is not None:
+        return cache_decision
+
     # Delegate fingerprint + TTL check to shared helper
     return check_phase_cache(ein, phase, cache_repo)
 
 
-def print_cache_status(
-    charities: list[dict],
+PLANNED_PHASES = ["crawl", "extract", "discover", "synthesize", "baseline", "rich", "judge"]
+
+
+@dataclass
+class PhaseDecision:
+    """Planned outcome for one charity/phase, computed from bulk-loaded rows."""
+
+    cache_decision: tuple[bool, str]  # (should_run, reason) from fingerprint + TTL
+    artifact_reason: str | None = None  # Set when the cache is valid but outputs are missing
+    cache_entry: dict | None = None
+    status: str = "RUN"  # RUN / SKIP / FORCE, after force flags and cascade
+    detail: str = ""
+
+
+@dataclass
+class RunPlan:
+    """Which phases run for which EIN, and why. Built once by build_run_plan()."""
+
+    decisions: dict[str, dict[str, PhaseDecision]] = field(default_factory=dict)
+
+    def get(self, ein: str, phase: str) -> PhaseDecision | None:
+        return self.decisions.get(ein, {}).get(phase)
+
+    def phases_to_run(self, ein: str) -> list[str]:
+        return [phase for phase, d in self.decisions.get(ein, {}).items() if d.status != "SKIP"]
+
+
+def build_run_plan(
+    eins: list[str],
     cache_repo: PhaseCacheRepository,
+    raw_repo: RawDataRepository,
+    data_repo: CharityDataRepository,
+    eval_repo: EvaluationRepository,
+    force_all: bool = False,
     force_phases: list[str] | None = None,
-) -> None:
-    """Print cache status for charities and exit.
+) -> RunPlan:
+    """Plan every phase for every charity from a handful of bulk queries.
 
-    Shows what would run without running, including cascade invalidation
-    (upstream phase running forces downstream phases to run too).
+    Loads phase_cache plus the artifact rows (raw parsed_json, charity_data,
+    evaluations) for the whole list, then applies the same fingerprint/TTL,
+    artifact-presence, force and cascade rules as the per-phase checks.
     """
     from src.utils.phase_fingerprint import PHASE_DEPENDENCIES
 
-    phases = ["crawl", "extract", "discover", "synthesize", "baseline", "rich", "judge"]
-
-    for charity in charities:
-        ein = charity["ein"]
-        name = charity["name"]
-        print(f"\nCache status for {ein} ({name[:40]}):")
+    cache_entries = cache_repo.get_many(eins)
+    raw_rows = raw_repo.get_for_charities(eins, columns=("success", "parsed_json"))
+    synth_rows = data_repo.get_many(eins)
+    eval_rows = eval_repo.get_many(eins)
+    fingerprints = {phase: get_phase_fingerprint(phase) for phase in PLANNED_PHASES}
 
+    plan = RunPlan()
+    for ein in eins:
+        rows = raw_rows.get(ein, [])
+        discovered = next((r for r in rows if r.get("source") == "discovered"), None)
         would_run: set[str] = set()
+        decisions: dict[str, PhaseDecision] = {}
 
-        for phase in phases:
-            current_fp = get_phase_fingerprint(phase)
+        for phase in PLANNED_PHASES:
+            entry = cache_entries.get((ein, phase))
             ttl_days = get_ttl_days(phase)
-            is_valid, reason = cache_repo.is_valid(ein, phase, current_fp, ttl_days)
-
-            cache_entry = cache_repo.get(ein, phase)
+            is_valid, reason = PhaseCacheRepository.evaluate_entry(phase, entry, fingerprints[phase], ttl_days)
+            decision = PhaseDecision(cache_decision=(not is_valid, reason), cache_entry=entry)
+            if is_valid:
+                artifacts_ok, artifact_reason = _check_phase_artifacts(
+                    ein,
+                    phase,
+                    raw_rows=rows,
+                    discovered=discovered,
+                    synth_data=synth_rows.get(ein),
+                    evaluation=eval_rows.get(ein),
+                )
+                if not artifacts_ok:
+                    decision.artifact_reason = artifact_reason
 
             # Check cascade: if any upstream phase would run, this one must too
-            cascade_dep = None
-            for dep in PHASE_DEPENDENCIES.get(phase, []):
-                if dep in would_run:
-                    cascade_dep = dep
-                    break
-
-            if force_phases and phase in force_phases:
-                status = "FORCE"
-                detail = "User requested"
-                would_run.add(phase)
+            cascade_dep = next((dep for dep in PHASE_DEPENDENCIES.get(phase, []) if dep in would_run), None)
+
+            if force_all:
+                decision.status, decision.detail = "FORCE", "Force all"
+            elif force_phases and phase in force_phases:
+                decision.status, decision.detail = "FORCE", "User requested"
             elif cascade_dep:
-                status = "RUN"
-                detail = f"Upstream {cascade_dep} ran"
-                would_run.add(phase)
-            elif is_valid:
-                status = "SKIP"
-                if cache_entry:
-                    ran_at = cache_entry.get("ran_at")
-                    if ran_at:
-                        age_days = (datetime.now() - ran_at).days
-                        if ttl_days == float("inf"):
-                            detail = "code unchanged"
-                        else:
-                            detail = f"code unchanged, {age_days}d old < {int(ttl_days)}d TTL"
-                    else:
-                        detail = "code unchanged"
-                else:
-                    detail = "code unchanged"
+                decision.status, decision.detail = "RUN", f"Upstream {cascade_dep} ran"
+            elif not is_valid:
+                decision.status, decision.detail = "RUN", reason
+            elif decision.artifact_reason:
+                decision.status, decision.detail = "RUN", f"Cached artifact missing: {decision.artifact_reason}"
             else:
-                status = "RUN"
-                detail = reason
+                decision.status, decision.detail = "SKIP", _cache_skip_detail(entry, ttl_days)
+
+            if decision.status != "SKIP":
                 would_run.add(phase)
+            decisions[phase] = decision
+
+        plan.decisions[ein] = decisions
+    return plan
+
 
-            print(f"  {phase:12} {status:5}  ({detail})")
+def _cache_skip_detail(cache_entry: dict | None, ttl_days: float) -> str:
+    ran_at = cache_entry.get("ran_at") if cache_entry else None
+    if not ran_at or ttl_days == float("inf"):
+        return "code unchanged"
+    age_days = (datetime.now() - ran_at).days
+    return f"code unchanged, {age_days}d old < {int(ttl_days)}d TTL"
+
+
+def print_cache_status(charities: list[dict], plan: RunPlan) -> None:
+    """Print cache status for charities from a precomputed run plan.
+
+    Shows what would run without running, including cascade invalidation
+    (upstream phase running forces downstream phases to run too) and
+    cached phases whose artifacts have gone missing.
+    """
+    for charity in charities:
+        ein = charity["ein"]
+        name = charity["name"]
+        print(f"\nCache status for {ein} ({name[:40]}):")
+        for phase in PLANNED_PHASES:
+            decision = plan.get(ein, phase)
+            if decision is not None:
+                print(f"  {phase:12} {decision.status:5}  ({decision.detail})")
 
+    total = sum(len(plan.phases_to_run(c["ein"])) for c in charities)
+    print(f"\n{total} phase runs planned across {len(charities)} charities")
     print()
 
 
@@ -624,9 +791,9 @@ def extract_raw_data(ein: str, collectors: dict, logger: PipelineLogger, force:
     """
     repo = RawDataRepository()
     if force:
-        rows = repo.get_all(eins=[ein])
+        rows = repo.get_all(eins=[ein], include_raw_content=True)
     else:
-        rows = repo.get_unparsed(eins=[ein])
+        rows = repo.get_unparsed(eins=[ein], include_raw_content=True)
 
     success = 0
     failed = 0
@@ -693,11 +860,11 @@ def run_discovery_phase(
         return result
 
     # Initialize services
-    zakat_svc = ZakatVerificationService()
-    evidence_svc = EvidenceDiscoveryService()
-    outcome_svc = OutcomeDiscoveryService()
-    toc_svc = TheoryOfChangeDiscoveryService()
-    awards_svc = AwardsDiscoveryService()
+    zakat_svc = ZakatVerificationService(model=DISCOVERY_MODEL)
+    evidence_svc = EvidenceDiscoveryService(model=DISCOVERY_MODEL)
+    outcome_svc = OutcomeDiscoveryService(model=DISCOVERY_MODEL)
+    toc_svc = TheoryOfChangeDiscoveryService(model=DISCOVERY_MODEL)
+    awards_svc = AwardsDiscoveryService(model=DISCOVERY_MODEL)
 
     discovered_profile = {
         "ein": ein,
@@ -798,6 +965,868 @@ def run_discovery_phase(
     return result
 
 
+class _PhaseSpans:
+    """One "phase" trace span per phase of process_charity_full; a phase ends where the next begins."""
+
+    def __init__(self, result: dict):
+        self._result = result
+        self._phase: str | None = None
+        self._span = None
+
+    def begin(self, phase: str) -> None:
+        self.end()
+        self._phase = phase
+        self._span = trace_span("phase", phase)
+
+    def end(self) -> None:
+        if self._span is None:
+            return
+        info = self._result["phases"].get(self._phase)
+        if info is None:
+            # No entry: either an exception cut the phase short or it had nothing to do
+            # (e.g. rich after a failed baseline).
+            failed = "error" in self._result
+            self._span.end(status="error" if failed else "ok", skipped=not failed)
+        else:
+            self._span.end(
+                status="ok" if info.get("success") else "error",
+                skipped=bool(info.get("skipped")),
+                cost=info.get("cost"),
+            )
+        self._span = None
+
+
+@dataclass
+class RunOptions:
+    """Run-wide settings every phase of every charity reads."""
+
+    llm_model: str
+    logger: PipelineLogger
+    verbose: bool = False
+    skip_export: bool = False
+    judge_gate_enabled: bool = True
+    output_dir: Path | None = None
+    ui_signals_config: dict | None = None
+    config_hash: str = ""
+    pilot_flags: dict | None = None
+    force_all: bool = False
+    force_phases: list[str] | None = None
+    run_plan: RunPlan | None = None
+    work_queue: WorkQueue | None = None
+
+
+class CharityRun:
+    """One charity's pass through the phases.
+
+    Holds the result dict, the phases that actually ran (for cascade
+    invalidation), the charity's working set and its trace spans. Each phase
+    step below takes a CharityRun and returns False when the charity stops
+    early; step() runs a sequence of them. process_charity_full() runs every
+    step on one thread, the staged scheduler (--staged) hands the run from
+    pool to pool between steps. Only one thread touches a run at a time.
+
+    With --queue the run holds a lease on its charity: phase_cache writes are
+    fenced by it (LeasedPhaseCache) and the run stops once it is lost.
+    """
+
+    def __init__(self, charity: dict, index: int, total: int, options: RunOptions, lease: Lease | None = None):
+        self.ein = charity["ein"]
+        self.name = charity["name"]
+        self.website = charity["website"]
+        self.index = index
+        self.total = total
+        self.options = options
+        self.lease = lease
+        self.result = {
+            "ein": self.ein,
+            "name": self.name,
+            "phases": {},
+            "costs": {
+                "crawl": 0.0,
+                "extract": 0.0,
+                "discover": 0.0,
+                "synthesize": 0.0,
+                "baseline": 0.0,
+                "rich": 0.0,
+                "judge": 0.0,
+            },
+            "total_cost": 0.0,
+            "success": False,
+            "cache_skips": [],  # Phases skipped due to smart cache
+        }
+        # Track which phases actually ran (for cascade invalidation)
+        self.phases_ran: set[str] = set()
+        self.working_set: CharityWorkingSet | None = None
+        self.done = False
+        self._started = False
+        self._charity_span = None
+        self._phase_spans = _PhaseSpans(self.result)
+        # Spans nest through contextvars: running every step in one context keeps
+        # the phase spans under the charity span whichever thread runs them.
+        self._context = contextvars.copy_context()
+
+    def log(self, message: str) -> None:
+        with print_lock:
+            print(f"[{self.index}/{self.total}] {message}")
+
+    def resources(self) -> dict[str, Any]:
+        """Worker-local resources (orchestrator, collectors, LLM client, ...) of the current thread."""
+        return _get_worker_resources(self.options.logger, self.options.llm_model)
+
+    def cache_repo(self) -> PhaseCacheRepository:
+        """phase_cache repository for this charity; writes are fenced by the lease when there is one."""
+        repo = self.resources()["cache_repo"]
+        if self.lease is None:
+            return repo
+        return LeasedPhaseCache(repo, self.options.work_queue, self.lease)
+
+    def begin_phase(self, phase: str) -> None:
+        self._phase_spans.begin(phase)
+
+    def end_phase(self) -> None:
+        self._phase_spans.end()
+
+    def should_run(self, phase: str) -> tuple[bool, str]:
+        ws = self.working_set
+        return should_run_phase_with_artifact_validation(
+            self.ein,
+            phase,
+            self.cache_repo(),
+            ws.raw_repo,
+            ws.data_repo,
+            ws.eval_repo,
+            self.options.force_all,
+            self.options.force_phases,
+            self.phases_ran,
+            self.options.run_plan,
+        )
+
+    def step(self, steps: Sequence[Callable[["CharityRun"], bool]], last: bool = False) -> bool:
+        """Run steps in order.
+
+        Returns:
+            True to hand the run to the next steps; False once the charity is
+            finished (stopped early, failed, or every step done with last=True)
+        """
+        return self._context.run(self._step, steps, last)
+
+    def _step(self, steps: Sequence[Callable[["CharityRun"], bool]], last: bool) -> bool:
+        if not self._started:
+            if not self._start():
+                self.done = True
+                return False
+        try:
+            if all(self._run_step(step) for step in steps) and not last:
+                return True
+        except LeaseLostError as e:
+            # Another runner holds the charity now; it is not a failure of this run.
+            self.result["error"] = str(e)
+            self.result["lease_lost"] = True
+            self.log(f"⇄ {self.name[:40]} - lease lost, left to the runner that reclaimed it")
+        except BudgetExceededError as e:
+            self.options.logger.error(f"Budget exhausted while processing {self.ein}", exception=e)
+            self.result["error"] = str(e)
+            self.result["budget_exhausted"] = True
+            self.log(f"✗ {self.name[:40]} - aborted: budget exhausted mid-charity")
+            with progress_lock:
+                progress["failed"] += 1
+        except Exception as e:
+            self.options.logger.error(f"Pipeline failed for {self.ein}", exception=e)
+            self.log(f"✗ {self.name[:40]} - Error: {str(e)[:50]}")
+            self.result["error"] = str(e)
+            with progress_lock:
+                progress["failed"] += 1
+        self._finish()
+        return False
+
+    def _run_step(self, step: Callable[["CharityRun"], bool]) -> bool:
+        if self.lease is not None and self.lease.lost:
+            raise LeaseLostError(f"Lease on {self.ein} lost (run {self.lease.run_id})")
+        return step(self)
+
+    def _start(self) -> bool:
+        # H9: don't start new charities once the cap is hit — quiet skip, no failure parade
+        try:
+            check_budget()
+        except BudgetExceededError as e:
+            self.result["error"] = str(e)
+            self.result["budget_exhausted"] = True
+            self.log(f"⊘ {self.name[:40]} - skipped: budget exhausted")
+            return False
+        self._started = True
+        self._charity_span = trace_span("charity", self.name, trace=self.ein)
+        return True
+
+    def _finish(self) -> None:
+        self._phase_spans.end()
+        reads = {"working_set": self.working_set.get_stats()} if self.working_set is not None else {}
+        self._charity_span.end(
+            status="ok" if self.result["success"] else "error", cost=self.result["total_cost"], **reads
+        )
+        self.done = True
+
+
+def _record_cache_skip(run: CharityRun, phase: str, reason: str, **extra: Any) -> None:
+    run.result["phases"][phase] = {"success": True, "skipped": True, "reason": reason, **extra, "cost": 0.0}
+    run.result["cache_skips"].append(phase)
+
+
+def _open_working_set(run: CharityRun) -> bool:
+    """Every phase reads this charity's rows through one working set."""
+    resources = run.resources()
+    # Each table is loaded once and reloaded only after a phase writes it.
+    run.working_set = CharityWorkingSet(
+        run.ein,
+        resources["charity_repo"],
+        resources["raw_repo"],
+        resources["data_repo"],
+        resources["eval_repo"],
+    )
+    return True
+
+
+def _phase_crawl(run: CharityRun) -> bool:
+    """Phase 1: Fetch raw data from all sources."""
+    ein, name, result = run.ein, run.name, run.result
+    run.begin_phase("crawl")
+    run_crawl, crawl_reason = run.should_run("crawl")
+    if not run_crawl:
+        # Cache hit - skip crawl
+        _record_cache_skip(run, "crawl", crawl_reason)
+        return True
+
+    resources = run.resources()
+    orchestrator: DataCollectionOrchestrator = resources["orchestrator"]
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    phase_start = time.time()
+    success, report = orchestrator.fetch_charity_data(ein=ein, website_url=run.website, charity_name=name)
+    run.working_set.after_phase("crawl")
+
+    if not success:
+        result["phases"]["crawl"] = {"success": False, "error": "Fetch failed"}
+        run.log(f"✗ {name[:40]} - Crawl failed")
+        return False
+
+    sources_ok = len(report.get("sources_succeeded", []))
+    # Extract LLM cost from website collector (nested in raw_data.website.crawl_stats.llm_cost)
+    website_data = report.get("raw_data", {}).get("website", {})
+    crawl_stats = website_data.get("crawl_stats", {})
+    crawl_cost = crawl_stats.get("llm_cost", 0.0) or 0.0
+    crawl_timing = crawl_stats.get("timing", {})
+    result["costs"]["crawl"] = crawl_cost
+    result["phases"]["crawl"] = {
+        "success": True,
+        "sources": sources_ok,
+        "time": round(time.time() - phase_start, 1),
+        "cost": crawl_cost,
+        "timing": crawl_timing,
+    }
+    run.phases_ran.add("crawl")
+    # Update cache
+    update_phase_cache(ein, "crawl", cache_repo, crawl_cost)
+
+    # Inline quality check for crawl
+    raw_data_for_check = run.working_set.raw_repo.get_for_charity(ein)
+    source_data = {rd["source"]: (rd.get("parsed_json") or {}) for rd in raw_data_for_check if rd.get("success")}
+    crawl_passed, crawl_issues = run_inline_quality_check("crawl", ein, {"ein": ein}, {"source_data": source_data})
+    if crawl_issues:
+        result["phases"]["crawl"]["quality_issues"] = crawl_issues
+    if not crawl_passed:
+        result["phases"]["crawl"]["success"] = False
+        result["phases"]["crawl"]["error"] = "Quality check failed"
+        cache_repo.delete(ein, "crawl")
+        run.log(f"✗ {name[:40]} - Crawl quality check failed")
+        return False
+    return True
+
+
+def _phase_extract(run: CharityRun) -> bool:
+    """Phase 2a: Parse raw_html into parsed_json."""
+    ein, name, result = run.ein, run.name, run.result
+    run.begin_phase("extract")
+    run_extract, extract_reason = run.should_run("extract")
+    if not run_extract:
+        _record_cache_skip(run, "extract", extract_reason)
+        return True
+
+    resources = run.resources()
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    phase_start = time.time()
+    # Pass force=True to re-parse all rows (code changed or explicit --force-phase)
+    extract_ok, extract_fail = extract_raw_data(ein, resources["collectors"], run.options.logger, force=True)
+    run.working_set.after_phase("extract")
+    if extract_fail > 0:
+        result["phases"]["extract"] = {
+            "success": False,
+            "parsed": extract_ok,
+            "failed": extract_fail,
+            "time": round(time.time() - phase_start, 1),
+            "cost": 0.0,
+            "error": f"Extract failed for {extract_fail} source rows",
+        }
+        run.log(f"✗ {name[:40]} - Extract failed ({extract_fail} rows)")
+        return False
+    result["phases"]["extract"] = {
+        "success": True,
+        "parsed": extract_ok,
+        "failed": extract_fail,
+        "time": round(time.time() - phase_start, 1),
+        "cost": 0.0,
+    }
+    run.phases_ran.add("extract")
+    update_phase_cache(ein, "extract", cache_repo, 0.0)
+
+    # Inline quality check for extract
+    raw_data_for_check = run.working_set.raw_repo.get_for_charity(ein)
+    extract_output = {"ein": ein, "parsed_sources": {}}
+    for rd in raw_data_for_check:
+        if rd.get("parsed_json"):
+            extract_output["parsed_sources"][rd["source"]] = rd["parsed_json"]
+    extract_passed, extract_issues = run_inline_quality_check(
+        "extract", ein, extract_output, {"source_data": extract_output["parsed_sources"]}
+    )
+    if extract_issues:
+        result["phases"]["extract"]["quality_issues"] = extract_issues
+    if not extract_passed:
+        result["phases"]["extract"]["success"] = False
+        result["phases"]["extract"]["error"] = "Quality check failed"
+        cache_repo.delete(ein, "extract")
+        run.log(f"✗ {name[:40]} - Extract quality check failed")
+        return False
+    return True
+
+
+def _phase_discover(run: CharityRun) -> bool:
+    """Phase 2b: Search-grounded discovery (zakat, evaluations, outcomes, theory of change, awards)."""
+    ein, name, result = run.ein, run.name, run.result
+    run.begin_phase("discover")
+    run_discover, discover_reason = run.should_run("discover")
+    if not run_discover:
+        _record_cache_skip(run, "discover", discover_reason)
+        return True
+
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    raw_repo = run.working_set.raw_repo
+    phase_start = time.time()
+    discover_result = run_discovery_phase(ein, name, run.website, raw_repo, run.options.logger)
+    run.working_set.after_phase("discover")
+    discover_cost = discover_result.get("cost_usd", 0.0)
+    result["costs"]["discover"] = discover_cost
+    if discover_result.get("skipped"):
+        skip_cost = discover_cost if discover_result.get("queries_run", 0) > 0 else 0.0
+        result["phases"]["discover"] = {
+            "success": True,
+            "skipped": True,
+            "reason": discover_result.get("skip_reason", "Unknown"),
+            "time": round(time.time() - phase_start, 1),
+            "cost": skip_cost,
+        }
+        # No-op discovery outcomes (e.g., no discoveries/no website) must not be cached.
+        cache_repo.delete(ein, "discover")
+        return True
+
+    # Check for discovery errors (JSON parse failures are hard errors)
+    discover_error = discover_result.get("error")
+    if discover_error:
+        result["phases"]["discover"] = {
+            "success": False,
+            "error": discover_error,
+            "queries_run": discover_result.get("queries_run", 0),
+            "queries_succeeded": discover_result.get("queries_succeeded", 0),
+            "time": round(time.time() - phase_start, 1),
+            "cost": discover_cost,
+        }
+        run.log(f"✗ {name[:40]} - Discover failed: {discover_error[:60]}")
+        return False
+
+    if not discover_result.get("success"):
+        result["phases"]["discover"] = {
+            "success": False,
+            "error": "Discovery did not produce a successful result",
+            "queries_run": discover_result.get("queries_run", 0),
+            "queries_succeeded": discover_result.get("queries_succeeded", 0),
+            "time": round(time.time() - phase_start, 1),
+            "cost": discover_cost,
+        }
+        run.log(f"✗ {name[:40]} - Discover failed")
+        return False
+
+    result["phases"]["discover"] = {
+        "success": True,
+        "queries_run": discover_result.get("queries_run", 0),
+        "queries_succeeded": discover_result.get("queries_succeeded", 0),
+        "time": round(time.time() - phase_start, 1),
+        "cost": discover_cost,
+    }
+    run.phases_ran.add("discover")
+    update_phase_cache(ein, "discover", cache_repo, discover_cost)
+
+    # Inline quality check for discover
+    # Do not pass stale synthesized charity_data from prior runs here.
+    # Discover validation should rely only on discover artifacts at this stage.
+    discover_raw = raw_repo.get_for_charity(ein)
+    discover_source_data = {
+        rd["source"]: rd.get("parsed_json", {}) for rd in discover_raw if rd.get("success") and rd.get("parsed_json")
+    }
+    discover_passed, discover_issues = run_inline_quality_check(
+        "discover", ein, {"ein": ein}, {"source_data": discover_source_data}
+    )
+    if discover_issues:
+        result["phases"]["discover"]["quality_issues"] = discover_issues
+    if not discover_passed:
+        result["phases"]["discover"]["success"] = False
+        result["phases"]["discover"]["error"] = "Quality check failed"
+        cache_repo.delete(ein, "discover")
+        run.log(f"✗ {name[:40]} - Discover quality check failed")
+        return False
+    return True
+
+
+def _phase_synthesize(run: CharityRun) -> bool:
+    """Phase 3: Compute derived fields into charity_data."""
+    ein, name, result = run.ein, run.name, run.result
+    run.begin_phase("synthesize")
+    run_synth, synth_reason = run.should_run("synthesize")
+    if not run_synth:
+        _record_cache_skip(run, "synthesize", synth_reason)
+        return True
+
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    ws = run.working_set
+    phase_start = time.time()
+    synth_result = synthesize_charity(ein, ws.raw_repo, ws.charity_repo)
+    synth_cost = synth_result.get("cost_usd", 0.0)
+    result["costs"]["synthesize"] = synth_cost
+
+    if not synth_result.get("success"):
+        result["phases"]["synthesize"] = {
+            "success": False,
+            "error": synth_result.get("error", "Unknown"),
+            "cost": synth_cost,
+        }
+        result["success"] = False
+        run.log(f"✗ {name[:40]} - Synthesize failed")
+        return False
+
+    # Save synthesized data to database
+    ws.data_repo.upsert(synth_result["synthesized"])
+    result["phases"]["synthesize"] = {
+        "success": True,
+        "time": round(time.time() - phase_start, 1),
+        "cost": synth_cost,
+    }
+    run.phases_ran.add("synthesize")
+    update_phase_cache(ein, "synthesize", cache_repo, synth_cost)
+
+    # Inline quality check for synthesize
+    synth_data = ws.data_repo.get(ein) or {}
+    raw_data_for_check = ws.raw_repo.get_for_charity(ein)
+    source_data = {rd["source"]: (rd.get("parsed_json") or {}) for rd in raw_data_for_check if rd.get("success")}
+    synth_passed, synth_issues = run_inline_quality_check(
+        "synthesize", ein, {"ein": ein, "charity_data": synth_data}, {"source_data": source_data}
+    )
+    if synth_issues:
+        result["phases"]["synthesize"]["quality_issues"] = synth_issues
+    if not synth_passed:
+        result["phases"]["synthesize"]["success"] = False
+        result["phases"]["synthesize"]["error"] = "Quality check failed"
+        cache_repo.delete(ein, "synthesize")
+        run.log(f"✗ {name[:40]} - Synthesize quality check failed")
+        return False
+    return True
+
+
+def _phase_reconcile(run: CharityRun) -> bool:
+    """Phase 3.5: Adversarial contradiction checks. Non-blocking: failure here does not stop baseline."""
+    ein, name = run.ein, run.name
+    data_repo = run.working_set.data_repo
+    run.end_phase()
+    reconcile_span = trace_span("phase", "reconcile")
+    try:
+        from src.parsers.charity_metrics_aggregator import CharityMetrics as _CM
+        from src.reconciliation.reconciler import reconcile as _reconcile
+
+        recon_data = data_repo.get(ein) or {}
+        recon_metrics_json = recon_data.get("metrics_json")
+        if isinstance(recon_metrics_json, dict):
+            recon_metrics = _CM(**recon_metrics_json)
+            recon_result = _reconcile(recon_metrics)
+
+            # Write patched metrics + signals back
+            patched_json = recon_metrics.model_dump()
+            patched_json["contradiction_signals"] = [s.model_dump() for s in recon_result.signals]
+            patched_json["reconciliation_completeness_gaps"] = recon_result.completeness_gaps
+
+            data_repo.upsert({
+                "charity_ein": ein,
+                "metrics_json": patched_json,
+            })
+
+            signal_count = len(recon_result.signals)
+            patch_count = len(recon_result.patched_fields)
+            if signal_count or patch_count:
+                run.log(f"⚡ {name[:40]} - Reconcile: {signal_count} signals, {patch_count} patched")
+    except Exception as e:
+        # Non-blocking — log and continue to baseline
+        run.log(f"⚠ {name[:40]} - Reconcile failed: {e}")
+    reconcile_span.end()
+    return True
+
+
+def _phase_baseline(run: CharityRun) -> bool:
+    """Phase 4: AMAL score and baseline narrative."""
+    ein, name, result = run.ein, run.name, run.result
+    ws = run.working_set
+    run.begin_phase("baseline")
+    run_baseline, baseline_reason = run.should_run("baseline")
+    if not run_baseline:
+        # Cache hit - get existing evaluation for result
+        existing_eval = ws.eval_repo.get(ein)
+        amal_score = existing_eval.get("amal_score") if existing_eval else None
+        _record_cache_skip(run, "baseline", baseline_reason, amal_score=amal_score)
+        result["success"] = True
+        result["amal_score"] = amal_score
+        return True
+
+    resources = run.resources()
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    llm_client: LLMClient = resources["llm_client"]
+    scorer: AmalScorerV2 = resources["scorer"]
+    phase_start = time.time()
+    eval_result = evaluate_charity(ein, ws.charity_repo, ws.raw_repo, ws.data_repo, llm_client, scorer)
+    baseline_cost = eval_result.get("cost_usd", 0.0)
+    result["costs"]["baseline"] = baseline_cost
+
+    if not eval_result.get("success"):
+        # Rich and judge only run after a successful baseline; export reports the failure.
+        result["phases"]["baseline"] = {
+            "success": False,
+            "error": eval_result.get("error", "Unknown"),
+            "cost": baseline_cost,
+        }
+        return True
+
+    scores = eval_result.get("scores")
+    amal_score = scores.amal_score if scores else None
+    strategic_scores = eval_result.get("strategic_scores")
+    zakat_scores = eval_result.get("zakat_scores")
+    # Save evaluation to database
+    ws.eval_repo.upsert(eval_result["evaluation"])
+    result["phases"]["baseline"] = {
+        "success": True,
+        "amal_score": amal_score,
+        "strategic_score": strategic_scores.strategic_score if strategic_scores else None,
+        "zakat_score": zakat_scores.zakat_score if zakat_scores else None,
+        "time": round(time.time() - phase_start, 1),
+        "cost": baseline_cost,
+    }
+    result["success"] = True
+    result["amal_score"] = amal_score
+    result["strategic_score"] = strategic_scores.strategic_score if strategic_scores else None
+    result["zakat_score"] = zakat_scores.zakat_score if zakat_scores else None
+    run.phases_ran.add("baseline")
+    update_phase_cache(ein, "baseline", cache_repo, baseline_cost)
+
+    # Inline quality check for baseline
+    evaluation = ws.eval_repo.get(ein) or {}
+    charity_data = ws.data_repo.get(ein) or {}
+    baseline_passed, baseline_issues = run_inline_quality_check(
+        "baseline", ein, {"ein": ein, "evaluation": evaluation}, {"charity_data": charity_data}
+    )
+    if baseline_issues:
+        result["phases"]["baseline"]["quality_issues"] = baseline_issues
+    if not baseline_passed:
+        result["phases"]["baseline"]["success"] = False
+        result["phases"]["baseline"]["error"] = "Quality check failed"
+        result["success"] = False
+        cache_repo.delete(ein, "baseline")
+        run.log(f"✗ {name[:40]} - Baseline quality check failed")
+        return False
+    return True
+
+
+def _phase_rich(run: CharityRun) -> bool:
+    """Phase 5: Rich investment memo narrative (only after a successful baseline)."""
+    ein, name, result = run.ein, run.name, run.result
+    ws = run.working_set
+    run.begin_phase("rich")
+    run_rich, rich_reason = run.should_run("rich")
+    if not run_rich:
+        _record_cache_skip(run, "rich", rich_reason)
+        return True
+    if not result.get("success"):
+        return True
+
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    phase_start = time.time()
+    rich_force = run.options.force_all or ("rich" in (run.options.force_phases or []))
+    rich_result = generate_rich_for_pipeline(
+        ein, ws.eval_repo, force=rich_force, data_repo=ws.data_repo, raw_repo=ws.raw_repo, charity_repo=ws.charity_repo
+    )
+    ws.after_phase("rich")
+    rich_cost = rich_result.get("cost_usd", 0.0)
+    result["costs"]["rich"] = rich_cost
+
+    if not rich_result.get("success"):
+        result["phases"]["rich"] = {
+            "success": False,
+            "error": rich_result.get("error", "Unknown"),
+            "cost": rich_cost,
+        }
+        result["success"] = False
+        cache_repo.delete(ein, "rich")
+        run.log(f"✗ {name[:40]} - Rich failed: {rich_result.get('error', 'Unknown')[:50]}")
+        return False
+
+    if rich_result.get("skipped"):
+        result["phases"]["rich"] = {
+            "success": True,
+            "skipped": True,
+            "reason": rich_result.get("reason", "Already has rich narrative"),
+            "cost": 0.0,
+        }
+        return True
+
+    result["phases"]["rich"] = {
+        "success": True,
+        "citations_count": rich_result.get("citations_count", 0),
+        "time": round(time.time() - phase_start, 1),
+        "cost": rich_cost,
+    }
+    run.phases_ran.add("rich")
+    update_phase_cache(ein, "rich", cache_repo, rich_cost)
+
+    # Inline quality check for rich
+    rich_eval = ws.eval_repo.get(ein) or {}
+    rich_passed, rich_issues = run_inline_quality_check("rich", ein, {"ein": ein, "evaluation": rich_eval}, {})
+    if rich_issues:
+        result["phases"]["rich"]["quality_issues"] = rich_issues
+    if not rich_passed:
+        result["phases"]["rich"]["success"] = False
+        result["phases"]["rich"]["error"] = "Quality check failed"
+        cache_repo.delete(ein, "rich")
+        run.log(f"✗ {name[:40]} - Rich quality check failed")
+        return False
+    return True
+
+
+def _phase_judge(run: CharityRun) -> bool:
+    """Phase 6: Validate evaluation quality (only after a successful baseline)."""
+    ein, name, result = run.ein, run.name, run.result
+    ws = run.working_set
+    run.begin_phase("judge")
+    run_judge, judge_reason = run.should_run("judge")
+    if not run_judge:
+        existing_eval = ws.eval_repo.get(ein)
+        judge_score = existing_eval.get("judge_score") if existing_eval else None
+        _record_cache_skip(run, "judge", judge_reason, judge_score=judge_score)
+        return True
+    if not result.get("success"):
+        return True
+
+    cache_repo: PhaseCacheRepository = run.cache_repo()
+    phase_start = time.time()
+    # J-001: Removed unused llm_client parameter
+    judge_result = judge_charity(ein, ws.eval_repo, ws.data_repo, ws.raw_repo, ws.charity_repo)
+    judge_cost = judge_result.get("cost_usd", 0.0)
+    result["costs"]["judge"] = judge_cost
+
+    if not judge_result.get("success"):
+        result["phases"]["judge"] = {
+            "success": False,
+            "error": judge_result.get("error", "Unknown"),
+            "cost": judge_cost,
+        }
+        result["success"] = False
+        run.log(f"✗ {name[:40]} - Judge failed: {judge_result.get('error', 'Unknown')[:50]}")
+        return False
+
+    # Store judge results in database (score + deduped counts; the
+    # gate reads error_count, not the score).
+    ws.eval_repo.update_judge_result(
+        ein,
+        judge_result["judge_score"],
+        judge_result.get("issues", []),
+        content_hash=judge_result.get("content_hash"),
+        error_count=judge_result.get("error_count"),
+        warning_count=judge_result.get("warning_count"),
+    )
+    result["phases"]["judge"] = {
+        "success": True,
+        "judge_score": judge_result["judge_score"],
+        "issues_count": len(judge_result.get("issues", [])),
+        "time": round(time.time() - phase_start, 1),
+        "cost": judge_cost,
+    }
+    result["judge_score"] = judge_result["judge_score"]
+    run.phases_ran.add("judge")
+    update_phase_cache(ein, "judge", cache_repo, judge_cost)
+    return True
+
+
+def _phase_export(run: CharityRun) -> bool:
+    """Phase 7: Export to website JSON if the publication gate passes.
+
+    Gate (Option A): deduped judge_error_count == 0 AND fresh content hash.
+    Warnings never gate.
+    """
+    ein, result, options = run.ein, run.result, run.options
+    ws = run.working_set
+    run.begin_phase("export")
+    if options.skip_export:
+        result["phases"]["export"] = {
+            "success": True,
+            "skipped": True,
+            "reason": "Export disabled (--skip-export)",
+        }
+        return True
+    if not result.get("success"):
+        result["phases"]["export"] = {
+            "success": False,
+            "skipped": True,
+            "reason": "Baseline failed - nothing to export",
+        }
+        return True
+
+    # Refetch the row: the gate reads error_count + content hash, not the score.
+    evaluation = ws.eval_repo.get(ein)
+    judge_score = result.get("judge_score")
+    if judge_score is None:
+        judge_score = evaluation.get("judge_score") if evaluation else None
+    error_count = evaluation.get("judge_error_count") if evaluation else None
+
+    gate_blocked = False
+    reason = ""
+    if options.judge_gate_enabled:
+        if error_count is None:
+            gate_blocked, stale = True, False
+        elif error_count > 0:
+            gate_blocked, stale = True, False
+        else:
+            stored_hash = evaluation.get("judge_content_hash") if evaluation else None
+            stale = stored_hash is None or stored_hash != compute_judge_content_hash(evaluation)
+            gate_blocked = stale
+        if gate_blocked:
+            reason = exclusion_reason(error_count, stale=stale)
+
+    if gate_blocked:
+        # Audit write must never fail the charity: phases 1-6 already succeeded.
+        try:
+            ExportExclusionRepository().record(ein, judge_score, reason)
+        except Exception as e:
+            print(f"⚠ export_exclusions audit write failed for {ein}: {e}")
+        result["phases"]["export"] = {
+            "success": True,
+            "skipped": True,
+            "reason": reason,
+        }
+        return True
+
+    # Export the charity
+    phase_start = time.time()
+    export_dir = options.output_dir or WEBSITE_DATA_DIR
+    flags = options.pilot_flags.get(ein) if options.pilot_flags else None
+    export_result = export_charity(
+        ein,
+        ws.charity_repo,
+        ws.raw_repo,
+        ws.data_repo,
+        ws.eval_repo,
+        export_dir,
+        ui_signals_config=options.ui_signals_config or {},
+        config_hash=options.config_hash,
+        hide_from_curated=flags.hide_from_curated if flags else False,
+        pilot_name=flags.name if flags else None,
+    )
+    quality_issues = export_result.get("quality_issues", [])
+    if export_result.get("success"):
+        result["phases"]["export"] = {
+            "success": True,
+            "tier": export_result.get("tier"),
+            "time": round(time.time() - phase_start, 1),
+        }
+        if quality_issues:
+            result["phases"]["export"]["quality_issues"] = quality_issues
+        result["exported"] = True
+    else:
+        result["phases"]["export"] = {
+            "success": False,
+            "error": export_result.get("error", "Unknown"),
+        }
+        if quality_issues:
+            result["phases"]["export"]["quality_issues"] = quality_issues
+        result["success"] = False
+    return True
+
+
+def _record_totals(run: CharityRun) -> bool:
+    """Persist the charity's total cost, count it in the progress totals and print its line."""
+    result = run.result
+    run.end_phase()
+
+    # Calculate total cost
+    result["total_cost"] = sum(result["costs"].values())
+
+    # Persist cost to database
+    if result["total_cost"] > 0:
+        run.working_set.eval_repo.update_llm_cost(run.ein, result["total_cost"])
+
+    # Print progress
+    with progress_lock:
+        if result["success"]:
+            progress["completed"] += 1
+        else:
+            progress["failed"] += 1
+
+    amal = result.get("amal_score", "N/A")
+    strat = result.get("strategic_score")
+    zkt = result.get("zakat_score")
+    lens_str = f" S:{strat} Z:{zkt}" if strat is not None else ""
+    score_str = f"A:{amal}{lens_str}" if result["success"] else "FAILED"
+    cost_str = f"${result['total_cost']:.4f}"
+    # Show cache skips if any
+    cache_skips = result.get("cache_skips", [])
+    cache_str = f" [cache:{','.join(cache_skips)}]" if cache_skips else ""
+    status = "✓" if result["success"] else "✗"
+    run.log(f"{status} {run.name[:40]} - {score_str} ({cost_str}){cache_str}")
+    return True
+
+
+# Every step of one charity, in order (process_charity_full)
+PHASE_STEPS: tuple[Callable[[CharityRun], bool], ...] = (
+    _open_working_set,
+    _phase_crawl,
+    _phase_extract,
+    _phase_discover,
+    _phase_synthesize,
+    _phase_reconcile,
+    _phase_baseline,
+    _phase_rich,
+    _phase_judge,
+    _phase_export,
+    _record_totals,
+)
+
+# --staged: the same steps grouped into stages, each run by the pool of its
+# phase class. Each "llm" stage runs on the pool of the model it calls
+# ("llm:<model>", see _llm_stage_models), so stages sharing a model share its cap.
+PIPELINE_STAGES: tuple[tuple[str, str, tuple[Callable[[CharityRun], bool], ...]], ...] = (
+    ("crawl", "network", (_open_working_set, _phase_crawl)),
+    ("extract", "cpu", (_phase_extract,)),
+    ("discover", "llm", (_phase_discover,)),
+    ("synthesize", "cpu", (_phase_synthesize, _phase_reconcile)),
+    ("baseline", "llm", (_phase_baseline,)),
+    ("rich", "llm", (_phase_rich,)),
+    ("judge", "llm", (_phase_judge,)),
+    ("export", "export", (_phase_export, _record_totals)),
+)
+
+
+def _process_charity(run: CharityRun) -> dict:
+    run.step(PHASE_STEPS, last=True)
+    return run.result
+
+
 def process_charity_full(
     charity: dict,
     index: int,
@@ -813,6 +1842,7 @@ def process_charity_full(
     pilot_flags: dict | None = None,
     force_all: bool = False,
     force_phases: list[str] | None = None,
+    run_plan: RunPlan | None = None,
 ) -> dict:
     """Process a single charity through all 7 phases end-to-end.
 
@@ -827,734 +1857,191 @@ def process_charity_full(
 
     Note: Discover phase runs in parallel with Extract (both are Phase 2).
     """
-    ein = charity["ein"]
-    name = charity["name"]
-    website = charity["website"]
-
-    result = {
-        "ein": ein,
-        "name": name,
-        "phases": {},
-        "costs": {
-            "crawl": 0.0,
-            "extract": 0.0,
-            "discover": 0.0,
-            "synthesize": 0.0,
-            "baseline": 0.0,
-            "rich": 0.0,
-            "judge": 0.0,
-        },
-        "total_cost": 0.0,
-        "success": False,
-        "cache_skips": [],  # Phases skipped due to smart cache
-    }
-
-    # Track which phases actually ran (for cascade invalidation)
-    phases_ran: set[str] = set()
-
-    # H9: don't start new charities once the cap is hit — quiet skip, no failure parade
-    try:
-        check_budget()
-    except BudgetExceededError as e:
-        result["error"] = str(e)
-        result["budget_exhausted"] = True
-        with print_lock:
-            print(f"[{index}/{total}] ⊘ {name[:40]} - skipped: budget exhausted")
-        return result
+    options = RunOptions(
+        llm_model=llm_model,
+        logger=logger,
+        verbose=verbose,
+        skip_export=skip_export,
+        judge_gate_enabled=judge_gate_enabled,
+        output_dir=output_dir,
+        ui_signals_config=ui_signals_config,
+        config_hash=config_hash,
+        pilot_flags=pilot_flags,
+        force_all=force_all,
+        force_phases=force_phases,
+        run_plan=run_plan,
+    )
+    return _process_charity(CharityRun(charity, index, total, options))
 
-    try:
-        worker_resources = _get_worker_resources(logger, llm_model)
-        orchestrator: DataCollectionOrchestrator = worker_resources["orchestrator"]
-        collectors: dict[str, Any] = worker_resources["collectors"]
-        charity_repo: CharityRepository = worker_resources["charity_repo"]
-        raw_repo: RawDataRepository = worker_resources["raw_repo"]
-        data_repo: CharityDataRepository = worker_resources["data_repo"]
-        eval_repo: EvaluationRepository = worker_resources["eval_repo"]
-        cache_repo: PhaseCacheRepository = worker_resources["cache_repo"]
-        llm_client: LLMClient = worker_resources["llm_client"]
-        scorer: AmalScorerV2 = worker_resources["scorer"]
-
-        # ========== PHASE 1: CRAWL ==========
-        run_crawl, crawl_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "crawl",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
-        )
 
-        if not run_crawl:
-            # Cache hit - skip crawl
-            result["phases"]["crawl"] = {
-                "success": True,
-                "skipped": True,
-                "reason": crawl_reason,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("crawl")
-        else:
-            phase_start = time.time()
-            success, report = orchestrator.fetch_charity_data(ein=ein, website_url=website, charity_name=name)
-
-            if not success:
-                result["phases"]["crawl"] = {"success": False, "error": "Fetch failed"}
-                with print_lock:
-                    print(f"[{index}/{total}] ✗ {name[:40]} - Crawl failed")
-                return result
-
-            sources_ok = len(report.get("sources_succeeded", []))
-            # Extract LLM cost from website collector (nested in raw_data.website.crawl_stats.llm_cost)
-            website_data = report.get("raw_data", {}).get("website", {})
-            crawl_stats = website_data.get("crawl_stats", {})
-            crawl_cost = crawl_stats.get("llm_cost", 0.0) or 0.0
-            crawl_timing = crawl_stats.get("timing", {})
-            result["costs"]["crawl"] = crawl_cost
-            result["phases"]["crawl"] = {
-                "success": True,
-                "sources": sources_ok,
-                "time": round(time.time() - phase_start, 1),
-                "cost": crawl_cost,
-                "timing": crawl_timing,
-            }
-            phases_ran.add("crawl")
-            # Update cache
-            update_phase_cache(ein, "crawl", cache_repo, crawl_cost)
-
-            # Inline quality check for crawl
-            raw_data_for_check = raw_repo.get_for_charity(ein)
-            source_data = {rd["source"]: (rd.get("parsed_json") or {}) for rd in raw_data_for_check if rd.get("success")}
-            crawl_passed, crawl_issues = run_inline_quality_check(
-                "crawl", ein, {"ein": ein}, {"source_data": source_data}
+def build_stage_pipeline(
+    llm_model: str,
+    crawl_workers: int = STAGED_CRAWL_WORKERS,
+    cpu_workers: int = STAGED_CPU_WORKERS,
+    llm_workers: int = STAGED_LLM_WORKERS,
+    export_workers: int = STAGED_EXPORT_WORKERS,
+    queue_size: int = STAGED_QUEUE_SIZE,
+) -> StagePipeline:
+    """The --staged scheduler: PIPELINE_STAGES on per-class pools with bounded queues between them.
+
+    LLM stages get one pool per model they call, each llm_workers wide.
+    """
+    stage_models = _llm_stage_models(llm_model)
+    pool_sizes = {"network": crawl_workers, "cpu": cpu_workers, "export": export_workers}
+    stages = []
+    for position, (stage_name, pool, steps) in enumerate(PIPELINE_STAGES):
+        if pool == "llm":
+            pool = f"llm:{stage_models[stage_name]}"
+            pool_sizes[pool] = llm_workers
+        stages.append(
+            Stage(
+                stage_name,
+                functools.partial(CharityRun.step, steps=steps, last=position == len(PIPELINE_STAGES) - 1),
+                pool=pool,
             )
-            if crawl_issues:
-                result["phases"]["crawl"]["quality_issues"] = crawl_issues
-            if not crawl_passed:
-                result["phases"]["crawl"]["success"] = False
-                result["phases"]["crawl"]["error"] = "Quality check failed"
-                cache_repo.delete(ein, "crawl")
-                with print_lock:
-                    print(f"[{index}/{total}] ✗ {name[:40]} - Crawl quality check failed")
-                return result
-
-        # ========== PHASE 2a: EXTRACT ==========
-        run_extract, extract_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "extract",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
         )
+    return StagePipeline(stages, pool_sizes, queue_size=queue_size)
 
-        if not run_extract:
-            result["phases"]["extract"] = {
-                "success": True,
-                "skipped": True,
-                "reason": extract_reason,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("extract")
-        else:
-            phase_start = time.time()
-            # Pass force=True to re-parse all rows (code changed or explicit --force-phase)
-            extract_ok, extract_fail = extract_raw_data(ein, collectors, logger, force=True)
-            if extract_fail > 0:
-                result["phases"]["extract"] = {
-                    "success": False,
-                    "parsed": extract_ok,
-                    "failed": extract_fail,
-                    "time": round(time.time() - phase_start, 1),
-                    "cost": 0.0,
-                    "error": f"Extract failed for {extract_fail} source rows",
-                }
-                with print_lock:
-                    print(f"[{index}/{total}] ✗ {name[:40]} - Extract failed ({extract_fail} rows)")
-                return result
-            result["phases"]["extract"] = {
-                "success": True,
-                "parsed": extract_ok,
-                "failed": extract_fail,
-                "time": round(time.time() - phase_start, 1),
-                "cost": 0.0,
-            }
-            phases_ran.add("extract")
-            update_phase_cache(ein, "extract", cache_repo, 0.0)
-
-            # Inline quality check for extract
-            raw_data_for_check = raw_repo.get_for_charity(ein)
-            extract_output = {"ein": ein, "parsed_sources": {}}
-            for rd in raw_data_for_check:
-                if rd.get("parsed_json"):
-                    extract_output["parsed_sources"][rd["source"]] = rd["parsed_json"]
-            extract_passed, extract_issues = run_inline_quality_check(
-                "extract", ein, extract_output, {"source_data": extract_output["parsed_sources"]}
-            )
-            if extract_issues:
-                result["phases"]["extract"]["quality_issues"] = extract_issues
-            if not extract_passed:
-                result["phases"]["extract"]["success"] = False
-                result["phases"]["extract"]["error"] = "Quality check failed"
-                cache_repo.delete(ein, "extract")
-                with print_lock:
-                    print(f"[{index}/{total}] ✗ {name[:40]} - Extract quality check failed")
-                return result
-
-        # ========== PHASE 2b: DISCOVER ==========
-        run_discover, discover_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "discover",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
-        )
 
-        if not run_discover:
-            result["phases"]["discover"] = {
-                "success": True,
-                "skipped": True,
-                "reason": discover_reason,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("discover")
-        else:
-            phase_start = time.time()
-            discover_result = run_discovery_phase(ein, name, website, raw_repo, logger)
-            discover_cost = discover_result.get("cost_usd", 0.0)
-            result["costs"]["discover"] = discover_cost
-            if discover_result.get("skipped"):
-                skip_cost = discover_cost if discover_result.get("queries_run", 0) > 0 else 0.0
-                result["phases"]["discover"] = {
-                    "success": True,
-                    "skipped": True,
-                    "reason": discover_result.get("skip_reason", "Unknown"),
-                    "time": round(time.time() - phase_start, 1),
-                    "cost": skip_cost,
-                }
-                # No-op discovery outcomes (e.g., no discoveries/no website) must not be cached.
-                cache_repo.delete(ein, "discover")
-            else:
-                # Check for discovery errors (JSON parse failures are hard errors)
-                discover_error = discover_result.get("error")
-                if discover_error:
-                    result["phases"]["discover"] = {
-                        "success": False,
-                        "error": discover_error,
-                        "queries_run": discover_result.get("queries_run", 0),
-                        "queries_succeeded": discover_result.get("queries_succeeded", 0),
-                        "time": round(time.time() - phase_start, 1),
-                        "cost": discover_cost,
-                    }
-                    with print_lock:
-                        print(f"[{index}/{total}] ✗ {name[:40]} - Discover failed: {discover_error[:60]}")
-                    return result
-
-                if not discover_result.get("success"):
-                    result["phases"]["discover"] = {
-                        "success": False,
-                        "error": "Discovery did not produce a successful result",
-                        "queries_run": discover_result.get("queries_run", 0),
-                        "queries_succeeded": discover_result.get("queries_succeeded", 0),
-                        "time": round(time.time() - phase_start, 1),
-                        "cost": discover_cost,
-                    }
-                    with print_lock:
-                        print(f"[{index}/{total}] ✗ {name[:40]} - Discover failed")
-                    return result
-
-                result["phases"]["discover"] = {
-                    "success": True,
-                    "queries_run": discover_result.get("queries_run", 0),
-                    "queries_succeeded": discover_result.get("queries_succeeded", 0),
-                    "time": round(time.time() - phase_start, 1),
-                    "cost": discover_cost,
-                }
-                phases_ran.add("discover")
-                update_phase_cache(ein, "discover", cache_repo, discover_cost)
-
-                # Inline quality check for discover
-                # Do not pass stale synthesized charity_data from prior runs here.
-                # Discover validation should rely only on discover artifacts at this stage.
-                discover_raw = raw_repo.get_for_charity(ein)
-                discover_source_data = {
-                    rd["source"]: rd.get("parsed_json", {})
-                    for rd in discover_raw
-                    if rd.get("success") and rd.get("parsed_json")
-                }
-                discover_passed, discover_issues = run_inline_quality_check(
-                    "discover", ein, {"ein": ein}, {"source_data": discover_source_data}
-                )
-                if discover_issues:
-                    result["phases"]["discover"]["quality_issues"] = discover_issues
-                if not discover_passed:
-                    result["phases"]["discover"]["success"] = False
-                    result["phases"]["discover"]["error"] = "Quality check failed"
-                    cache_repo.delete(ein, "discover")
-                    with print_lock:
-                        print(f"[{index}/{total}] ✗ {name[:40]} - Discover quality check failed")
-                    return result
-
-        # ========== PHASE 3: SYNTHESIZE ==========
-        run_synth, synth_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "synthesize",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
-        )
+def _llm_stage_models(llm_model: str) -> dict[str, str]:
+    """The model each LLM stage calls (its primary; fallbacks share the slot)."""
+    return {
+        "discover": DISCOVERY_MODEL,
+        "baseline": llm_model,
+        "rich": TASK_MODELS[LLMTask.PREMIUM_NARRATIVE][0],  # RichNarrativeGenerator
+        "judge": JudgeConfig().judge_model,  # LLM judges (judge_phase's config keeps the default)
+    }
 
-        if not run_synth:
-            result["phases"]["synthesize"] = {
-                "success": True,
-                "skipped": True,
-                "reason": synth_reason,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("synthesize")
-        else:
-            phase_start = time.time()
-            synth_result = synthesize_charity(ein, raw_repo, charity_repo)
-            synth_cost = synth_result.get("cost_usd", 0.0)
-            result["costs"]["synthesize"] = synth_cost
 
-            if not synth_result.get("success"):
-                result["phases"]["synthesize"] = {
+def run_threaded(charities: list[dict], options: RunOptions, workers: int) -> Iterator[dict]:
+    """Default mode: each worker takes a charity through every phase. Yields results as charities finish."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_process_charity, CharityRun(charity, i, len(charities), options)): charity
+            for i, charity in enumerate(charities, 1)
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                charity = futures[future]
+                options.logger.error(f"Worker exception for {charity['ein']}", exception=e)
+                yield {
+                    "ein": charity["ein"],
+                    "name": charity["name"],
                     "success": False,
-                    "error": synth_result.get("error", "Unknown"),
-                    "cost": synth_cost,
-                }
-                result["success"] = False
-                with print_lock:
-                    print(f"[{index}/{total}] ✗ {name[:40]} - Synthesize failed")
-                return result
-            else:
-                # Save synthesized data to database
-                data_repo.upsert(synth_result["synthesized"])
-                result["phases"]["synthesize"] = {
-                    "success": True,
-                    "time": round(time.time() - phase_start, 1),
-                    "cost": synth_cost,
+                    "error": str(e),
                 }
-                phases_ran.add("synthesize")
-                update_phase_cache(ein, "synthesize", cache_repo, synth_cost)
-
-                # Inline quality check for synthesize
-                synth_data = data_repo.get(ein) or {}
-                raw_data_for_check = raw_repo.get_for_charity(ein)
-                source_data = {
-                    rd["source"]: (rd.get("parsed_json") or {}) for rd in raw_data_for_check if rd.get("success")
-                }
-                synth_passed, synth_issues = run_inline_quality_check(
-                    "synthesize", ein, {"ein": ein, "charity_data": synth_data}, {"source_data": source_data}
-                )
-                if synth_issues:
-                    result["phases"]["synthesize"]["quality_issues"] = synth_issues
-                if not synth_passed:
-                    result["phases"]["synthesize"]["success"] = False
-                    result["phases"]["synthesize"]["error"] = "Quality check failed"
-                    cache_repo.delete(ein, "synthesize")
-                    with print_lock:
-                        print(f"[{index}/{total}] ✗ {name[:40]} - Synthesize quality check failed")
-                    return result
 
-        # ========== PHASE 3.5: RECONCILE (adversarial contradiction checks) ==========
-        # Non-blocking: failure here does not stop baseline.
-        try:
-            from src.parsers.charity_metrics_aggregator import CharityMetrics as _CM
-            from src.reconciliation.reconciler import reconcile as _reconcile
-
-            recon_data = data_repo.get(ein) or {}
-            recon_metrics_json = recon_data.get("metrics_json")
-            if isinstance(recon_metrics_json, dict):
-                recon_metrics = _CM(**recon_metrics_json)
-                recon_result = _reconcile(recon_metrics)
-
-                # Write patched metrics + signals back
-                patched_json = recon_metrics.model_dump()
-                patched_json["contradiction_signals"] = [s.model_dump() for s in recon_result.signals]
-                patched_json["reconciliation_completeness_gaps"] = recon_result.completeness_gaps
-
-                data_repo.upsert({
-                    "charity_ein": ein,
-                    "metrics_json": patched_json,
-                })
-
-                signal_count = len(recon_result.signals)
-                patch_count = len(recon_result.patched_fields)
-                if signal_count or patch_count:
-                    with print_lock:
-                        print(
-                            f"[{index}/{total}] ⚡ {name[:40]} - "
-                            f"Reconcile: {signal_count} signals, {patch_count} patched"
-                        )
-        except Exception as e:
-            # Non-blocking — log and continue to baseline
-            with print_lock:
-                print(f"[{index}/{total}] ⚠ {name[:40]} - Reconcile failed: {e}")
-
-        # ========== PHASE 4: BASELINE ==========
-        run_baseline, baseline_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "baseline",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
-        )
 
-        if not run_baseline:
-            # Cache hit - get existing evaluation for result
-            existing_eval = eval_repo.get(ein)
-            amal_score = existing_eval.get("amal_score") if existing_eval else None
-            result["phases"]["baseline"] = {
-                "success": True,
-                "skipped": True,
-                "reason": baseline_reason,
-                "amal_score": amal_score,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("baseline")
-            result["success"] = True
-            result["amal_score"] = amal_score
-        else:
-            phase_start = time.time()
-            eval_result = evaluate_charity(ein, charity_repo, raw_repo, data_repo, llm_client, scorer)
-            baseline_cost = eval_result.get("cost_usd", 0.0)
-            result["costs"]["baseline"] = baseline_cost
-
-            if eval_result.get("success"):
-                scores = eval_result.get("scores")
-                amal_score = scores.amal_score if scores else None
-                strategic_scores = eval_result.get("strategic_scores")
-                zakat_scores = eval_result.get("zakat_scores")
-                # Save evaluation to database
-                eval_repo.upsert(eval_result["evaluation"])
-                result["phases"]["baseline"] = {
-                    "success": True,
-                    "amal_score": amal_score,
-                    "strategic_score": strategic_scores.strategic_score if strategic_scores else None,
-                    "zakat_score": zakat_scores.zakat_score if zakat_scores else None,
-                    "time": round(time.time() - phase_start, 1),
-                    "cost": baseline_cost,
-                }
-                result["success"] = True
-                result["amal_score"] = amal_score
-                result["strategic_score"] = strategic_scores.strategic_score if strategic_scores else None
-                result["zakat_score"] = zakat_scores.zakat_score if zakat_scores else None
-                phases_ran.add("baseline")
-                update_phase_cache(ein, "baseline", cache_repo, baseline_cost)
-
-                # Inline quality check for baseline
-                evaluation = eval_repo.get(ein) or {}
-                charity_data = data_repo.get(ein) or {}
-                baseline_passed, baseline_issues = run_inline_quality_check(
-                    "baseline", ein, {"ein": ein, "evaluation": evaluation}, {"charity_data": charity_data}
-                )
-                if baseline_issues:
-                    result["phases"]["baseline"]["quality_issues"] = baseline_issues
-                if not baseline_passed:
-                    result["phases"]["baseline"]["success"] = False
-                    result["phases"]["baseline"]["error"] = "Quality check failed"
-                    result["success"] = False
-                    cache_repo.delete(ein, "baseline")
-                    with print_lock:
-                        print(f"[{index}/{total}] ✗ {name[:40]} - Baseline quality check failed")
-                    return result
-            else:
-                result["phases"]["baseline"] = {
-                    "success": False,
-                    "error": eval_result.get("error", "Unknown"),
-                    "cost": baseline_cost,
-                }
+def run_staged(charities: list[dict], options: RunOptions, pipeline: StagePipeline) -> Iterator[dict]:
+    """--staged mode: charities flow through the stage pools. Yields results as charities finish."""
+    runs = [CharityRun(charity, i, len(charities), options) for i, charity in enumerate(charities, 1)]
 
-        # ========== PHASE 5: RICH NARRATIVE ==========
-        run_rich, rich_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "rich",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
-        )
+    def stage_failed(stage_name: str, run: CharityRun, e: Exception) -> None:
+        """A stage raised past CharityRun.step's own handlers: record it like any other failure."""
+        options.logger.error(f"Stage {stage_name} failed for {run.ein}", exception=e)
+        run.log(f"✗ {run.name[:40]} - {stage_name} stage error: {str(e)[:50]}")
+        run.result["success"] = False
+        run.result["error"] = str(e)
+        with progress_lock:
+            progress["failed"] += 1
 
-        if not run_rich:
-            result["phases"]["rich"] = {
-                "success": True,
-                "skipped": True,
-                "reason": rich_reason,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("rich")
-        elif result.get("success"):
-            # Only generate rich if baseline succeeded
-            phase_start = time.time()
-            rich_force = force_all or ("rich" in (force_phases or []))
-            rich_result = generate_rich_for_pipeline(ein, eval_repo, force=rich_force)
-            rich_cost = rich_result.get("cost_usd", 0.0)
-            result["costs"]["rich"] = rich_cost
-
-            if rich_result.get("success"):
-                if rich_result.get("skipped"):
-                    result["phases"]["rich"] = {
-                        "success": True,
-                        "skipped": True,
-                        "reason": rich_result.get("reason", "Already has rich narrative"),
-                        "cost": 0.0,
-                    }
-                else:
-                    result["phases"]["rich"] = {
-                        "success": True,
-                        "citations_count": rich_result.get("citations_count", 0),
-                        "time": round(time.time() - phase_start, 1),
-                        "cost": rich_cost,
-                    }
-                    phases_ran.add("rich")
-                    update_phase_cache(ein, "rich", cache_repo, rich_cost)
-            else:
-                result["phases"]["rich"] = {
-                    "success": False,
-                    "error": rich_result.get("error", "Unknown"),
-                    "cost": rich_cost,
-                }
-                result["success"] = False
-                cache_repo.delete(ein, "rich")
-                with print_lock:
-                    print(f"[{index}/{total}] ✗ {name[:40]} - Rich failed: {rich_result.get('error', 'Unknown')[:50]}")
-                return result
-
-            # Inline quality check for rich (runs after success or skip-with-existing)
-            if result["phases"].get("rich", {}).get("success") and not result["phases"]["rich"].get("skipped"):
-                rich_eval = eval_repo.get(ein) or {}
-                rich_passed, rich_issues = run_inline_quality_check(
-                    "rich", ein, {"ein": ein, "evaluation": rich_eval}, {}
-                )
-                if rich_issues:
-                    result["phases"]["rich"]["quality_issues"] = rich_issues
-                if not rich_passed:
-                    result["phases"]["rich"]["success"] = False
-                    result["phases"]["rich"]["error"] = "Quality check failed"
-                    cache_repo.delete(ein, "rich")
-                    with print_lock:
-                        print(f"[{index}/{total}] ✗ {name[:40]} - Rich quality check failed")
-                    return result
-
-        # ========== PHASE 6: JUDGE ==========
-        run_judge, judge_reason = should_run_phase_with_artifact_validation(
-            ein,
-            "judge",
-            cache_repo,
-            raw_repo,
-            data_repo,
-            eval_repo,
-            force_all,
-            force_phases,
-            phases_ran,
-        )
+    for run in pipeline.run(runs, on_error=stage_failed):
+        yield run.result
+
+
+def run_leased(
+    work_queue: WorkQueue,
+    run_id: str,
+    options: RunOptions,
+    workers: int,
+    worker_id: str,
+    lease_seconds: float = WORK_QUEUE_LEASE_SECONDS,
+    poll_seconds: float = WORK_QUEUE_POLL_SECONDS,
+) -> Iterator[dict]:
+    """--queue mode: workers claim charities from a queue shared with other runners. Yields results as charities finish.
+
+    Each worker claims one charity at a time and runs it end to end under a
+    heartbeated lease. When nothing is claimable but other runners still
+    hold leases, workers poll so a crashed runner's charities are reclaimed
+    once their leases expire; they stop when the run is drained. Once the
+    budget is exhausted, the charity is handed back and nothing new is claimed.
+    Database errors on queue calls are retried with backoff; a worker that
+    still cannot reach the queue stops claiming rather than ending the run.
+    """
+    finished: queue.Queue[dict] = queue.Queue()
+    stop = threading.Event()
 
-        if not run_judge:
-            existing_eval = eval_repo.get(ein)
-            result["phases"]["judge"] = {
-                "success": True,
-                "skipped": True,
-                "reason": judge_reason,
-                "judge_score": existing_eval.get("judge_score") if existing_eval else None,
-                "cost": 0.0,
-            }
-            result["cache_skips"].append("judge")
-        elif result.get("success"):
-            # Only judge if baseline succeeded
-            phase_start = time.time()
-            # J-001: Removed unused llm_client parameter
-            judge_result = judge_charity(ein, eval_repo, data_repo, raw_repo, charity_repo)
-            judge_cost = judge_result.get("cost_usd", 0.0)
-            result["costs"]["judge"] = judge_cost
-
-            if judge_result.get("success"):
-                # Store judge results in database (score + deduped counts; the
-                # gate reads error_count, not the score).
-                eval_repo.update_judge_result(
-                    ein,
-                    judge_result["judge_score"],
-                    judge_result.get("issues", []),
-                    content_hash=judge_result.get("content_hash"),
-                    error_count=judge_result.get("error_count"),
-                    warning_count=judge_result.get("warning_count"),
-                )
-                result["phases"]["judge"] = {
-                    "success": True,
-                    "judge_score": judge_result["judge_score"],
-                    "issues_count": len(judge_result.get("issues", [])),
-                    "time": round(time.time() - phase_start, 1),
-                    "cost": judge_cost,
-                }
-                result["judge_score"] = judge_result["judge_score"]
-                phases_ran.add("judge")
-                update_phase_cache(ein, "judge", cache_repo, judge_cost)
-            else:
-                result["phases"]["judge"] = {
-                    "success": False,
-                    "error": judge_result.get("error", "Unknown"),
-                    "cost": judge_cost,
-                }
-                result["success"] = False
-                with print_lock:
-                    print(
-                        f"[{index}/{total}] ✗ {name[:40]} - Judge failed: {judge_result.get('error', 'Unknown')[:50]}"
-                    )
-                return result
-
-        # ========== PHASE 7: EXPORT ==========
-        # Export to website JSON only if the publication gate passes (Option A):
-        # deduped judge_error_count == 0 AND fresh content hash. Warnings never gate.
-        if skip_export:
-            result["phases"]["export"] = {
-                "success": True,
-                "skipped": True,
-                "reason": "Export disabled (--skip-export)",
-            }
-        elif not result.get("success"):
-            result["phases"]["export"] = {
-                "success": False,
-                "skipped": True,
-                "reason": "Baseline failed - nothing to export",
-            }
-        else:
-            # Refetch the row: the gate reads error_count + content hash, not the score.
-            evaluation = eval_repo.get(ein)
-            judge_score = result.get("judge_score")
-            if judge_score is None:
-                judge_score = evaluation.get("judge_score") if evaluation else None
-            error_count = evaluation.get("judge_error_count") if evaluation else None
-
-            gate_blocked = False
-            reason = ""
-            if judge_gate_enabled:
-                if error_count is None:
-                    gate_blocked, stale = True, False
-                elif error_count > 0:
-                    gate_blocked, stale = True, False
-                else:
-                    stored_hash = evaluation.get("judge_content_hash") if evaluation else None
-                    stale = stored_hash is None or stored_hash != compute_judge_content_hash(evaluation)
-                    gate_blocked = stale
-                if gate_blocked:
-                    reason = exclusion_reason(error_count, stale=stale)
-
-            if gate_blocked:
-                # Audit write must never fail the charity: phases 1-6 already succeeded.
-                try:
-                    ExportExclusionRepository().record(ein, judge_score, reason)
-                except Exception as e:
-                    print(f"⚠ export_exclusions audit write failed for {ein}: {e}")
-                result["phases"]["export"] = {
-                    "success": True,
-                    "skipped": True,
-                    "reason": reason,
-                }
-            else:
-                # Export the charity
-                phase_start = time.time()
-                export_dir = output_dir or WEBSITE_DATA_DIR
-                flags = pilot_flags.get(ein) if pilot_flags else None
-                export_result = export_charity(
-                    ein,
-                    charity_repo,
-                    raw_repo,
-                    data_repo,
-                    eval_repo,
-                    export_dir,
-                    ui_signals_config=ui_signals_config or {},
-                    config_hash=config_hash,
-                    hide_from_curated=flags.hide_from_curated if flags else False,
-                    pilot_name=flags.name if flags else None,
-                )
-                if export_result.get("success"):
-                    result["phases"]["export"] = {
-                        "success": True,
-                        "tier": export_result.get("tier"),
-                        "time": round(time.time() - phase_start, 1),
-                    }
-                    quality_issues = export_result.get("quality_issues", [])
-                    if quality_issues:
-                        result["phases"]["export"]["quality_issues"] = quality_issues
-                    result["exported"] = True
-                else:
-                    result["phases"]["export"] = {
-                        "success": False,
-                        "error": export_result.get("error", "Unknown"),
-                    }
-                    quality_issues = export_result.get("quality_issues", [])
-                    if quality_issues:
-                        result["phases"]["export"]["quality_issues"] = quality_issues
-                    result["success"] = False
+    def call_queue(what: str, call: Callable[[], Any]) -> Any:
+        """Queue calls outlast database blips: retried with jittered backoff, the last error raised."""
 
-        # Calculate total cost
-        result["total_cost"] = sum(result["costs"].values())
+        def log_failure(attempt: int, error: Exception) -> None:
+            options.logger.warning(f"Work queue {what} failed (try {attempt + 1}/{WORK_QUEUE_CALL_RETRIES}): {error}")
 
-        # Persist cost to database
-        if result["total_cost"] > 0:
-            eval_repo.update_llm_cost(ein, result["total_cost"])
+        return retry_call(
+            call, WORK_QUEUE_CALL_RETRIES, WORK_QUEUE_RETRY_SECONDS, WORK_QUEUE_RETRY_MAX_SECONDS, log_failure
+        )
 
-        # Print progress
-        with progress_lock:
-            if result["success"]:
-                progress["completed"] += 1
-            else:
-                progress["failed"] += 1
+    total = call_queue("stats", lambda: work_queue.get_stats(run_id))["total"]
 
-        amal = result.get("amal_score", "N/A")
-        strat = result.get("strategic_score")
-        zkt = result.get("zakat_score")
-        lens_str = f" S:{strat} Z:{zkt}" if strat is not None else ""
-        score_str = f"A:{amal}{lens_str}" if result["success"] else "FAILED"
-        cost_str = f"${result['total_cost']:.4f}"
-        # Show cache skips if any
-        cache_skips = result.get("cache_skips", [])
-        cache_str = f" [cache:{','.join(cache_skips)}]" if cache_skips else ""
-        with print_lock:
-            status = "✓" if result["success"] else "✗"
-            print(f"[{index}/{total}] {status} {name[:40]} - {score_str} ({cost_str}){cache_str}")
+    def settle(lease: Lease, result: dict) -> None:
+        """Hand the charity back (budget exhausted) or mark it done; the lease is heartbeated until this returns."""
+        try:
+            if result.get("budget_exhausted"):
+                call_queue(f"release of {lease.ein}", lambda: work_queue.release(lease))
+                stop.set()
+            elif not result.get("lease_lost") and not call_queue(
+                f"completion of {lease.ein}",
+                lambda: work_queue.complete(lease, result.get("success", False), result.get("error")),
+            ):
+                result["lease_lost"] = True
+        except Exception as e:
+            # The lease expires and another claim processes the charity again.
+            options.logger.error(f"Could not record {lease.ein} in work queue {run_id}", exception=e)
+            result["queue_error"] = str(e)
 
-        return result
+    def drain(keeper: LeaseKeeper) -> None:
+        while not stop.is_set():
+            try:
+                lease = call_queue("claim", lambda: work_queue.claim(run_id, worker_id, lease_seconds))
+                if lease is None:
+                    stats = call_queue("stats", lambda: work_queue.get_stats(run_id))
+                    if not stats["pending"] and not stats["leased"]:
+                        return
+                    stop.wait(poll_seconds)
+                    continue
+            except Exception as e:
+                options.logger.error(f"Work queue {run_id} unreachable; worker stops claiming", exception=e)
+                return
 
-    except BudgetExceededError as e:
-        logger.error(f"Budget exhausted while processing {ein}", exception=e)
-        result["error"] = str(e)
-        result["budget_exhausted"] = True
-        with print_lock:
-            print(f"[{index}/{total}] ✗ {name[:40]} - aborted: budget exhausted mid-charity")
-        with progress_lock:
-            progress["failed"] += 1
-        return result
+            keeper.track(lease)
+            try:
+                result = _process_charity(CharityRun(lease.charity, lease.position + 1, total, options, lease=lease))
+            except Exception as e:
+                options.logger.error(f"Worker exception for {lease.ein}", exception=e)
+                result = {"ein": lease.ein, "name": lease.charity["name"], "success": False, "error": str(e)}
+            try:
+                settle(lease, result)
+            finally:
+                keeper.untrack(lease)
+            finished.put(result)
 
-    except Exception as e:
-        logger.error(f"Pipeline failed for {ein}", exception=e)
-        with print_lock:
-            print(f"[{index}/{total}] ✗ {name[:40]} - Error: {str(e)[:50]}")
-        result["error"] = str(e)
-        with progress_lock:
-            progress["failed"] += 1
-        return result
+    with LeaseKeeper(work_queue, lease_seconds) as keeper, ThreadPoolExecutor(max_workers=workers) as executor:
+        drains = [executor.submit(drain, keeper) for _ in range(workers)]
+        try:
+            while True:
+                try:
+                    yield finished.get(timeout=0.5)
+                except queue.Empty:
+                    if all(d.done() for d in drains) and finished.empty():
+                        break
+        finally:
+            stop.set()
+        for d in drains:
+            # Logged, not raised: the run's final commit and summary still happen.
+            if d.exception() is not None:
+                options.logger.error(f"Work queue {run_id} worker crashed", exception=d.exception())
 
 
 def main():
@@ -1563,7 +2050,74 @@ def main():
     group.add_argument("--charities", type=str, help="Path to charity list file")
     group.add_argument("--ein", type=str, help="Single charity EIN")
     parser.add_argument("--workers", type=int, default=20, help="Number of parallel workers (default: 20)")
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Run phases on separate worker pools with bounded queues between them instead of one "
+        "end-to-end worker per charity (sized by --crawl-workers/--cpu-workers/--llm-workers/--export-workers)",
+    )
+    parser.add_argument(
+        "--crawl-workers",
+        type=int,
+        default=STAGED_CRAWL_WORKERS,
+        metavar="N",
+        help=f"--staged: charities crawling at once (default: {STAGED_CRAWL_WORKERS})",
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        default=STAGED_CPU_WORKERS,
+        metavar="N",
+        help=f"--staged: charities in extract/synthesize at once (default: {STAGED_CPU_WORKERS})",
+    )
+    parser.add_argument(
+        "--llm-workers",
+        type=int,
+        default=STAGED_LLM_WORKERS,
+        metavar="N",
+        help=f"--staged: charities in discover/baseline/rich/judge at once, per model (default: {STAGED_LLM_WORKERS})",
+    )
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        default=STAGED_EXPORT_WORKERS,
+        metavar="N",
+        help=f"--staged: charities exporting at once (default: {STAGED_EXPORT_WORKERS})",
+    )
+    parser.add_argument(
+        "--stage-queue",
+        type=int,
+        default=STAGED_QUEUE_SIZE,
+        metavar="N",
+        help=f"--staged: charities queued in front of each stage before upstream stages wait "
+        f"(default: {STAGED_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        metavar="RUN_ID",
+        help="Drain the charity list together with every other runner started with the same RUN_ID "
+        "(leased work queue in Dolt; a crashed runner's charities are reclaimed when its leases expire)",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        default=WORK_QUEUE_LEASE_SECONDS,
+        metavar="S",
+        help=f"--queue: seconds a charity stays claimed without a heartbeat (default: {WORK_QUEUE_LEASE_SECONDS})",
+    )
+    parser.add_argument(
+        "--worker-id",
+        type=str,
+        default=f"{socket.gethostname()}:{os.getpid()}",
+        help="--queue: name this runner's leases are recorded under (default: host:pid)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Show detailed output")
+    parser.add_argument(
+        "--concurrent-sources",
+        action="store_true",
+        help="Crawl phase: fetch each charity's sources (and website) in parallel instead of one at a time",
+    )
     parser.add_argument("--clean", action="store_true", help="Delete existing data before processing (fresh start)")
     parser.add_argument("--model", type=str, help="Override LLM model (e.g., gpt-5.2, claude-sonnet-4-5)")
     parser.add_argument("--tag", type=str, metavar="NAME", help="Custom tag name (default: auto-generated timestamp)")
@@ -1589,6 +2143,24 @@ def main():
     )
     parser.add_argument("--dry-run", action="store_true", help="Show what would run without running")
     parser.add_argument("--cache-status", action="store_true", help="Show cache status for charity(ies) and exit")
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Reuse stored LLM responses for byte-identical prompts (also: LLM_RESPONSE_CACHE=1)",
+    )
+    parser.add_argument(
+        "--llm-stream",
+        action="store_true",
+        help="Stream narrative generation and cancel early on schema violations (also: LLM_STREAMING=1)",
+    )
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Write per-run span traces as JSONL and print latency percentiles "
+        "(default path: logs/traces/run-<timestamp>.jsonl; also: PIPELINE_TRACE=path)",
+    )
     parser.add_argument(
         "--checkpoint",
         type=int,
@@ -1610,6 +2182,19 @@ def main():
     if args.prune and args.ein:
         parser.error("--prune cannot be combined with --ein")
 
+    stage_sizes = (args.crawl_workers, args.cpu_workers, args.llm_workers, args.export_workers, args.stage_queue)
+    if args.staged and min(stage_sizes) < 1:
+        parser.error("--crawl-workers, --cpu-workers, --llm-workers, --export-workers and --stage-queue must be >= 1")
+    if args.queue:
+        # Staged pools hand a charity between threads mid-lease; --clean would wipe other runners' work.
+        if args.staged or args.clean:
+            parser.error("--queue cannot be combined with --staged or --clean")
+        if args.lease_seconds < 3:
+            parser.error("--lease-seconds must be >= 3")
+
+    global CONCURRENT_SOURCE_FETCH
+    CONCURRENT_SOURCE_FETCH = args.concurrent_sources
+
     # Budget guardrail: enforced pre-call in LLMClient.generate() and GeminiSearchClient.search()
     try:
         apply_budget_cap(args.budget)
@@ -1617,6 +2202,16 @@ def main():
         print(f"Error: {e}")
         sys.exit(1)
 
+    if args.llm_cache:
+        configure_response_cache(enabled=True)
+    if args.llm_stream:
+        configure_streaming(enabled=True)
+    if args.trace is not None:
+        trace_path = args.trace or (
+            Path(__file__).parent / "logs" / "traces" / f"run-{datetime.now().strftime('%Y-%m-%d-%H%M%S')}.jsonl"
+        )
+        configure_tracing(trace_path)
+
     # Check environment
     required_vars = ["GOOGLE_API_KEY"]
     missing = [v for v in required_vars if not os.getenv(v)]
@@ -1678,6 +2273,9 @@ def main():
                 print(f"  Cleaned {charity['ein']}: {tables_str}")
         print()
 
+    # Hash phase code once up front; workers then only stat() files per check.
+    precompute_code_fingerprints()
+
     # Initialize resources used on main thread.
     # Worker threads initialize their own per-thread resources lazily.
     cache_repo = PhaseCacheRepository()
@@ -1688,17 +2286,36 @@ def main():
     llm_client = LLMClient(model=args.model, logger=logger)
     llm_model = llm_client.model_name
 
+    # One bulk pass over phase_cache + artifact rows decides every cache skip
+    # up front; the dry-run output and the workers both read from it.
+    run_plan = build_run_plan(
+        [c["ein"] for c in charities],
+        cache_repo,
+        raw_repo,
+        data_repo,
+        eval_repo,
+        force_all=args.force_all,
+        force_phases=args.force_phase,
+    )
+
     # Handle --cache-status: show cache status and exit
     if args.cache_status:
-        print_cache_status(charities, cache_repo, args.force_phase)
+        print_cache_status(charities, run_plan)
         sys.exit(0)
 
     # Handle --dry-run: show what would run and exit
     if args.dry_run:
         print("\n🔍 DRY RUN - Showing what would run without running:\n")
-        print_cache_status(charities, cache_repo, args.force_phase)
+        print_cache_status(charities, run_plan)
         sys.exit(0)
 
+    work_queue = None
+    if args.queue:
+        work_queue = DoltWorkQueue()
+        added = work_queue.enqueue(args.queue, charities)
+        queue_stats = work_queue.get_stats(args.queue)
+        print(f"Work queue {args.queue}: {added} charities added, {queue_stats['total']} queued in total")
+
     # Set progress total
     progress["total"] = len(charities)
 
@@ -1714,11 +2331,36 @@ def main():
         # Overlay explicit run file on top of defaults.
         pilot_flags.update(load_pilot_charities(args.charities))
 
+    stage_pipeline = (
+        build_stage_pipeline(
+            llm_model,
+            crawl_workers=args.crawl_workers,
+            cpu_workers=args.cpu_workers,
+            llm_workers=args.llm_workers,
+            export_workers=args.export_workers,
+            queue_size=args.stage_queue,
+        )
+        if args.staged
+        else None
+    )
+
     print("=" * 80)
     print(f"STREAMING PIPELINE: {len(charities)} charities × 7 phases")
-    print(f"  Workers: {args.workers}")
+    if stage_pipeline is None:
+        print(f"  Workers: {args.workers}")
+    else:
+        pools = ", ".join(f"{pool} {size}" for pool, size in stage_pipeline.pool_sizes.items())
+        print(f"  Pools: {pools}")
+    if work_queue is not None:
+        print(f"  Queue: {args.queue} as {args.worker_id} (leases {args.lease_seconds}s)")
+    if args.concurrent_sources:
+        print("  Crawl: concurrent source fetch")
     print(f"  Model: {llm_client.model_name}")
-    print("  Mode: End-to-end (each charity completes fully)")
+    if stage_pipeline is None:
+        print("  Mode: End-to-end (each charity completes fully)")
+    else:
+        stages = " → ".join(stage.name for stage in stage_pipeline.stages)
+        print(f"  Mode: Staged ({stages}; ≤{args.stage_queue} queued per stage)")
     # Smart caching info
     if args.force_all:
         cache_info = "OFF (--force-all)"
@@ -1727,6 +2369,12 @@ def main():
     else:
         cache_info = "ON (code fingerprint + TTL)"
     print(f"  Caching: {cache_info}")
+    response_cache = get_response_cache()
+    if response_cache is not None:
+        print(f"  LLM response cache: ON ({response_cache.path})")
+    tracer = get_tracer()
+    if tracer is not None:
+        print(f"  Tracing: {tracer.path}")
     checkpoint_info = f"every {args.checkpoint} charities" if args.checkpoint > 0 else "at end only"
     print(f"  Checkpoints: {checkpoint_info}")
     if args.skip_export:
@@ -1744,67 +2392,59 @@ def main():
     checkpoint_count = 0  # Number of checkpoint commits made
     since_last_checkpoint = 0  # Charities completed since last checkpoint
 
-    # Process using ThreadPoolExecutor
+    options = RunOptions(
+        llm_model=llm_model,
+        logger=logger,
+        verbose=args.verbose,
+        skip_export=args.skip_export,
+        judge_gate_enabled=not args.no_judge_gate,
+        output_dir=WEBSITE_DATA_DIR,
+        ui_signals_config=ui_signals_config,
+        config_hash=config_hash,
+        pilot_flags=pilot_flags,
+        force_all=args.force_all,
+        force_phases=args.force_phase,
+        # Other runners change phase_cache while this one runs, so a plan built
+        # at startup goes stale: leased charities check the cache per phase.
+        run_plan=run_plan if work_queue is None else None,
+        work_queue=work_queue,
+    )
+    if work_queue is not None:
+        finished = run_leased(work_queue, args.queue, options, args.workers, args.worker_id, args.lease_seconds)
+    elif stage_pipeline is None:
+        finished = run_threaded(charities, options, args.workers)
+    else:
+        finished = run_staged(charities, options, stage_pipeline)
+
     try:
-        with ThreadPoolExecutor(max_workers=args.workers) as executor:
-            futures = {}
-            for i, charity in enumerate(charities, 1):
-                future = executor.submit(
-                    process_charity_full,
-                    charity,
-                    i,
-                    len(charities),
-                    llm_model,
-                    logger,
-                    args.verbose,
-                    args.skip_export,
-                    not args.no_judge_gate,
-                    WEBSITE_DATA_DIR,
-                    ui_signals_config,
-                    config_hash,
-                    pilot_flags,
-                    args.force_all,
-                    args.force_phase,
+        for result in finished:
+            results.append(result)
+
+            # Checkpoint commit: snapshot progress every N charities
+            since_last_checkpoint += 1
+            if args.checkpoint > 0 and since_last_checkpoint >= args.checkpoint:
+                completed = sum(1 for r in results if r.get("success"))
+                failed = len(results) - completed
+                if work_queue is None:
+                    remaining = len(charities) - len(results)
+                else:
+                    queue_stats = work_queue.get_stats(args.queue)
+                    remaining = queue_stats["pending"] + queue_stats["leased"]
+                commit_hash = dolt.commit(
+                    f"Checkpoint {checkpoint_count + 1}: {completed} ok, {failed} failed, {remaining} remaining",
+                    tables=STREAMING_RUN_TABLES,
                 )
-                futures[future] = charity
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    charity = futures[future]
-                    logger.error(f"Worker exception for {charity['ein']}", exception=e)
-                    results.append(
-                        {
-                            "ein": charity["ein"],
-                            "name": charity["name"],
-                            "success": False,
-                            "error": str(e),
-                        }
-                    )
-
-                # Checkpoint commit: snapshot progress every N charities
-                since_last_checkpoint += 1
-                if args.checkpoint > 0 and since_last_checkpoint >= args.checkpoint:
-                    completed = sum(1 for r in results if r.get("success"))
-                    failed = len(results) - completed
-                    commit_hash = dolt.commit(
-                        f"Checkpoint {checkpoint_count + 1}: "
-                        f"{completed} ok, {failed} failed, "
-                        f"{len(charities) - len(results)} remaining",
-                        tables=STREAMING_RUN_TABLES,
-                    )
-                    if commit_hash:
-                        checkpoint_count += 1
-                        since_last_checkpoint = 0
-                        with print_lock:
-                            print(
-                                f"  ⊟ Checkpoint {checkpoint_count} committed "
-                                f"({len(results)}/{len(charities)} processed) [{commit_hash[:8]}]"
-                            )
+                if commit_hash:
+                    checkpoint_count += 1
+                    since_last_checkpoint = 0
+                    with print_lock:
+                        print(
+                            f"  ⊟ Checkpoint {checkpoint_count} committed "
+                            f"({len(results)}/{len(charities)} processed) [{commit_hash[:8]}]"
+                        )
     finally:
-        # Cleanup worker-local resources
+        # Wait for in-flight charities, then cleanup worker-local resources
+        finished.close()
         _cleanup_worker_resources()
 
     elapsed = time.time() - start_time
@@ -1824,6 +2464,7 @@ def main():
 
     # Final commit to DoltDB (captures anything since last checkpoint)
     success_count = sum(1 for r in results if r.get("success"))
+    commit_hash = None
     if success_count > 0:
         checkpoint_note = f" ({checkpoint_count} checkpoints)" if checkpoint_count > 0 else ""
         commit_hash = dolt.commit(
@@ -1836,6 +2477,19 @@ def main():
         elif checkpoint_count > 0:
             print(f"\n✓ All changes captured in {checkpoint_count} checkpoint(s)")
 
+    # With --queue, the tag and the export rebuild cover the whole run and are
+    # done once, by whichever runner finalizes it after the last charity.
+    run_success_count, run_count = success_count, len(results)
+    finalizer = True
+    if work_queue is not None:
+        finalizer = work_queue.finalize(args.queue, args.worker_id)
+        queue_stats = work_queue.get_stats(args.queue)
+        run_success_count, run_count = queue_stats["succeeded"], queue_stats["total"]
+        if not finalizer:
+            open_count = queue_stats["pending"] + queue_stats["leased"]
+            print(f"⇄ Tag and export rebuild left to the last runner on {args.queue} ({open_count} charities open)")
+
+    if run_success_count > 0 and finalizer:
         # Tag the run unless --no-tag specified
         # Use the final commit hash, or the latest HEAD if all changes were in checkpoints
         tag_ref = commit_hash or "HEAD"
@@ -1853,7 +2507,7 @@ def main():
             avg_score = sum(scores) / len(scores) if scores else 0
 
             tag_message = (
-                f"Pipeline run: {success_count}/{len(results)} charities from {source}\n"
+                f"Pipeline run: {run_success_count}/{run_count} charities from {source}\n"
                 f"Cost: ${total_cost:.2f} (${avg_cost:.4f}/charity) | Avg score: {avg_score:.1f}"
             )
 
@@ -1868,9 +2522,9 @@ def main():
     # Rebuild exports from all currently exportable charities.
     # This keeps dataset additive/non-regressive across partial reruns.
     # Guard: a run where nothing succeeded must not touch the published dataset.
-    if not args.skip_export and success_count == 0:
+    if not args.skip_export and run_success_count == 0:
         print("⚠ Skipping comprehensive export rebuild: zero charities succeeded this run")
-    if not args.skip_export and success_count > 0:
+    if not args.skip_export and run_success_count > 0 and finalizer:
         all_charities = charity_repo.get_all()
         exportable_eins: list[str] = []
         for charity in all_charities:
@@ -2005,15 +2659,78 @@ def main():
     print("\n" + "=" * 80)
     print("PIPELINE SUMMARY")
     print("=" * 80)
+    # A lost lease is not a failure: the runner that reclaimed the charity reports it.
+    leases_lost = sum(1 for r in results if r.get("lease_lost"))
     print(f"Total charities: {len(results)}")
     print(f"  ✓ Completed: {success_count}")
-    print(f"  ✗ Failed: {len(results) - success_count}")
+    print(f"  ✗ Failed: {len(results) - success_count - leases_lost}")
+    if leases_lost:
+        print(f"  ⇄ Lease lost: {leases_lost} charities reclaimed by other runners")
     budget_hit = sum(1 for r in results if r.get("budget_exhausted"))
     if budget_hit:
         print(f"  ⊘ Budget-capped: {budget_hit} charities skipped/aborted after the cap was hit")
-    print(f"Time: {elapsed:.1f}s ({elapsed / len(results):.1f}s per charity)")
+    if work_queue is not None:
+        print(
+            f"Queue {args.queue}: {queue_stats['done']}/{queue_stats['total']} done "
+            f"({queue_stats['succeeded']} succeeded), {queue_stats['failed']} failed after expired leases, "
+            f"{queue_stats['pending'] + queue_stats['leased']} open"
+        )
+    print(f"Time: {elapsed:.1f}s ({elapsed / max(len(results), 1):.1f}s per charity)")
     if get_limit() is not None:
         print(f"Budget: ${get_spent():.4f} spent of ${get_limit():.2f} cap")
+    if response_cache is not None:
+        cache_stats = response_cache.get_stats()
+        print(
+            f"LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0%}), saved ${get_saved():.4f}"
+        )
+    throttled = {d: st for d, st in global_rate_limiter.get_stats().items() if st["waits"] or st["rate_limited"]}
+    if throttled:
+        print("Rate limiting:")
+        for domain, st in sorted(throttled.items()):
+            print(
+                f"  {domain}: waited {st['total_wait_seconds']:.1f}s over {st['waits']}/{st['acquisitions']} "
+                f"requests (max {st['max_wait_seconds']:.1f}s), {st['rate_limited']} × 429"
+            )
+    crawl_stats = crawl_scheduler.get_stats()
+    if crawl_stats["hosts"]:
+        hosts = crawl_stats["hosts"]
+        print(
+            f"Website hosts: {sum(st['requests'] for st in hosts.values())} requests to {len(hosts)} hosts, "
+            f"peak {crawl_stats['max_in_flight']}/{crawl_stats['max_concurrent']} in flight"
+        )
+        busiest = sorted(hosts.items(), key=lambda item: item[1]["total_wait_seconds"], reverse=True)[:5]
+        for host, st in busiest:
+            if not st["waits"]:
+                break
+            delay = f", crawl-delay {st['crawl_delay']:g}s" if st["crawl_delay"] else ""
+            print(
+                f"  {host}: waited {st['total_wait_seconds']:.1f}s over {st['waits']}/{st['requests']} requests "
+                f"(max {st['max_wait_seconds']:.1f}s, queue ≤{st['max_queued']}{delay})"
+            )
+    if stage_pipeline is not None:
+        print("Stages:")
+        for stage_name, st in stage_pipeline.get_stats().items():
+            print(
+                f"  {stage_name:10} {st['processed']} charities ({st['dropped']} stopped) on {st['pool']} ×{st['workers']}: "
+                f"busy {st['busy_seconds']:.0f}s, waited {st['slot_wait_seconds']:.0f}s for a slot, "
+                f"blocked {st['blocked_seconds']:.0f}s downstream, queue ≤{st['max_queued']}"
+            )
+    pool_stats = get_pool_stats()["sync"]
+    if pool_stats:
+        pooled_requests = sum(st["requests"] for st in pool_stats.values())
+        opened = sum(st["connections_opened"] for st in pool_stats.values())
+        print(f"HTTP pool: {pooled_requests} requests over {opened} connections ({len(pool_stats)} hosts)")
+    pdf_stats = get_pdf_text_extractor().get_stats()
+    if pdf_stats["extracted"] or pdf_stats["cache_hits"]:
+        print(
+            f"PDF text: {pdf_stats['extracted']} extracted, {pdf_stats['cache_hits']} cached, "
+            f"{pdf_stats['timeouts']} timed out, {pdf_stats['errors']} failed"
+        )
+    if tracer is not None:
+        configure_tracing(None)
+        print(f"\nTrace: {tracer.path}")
+        print(format_trace_report(summarize_trace(load_trace(tracer.path))))
 
     # Score distribution
     scores = [r.get("amal_score") for r in results if r.get("amal_score")]
@@ -2053,7 +2770,7 @@ def main():
 
     if comprehensive_export_hard_failed:
         print("\n⛔ Exiting with error: comprehensive export rebuild was incomplete")
-    sys.exit(0 if success_count == len(results) and not comprehensive_export_hard_failed else 1)
+    sys.exit(0 if success_count + leases_lost == len(results) and not comprehensive_export_hard_failed else 1)
 
 
 if __name__ == "__main__":
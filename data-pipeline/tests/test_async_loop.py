@@ -0,0 +1,104 @@
+"""Shared crawl loop: reuse across calls and threads, cancellation, timeouts and context propagation."""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.collectors.web_collector import WebsiteCollector
+from src.utils.async_loop import AsyncLoopService
+from src.utils.http_pool import get_async_client
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def service():
+    service = AsyncLoopService(name="test-loop")
+    yield service
+    service.close()
+
+
+async def _loop_identity():
+    return asyncio.get_running_loop(), threading.current_thread().name, get_async_client()
+
+
+def test_calls_from_many_threads_share_one_loop_and_client(service):
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        identities = list(pool.map(lambda _: service.run(_loop_identity()), range(8)))
+
+    loops, threads, clients = zip(*identities)
+    assert len(set(loops)) == 1 and len(set(clients)) == 1
+    assert set(threads) == {"test-loop"}
+    assert service.get_stats()["loops_started"] == 1
+
+
+def test_caller_context_is_carried_into_the_task(service):
+    async def read():
+        return request_id.get()
+
+    token = request_id.set("charity-1")
+    try:
+        assert service.run(read()) == "charity-1"
+    finally:
+        request_id.reset(token)
+    assert service.run(read()) is None
+
+
+def test_timeout_cancels_the_task_on_the_loop(service):
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        service.run(hang(), timeout=0.05)
+    assert cancelled.wait(1)
+    assert service.get_stats()["timeouts"] == 1
+
+
+def test_coroutine_exceptions_propagate_unchanged(service):
+    async def inner_timeout():
+        await asyncio.wait_for(asyncio.sleep(1), timeout=0.01)
+
+    async def boom():
+        raise ValueError("bad page")
+
+    with pytest.raises(ValueError, match="bad page"):
+        service.run(boom())
+    with pytest.raises(TimeoutError):
+        service.run(inner_timeout(), timeout=5)
+    assert service.get_stats()["timeouts"] == 0
+
+
+def test_run_from_the_loop_thread_is_refused(service):
+    async def nested():
+        with pytest.raises(RuntimeError):
+            service.run(asyncio.sleep(0))
+        return True
+
+    assert service.run(nested()) is True
+
+
+def test_close_stops_the_loop_and_next_run_restarts_it(service):
+    loop, _, _ = service.run(_loop_identity())
+    service.close()
+    assert loop.is_closed() and service.get_stats()["running"] is False
+
+    new_loop, _, _ = service.run(_loop_identity())
+    assert new_loop is not loop
+    assert service.get_stats()["loops_started"] == 2
+
+
+def test_domain_semaphores_are_shared_across_crawls_on_the_loop(service):
+    async def semaphore_for(url):
+        return WebsiteCollector._per_domain_semaphores()(url)
+
+    first = service.run(semaphore_for("https://helpinghands.org/about"))
+    second = service.run(semaphore_for("https://helpinghands.org/donate"))
+    assert first is second
@@ -1,8 +1,11 @@
 """H5: crawl politeness + terminal failure classification (pure-function tests)."""
 
 import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+from src.collectors import web_collector
 from src.collectors.orchestrator import (
     DataCollectionOrchestrator,
     classify_failure,
@@ -59,6 +62,42 @@ class TestPerDomainSemaphores:
         assert PER_DOMAIN_CONCURRENCY == 2
 
 
+def test_curl_cffi_retries_release_host_slot_between_attempts(monkeypatch):
+    """Each HTTP attempt takes the host slot itself; backoff sleeps happen outside it."""
+    cache = MagicMock()
+    cache.get_http_headers.return_value = {}
+    cache.get_all_cloudflare_profiles.return_value = {}
+    monkeypatch.setattr(web_collector, "CrawlerCache", lambda cache_dir, **kwargs: cache)
+    collector = WebsiteCollector(use_llm=False, max_pdf_downloads=0, use_playwright=False, content_scoring=False)
+    held, slots, sleeps = [], [], []
+
+    @contextmanager
+    def host_slot(url):
+        slots.append(url)
+        held.append(url)
+        try:
+            yield
+        finally:
+            held.remove(url)
+
+    def blocked_profile(url, timeout, impersonate):
+        assert held == [url]
+        raise RuntimeError(f"{impersonate} blocked")
+
+    blocked = SimpleNamespace(status_code=403, headers={}, text="")
+    monkeypatch.setattr(collector, "_host_slot", host_slot)
+    monkeypatch.setattr(web_collector, "get_session", lambda: SimpleNamespace(get=lambda *a, **kw: blocked))
+    monkeypatch.setattr(web_collector, "HAS_CURL_CFFI", True)
+    monkeypatch.setattr(web_collector, "curl_requests", SimpleNamespace(get=blocked_profile), raising=False)
+    monkeypatch.setattr(web_collector.time, "sleep", lambda seconds: sleeps.append(list(held)))
+
+    success, _, _, error = collector._fetch_url("https://blocked.example/", force=True)
+
+    assert not success and "even with curl_cffi" in error
+    assert len(slots) == 4  # plain request + one per browser profile
+    assert sleeps == [[], [], []]
+
+
 def test_terminal_ttl_is_180_days():
     assert TERMINAL_FAILURE_TTL_DAYS == 180
 
@@ -78,6 +117,7 @@ class TestSingleRetryIncrementPerWebsiteFailure:
         # Skip every non-website source so only the website block runs
         orch.skip_sources = {"propublica", "charity_navigator", "candid", "form990_grants", "bbb"}
         orch.frozen_sources = set()  # H12: not testing the freeze label here
+        orch.concurrent_sources = False
         orch.blocked_sites = []
         orch._blocked_sites_lock = threading.Lock()
         orch.raw_data_repo = MagicMock()
@@ -0,0 +1,131 @@
+"""Per-host crawl politeness: host keys, robots crawl-delay, the global ceiling and per-host stats."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from src.utils.crawl_scheduler import HostScheduler, registrable_domain
+
+
+class FakeRobots:
+    def __init__(self, delays):
+        self.delays = delays
+        self.calls = []
+
+    def get_crawl_delay(self, url):
+        self.calls.append(url)
+        return self.delays.get(registrable_domain(url))
+
+
+@pytest.mark.parametrize(
+    "url, host",
+    [
+        ("https://www.helpinghands.org/about", "helpinghands.org"),
+        ("https://donate.helpinghands.org", "helpinghands.org"),
+        ("http://HelpingHands.ORG:8080/", "helpinghands.org"),
+        ("https://www.reliefcharity.org.uk/", "reliefcharity.org.uk"),
+        ("https://shop.relief.com.au/", "relief.com.au"),
+        ("https://192.168.0.10/page", "192.168.0.10"),
+        ("helpinghands.org/give", "helpinghands.org"),
+    ],
+)
+def test_registrable_domain(url, host):
+    assert registrable_domain(url) == host
+
+
+def test_hosts_are_paced_independently():
+    scheduler = HostScheduler(max_concurrent=4, host_rate=(10.0, 1))
+
+    start = time.monotonic()
+    with scheduler.slot("https://www.a.org/1"):
+        pass
+    with scheduler.slot("https://b.org/1"):
+        pass
+    assert time.monotonic() - start < 0.05
+
+    with scheduler.slot("https://a.org/2"):
+        pass
+    assert time.monotonic() - start >= 0.09
+
+    hosts = scheduler.get_stats()["hosts"]
+    assert hosts["a.org"]["requests"] == 2 and hosts["a.org"]["waits"] == 1
+    assert hosts["b.org"]["requests"] == 1 and hosts["b.org"]["waits"] == 0
+
+
+def test_robots_crawl_delay_slows_host_and_is_capped():
+    robots = FakeRobots({"slow.org": 0.1, "glacial.org": 3600})
+    scheduler = HostScheduler(host_rate=(100.0, 5), max_crawl_delay=60)
+
+    with scheduler.slot("https://slow.org/1", robots=robots):
+        pass
+    start = time.monotonic()
+    with scheduler.slot("https://www.slow.org/2", robots=robots):
+        pass
+    assert time.monotonic() - start >= 0.09
+    with scheduler.slot("https://glacial.org/", robots=robots):
+        pass
+
+    hosts = scheduler.get_stats()["hosts"]
+    assert hosts["slow.org"]["crawl_delay"] == 0.1 and hosts["slow.org"]["rate"] == pytest.approx(10.0)
+    assert hosts["glacial.org"]["crawl_delay"] == 60
+    # robots.txt is consulted once per host
+    assert robots.calls == ["https://slow.org/1", "https://glacial.org/"]
+
+
+def test_global_ceiling_bounds_in_flight_requests():
+    scheduler = HostScheduler(max_concurrent=2, host_rate=(1000.0, 10))
+    release = threading.Event()
+    entered = []
+
+    def fetch(n):
+        with scheduler.slot(f"https://host{n}.org/"):
+            entered.append(n)
+            release.wait(1)
+
+    threads = [threading.Thread(target=fetch, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert len(entered) == 2
+    assert scheduler.get_stats()["in_flight"] == 2
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    stats = scheduler.get_stats()
+    assert len(entered) == 4
+    assert stats["in_flight"] == 0 and stats["max_in_flight"] == 2
+
+
+def test_async_slot_queues_behind_same_host():
+    scheduler = HostScheduler(max_concurrent=4, host_rate=(20.0, 1))
+
+    async def fetch(url):
+        async with scheduler.slot_async(url):
+            return time.monotonic()
+
+    async def crawl():
+        return await asyncio.gather(*(fetch(f"https://a.org/{n}") for n in range(3)), fetch("https://b.org/"))
+
+    start = time.monotonic()
+    *same_host, other_host = asyncio.run(crawl())
+
+    assert max(same_host) - start >= 0.09
+    assert other_host - start < 0.04
+    hosts = scheduler.get_stats()["hosts"]
+    assert hosts["a.org"]["max_queued"] >= 2 and hosts["a.org"]["queued"] == 0
+
+
+def test_rate_limited_host_pauses_only_itself():
+    scheduler = HostScheduler(host_rate=(100.0, 5))
+
+    assert scheduler.report_rate_limited("https://www.a.org/x", retry_after="0.1") == pytest.approx(0.1)
+    start = time.monotonic()
+    with scheduler.slot("https://b.org/"):
+        pass
+    assert time.monotonic() - start < 0.05
+    with scheduler.slot("https://a.org/"):
+        pass
+    assert time.monotonic() - start >= 0.09
+    assert scheduler.get_stats()["hosts"]["a.org"]["rate_limited"] == 1
@@ -101,7 +101,7 @@ class TestCaptchaDetectionStatusCodes:
         from src.collectors.web_collector import WebsiteCollector
         import inspect
 
-        source = inspect.getsource(WebsiteCollector._fetch_url)
+        source = inspect.getsource(WebsiteCollector._fetch_url_uncached)
         assert "503" in source, "503 should be in sync captcha detection"
 
     def test_async_path_includes_503(self):
@@ -121,7 +121,7 @@ class TestCurlCffiRetryDelay:
         from src.collectors.web_collector import WebsiteCollector
         import inspect
 
-        source = inspect.getsource(WebsiteCollector._fetch_url)
+        source = inspect.getsource(WebsiteCollector._fetch_url_uncached)
         assert "time.sleep" in source, "Sync path should have time.sleep between retries"
 
     def test_async_path_has_delay(self):
@@ -0,0 +1,124 @@
+"""CrawlerCache page storage: SQLite backend, legacy JSON compatibility, migration."""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from src.utils.crawler_cache import CrawlerCache, SqliteCacheBackend
+
+URL = "https://example.org/about"
+HTML = "<html><body>EIN 12-3456789 " + "mission " * 200 + "</body></html>"
+
+
+@pytest.fixture(params=["sqlite", "json"])
+def cache(request, tmp_path):
+    cache = CrawlerCache(cache_dir=tmp_path, ttl_days=30, backend=request.param)
+    yield cache
+    cache.close()
+
+
+def _legacy_entry(url, days_old=0, **extra):
+    cached_at = datetime.now(timezone.utc) - timedelta(days=days_old)
+    return {
+        "url": url,
+        "html": HTML,
+        "final_url": url,
+        "cached_at": cached_at.isoformat(),
+        "had_data": False,
+        "extraction_methods_tried": ["deterministic"],
+        "content_hash": "abc",
+        "last_modified": None,
+        "etag": '"v1"',
+        "fields_extracted": [],
+        "schema_version": "1.0",
+        "js_rendering_needed": False,
+        "extraction_failure_reason": None,
+        **extra,
+    }
+
+
+def _write_legacy(cache_dir, entry):
+    html_dir = cache_dir / "html"
+    html_dir.mkdir(parents=True, exist_ok=True)
+    path = html_dir / f"{hashlib.md5(entry['url'].encode()).hexdigest()}.json"
+    path.write_text(json.dumps(entry))
+    return path
+
+
+def test_round_trip_and_metadata_updates(cache):
+    cache.cache_html(URL, HTML, URL + "/", extraction_methods_tried=["deterministic"], etag='"e"')
+    cache.update_had_data(URL, True, extraction_methods_tried=["deterministic", "llm"], js_rendering_needed=True)
+    cache.update_fields_extracted(URL, ["ein", "mission"])
+
+    cached = cache.get_cached_html(URL)
+    assert cached["html"] == HTML
+    assert cached["final_url"] == URL + "/"
+    assert cached["had_data"] is True
+    assert cached["js_rendering_needed"] is True
+    assert cached["extraction_methods_tried"] == ["deterministic", "llm"]
+    assert cache.get_fields_extracted(URL) == ["ein", "mission"]
+    assert cache.get_http_headers(URL) == {"etag": '"e"'}
+    assert not cache.has_content_changed(URL, HTML)
+    assert cache.get_cache_stats()["cached_pages"] == 1
+
+
+def test_clear_expired_removes_only_old_entries(cache):
+    cache.cache_html("https://example.org/new", HTML, "https://example.org/new")
+    cache.backend.put("https://example.org/old", _legacy_entry("https://example.org/old", days_old=90))
+
+    assert cache.clear_expired_cache() == 1
+    assert cache.get_cached_html("https://example.org/new") is not None
+    assert cache.backend.get("https://example.org/old") is None
+
+
+def test_sqlite_compresses_html_and_writes_no_per_url_files(tmp_path):
+    cache = CrawlerCache(cache_dir=tmp_path, backend="sqlite")
+    cache.cache_html(URL, HTML, URL)
+
+    assert isinstance(cache.backend, SqliteCacheBackend)
+    assert list((tmp_path / "html").iterdir()) == []
+    stats = cache.get_cache_stats()
+    assert stats["backend"] == "sqlite"
+    assert 0 < stats["total_cache_size_mb"] * 1024 * 1024 < len(HTML)
+    cache.close()
+
+
+def test_legacy_entry_is_imported_on_first_read(tmp_path):
+    path = _write_legacy(tmp_path, _legacy_entry(URL))
+    cache = CrawlerCache(cache_dir=tmp_path, backend="sqlite")
+
+    assert cache.get_cached_html(URL)["etag"] == '"v1"'
+    assert not path.exists()
+    assert cache.get_cache_stats()["cached_pages"] == 1
+    cache.close()
+
+
+def test_update_imports_legacy_entry(tmp_path):
+    _write_legacy(tmp_path, _legacy_entry(URL))
+    cache = CrawlerCache(cache_dir=tmp_path, backend="sqlite")
+
+    cache.update_had_data(URL, True)
+
+    assert cache.get_cached_html(URL)["had_data"] is True
+    cache.close()
+
+
+def test_migrate_legacy_files_in_batches(tmp_path):
+    urls = [f"https://example.org/{i}" for i in range(5)]
+    for url in urls:
+        _write_legacy(tmp_path, _legacy_entry(url, had_data=True))
+    (tmp_path / "html" / "broken.json").write_text("{not json")
+
+    cache = CrawlerCache(cache_dir=tmp_path, backend="sqlite")
+    result = cache.migrate_legacy_files(batch_size=2)
+
+    assert result == {"migrated": 5, "failed": 1}
+    assert [p.name for p in (tmp_path / "html").iterdir()] == ["broken.json"]
+    assert all(cache.get_cached_html(url)["had_data"] for url in urls)
+    cache.close()
+
+
+def test_unknown_backend_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CrawlerCache(cache_dir=tmp_path, backend="redis")
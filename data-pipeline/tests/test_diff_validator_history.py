@@ -0,0 +1,69 @@
+"""DiffValidator loads score history for all changed EINs in bulk."""
+
+import src.judges.diff_validator as diff_validator_module
+from src.judges.diff_validator import ChangeRecord, DiffValidator
+
+
+def _changes():
+    return [
+        ChangeRecord(ein="11-1111111", diff_type="modified", old_score=60, new_score=80, score_delta=20),
+        ChangeRecord(ein="22-2222222", diff_type="modified", old_score=70, new_score=72, score_delta=2),
+        ChangeRecord(ein="33-3333333", diff_type="added", new_score=50),
+    ]
+
+
+def test_validate_issues_one_history_query_for_all_changes(monkeypatch):
+    queries = []
+
+    def fake_query(sql, params=None, fetch="all"):
+        queries.append((sql, params))
+        # Rows arrive grouped by EIN, oldest first
+        return [
+            {"charity_ein": "11-1111111", "amal_score": 60},
+            {"charity_ein": "11-1111111", "amal_score": 75},
+            {"charity_ein": "11-1111111", "amal_score": 80},
+            {"charity_ein": "22-2222222", "amal_score": 72},
+        ]
+
+    monkeypatch.setattr(diff_validator_module, "db_query", fake_query)
+    validator = DiffValidator()
+    monkeypatch.setattr(validator, "_get_all_changes", _changes)
+
+    report = validator.validate()
+
+    assert len(queries) == 1
+    sql, params = queries[0]
+    assert "ROW_NUMBER() OVER" in sql
+    assert params == ("11-1111111", "22-2222222", DiffValidator.SCORE_HISTORY_LIMIT)
+
+    by_ein = {c.ein: c for c in report.all_changes}
+    assert by_ein["11-1111111"].score_history == [60, 75, 80]
+    assert by_ein["11-1111111"].score_trend == "improving"
+    assert by_ein["22-2222222"].score_history == [72]
+    assert by_ein["33-3333333"].score_history == []
+
+
+def test_history_loader_chunks_and_falls_back_per_ein(monkeypatch):
+    calls = []
+
+    def fake_query(sql, params=None, fetch="all"):
+        windowed = "ROW_NUMBER" in sql
+        calls.append((windowed, params))
+        if windowed:
+            raise RuntimeError("window functions unsupported")
+        return [{"amal_score": 80, "commit_date": 2}, {"amal_score": 70, "commit_date": 1}]
+
+    monkeypatch.setattr(diff_validator_module, "db_query", fake_query)
+    validator = DiffValidator()
+    monkeypatch.setattr(validator, "SCORE_HISTORY_BATCH_SIZE", 2)
+
+    histories = validator._load_score_histories(["a", "b", "c", "a"])
+
+    assert histories == {"a": [70, 80], "b": [70, 80], "c": [70, 80]}
+    assert calls == [
+        (True, ("a", "b", 5)),
+        (False, ("a", 5)),
+        (False, ("b", 5)),
+        (True, ("c", 5)),
+        (False, ("c", 5)),
+    ]
@@ -147,7 +147,7 @@ class TestExportCommitsExclusionsBeforeStamp:
             export_module, "export_prompts",
             lambda outdir: {"exported": 0, "output_dir": str(outdir)},
         )
-        monkeypatch.setattr(export_module, "_mirror_export_to_public_data", lambda outdir: None)
+        monkeypatch.setattr(export_module, "_mirror_export_to_public_data", lambda outdir, **kw: None)
         monkeypatch.setattr(export_module, "_build_calibration_report", lambda **kw: {})
         monkeypatch.setattr(
             sys, "argv", ["export.py", "--ein", "11-1111111", "--output", str(tmp_path)]
@@ -0,0 +1,179 @@
+"""Bulk and incremental export paths: same artifacts as a full per-EIN export."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import export
+from export import PilotCharityFlags, export_charities_bulk, export_charity
+
+EINS = ["12-3456789", "98-7654321", "55-5555555"]  # last one has no charity row
+
+
+def _charity(ein):
+    return {"ein": ein, "name": f"Relief Org {ein[:2]}", "mission": "Test mission", "category": None, "website": None}
+
+
+def _charity_data(ein):
+    return {"charity_ein": ein, "primary_category": "HUMANITARIAN", "program_expenses": 1_000_000}
+
+
+def _evaluation(ein):
+    return {
+        "charity_ein": ein,
+        "amal_score": 70,
+        "wallet_tag": "SADAQAH-ELIGIBLE",
+        "baseline_narrative": {"headline": "Test headline"},
+        "score_details": {},
+        "confidence_tier": "HIGH",
+    }
+
+
+class FakeRepo:
+    """Serves both the per-EIN and bulk read APIs from a dict, counting calls."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def get(self, ein):
+        self.calls += 1
+        row = self.rows.get(ein)
+        return dict(row) if row else None
+
+    def get_many(self, eins):
+        self.calls += 1
+        return {ein: dict(self.rows[ein]) for ein in eins if ein in self.rows}
+
+    def get_for_charity(self, ein, columns=None):
+        self.calls += 1
+        return list(self.rows.get(ein, []))
+
+    def get_for_charities(self, eins, columns=None):
+        self.calls += 1
+        return {ein: list(self.rows[ein]) for ein in eins if ein in self.rows}
+
+
+def _repos():
+    live = EINS[:2]
+    raw = {ein: [{"charity_ein": ein, "source": "propublica", "success": True, "parsed_json": {"propublica_990": {}}}] for ein in live}
+    return (
+        FakeRepo({ein: _charity(ein) for ein in live}),
+        FakeRepo(raw),
+        FakeRepo({ein: _charity_data(ein) for ein in live}),
+        FakeRepo({ein: _evaluation(ein) for ein in live}),
+    )
+
+
+def _run_serial(output_dir):
+    repos = _repos()
+    cfg = export._load_ui_signals_config()
+    results = [
+        export_charity(ein, *repos, output_dir, ui_signals_config=cfg, config_hash="h")
+        for ein in EINS
+    ]
+    return results, repos
+
+
+def _run_bulk(output_dir, workers):
+    repos = _repos()
+    cfg = export._load_ui_signals_config()
+    results = export_charities_bulk(
+        EINS, {EINS[0]: PilotCharityFlags()}, *repos, output_dir, ui_signals_config=cfg, config_hash="h", workers=workers
+    )
+    return results, repos
+
+
+def _strip(results):
+    return [{k: v for k, v in r.items() if k != "detail_file"} for r in results]
+
+
+def test_bulk_matches_per_ein_export(tmp_path):
+    serial, _ = _run_serial(tmp_path / "serial")
+    bulk, _ = _run_bulk(tmp_path / "bulk", workers=2)
+
+    assert [r["ein"] for r in bulk] == EINS
+    assert _strip(bulk) == _strip(serial)
+    assert bulk[2] == {"ein": EINS[2], "success": False, "error": "Charity not found"}
+    for ein in EINS[:2]:
+        name = f"charities/charity-{ein}.json"
+        assert (tmp_path / "bulk" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
+
+
+def test_bulk_issues_one_query_per_table(tmp_path):
+    _, serial_repos = _run_serial(tmp_path / "serial")
+    _, bulk_repos = _run_bulk(tmp_path / "bulk", workers=1)
+    assert [repo.calls for repo in bulk_repos] == [1, 1, 1, 1]
+    assert sum(repo.calls for repo in serial_repos) > 4
+
+
+def test_incremental_export_skips_unchanged_charities(tmp_path):
+    output_dir = tmp_path / "out"
+    manifest_path = tmp_path / "manifest.json"
+    cfg = export._load_ui_signals_config()
+
+    repos = _repos()
+    manifest = export.ExportManifest(output_dir, path=manifest_path)
+    first = [export_charity(ein, *repos, output_dir, cfg, "h", manifest=manifest) for ein in EINS[:2]]
+    manifest.save()
+    detail = output_dir / "charities" / f"charity-{EINS[0]}.json"
+    mtime = detail.stat().st_mtime_ns
+
+    # Second run: first charity unchanged, second charity's evaluation changed
+    repos = _repos()
+    repos[3].rows[EINS[1]]["amal_score"] = 55
+    manifest = export.ExportManifest(output_dir, path=manifest_path)
+    second = [export_charity(ein, *repos, output_dir, cfg, "h", manifest=manifest) for ein in EINS[:2]]
+
+    assert second[0]["unchanged"] is True
+    assert second[0]["summary"] == json.loads(json.dumps(first[0]["summary"], default=str))
+    assert detail.stat().st_mtime_ns == mtime
+    assert "unchanged" not in second[1]
+
+    # A different config hash invalidates every entry
+    third = export_charity(EINS[0], *_repos(), output_dir, cfg, "other", manifest=manifest)
+    assert "unchanged" not in third
+
+
+def test_incremental_manifest_keyed_on_export_code_fingerprint(tmp_path, monkeypatch):
+    output_dir = tmp_path / "out"
+    manifest_path = tmp_path / "manifest.json"
+    cfg = export._load_ui_signals_config()
+    manifest = export.ExportManifest(output_dir, path=manifest_path)
+    assert manifest.code_fingerprint == export.compute_code_fingerprint("export", Path(export.__file__).parent)
+    export_charity(EINS[0], *_repos(), output_dir, cfg, "h", manifest=manifest)
+    manifest.save()
+
+    # Editing any export code file (not only export.py) changes the phase fingerprint
+    monkeypatch.setattr(export, "compute_code_fingerprint", lambda phase, base_path=None: "changed-export-code")
+    manifest = export.ExportManifest(output_dir, path=manifest_path)
+    again = export_charity(EINS[0], *_repos(), output_dir, cfg, "h", manifest=manifest)
+    assert "unchanged" not in again
+
+
+def test_incremental_manifest_rejects_tampered_detail_file(tmp_path):
+    output_dir = tmp_path / "out"
+    cfg = export._load_ui_signals_config()
+    manifest = export.ExportManifest(output_dir, path=tmp_path / "manifest.json")
+    export_charity(EINS[0], *_repos(), output_dir, cfg, "h", manifest=manifest)
+
+    (output_dir / "charities" / f"charity-{EINS[0]}.json").write_text("{}")
+    again = export_charity(EINS[0], *_repos(), output_dir, cfg, "h", manifest=manifest)
+    assert "unchanged" not in again
+    assert json.loads((output_dir / "charities" / f"charity-{EINS[0]}.json").read_text())["ein"] == EINS[0]
+
+
+def test_sync_tree_copies_only_changed_files(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    (src / "charities").mkdir(parents=True)
+    (src / "charities" / "a.json").write_text("a")
+    (src / "charities" / "b.json").write_text("b")
+    assert export._sync_tree(src, dst) == (2, 0)
+
+    (src / "charities" / "b.json").write_text("bb")
+    (src / "charities" / "a.json").unlink()
+    assert export._sync_tree(src, dst) == (1, 1)
+    assert (dst / "charities" / "b.json").read_text() == "bb"
+    assert not (dst / "charities" / "a.json").exists()
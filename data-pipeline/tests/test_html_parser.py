@@ -0,0 +1,85 @@
+"""Shared HTML parsing: lxml-backed soups, DomCache reuse and parse stats per collector."""
+
+import pytest
+from src.collectors.web_collector import WebsiteCollector
+from src.extractors.structured_data import StructuredDataExtractor
+from src.utils.html_parser import HAS_LXML, HTML_PARSER, DomCache, get_parse_stats, make_soup, reset_parse_stats
+from src.utils.pdf_downloader import PDFDownloader
+
+PAGE = """
+<html><head><title>Helping Hands Relief</title>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "NGO", "name": "Helping Hands Relief", "taxID": "12-3456789"}
+</script></head>
+<body><h1>Helping Hands Relief</h1>
+<p>Our mission is to provide emergency relief to families in need. EIN: 12-3456789</p>
+<a href="/about">About</a>
+<a href="/files/2023-annual-report.pdf">2023 Annual Report</a>
+<a href="/files/form-990-2022.pdf">Form 990 (2022)</a>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_parse_stats()
+    yield
+    reset_parse_stats()
+
+
+def test_make_soup_uses_lxml_and_records_stats():
+    soup = make_soup(PAGE, source="bbb")
+    make_soup(PAGE, source="bbb", parser="html.parser")
+
+    assert soup.find("h1").get_text() == "Helping Hands Relief"
+    assert HTML_PARSER == ("lxml" if HAS_LXML else "html.parser")
+    stats = get_parse_stats()
+    assert list(stats) == ["bbb"]
+    assert stats["bbb"]["parses"] == 2
+    assert stats["bbb"]["bytes"] == 2 * len(PAGE)
+
+
+def test_dom_cache_shares_trees_and_evicts_lru():
+    cache = DomCache(max_pages=2)
+    page = cache.get(PAGE)
+
+    assert cache.soup(PAGE) is page.soup
+    assert cache.get(PAGE).tree is page.tree
+    assert get_parse_stats()["website"]["parses"] == (2 if HAS_LXML else 1)
+
+    cache.get("<p>b</p>")
+    cache.get(PAGE)  # "<p>b</p>" is now least recently used
+    cache.get("<p>c</p>")
+
+    assert cache.get(PAGE) is page
+    assert cache.get_stats() == {"hits": 4, "misses": 3, "evictions": 1, "pages": 2}
+
+
+@pytest.mark.skipif(not HAS_LXML, reason="lxml not installed")
+def test_structured_data_from_shared_tree_matches_string_parse():
+    extractor = StructuredDataExtractor()
+    tree = DomCache(max_pages=1).get(PAGE).tree
+
+    assert extractor.extract(PAGE, "https://helpinghands.example/", tree=tree) == extractor.extract(
+        PAGE, "https://helpinghands.example/"
+    )
+
+
+def test_identify_pdfs_with_shared_soup_matches_own_parse(tmp_path):
+    downloader = PDFDownloader(tmp_path)
+    soup = DomCache(max_pages=1).soup(PAGE)
+
+    shared = downloader.identify_pdfs(PAGE, "https://helpinghands.example/", soup=soup)
+
+    assert shared == downloader.identify_pdfs(PAGE, "https://helpinghands.example/")
+    assert len(shared) == 2
+
+
+def test_extract_page_data_parses_page_once():
+    collector = WebsiteCollector(use_llm=False, max_pdf_downloads=0, use_playwright=False, content_scoring=False)
+
+    collector._dom_cache.soup(PAGE)  # the crawl loop parses the page for links first
+    collector._extract_page_data(PAGE, "https://helpinghands.example/")
+
+    assert collector._dom_cache.get_stats()["misses"] == 1
+    assert get_parse_stats()["website"]["parses"] == (2 if HAS_LXML else 1)
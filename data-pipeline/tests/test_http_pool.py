@@ -0,0 +1,78 @@
+"""Shared pooled HTTP clients: keep-alive reuse, per-loop async clients, stats."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.utils import http_pool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    http_pool.reset_pools()
+    yield
+    http_pool.reset_pools()
+
+
+def test_session_is_shared_and_reuses_connections(server):
+    session = http_pool.get_session()
+    assert http_pool.get_session() is session
+
+    for _ in range(5):
+        assert session.get(f"{server}/page", timeout=5).text == "ok"
+
+    stats = http_pool.get_pool_stats()["sync"]
+    host = server.removeprefix("http://")
+    assert stats[host]["requests"] == 5
+    assert stats[host]["connections_opened"] == 1
+
+
+def test_session_does_not_keep_cookies(server):
+    session = http_pool.get_session()
+    session.get(server, timeout=5)
+    assert len(session.cookies) == 0
+
+
+def test_async_client_is_shared_within_a_loop(server):
+    async def main():
+        client = http_pool.get_async_client()
+        assert http_pool.get_async_client() is client
+        responses = await asyncio.gather(*(client.get(f"{server}/{i}") for i in range(3)))
+        await http_pool.close_async_client()
+        return client, [r.text for r in responses]
+
+    first, texts = asyncio.run(main())
+    assert texts == ["ok"] * 3
+    assert first.is_closed
+    assert http_pool.get_pool_stats()["async"]["requests"] == {"127.0.0.1": 3}
+
+    async def other_loop():
+        return http_pool.get_async_client()
+
+    assert asyncio.run(other_loop()) is not first
@@ -0,0 +1,176 @@
+"""JudgeOrchestrator scheduling: concurrent LLM judges and charities, stable order, batched verdicts."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import src.db.repository as repository_module
+import src.judges.orchestrator as orchestrator_module
+from src.db.repository import JudgeVerdictRepository
+from src.judges.base_judge import BaseJudge, JudgeType
+from src.judges.orchestrator import JudgeOrchestrator
+from src.judges.schemas.config import JudgeConfig
+from src.judges.schemas.verdict import JudgeVerdict
+
+
+class _DeterministicJudge(BaseJudge):
+    name = "det"
+    judge_type = JudgeType.DETERMINISTIC
+
+    def validate(self, output, context):
+        return self.create_verdict(passed=bool(output.get("ein")))
+
+
+class _OtherDeterministicJudge(_DeterministicJudge):
+    name = "det2"
+
+
+class _SlowLLMJudge(BaseJudge):
+    judge_type = JudgeType.LLM
+
+    def __init__(self, config, name, tracker, delay=0.05):
+        super().__init__(config)
+        self._name = name
+        self.tracker = tracker
+        self.delay = delay
+
+    @property
+    def name(self):
+        return self._name
+
+    def validate(self, output, context):
+        self.tracker.enter()
+        try:
+            time.sleep(self.delay)
+        finally:
+            self.tracker.leave()
+        return self.create_verdict(passed=True, cost_usd=0.01, metadata={"summary": output["narrative"]["summary"]})
+
+
+class _ExplodingLLMJudge(_SlowLLMJudge):
+    def validate(self, output, context):
+        raise RuntimeError("model unavailable")
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def leave(self):
+        with self.lock:
+            self.active -= 1
+
+
+def _charity(ein, strategic=True):
+    charity = {"ein": ein, "name": f"Charity {ein}", "narrative": {"summary": "amal"}}
+    if strategic:
+        charity["strategic_narrative"] = {"summary": "strategic"}
+    return charity
+
+
+def _orchestrator(config, tracker, llm_names=("citation", "factual", "score", "zakat"), persist=False):
+    orch = JudgeOrchestrator(config, persist_verdicts=persist)
+    orch._judges = [
+        _DeterministicJudge(config),
+        *[_SlowLLMJudge(config, name, tracker) for name in llm_names],
+        _OtherDeterministicJudge(config),
+    ]
+    return orch
+
+
+def test_verdicts_keep_judge_and_variant_order():
+    config = JudgeConfig(sample_rate=1.0)
+    with _orchestrator(config, _ConcurrencyTracker()) as orch:
+        result = orch.validate_single(_charity("1"))
+
+    assert [v.judge_name for v in result.verdicts] == [
+        "det",
+        "citation",
+        "strategic_citation",
+        "factual",
+        "strategic_factual",
+        "score",
+        "strategic_score",
+        "zakat",
+        "det2",
+    ]
+    assert result.verdicts[2].metadata["summary"] == "strategic"
+    assert result.total_cost_usd == 7 * 0.01
+
+
+def test_llm_calls_overlap_within_per_model_cap():
+    tracker = _ConcurrencyTracker()
+    config = JudgeConfig(sample_rate=1.0, llm_concurrency_per_model=3, max_concurrent_charities=4)
+    with _orchestrator(config, tracker) as orch:
+        orch.validate_batch([_charity(str(i)) for i in range(4)])
+
+    assert tracker.peak == 3
+
+
+def test_judge_failure_becomes_error_verdict():
+    config = JudgeConfig(sample_rate=1.0)
+    orch = JudgeOrchestrator(config, persist_verdicts=False)
+    orch._judges = [_ExplodingLLMJudge(config, "citation", _ConcurrencyTracker())]
+    with orch:
+        result = orch.validate_single(_charity("1"))
+
+    assert [v.judge_name for v in result.verdicts] == ["citation", "strategic_citation"]
+    assert not result.passed
+    assert all(v.issues[0].field == "judge_execution" for v in result.verdicts)
+
+
+def test_batch_results_in_sample_order_and_verdicts_written_in_one_batch(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "_get_current_commit_hash", lambda: "abc123")
+    repo = MagicMock()
+    config = JudgeConfig(sample_rate=1.0, max_concurrent_charities=3)
+    charities = [_charity(str(i), strategic=i % 2 == 0) for i in range(6)]
+
+    with _orchestrator(config, _ConcurrencyTracker(), llm_names=("citation",), persist=True) as orch:
+        orch._verdict_repo = repo
+        batch = orch.validate_batch(charities)
+
+    assert [r.ein for r in batch.results] == [c["ein"] for c in charities]
+    repo.save_verdict.assert_not_called()
+    repo.save_verdicts_batch.assert_called_once()
+    rows, commit = repo.save_verdicts_batch.call_args.args
+    assert commit == "abc123"
+    assert [(r["charity_ein"], r["judge_name"]) for r in rows] == [
+        (r.ein, v.judge_name) for r in batch.results for v in r.verdicts
+    ]
+
+
+def test_deterministic_process_pool_matches_inline():
+    config = JudgeConfig(sample_rate=1.0, deterministic_workers=1)
+    charity = _charity("1", strategic=False)
+    with _orchestrator(config, _ConcurrencyTracker(), llm_names=()) as orch:
+        pooled = orch.validate_single(charity)
+        assert orch._deterministic_pool is not None
+
+    inline_config = JudgeConfig(sample_rate=1.0)
+    with _orchestrator(inline_config, _ConcurrencyTracker(), llm_names=()) as orch:
+        inline = orch.validate_single(charity)
+
+    assert pooled.verdicts == inline.verdicts
+    assert all(isinstance(v, JudgeVerdict) for v in pooled.verdicts)
+
+
+def test_save_verdicts_batch_is_one_multi_row_upsert(monkeypatch):
+    calls = []
+    monkeypatch.setattr(repository_module, "execute_many", lambda sql, params: calls.append((sql, params)))
+    monkeypatch.setattr(repository_module, "execute_query", MagicMock(side_effect=AssertionError("per-row write")))
+
+    rows = [{"charity_ein": str(i), "judge_name": "det", "passed": True, "issues": []} for i in range(3)]
+    assert JudgeVerdictRepository().save_verdicts_batch(rows, "abc123") == 3
+
+    assert len(calls) == 1
+    sql, params = calls[0]
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert [p[:4] for p in params] == [(str(i), "det", True, "[]") for i in range(3)]
+    assert all(p[4] == "abc123" for p in params)
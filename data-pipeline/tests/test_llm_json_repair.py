@@ -0,0 +1,113 @@
+"""Single-pass LLM JSON repair: individual repairs, truncation and streamed input."""
+
+import json
+
+import pytest
+
+from src.llm.json_repair import StreamingJsonRepairer, parse_llm_json, repair_json_text
+
+
+def kinds(result):
+    return [r.kind for r in result.repairs]
+
+
+def test_valid_json_is_untouched():
+    text = '{"name": "Helping Hands", "programs": [1, 2.5, null, true]}'
+    result = repair_json_text(text)
+    assert result.text == text
+    assert result.repairs == []
+    assert result.loads() == json.loads(text)
+
+
+def test_fence_and_surrounding_prose():
+    result = repair_json_text('Here is the JSON:\n```json\n{"k": "v"}\n```\nLet me know.')
+    assert result.loads() == {"k": "v"}
+    assert kinds(result) == ["leading_text", "trailing_text"]
+
+
+@pytest.mark.parametrize(
+    "text, expected, kind",
+    [
+        ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}, "trailing_comma"),
+        ('{"a": 1,, "b": 2}', {"a": 1, "b": 2}, "duplicate_comma"),
+        ('{"a": "line one\nline two"}', {"a": "line one\nline two"}, "control_char"),
+        ('{"a": "costs \\$5"}', {"a": "costs \\$5"}, "invalid_escape"),
+        ('{"a": [{"b": 1}}}', {"a": [{"b": 1}]}, "mismatched_bracket"),
+        ('{"a": True, "b": None}', {"a": True, "b": None}, "python_literal"),
+    ],
+)
+def test_repairs_are_reported(text, expected, kind):
+    result = repair_json_text(text)
+    assert result.loads() == expected
+    assert kind in kinds(result)
+    assert not result.truncated
+
+
+def test_repair_positions_point_into_original_text():
+    text = '{"a": 1, "b": [1, 2,]}'
+    (repair,) = repair_json_text(text).repairs
+    assert text[repair.position] == "]"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": 1, "b": 2, "c": 3, "d": "trunc', {"a": 1, "b": 2, "c": 3}),
+        ('{"a": {"b": {"c": [1, 2, 3', {"a": {"b": {"c": [1, 2]}}}),
+        ('{"ok": true, "items": [{"name": "4-star"}, {"name": "Plat', {"ok": True, "items": [{"name": "4-star"}]}),
+        ('{"ok": true, "items": [{"na', {"ok": True}),
+        ('{"ok": true, "conf', {"ok": True}),
+    ],
+)
+def test_truncated_input_keeps_complete_values(text, expected):
+    result = repair_json_text(text)
+    assert result.truncated
+    assert result.loads() == expected
+    assert kinds(result)[-1] == "truncated"
+
+
+def test_close_truncated_false_leaves_input_unparseable():
+    result = repair_json_text('{"summary": "half a sent', close_truncated=False)
+    assert result.truncated
+    with pytest.raises(json.JSONDecodeError):
+        result.loads()
+
+
+def test_fix_brackets_false_keeps_mismatch():
+    with pytest.raises(json.JSONDecodeError):
+        repair_json_text('{"a": [1}', fix_brackets=False).loads()
+
+
+def test_start_chars_restricts_top_level_value():
+    assert parse_llm_json('Options: [a, b]. Answer: {"pick": "a"}', start_chars="{") == {"pick": "a"}
+
+
+def test_no_json_raises():
+    assert repair_json_text("no json here").text is None
+    with pytest.raises(json.JSONDecodeError):
+        parse_llm_json("")
+
+
+def test_streamed_chunks_match_single_pass():
+    text = '```json\n{"summary": "Feeds \\"families\\"", "score": 42, "tags": ["food", "relief",],}\n```'
+    repairer = StreamingJsonRepairer()
+    for i in range(0, len(text), 3):
+        repairer.feed(text[i : i + 3])
+    streamed = repairer.finish()
+    single = repair_json_text(text)
+    assert streamed.text == single.text
+    assert [(r.kind, r.position) for r in streamed.repairs] == [(r.kind, r.position) for r in single.repairs]
+
+
+def test_completed_keys_and_snapshot_before_last_token():
+    repairer = StreamingJsonRepairer()
+    assert repairer.feed('{"summary": "Feeds fam') == []
+    assert repairer.snapshot() == {}
+    assert repairer.feed('ilies", "score": 4') == ["summary"]
+    # "4" may still be the start of "42"
+    assert repairer.snapshot() == {"summary": "Feeds families"}
+    assert repairer.feed('2, "tags": ["food"') == ["score"]
+    assert repairer.snapshot() == {"summary": "Feeds families", "score": 42, "tags": ["food"]}
+    assert repairer.feed("]}") == ["tags"]
+    assert repairer.done
+    assert repairer.finish().loads() == {"summary": "Feeds families", "score": 42, "tags": ["food"]}
@@ -0,0 +1,131 @@
+"""LLM response cache: content-addressed reuse, eviction, and budget accounting."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import src.llm.llm_client as llm_client_module
+from src.llm.budget_tracker import get_saved, get_spent, set_budget
+from src.llm.llm_client import LLMClient
+from src.llm.response_cache import LLMResponseCache, compute_cache_key
+
+
+def _fake_completion_response(content: str):
+    response = MagicMock()
+    choice = MagicMock()
+    choice.message.content = content
+    choice.finish_reason = "stop"
+    response.choices = [choice]
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 5
+    response.usage.prompt_tokens_details = None
+    response.usage.cache_read_input_tokens = None
+    response.usage.cache_creation_input_tokens = None
+    return response
+
+
+@pytest.fixture(autouse=True)
+def reset_budget():
+    set_budget(None)
+    yield
+    set_budget(None)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(path=tmp_path / "responses.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def completion_calls(monkeypatch):
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        return _fake_completion_response(f'{{"call": {len(calls)}}}')
+
+    monkeypatch.setattr(llm_client_module, "completion", fake_completion)
+    monkeypatch.setattr(llm_client_module, "completion_cost", lambda completion_response: 0.25)
+    return calls
+
+
+def test_identical_request_served_from_cache(cache, completion_calls):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=cache)
+
+    first = client.generate("hello", system_prompt="sys", json_mode=True)
+    second = LLMClient(model="gemini-3-flash-preview", response_cache=cache).generate(
+        "hello", system_prompt="sys", json_mode=True
+    )
+
+    assert len(completion_calls) == 1
+    assert second.text == first.text
+    assert second.cost_usd == 0.0
+    assert second.metadata["cache_hit"] is True
+    assert get_spent() == pytest.approx(0.25)
+    assert get_saved() == pytest.approx(0.25)
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 1
+
+
+def test_key_covers_generation_parameters(cache, completion_calls):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=cache)
+    client.generate("hello", temperature=0.1)
+    client.generate("hello", temperature=0.3)
+    client.generate("hello", temperature=0.1, max_tokens=100)
+    client.generate("hello", temperature=0.1, json_mode=True, json_schema={"type": "object"})
+    assert len(completion_calls) == 4
+
+
+def test_repeat_within_process_is_treated_as_retry(cache, completion_calls):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=cache)
+    client.generate("hello")  # miss -> stored
+    hit = client.generate("hello")  # hit
+    retry = client.generate("hello")  # caller rejected the hit and retried
+    assert hit.metadata.get("cache_hit") is True
+    assert "cache_hit" not in retry.metadata
+    assert len(completion_calls) == 2
+
+
+def test_use_cache_false_bypasses(cache, completion_calls):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=cache)
+    client.generate("hello", use_cache=False)
+    client.generate("hello", use_cache=False)
+    assert len(completion_calls) == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_truncated_responses_not_stored(cache):
+    key = compute_cache_key("m", "p", None, 0.1, False, None, None)
+    assert cache.put(key, {"text": "{\"partial\":", "finish_reason": "length"}) is False
+    assert cache.put(key, {"text": "   ", "finish_reason": "stop"}) is False
+    assert cache.get(key) is None
+
+
+def test_size_eviction_is_lru(tmp_path):
+    cache = LLMResponseCache(path=tmp_path / "c.sqlite3", max_bytes=400)
+    keys = [compute_cache_key("m", f"p{i}", None, 0.1, False, None, None) for i in range(3)]
+    cache.put(keys[0], {"text": "a" * 150, "finish_reason": "stop"})
+    cache.put(keys[1], {"text": "b" * 150, "finish_reason": "stop"})
+    cache.get(keys[0])  # keys[1] is now least recently used
+    cache.put(keys[2], {"text": "c" * 150, "finish_reason": "stop"})
+
+    stats = cache.get_stats()
+    assert stats["total_bytes"] <= 400
+    assert stats["evictions"] >= 1
+    cache._served_keys.clear()
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    cache.close()
+
+
+def test_age_eviction(tmp_path):
+    cache = LLMResponseCache(path=tmp_path / "c.sqlite3", max_age_days=1)
+    key = compute_cache_key("m", "p", None, 0.1, False, None, None)
+    cache.put(key, {"text": "old", "finish_reason": "stop"})
+    cache._conn.execute("UPDATE llm_responses SET created_at = ?", (time.time() - 2 * 86400,))
+    cache._conn.commit()
+    assert cache.get(key) is None
+    assert cache.get_stats()["entries"] == 0
+    cache.close()
@@ -0,0 +1,184 @@
+"""Streamed LLM generation: incremental schema checks, early cancellation and fallback."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel, Field
+
+import src.llm.llm_client as llm_client_module
+from src.llm.llm_client import LLMClient
+from src.llm.stream_validation import StreamingSchemaValidator, StreamValidationError, configure_streaming
+
+
+class Strength(BaseModel):
+    point: str
+    detail: str
+
+
+class Narrative(BaseModel):
+    headline: str = Field(max_length=20)
+    summary: str
+    strengths: list[Strength]
+    score: int = Field(ge=0, le=100)
+
+
+GOOD = '{"headline": "Feeds families", "summary": "Runs food banks.", "strengths": [{"point": "a", "detail": "b"}], "score": 80}'
+BAD = '{"headline": "Feeds families", "strengths": ["just a string"], "summary": "' + "x" * 5000 + '"}'
+
+
+def feed_all(validator, text, size=7):
+    for i in range(0, len(text), size):
+        validator.feed(text[i : i + size])
+
+
+def test_valid_stream_passes():
+    validator = StreamingSchemaValidator(Narrative)
+    feed_all(validator, GOOD)
+    assert validator.validated_fields == ["headline", "summary", "strengths", "score"]
+    assert validator.text == GOOD
+
+
+def test_wrong_shape_fails_as_soon_as_field_completes():
+    validator = StreamingSchemaValidator(Narrative)
+    with pytest.raises(StreamValidationError, match=r"strengths\.0") as exc:
+        feed_all(validator, BAD)
+    assert exc.value.chars_seen < 100
+
+
+def test_constraints_and_nulls_are_not_definite():
+    validator = StreamingSchemaValidator(Narrative)
+    feed_all(validator, '{"headline": "' + "h" * 50 + '", "summary": null, "score": 250}')
+    assert validator.validated_fields == ["headline", "summary", "score"]
+
+
+def test_fields_limits_what_is_checked():
+    validator = StreamingSchemaValidator(Narrative, fields=("headline",))
+    feed_all(validator, '{"headline": "ok", "strengths": ["free-form"]}')
+    assert validator.validated_fields == ["headline"]
+    with pytest.raises(ValueError):
+        StreamingSchemaValidator(Narrative, fields=("nope",))
+
+
+def test_preamble_limit_and_mismatched_bracket():
+    with pytest.raises(StreamValidationError, match="No JSON object"):
+        feed_all(StreamingSchemaValidator(Narrative, max_preamble_chars=50), "I'm sorry, " * 10)
+    with pytest.raises(StreamValidationError, match="Mismatched bracket"):
+        feed_all(StreamingSchemaValidator(Narrative), '{"strengths": [{"point": "a"}}')
+
+
+# =============================================================================
+# LLMClient streaming
+# =============================================================================
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def _built_response(chunks):
+    response = MagicMock()
+    choice = MagicMock()
+    choice.message.content = "".join(c.choices[0].delta.content for c in chunks)
+    choice.finish_reason = "stop"
+    response.choices = [choice]
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = len(chunks)
+    response.usage.prompt_tokens_details = None
+    response.usage.cache_read_input_tokens = None
+    response.usage.cache_creation_input_tokens = None
+    return response
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    """Fake streaming backend: model name -> response text; records chunks consumed per model."""
+    texts = {}
+    consumed = {}
+    spent = []
+
+    def fake_completion(**kwargs):
+        assert kwargs["stream"] is True
+        model = kwargs["model"]
+        consumed[model] = 0
+
+        def gen():
+            text = texts[model]
+            for i in range(0, len(text), 10):
+                consumed[model] += 1
+                yield _chunk(text[i : i + 10])
+
+        return gen()
+
+    monkeypatch.setattr(llm_client_module, "completion", fake_completion)
+    monkeypatch.setattr(llm_client_module, "stream_chunk_builder", lambda chunks, messages: _built_response(chunks))
+    monkeypatch.setattr(
+        llm_client_module,
+        "completion_cost",
+        lambda completion_response: 0.001 * completion_response.usage.completion_tokens,
+    )
+    monkeypatch.setattr(llm_client_module, "_budget_check", lambda: None)
+    monkeypatch.setattr(llm_client_module, "_budget_add_cost", spent.append)
+    configure_streaming(enabled=True)
+    yield SimpleNamespace(texts=texts, consumed=consumed, spent=spent)
+    configure_streaming(enabled=False)
+
+
+def _litellm_name(model):
+    return llm_client_module.MODEL_REGISTRY[model]["litellm_name"]
+
+
+def test_streamed_response_reports_time_to_first_token(streaming):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=None)
+    streaming.texts[_litellm_name("gemini-3-flash-preview")] = GOOD
+
+    response = client.generate("hi", json_mode=True, stream_schema=Narrative)
+
+    assert response.text == GOOD
+    assert response.metadata["streamed"] is True
+    assert response.metadata["time_to_first_token_ms"] >= 0
+
+
+def test_violation_cancels_stream_and_falls_back(streaming):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=None)
+    client.fallback_models = ["gemini-3.1-pro-preview"]
+    primary = _litellm_name("gemini-3-flash-preview")
+    fallback = _litellm_name("gemini-3.1-pro-preview")
+    streaming.texts[primary] = BAD
+    streaming.texts[fallback] = GOOD
+
+    response = client.generate("hi", json_mode=True, stream_schema=Narrative)
+
+    assert response.text == GOOD
+    assert response.model == "gemini-3.1-pro-preview"
+    # The primary stream was abandoned long before its 5000-char summary arrived
+    assert streaming.consumed[primary] < 10
+    assert streaming.spent[0] == pytest.approx(0.001 * streaming.consumed[primary])
+
+
+def test_violation_on_last_model_raises(streaming):
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=None)
+    streaming.texts[_litellm_name("gemini-3-flash-preview")] = BAD
+
+    with pytest.raises(StreamValidationError):
+        client.generate("hi", json_mode=True, stream_schema=Narrative)
+
+
+def test_streaming_disabled_uses_plain_completion(monkeypatch):
+    configure_streaming(enabled=False)
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        return _built_response([_chunk(GOOD)])
+
+    monkeypatch.setattr(llm_client_module, "completion", fake_completion)
+    monkeypatch.setattr(llm_client_module, "completion_cost", lambda completion_response: 0.0)
+    monkeypatch.setattr(llm_client_module, "_budget_check", lambda: None)
+    monkeypatch.setattr(llm_client_module, "_budget_add_cost", lambda cost: None)
+
+    client = LLMClient(model="gemini-3-flash-preview", response_cache=None)
+    response = client.generate("hi", stream_schema=Narrative)
+
+    assert "stream" not in calls[0]
+    assert "streamed" not in response.metadata
@@ -0,0 +1,81 @@
+"""Concurrent source fetching in DataCollectionOrchestrator.fetch_charity_data."""
+
+import threading
+from unittest.mock import MagicMock
+
+from src.collectors.base import FetchResult
+from src.collectors.orchestrator import DataCollectionOrchestrator
+
+SOURCES = ("propublica", "charity_navigator", "candid", "form990_grants", "bbb")
+
+
+def _make_orchestrator(concurrent: bool, fetch_side_effect=None) -> DataCollectionOrchestrator:
+    orch = DataCollectionOrchestrator.__new__(DataCollectionOrchestrator)
+    orch.logger = MagicMock()
+    orch.skip_sources = set()
+    orch.frozen_sources = set()
+    orch.concurrent_sources = concurrent
+    orch.blocked_sites = []
+    orch._blocked_sites_lock = threading.Lock()
+    orch.raw_data_repo = MagicMock()
+    orch.raw_data_repo.get_by_source.return_value = None  # not fresh, no backoff
+    orch.charity_repo = MagicMock()
+    orch._get_or_create_charity = lambda ein, name=None, website=None: ein
+
+    for source in SOURCES:
+        collector = MagicMock()
+        if fetch_side_effect is not None:
+            collector.fetch.side_effect = lambda *a, _s=source, **kw: fetch_side_effect(_s)
+        else:
+            collector.fetch.return_value = FetchResult(success=True, raw_data="x" * 1000, content_type="html")
+        setattr(orch, source, collector)
+
+    orch.website = MagicMock()
+    orch.website.collect_multi_page.return_value = (
+        True,
+        {"website_profile": {"name": "Test"}, "raw_content": "<html></html>"},
+        None,
+    )
+    return orch
+
+
+def _strip_timestamps(report: dict) -> dict:
+    report = dict(report)
+    report["timestamps"] = sorted(report["timestamps"])
+    return report
+
+
+def test_concurrent_report_matches_serial():
+    _, serial = _make_orchestrator(False).fetch_charity_data("12-3456789", website_url="https://example.org")
+    ok, concurrent = _make_orchestrator(True).fetch_charity_data("12-3456789", website_url="https://example.org")
+    assert ok is True
+    assert _strip_timestamps(concurrent) == _strip_timestamps(serial)
+    assert concurrent["sources_succeeded"] == [*SOURCES, "website"]
+
+
+def test_concurrent_mode_overlaps_sources():
+    # Every source blocks until all five are in flight; serial execution would time out.
+    barrier = threading.Barrier(len(SOURCES), timeout=5)
+
+    def fetch(source):
+        barrier.wait()
+        return FetchResult(success=True, raw_data="x" * 1000, content_type="html")
+
+    orch = _make_orchestrator(True, fetch_side_effect=fetch)
+    ok, report = orch.fetch_charity_data("12-3456789", website_url="https://example.org")
+    assert ok is True
+    assert not barrier.broken
+
+
+def test_concurrent_failures_keep_source_order():
+    def fetch(source):
+        if source in ("candid", "bbb"):
+            return FetchResult(success=False, raw_data=None, content_type="html", error=f"{source} not found")
+        return FetchResult(success=True, raw_data="x" * 1000, content_type="html")
+
+    orch = _make_orchestrator(True, fetch_side_effect=fetch)
+    ok, report = orch.fetch_charity_data("12-3456789", website_url="https://example.org")
+    assert ok is False
+    assert list(report["sources_failed"]) == ["candid", "bbb"]
+    assert report["missing_required_sources"] == ["candid"]
+    assert orch.raw_data_repo.increment_retry_count.call_count == 2
@@ -0,0 +1,91 @@
+"""Crawled-page reuse: PageStore eviction and no re-fetching in collect_multi_page."""
+
+from contextlib import nullcontext
+
+import pytest
+from src.collectors import web_collector
+from src.collectors.web_collector import WebsiteCollector
+from src.utils.crawler_cache import CrawlerCache
+from src.utils.page_store import PageStore
+
+HOMEPAGE = """
+<html><head><title>Helping Hands Relief</title></head>
+<body><h1>Helping Hands Relief</h1>
+<p>Our mission is to provide emergency relief to families in need. EIN: 12-3456789</p>
+<a href="/about">About</a></body></html>
+"""
+
+
+def test_page_store_evicts_lru_over_byte_cap():
+    store = PageStore(max_bytes=250)
+    store.put("a", "a" * 100)
+    store.put("b", "b" * 100)
+    assert store.get("a") == ("a" * 100, "a")  # "b" is now least recently used
+    store.put("c", "c" * 100, final_url="https://c/")
+
+    assert "b" not in store
+    assert store.get("c") == ("c" * 100, "https://c/")
+    stats = store.get_stats()
+    assert stats["evictions"] == 1 and stats["pages"] == 2 and stats["total_bytes"] == 200
+
+
+def test_page_store_rejects_page_larger_than_cap():
+    store = PageStore(max_bytes=10)
+    assert store.put("big", "x" * 11) is False
+    assert len(store) == 0
+
+
+@pytest.fixture
+def collector(monkeypatch, tmp_path):
+    # Keep the crawler cache (SQLite page store, per-host state) out of the repo's shared/ dir
+    monkeypatch.setattr(
+        web_collector, "CrawlerCache", lambda cache_dir, **kwargs: CrawlerCache(cache_dir=tmp_path, **kwargs)
+    )
+    collector = WebsiteCollector(use_llm=False, max_pdf_downloads=0, use_playwright=False, content_scoring=False)
+    monkeypatch.setattr(collector, "_discover_urls_from_sitemap", lambda url, max_pages: (False, []))
+    monkeypatch.setattr(collector, "_host_slot", lambda url: nullcontext())
+
+    async def fake_fetch_async(client, url, semaphore):
+        if url.rstrip("/") == "https://helpinghands.example":
+            return url, True, HOMEPAGE, url, None
+        return url, False, None, None, "HTTP 404"
+
+    monkeypatch.setattr(collector, "_fetch_url_async", fake_fetch_async)
+    return collector
+
+
+def test_homepage_comes_from_crawl_not_a_refetch(collector, monkeypatch):
+    fetches = []
+
+    def fake_fetch(url, **kwargs):
+        fetches.append(url)
+        return False, None, None, "unexpected fetch"
+
+    monkeypatch.setattr(collector, "_fetch_url", fake_fetch)
+
+    success, data, error = collector.collect_multi_page("https://helpinghands.example/")
+
+    assert success is True, error
+    assert fetches == []
+    assert data["raw_content"] == HOMEPAGE
+    assert data["crawl_stats"]["page_store"]["hits"] >= 1
+
+
+def test_page_store_miss_falls_back_to_fetch(collector, monkeypatch):
+    fetches = []
+
+    def fake_fetch(url, **kwargs):
+        fetches.append(url)
+        return True, "<html>fresh</html>", url, None
+
+    monkeypatch.setattr(collector, "_fetch_url", fake_fetch)
+    collector._page_store = PageStore(1024)
+
+    assert collector._fetch_crawled_page("https://other.example/x") == (
+        True,
+        "<html>fresh</html>",
+        "https://other.example/x",
+        None,
+    )
+    assert collector._fetch_crawled_page("https://other.example/x")[1] == "<html>fresh</html>"
+    assert fetches == ["https://other.example/x"]
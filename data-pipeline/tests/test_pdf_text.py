@@ -0,0 +1,160 @@
+"""PDF text extraction: process pool, page limits, deadlines, and the file-hash cache."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+from src.parsers.form_990_parser import Form990Parser
+from src.utils import pdf_text
+from src.utils.pdf_downloader import PDFDownloader
+from src.utils.pdf_text import PdfTextExtractor
+
+
+def _make_pdf(path, page_texts):
+    """Write a minimal valid PDF with one line of Helvetica text per page."""
+    n = len(page_texts)
+    font_id = 3 + 2 * n
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(n))}] /Count {n} >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(out)
+    return path
+
+
+@pytest.fixture
+def report(tmp_path):
+    return _make_pdf(tmp_path / "report.pdf", [f"Annual report page {i + 1}" for i in range(5)])
+
+
+def test_inline_extraction_respects_page_limit(report):
+    result = PdfTextExtractor(workers=0).extract(report, max_pages=2)
+
+    assert result.page_count == 5
+    assert result.pages == ["Annual report page 1", "Annual report page 2"]
+    assert not result.complete
+    assert result.text(page_markers=True).startswith("--- PAGE 1 ---\nAnnual report page 1")
+
+
+def test_process_pool_matches_inline(report):
+    pooled = PdfTextExtractor(workers=1)
+    try:
+        result = pooled.extract(report)
+    finally:
+        pooled.close()
+
+    assert result == PdfTextExtractor(workers=0).extract(report)
+    assert result.complete and result.pages[-1] == "Annual report page 5"
+
+
+def test_hard_timeout_counts_from_task_start_not_submit(monkeypatch):
+    # One worker, three 0.6s tasks: the last waits ~1.2s in the queue, past the 0.8s budget
+    monkeypatch.setattr(pdf_text, "_HARD_TIMEOUT_GRACE_SECONDS", 0.8)
+    monkeypatch.setattr(pdf_text, "_WAIT_POLL_SECONDS", 0.05)
+    pooled = PdfTextExtractor(workers=1, timeout=0)
+    try:
+        pooled._call_in_pool(time.sleep, 0)  # warm the worker up so spawn time isn't in play
+        with ThreadPoolExecutor(max_workers=3) as callers:
+            results = list(callers.map(lambda _: pooled._call_in_pool(time.sleep, 0.6), range(3)))
+    finally:
+        pooled.close()
+
+    assert results == [None, None, None]
+    assert pooled.get_stats()["pool_restarts"] == 0
+
+
+def test_hard_timeout_recycles_pool_for_overrunning_task(monkeypatch):
+    monkeypatch.setattr(pdf_text, "_HARD_TIMEOUT_GRACE_SECONDS", 0.3)
+    monkeypatch.setattr(pdf_text, "_WAIT_POLL_SECONDS", 0.05)
+    pooled = PdfTextExtractor(workers=1, timeout=0)
+    try:
+        with pytest.raises(FutureTimeoutError):
+            pooled._call_in_pool(time.sleep, 30)
+    finally:
+        pooled.close()
+
+    assert pooled.get_stats()["pool_restarts"] == 1
+
+
+def test_results_cached_by_file_hash(report, tmp_path, monkeypatch):
+    extractor = PdfTextExtractor(workers=0, cache_dir=tmp_path / "cache")
+    file_hash = PDFDownloader.calculate_file_hash(report)
+    first = extractor.extract(report, file_hash=file_hash)
+
+    def fail(*args):
+        raise AssertionError("re-extracted a cached PDF")
+
+    monkeypatch.setattr(pdf_text, "_extract_pages", fail)
+    # A copy under another name has the same hash, so it is a cache hit too
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(report.read_bytes())
+
+    assert extractor.extract(copy).pages == first.pages
+    assert extractor.extract(report, max_pages=2, file_hash=file_hash).pages == first.pages[:2]
+    assert extractor.get_stats() == {"extracted": 1, "cache_hits": 2, "timeouts": 0, "errors": 0, "pool_restarts": 0}
+
+
+def test_partial_result_not_cached_and_more_pages_re_extracted(report, tmp_path):
+    extractor = PdfTextExtractor(workers=0, cache_dir=tmp_path / "cache")
+    assert len(extractor.extract(report, max_pages=2).pages) == 2
+    assert len(extractor.extract(report, max_pages=4).pages) == 4
+    assert extractor.get_stats()["extracted"] == 2
+
+    timed_out = PdfTextExtractor(workers=0, timeout=-1, cache_dir=tmp_path / "other").extract(report)
+    assert timed_out.timed_out and timed_out.pages == []
+    assert list((tmp_path / "other").iterdir()) == []
+
+
+def test_unreadable_pdf_reports_error(tmp_path):
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+
+    result = PdfTextExtractor(workers=0).extract(bad)
+
+    assert result.error and result.pages == []
+
+
+def test_form_990_parser_reads_pages_from_extractor(tmp_path, monkeypatch):
+    pdf = _make_pdf(tmp_path / "990.pdf", ["Form 990-EZ Short Form", "Part III"])
+    monkeypatch.setattr(pdf_text, "_extractor", PdfTextExtractor(workers=0))
+
+    data = Form990Parser().parse_pdf(pdf)
+
+    assert data.page_count == 2
+    assert data.form_variant == "990-EZ"
+
+
+def test_form_990_parser_reads_past_default_page_limit(tmp_path, monkeypatch):
+    pages = ["Form 990 Return"] + [f"Continuation {i}" for i in range(4)] + ["Schedule O Supplemental"]
+    pdf = _make_pdf(tmp_path / "990.pdf", pages)
+    monkeypatch.setattr(pdf_text, "_extractor", PdfTextExtractor(workers=0, max_pages=2))
+
+    data = Form990Parser().parse_pdf(pdf)
+
+    assert data is not None and data.page_count == 6
+
+
+def test_form_990_parser_rejects_timed_out_extraction(tmp_path, monkeypatch):
+    pdf = _make_pdf(tmp_path / "990.pdf", ["Form 990 Return", "Part III"])
+    monkeypatch.setattr(pdf_text, "_extractor", PdfTextExtractor(workers=0, timeout=-1))
+
+    assert Form990Parser().parse_pdf(pdf) is None
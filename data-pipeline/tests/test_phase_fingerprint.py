@@ -0,0 +1,54 @@
+"""Code fingerprint memoization and change explanations."""
+
+import os
+
+import pytest
+
+from src.utils import phase_fingerprint as pf
+
+
+@pytest.fixture
+def phase_tree(tmp_path, monkeypatch):
+    base = tmp_path / "data-pipeline"
+    base.mkdir()
+    (base / "a.py").write_text("A = 1\n")
+    (base / "b.py").write_text("B = 1\n")
+    monkeypatch.setitem(pf.PHASE_CODE_FILES, "testphase", ["a.py", "b.py"])
+    monkeypatch.setenv("AMAL_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setattr(pf, "_fingerprint_memo", {})
+    monkeypatch.setattr(pf, "_digest_records", {})
+    return base
+
+
+def test_fingerprint_matches_concatenated_hash(phase_tree):
+    import hashlib
+
+    expected = hashlib.sha256(b"A = 1\nB = 1\n").hexdigest()[:16]
+    assert pf.compute_code_fingerprint("testphase", phase_tree) == expected
+
+
+def test_unchanged_files_are_not_reread(phase_tree, monkeypatch):
+    pf.compute_code_fingerprint("testphase", phase_tree)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file re-read despite unchanged stat")
+
+    monkeypatch.setattr(pf.Path, "read_bytes", fail)
+    pf.compute_code_fingerprint("testphase", phase_tree)
+
+
+def test_edit_invalidates_and_is_explained(phase_tree):
+    old = pf.compute_code_fingerprint("testphase", phase_tree)
+    target = phase_tree / "b.py"
+    target.write_text("B = 2  # changed\n")
+    os.utime(target, ns=(1, 1))  # force a distinct mtime even on coarse clocks
+
+    new = pf.compute_code_fingerprint("testphase", phase_tree)
+    assert new != old
+    assert pf.explain_fingerprint_change("testphase", old, phase_tree) == ["b.py"]
+    assert pf.explain_fingerprint_change("testphase", "unknownfp", phase_tree) == []
+
+
+def test_precompute_covers_every_phase(phase_tree):
+    fingerprints = pf.precompute_code_fingerprints(phase_tree)
+    assert set(fingerprints) == set(pf.PHASE_CODE_FILES)
@@ -0,0 +1,140 @@
+"""Token-bucket rate limiter: burst, non-convoy waits, 429 adaptation and counters."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import src.utils.rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+
+def test_burst_then_sustained_rate(clock):
+    limiter = TokenBucketRateLimiter({"api": (2.0, 3)})
+    waits = [limiter.acquire("api") for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.5)
+    assert waits[4] == pytest.approx(0.5)
+
+
+def test_unconfigured_domain_uses_fixed_delay(clock):
+    limiter = TokenBucketRateLimiter({})
+    assert limiter.wait("other", 2.0) == 0.0
+    assert limiter.wait("other", 2.0) == pytest.approx(2.0)
+    clock.now += 5
+    assert limiter.wait("other", 2.0) == 0.0
+
+
+def test_waiters_do_not_hold_the_lock():
+    # The old limiter slept under the domain lock, so every other caller
+    # queued behind a sleeping thread. Now a waiter only holds the lock
+    # while reserving its slot.
+    limiter = TokenBucketRateLimiter({"api": (2.0, 1)})
+    limiter.acquire("api")
+    sleeper = threading.Thread(target=limiter.acquire, args=("api",))
+    sleeper.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    stats = limiter.get_stats("api")
+    reserved = limiter._reserve("api", None)
+    elapsed = time.monotonic() - start
+    sleeper.join()
+
+    assert elapsed < 0.1
+    assert stats["acquisitions"] == 2 and stats["waits"] == 1
+    assert reserved == pytest.approx(0.95, abs=0.05)  # third slot, one interval after the sleeper's
+
+
+def test_report_rate_limited_pauses_and_halves_rate(clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter_module, "RATE_LIMIT_RECOVERY_SECONDS", 100)
+    limiter = TokenBucketRateLimiter({"api": (1.0, 5)})
+    limiter.acquire("api")
+
+    assert limiter.report_rate_limited("api", "30") == 30.0
+    assert limiter.acquire("api") == pytest.approx(32.0)  # 30s pause + one token at 0.5/s
+    assert limiter.get_stats("api")["rate"] == pytest.approx(0.5)
+
+    clock.now += 100
+    limiter.acquire("api")
+    assert limiter.get_stats("api")["rate"] == pytest.approx(1.0)
+
+
+def test_rate_factor_has_a_floor(clock):
+    limiter = TokenBucketRateLimiter({"api": (8.0, 1)})
+    for _ in range(10):
+        limiter.report_rate_limited("api", 0)
+    assert limiter.get_stats("api")["rate"] == pytest.approx(8.0 * rate_limiter_module.RATE_LIMIT_MIN_RATE_FACTOR)
+
+
+def test_acquire_async_does_not_block_event_loop():
+    limiter = TokenBucketRateLimiter({"api": (10.0, 1)})
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        waits = [await limiter.acquire_async("api") for _ in range(3)]
+        task.cancel()
+        return waits, ticks
+
+    waits, ticks = asyncio.run(main())
+    assert waits[0] == 0.0 and waits[1] > 0
+    assert ticks >= 5
+
+
+def test_stats_and_reset(clock):
+    limiter = TokenBucketRateLimiter({"api": (1.0, 1)})
+    limiter.acquire("api")
+    limiter.acquire("api")
+    limiter.report_rate_limited("api")
+
+    stats = limiter.get_stats()["api"]
+    assert stats["acquisitions"] == 2
+    assert stats["waits"] == 1
+    assert stats["total_wait_seconds"] == pytest.approx(1.0)
+    assert stats["rate_limited"] == 1
+    assert stats["paused_seconds_remaining"] == rate_limiter_module.RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS
+
+    limiter.reset("api")
+    assert limiter.get_stats() == {}
+    assert limiter.acquire("api") == 0.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_configure_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter().configure("api", 0)
@@ -0,0 +1,106 @@
+"""raw_content compression: codec round-trips and transparent encode/decode in RawDataRepository."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.db import raw_codec
+from src.db.raw_codec import decode_raw_content, encode_raw_content, stored_codec
+from src.db.repository import RawDataRepository
+
+EIN = "12-3456789"
+HTML = "<html><body>" + "<p>Feeding families in need since 1998.</p>" * 400 + "</body></html>"
+
+
+@pytest.fixture
+def gzip_enabled(monkeypatch):
+    monkeypatch.setenv("RAW_CONTENT_COMPRESSION", "gzip")
+
+
+def test_gzip_round_trip_is_smaller():
+    encoded = encode_raw_content(HTML, "gzip")
+    assert stored_codec(encoded) == "gzip"
+    assert len(encoded) * 5 < len(HTML)
+    assert decode_raw_content(encoded) == HTML
+
+
+def test_plain_and_small_values_pass_through(monkeypatch):
+    monkeypatch.delenv("RAW_CONTENT_COMPRESSION", raising=False)
+    assert encode_raw_content(HTML) == HTML
+    assert encode_raw_content("<html>tiny</html>", "gzip") == "<html>tiny</html>"
+    assert decode_raw_content(HTML) == HTML
+    assert decode_raw_content(None) is None
+
+
+def test_zstd_falls_back_to_gzip_without_zstandard(monkeypatch):
+    monkeypatch.setattr(raw_codec, "HAS_ZSTD", False)
+    monkeypatch.setenv("RAW_CONTENT_COMPRESSION", "zstd")
+    assert raw_codec.configured_codec() == "gzip"
+    assert stored_codec(encode_raw_content(HTML)) == "gzip"
+
+
+def test_unknown_codec_rejected(monkeypatch):
+    monkeypatch.setenv("RAW_CONTENT_COMPRESSION", "lz4")
+    with pytest.raises(ValueError):
+        raw_codec.configured_codec()
+
+
+def test_writes_store_encoded_content(gzip_enabled):
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query") as mock_execute:
+        repo.store_raw(EIN, "website", HTML)
+        repo.upsert(EIN, "website", {"mission": "x"}, raw_content=HTML)
+
+    stored = []
+    for call in mock_execute.call_args_list:
+        sql, params = call.args
+        columns = [c.strip() for c in sql.split("(", 1)[1].split(")", 1)[0].split(",")]
+        stored.append(params[columns.index("raw_content")])
+    assert [stored_codec(s) for s in stored] == ["gzip", "gzip"]
+    assert all(decode_raw_content(s) == HTML for s in stored)
+
+
+def test_reads_decode_compressed_and_plain_rows():
+    rows = [
+        {"charity_ein": EIN, "source": "website", "raw_content": encode_raw_content(HTML, "gzip"), "parsed_json": None},
+        {"charity_ein": EIN, "source": "propublica", "raw_content": '{"filings": []}', "parsed_json": None},
+    ]
+    with patch("src.db.repository.execute_query", return_value=rows):
+        result = RawDataRepository().get_all(include_raw_content=True)
+
+    assert [r["raw_content"] for r in result] == [HTML, '{"filings": []}']
+
+
+def test_recompress_skips_rows_already_encoded_and_reports_stats():
+    table = {
+        "a": {"id": "a", "source": "website", "raw_content": HTML},
+        "b": {"id": "b", "source": "website", "raw_content": encode_raw_content(HTML, "gzip")},
+        "c": {"id": "c", "source": "propublica", "raw_content": "{}"},
+    }
+
+    def fake_query(sql, params=None, fetch="all"):
+        last_id, limit = params
+        return [dict(table[k]) for k in sorted(table) if k > last_id][:limit]
+
+    def fake_many(sql, params_list):
+        for value, row_id in params_list:
+            table[row_id]["raw_content"] = value
+
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query", side_effect=fake_query), patch(
+        "src.db.repository.execute_many", side_effect=fake_many
+    ) as mock_many:
+        assert repo.recompress_raw_content("gzip", batch_size=2) == {"scanned": 3, "rewritten": 1}
+        mock_many.assert_called_once()
+        stats = repo.get_compression_stats(batch_size=2)
+
+    assert stats["website"]["rows"] == 2 and stats["website"]["compressed_rows"] == 2
+    assert stats["website"]["original_bytes"] == 2 * len(HTML)
+    assert stats["website"]["ratio"] > 5
+    assert stats["propublica"] == {
+        "rows": 1,
+        "compressed_rows": 0,
+        "stored_bytes": 2,
+        "original_bytes": 2,
+        "ratio": 1.0,
+    }
@@ -4,8 +4,9 @@ A failed crawl must never clobber parsed_json/raw_content from a previous
 successful crawl. Failures record success=False, error_message,
 last_failure_reason, and an incremented retry_count instead.
 
-These tests mock src.db.repository.execute_query (no live Dolt needed):
-call 1 = the get_by_source SELECT, call 2 = the UPDATE/INSERT under test.
+Writes are single INSERT ... ON DUPLICATE KEY UPDATE statements, so these
+tests inspect the insert values and the update clause of that statement.
+They mock src.db.repository.execute_query (no live Dolt needed).
 NOTE: the patch target is src.db.repository.execute_query (the name as
 imported into the repository module), NOT src.db.client.execute_query.
 """
@@ -13,18 +14,13 @@ imported into the repository module), NOT src.db.client.execute_query.
 import json
 from unittest.mock import patch
 
+import pytest
+
 from src.db.repository import RawDataRepository
 
 EIN = "12-3456789"
 
 
-def _set_clause_map(sql: str, params: tuple) -> dict:
-    """Map UPDATE set-clause column names to their bound values."""
-    set_part = sql.split(" SET ", 1)[1].split(" WHERE ", 1)[0]
-    cols = [seg.split("=")[0].strip() for seg in set_part.split(",") if "%s" in seg]
-    return dict(zip(cols, params))
-
-
 def _insert_map(sql: str, params: tuple) -> dict:
     """Map INSERT column names to their bound values."""
     cols_part = sql.split("(", 1)[1].split(")", 1)[0]
@@ -32,6 +28,29 @@ def _insert_map(sql: str, params: tuple) -> dict:
     return dict(zip(cols, params))
 
 
+def _update_clause(sql: str) -> list[tuple[str, str]]:
+    """Ordered (column, expression) pairs from the ON DUPLICATE KEY UPDATE clause."""
+    clause = sql.split("ON DUPLICATE KEY UPDATE", 1)[1]
+    pairs, depth, current = [], 0, ""
+    for ch in clause:
+        depth += ch == "("
+        depth -= ch == ")"
+        if ch == "," and depth == 0:
+            pairs.append(current)
+            current = ""
+        else:
+            current += ch
+    pairs.append(current)
+    return [(p.split("=", 1)[0].strip(), p.split("=", 1)[1].strip()) for p in pairs]
+
+
+def _single_write(mock_execute) -> tuple[str, tuple]:
+    assert mock_execute.call_count == 1, "upsert must be a single round-trip"
+    sql, params = mock_execute.call_args[0][0], mock_execute.call_args[0][1]
+    assert sql.startswith("INSERT INTO raw_scraped_data")
+    return sql, params
+
+
 def _success_row() -> dict:
     return {
         "id": "uuid-1",
@@ -46,81 +65,33 @@ def _success_row() -> dict:
     }
 
 
-def _failed_row(retry_count: int = 1) -> dict:
-    return {
-        "id": "uuid-1",
-        "charity_ein": EIN,
-        "source": "website",
-        "parsed_json": "{}",
-        "raw_content": None,
-        "success": 0,
-        "error_message": "old error",
-        "retry_count": retry_count,
-        "last_failure_reason": "old error",
-    }
-
-
-def test_failure_update_preserves_previous_success_content():
+def test_failure_write_guards_previous_success_content():
     """_store_failed_crawl-style write must not clobber last-good parsed_json."""
     repo = RawDataRepository()
     with patch("src.db.repository.execute_query") as mock_execute:
-        mock_execute.side_effect = [_success_row(), None]
         repo.upsert(
             charity_ein=EIN,
             source="website",
             parsed_json={},
             success=False,
             error_message="captcha_blocked",
+            raw_content="<html>challenge</html>",
         )
-        sql, params = mock_execute.call_args_list[1][0][0], mock_execute.call_args_list[1][0][1]
-        assert sql.startswith("UPDATE raw_scraped_data")
-        m = _set_clause_map(sql, params)
-        assert "parsed_json" not in m
-        assert "raw_content" not in m
-        assert m["success"] is False
-        assert m["error_message"] == "captcha_blocked"
-
-
-def test_failure_update_records_reason_and_increments_retry():
-    repo = RawDataRepository()
-    with patch("src.db.repository.execute_query") as mock_execute:
-        mock_execute.side_effect = [_success_row(), None]
-        repo.upsert(
-            charity_ein=EIN,
-            source="website",
-            parsed_json={},
-            success=False,
-            error_message="captcha_blocked",
-        )
-        sql, params = mock_execute.call_args_list[1][0][0], mock_execute.call_args_list[1][0][1]
-        m = _set_clause_map(sql, params)
-        assert m["last_failure_reason"] == "captcha_blocked"
-        assert m["retry_count"] == 1  # previous successful row had retry_count 0
-
-
-def test_failure_over_failure_still_writes_parsed_json():
-    """Chosen semantics: partial parsed data may replace a previous failure's
-    empty payload — only a previous SUCCESS is protected."""
-    repo = RawDataRepository()
-    with patch("src.db.repository.execute_query") as mock_execute:
-        mock_execute.side_effect = [_failed_row(retry_count=1), None]
-        repo.upsert(
-            charity_ein=EIN,
-            source="charity_navigator",
-            parsed_json={"cn_profile": {"score": 90}},
-            success=False,
-            error_message="Empty or failed data",
-        )
-        sql, params = mock_execute.call_args_list[1][0][0], mock_execute.call_args_list[1][0][1]
-        m = _set_clause_map(sql, params)
-        assert json.loads(m["parsed_json"]) == {"cn_profile": {"score": 90}}
-        assert m["retry_count"] == 2
-
-
-def test_failure_insert_sets_reason_and_retry():
+        sql, params = _single_write(mock_execute)
+        updates = _update_clause(sql)
+        cols = [c for c, _ in updates]
+        expr = dict(updates)
+        assert expr["parsed_json"] == "IF(success, parsed_json, VALUES(parsed_json))"
+        assert expr["raw_content"] == "IF(success, raw_content, VALUES(raw_content))"
+        # Guards must read the old `success` before it is overwritten
+        assert cols.index("parsed_json") < cols.index("success")
+        assert cols.index("raw_content") < cols.index("success")
+        assert _insert_map(sql, params)["success"] is False
+
+
+def test_failure_write_records_reason_and_increments_retry_in_sql():
     repo = RawDataRepository()
     with patch("src.db.repository.execute_query") as mock_execute:
-        mock_execute.side_effect = [None, None]
         repo.upsert(
             charity_ein=EIN,
             source="website",
@@ -128,18 +99,20 @@ def test_failure_insert_sets_reason_and_retry():
             success=False,
             error_message="Unknown error",
         )
-        sql, params = mock_execute.call_args_list[1][0][0], mock_execute.call_args_list[1][0][1]
-        assert sql.startswith("INSERT INTO raw_scraped_data")
+        sql, params = _single_write(mock_execute)
         m = _insert_map(sql, params)
         assert m["last_failure_reason"] == "Unknown error"
-        assert m["retry_count"] == 1
+        assert m["retry_count"] == 1  # fresh insert
+        expr = dict(_update_clause(sql))
+        assert expr["retry_count"] == "COALESCE(retry_count, 0) + 1"
+        assert expr["last_failure_reason"] == "VALUES(last_failure_reason)"
+        assert "raw_content" not in expr
 
 
-def test_success_update_still_writes_content_and_resets_retry():
-    """Regression guard: the success path is unchanged."""
+def test_success_write_overwrites_content_and_resets_retry():
+    """Regression guard: the success path still writes content unconditionally."""
     repo = RawDataRepository()
     with patch("src.db.repository.execute_query") as mock_execute:
-        mock_execute.side_effect = [_failed_row(retry_count=2), None]
         repo.upsert(
             charity_ein=EIN,
             source="website",
@@ -147,20 +120,103 @@ def test_success_update_still_writes_content_and_resets_retry():
             success=True,
             raw_content="<html>fresh</html>",
         )
-        sql, params = mock_execute.call_args_list[1][0][0], mock_execute.call_args_list[1][0][1]
-        m = _set_clause_map(sql, params)
+        sql, params = _single_write(mock_execute)
+        m = _insert_map(sql, params)
         assert json.loads(m["parsed_json"]) == {"website_profile": {"mission": "x"}}
         assert m["raw_content"] == "<html>fresh</html>"
-        assert m["retry_count"] == 0
-        assert "last_failure_reason" not in m
+        expr = dict(_update_clause(sql))
+        assert expr["parsed_json"] == "VALUES(parsed_json)"
+        assert expr["raw_content"] == "VALUES(raw_content)"
+        assert expr["retry_count"] == "0"
+        assert "last_failure_reason" not in expr
 
 
-def test_increment_retry_count_writes_last_failure_reason():
+def test_success_write_without_reset_keeps_retry_count():
     repo = RawDataRepository()
     with patch("src.db.repository.execute_query") as mock_execute:
-        mock_execute.side_effect = [_failed_row(retry_count=1), None]
+        repo.upsert(charity_ein=EIN, source="website", parsed_json={}, success=True, reset_retry=False)
+        sql, _ = _single_write(mock_execute)
+        assert "retry_count" not in dict(_update_clause(sql))
+
+
+def test_increment_retry_count_is_atomic_and_returns_new_count():
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query") as mock_execute:
+        mock_execute.side_effect = [None, {"charity_ein": EIN, "source": "bbb", "retry_count": 2}]
         new_count = repo.increment_retry_count(EIN, "bbb", "BBB profile not found")
         assert new_count == 2
-        sql, params = mock_execute.call_args_list[1][0][0], mock_execute.call_args_list[1][0][1]
-        assert "last_failure_reason = %s" in sql
+        sql, params = mock_execute.call_args_list[0][0]
+        assert "retry_count = COALESCE(retry_count, 0) + 1" in sql
+        assert "last_failure_reason = VALUES(last_failure_reason)" in sql
         assert "BBB profile not found" in params
+        assert "raw_content" not in mock_execute.call_args_list[1][0][0]
+
+
+def test_store_raw_is_single_statement():
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query") as mock_execute:
+        repo.store_raw(EIN, "propublica", '{"organization": {}}')
+        sql, params = _single_write(mock_execute)
+        expr = dict(_update_clause(sql))
+        assert expr["raw_content"] == "VALUES(raw_content)"
+        assert expr["retry_count"] == "0"
+        assert "error_message" not in expr
+
+
+def _metadata_row() -> dict:
+    row = _success_row()
+    row.pop("raw_content")
+    return row
+
+
+def test_reads_do_not_select_raw_content_by_default():
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query") as mock_execute:
+        mock_execute.return_value = [_metadata_row()]
+        rows = repo.get_for_charity(EIN)
+        sql = mock_execute.call_args[0][0]
+        assert "raw_content" not in sql
+        assert "SELECT *" not in sql
+        assert rows[0]["parsed_json"] == {"website_profile": {"mission": "Feed people"}}
+
+
+def test_raw_content_is_loaded_lazily_once():
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query") as mock_execute:
+        mock_execute.side_effect = [_metadata_row(), {"raw_content": "<html>good</html>"}]
+        row = repo.get_by_source(EIN, "website")
+        assert mock_execute.call_count == 1
+        assert row.get("raw_content") == "<html>good</html>"
+        assert row["raw_content"] == "<html>good</html>"
+        assert mock_execute.call_count == 2
+        assert mock_execute.call_args[0][0].startswith("SELECT raw_content FROM")
+
+
+def test_include_raw_content_and_projection():
+    repo = RawDataRepository()
+    with patch("src.db.repository.execute_query") as mock_execute:
+        mock_execute.return_value = []
+        repo.get_unparsed(eins=[EIN], include_raw_content=True)
+        assert "raw_content, parsed_json" in mock_execute.call_args[0][0]
+
+        mock_execute.return_value = None
+        repo.get_by_source(EIN, "website", columns=("success", "retry_count"))
+        assert mock_execute.call_args[0][0].startswith("SELECT charity_ein, source, success, retry_count FROM")
+
+
+def test_projection_rejects_unknown_columns():
+    with pytest.raises(ValueError):
+        RawDataRepository().get_for_charity(EIN, columns=("success; DROP TABLE charities",))
+
+
+def test_get_for_charities_chunks_in_lists():
+    from src.db import repository
+
+    eins = [f"00-{i:07d}" for i in range(repository.BULK_READ_CHUNK_SIZE + 1)]
+    with patch("src.db.repository.execute_query") as mock_execute:
+        mock_execute.side_effect = [[{**_metadata_row(), "charity_ein": eins[0]}], []]
+        grouped = RawDataRepository().get_for_charities(eins)
+        assert mock_execute.call_count == 2
+        assert len(mock_execute.call_args_list[0][0][1]) == repository.BULK_READ_CHUNK_SIZE
+        assert "raw_content" not in mock_execute.call_args_list[0][0][0]
+        assert list(grouped) == [eins[0]]
@@ -0,0 +1,94 @@
+"""Bulk run planner for --dry-run / --cache-status and the worker loop."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+import streaming_runner
+from streaming_runner import build_run_plan, should_run_phase_with_artifact_validation
+
+EIN = "12-3456789"
+
+
+@pytest.fixture(autouse=True)
+def fixed_fingerprints(monkeypatch):
+    monkeypatch.setattr(streaming_runner, "get_phase_fingerprint", lambda phase: f"fp-{phase}")
+
+
+def _repos(cache_phases=(), raw_rows=None):
+    cache_repo = Mock()
+    cache_repo.get_many.return_value = {
+        (EIN, phase): {"charity_ein": EIN, "phase": phase, "code_fingerprint": f"fp-{phase}", "ran_at": datetime.now()}
+        for phase in cache_phases
+    }
+    raw_repo = Mock()
+    raw_repo.get_for_charities.return_value = {EIN: raw_rows or []}
+    data_repo = Mock()
+    data_repo.get_many.return_value = {}
+    eval_repo = Mock()
+    eval_repo.get_many.return_value = {}
+    return cache_repo, raw_repo, data_repo, eval_repo
+
+
+PROPUBLICA_ROW = {
+    "charity_ein": EIN,
+    "source": "propublica",
+    "success": True,
+    "parsed_json": {"propublica_990": {"ein": EIN, "name": "Test Org"}},
+}
+
+
+def test_no_cache_entries_runs_everything_with_one_query_per_table():
+    repos = _repos()
+    plan = build_run_plan([EIN], *repos)
+    assert plan.phases_to_run(EIN) == streaming_runner.PLANNED_PHASES
+    assert plan.get(EIN, "crawl").detail == "No cache entry"
+    for repo, method in zip(repos, ("get_many", "get_for_charities", "get_many", "get_many")):
+        assert getattr(repo, method).call_count == 1
+
+
+def test_valid_cache_with_missing_artifact_cascades_downstream():
+    repos = _repos(cache_phases=("crawl", "extract", "discover", "synthesize"), raw_rows=[PROPUBLICA_ROW])
+    plan = build_run_plan([EIN], *repos)
+
+    assert plan.get(EIN, "crawl").status == "SKIP"
+    assert plan.get(EIN, "extract").status == "SKIP"
+    discover = plan.get(EIN, "discover")
+    assert discover.status == "RUN"
+    assert discover.detail.startswith("Cached artifact missing")
+    assert plan.get(EIN, "synthesize").detail == "Upstream discover ran"
+
+
+def test_force_phase_is_reported():
+    repos = _repos(cache_phases=("crawl",), raw_rows=[PROPUBLICA_ROW])
+    plan = build_run_plan([EIN], *repos, force_phases=["crawl"])
+    assert plan.get(EIN, "crawl").status == "FORCE"
+    assert plan.get(EIN, "extract").detail == "Upstream crawl ran"
+
+
+def test_worker_check_uses_plan_without_queries():
+    repos = _repos(cache_phases=("crawl", "extract", "discover"), raw_rows=[PROPUBLICA_ROW])
+    plan = build_run_plan([EIN], *repos)
+    cache_repo, raw_repo, data_repo, eval_repo = Mock(), Mock(), Mock(), Mock()
+
+    run, reason = should_run_phase_with_artifact_validation(
+        EIN, "crawl", cache_repo, raw_repo, data_repo, eval_repo, upstream_ran=set(), plan=plan
+    )
+    assert run is False and reason == "Cache valid"
+
+    run, reason = should_run_phase_with_artifact_validation(
+        EIN, "discover", cache_repo, raw_repo, data_repo, eval_repo, upstream_ran=set(), plan=plan
+    )
+    assert run is True and reason.startswith("Cached artifact missing")
+    cache_repo.delete.assert_called_once_with(EIN, "discover")
+
+    # In-session cascade still wins over a planned skip
+    run, reason = should_run_phase_with_artifact_validation(
+        EIN, "extract", cache_repo, raw_repo, data_repo, eval_repo, upstream_ran={"crawl"}, plan=plan
+    )
+    assert run is True and reason == "Upstream crawl ran"
+
+    cache_repo.get.assert_not_called()
+    cache_repo.is_valid.assert_not_called()
+    raw_repo.get_for_charity.assert_not_called()
@@ -0,0 +1,225 @@
+"""Stage-decoupled pipeline: stage order, drops, shared pool caps, backpressure, and the --staged runner steps."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from src.utils.stage_pipeline import Stage, StagePipeline
+
+
+class Item:
+    def __init__(self, n):
+        self.n = n
+        self.visited = []
+
+
+def _visit(name, keep=lambda item: True, delay=0.0):
+    def run(item):
+        item.visited.append(name)
+        time.sleep(delay)
+        return keep(item)
+
+    return run
+
+
+def test_items_visit_stages_in_order_until_dropped():
+    pipeline = StagePipeline(
+        [
+            Stage("crawl", _visit("crawl"), pool="network"),
+            Stage("extract", _visit("extract", keep=lambda item: item.n % 2 == 0), pool="cpu"),
+            Stage("export", _visit("export"), pool="export"),
+        ],
+        pool_sizes={"network": 3, "cpu": 2, "export": 1},
+        queue_size=2,
+    )
+    items = [Item(n) for n in range(6)]
+
+    finished = list(pipeline.run(items))
+
+    assert sorted(item.n for item in finished) == list(range(6))
+    for item in items:
+        expected = ["crawl", "extract", "export"] if item.n % 2 == 0 else ["crawl", "extract"]
+        assert item.visited == expected
+    stats = pipeline.get_stats()
+    assert stats["extract"]["processed"] == 6 and stats["extract"]["dropped"] == 3
+    assert stats["export"]["processed"] == 3 and stats["export"]["workers"] == 1
+
+
+def test_stages_sharing_a_pool_share_its_cap():
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def cpu_work(item):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return True
+
+    pipeline = StagePipeline(
+        [Stage("extract", cpu_work, pool="cpu"), Stage("synthesize", cpu_work, pool="cpu")],
+        pool_sizes={"cpu": 2},
+    )
+    assert len(list(pipeline.run([Item(n) for n in range(8)]))) == 8
+    assert peak == 2
+
+
+def test_full_queue_blocks_upstream_stage():
+    release = threading.Event()
+
+    def slow_llm(item):
+        release.wait(2)
+        return True
+
+    pipeline = StagePipeline(
+        [Stage("crawl", _visit("crawl"), pool="network"), Stage("evaluate", slow_llm, pool="llm")],
+        pool_sizes={"network": 4, "llm": 1},
+        queue_size=2,
+    )
+    items = [Item(n) for n in range(8)]
+    results = pipeline.run(items)
+    threading.Timer(0.2, release.set).start()
+    finished = list(results)
+
+    assert len(finished) == 8
+    stats = pipeline.get_stats()
+    # One charity in evaluation and two queued: the crawlers had to wait for room.
+    assert stats["evaluate"]["max_queued"] <= 2
+    assert stats["crawl"]["blocked_seconds"] > 0.1
+
+
+def test_stage_exception_drops_the_item():
+    def boom(item):
+        raise RuntimeError("bad row")
+
+    pipeline = StagePipeline(
+        [Stage("extract", boom, pool="cpu"), Stage("export", _visit("export"), pool="export")],
+        pool_sizes={"cpu": 1, "export": 1},
+    )
+    items = [Item(0), Item(1)]
+    errors = []
+    assert len(list(pipeline.run(items, on_error=lambda stage, item, e: errors.append((stage, item.n, str(e)))))) == 2
+    assert all(item.visited == [] for item in items)
+    assert pipeline.get_stats()["extract"]["errors"] == 2
+    assert sorted(errors) == [("extract", 0, "bad row"), ("extract", 1, "bad row")]
+
+
+def test_stage_exception_is_logged_with_traceback_by_default(caplog):
+    def boom(item):
+        raise RuntimeError("bad row")
+
+    pipeline = StagePipeline([Stage("extract", boom, pool="cpu")], pool_sizes={"cpu": 1})
+    with caplog.at_level("ERROR", logger="src.utils.stage_pipeline"):
+        assert len(list(pipeline.run([Item(0)]))) == 1
+
+    assert "Stage extract failed" in caplog.text
+    assert caplog.records[0].exc_info and "bad row" in caplog.text
+
+
+def test_missing_pool_size_is_rejected():
+    with pytest.raises(ValueError, match="llm"):
+        StagePipeline([Stage("evaluate", _visit("evaluate"), pool="llm")], pool_sizes={"cpu": 1})
+
+
+# ---------------------------------------------------------------------------
+# streaming_runner --staged
+# ---------------------------------------------------------------------------
+
+_LOGGER = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None, error=lambda *a, **k: None)
+
+
+def _charity_run():
+    import streaming_runner
+    from src.llm.budget_tracker import set_budget
+
+    set_budget(None)
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=_LOGGER)
+    charity = {"ein": "12-3456789", "name": "Helping Hands", "website": None}
+    return streaming_runner.CharityRun(charity, 1, 1, options)
+
+
+def test_pipeline_stages_run_the_same_steps_as_end_to_end_mode():
+    import streaming_runner
+
+    staged = [step for _, _, steps in streaming_runner.PIPELINE_STAGES for step in steps]
+    assert tuple(staged) == streaming_runner.PHASE_STEPS
+
+    pipeline = streaming_runner.build_stage_pipeline("gemini-3-flash-preview", crawl_workers=40, llm_workers=6)
+    assert pipeline.pool_sizes["network"] == 40
+    assert pipeline.pool_sizes["llm:gemini-3-flash-preview"] == 6
+
+
+def test_llm_stages_run_on_the_pool_of_the_model_they_call(monkeypatch):
+    import streaming_runner
+
+    monkeypatch.setattr(
+        streaming_runner,
+        "_llm_stage_models",
+        lambda llm_model: {"discover": "search-model", "baseline": llm_model, "rich": "memo-model", "judge": llm_model},
+    )
+    pipeline = streaming_runner.build_stage_pipeline("main-model", crawl_workers=40, llm_workers=6)
+
+    pools = {stage.name: stage.pool for stage in pipeline.stages}
+    assert pools["discover"] == "llm:search-model"
+    assert pools["baseline"] == pools["judge"] == "llm:main-model"
+    assert pools["rich"] == "llm:memo-model"
+    assert pipeline.pool_sizes == {
+        "network": 40,
+        "cpu": streaming_runner.STAGED_CPU_WORKERS,
+        "export": streaming_runner.STAGED_EXPORT_WORKERS,
+        "llm:search-model": 6,
+        "llm:main-model": 6,
+        "llm:memo-model": 6,
+    }
+
+
+def test_charity_run_hands_off_between_steps_and_stops_on_failure():
+    run = _charity_run()
+    calls = []
+
+    def ok(r):
+        calls.append("ok")
+        return True
+
+    def stop(r):
+        calls.append("stop")
+        return False
+
+    assert run.step([ok]) is True and not run.done
+    assert run.step([stop, ok]) is False and run.done
+    assert calls == ["ok", "stop"]
+
+
+def test_charity_run_turns_a_stage_exception_into_a_failed_result():
+    run = _charity_run()
+
+    def boom(r):
+        raise RuntimeError("no database")
+
+    assert run.step([boom]) is False
+    assert run.done and run.result["success"] is False
+    assert run.result["error"] == "no database"
+
+
+def test_run_staged_records_and_counts_a_stage_that_raises(monkeypatch):
+    import streaming_runner
+
+    def boom(run):
+        raise RuntimeError("stage crashed")
+
+    errors = []
+    logger = SimpleNamespace(error=lambda message, exception=None: errors.append((message, str(exception))))
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=logger)
+    monkeypatch.setitem(streaming_runner.progress, "failed", 0)
+    pipeline = StagePipeline([Stage("crawl", boom, pool="network")], pool_sizes={"network": 1})
+    charity = {"ein": "12-3456789", "name": "Helping Hands", "website": None}
+
+    (result,) = streaming_runner.run_staged([charity], options, pipeline)
+
+    assert result["success"] is False and result["error"] == "stage crashed"
+    assert streaming_runner.progress["failed"] == 1
+    assert errors == [("Stage crawl failed for 12-3456789", "stage crashed")]
@@ -0,0 +1,175 @@
+"""Run tracing: span nesting, thread propagation, latency percentiles and critical paths."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from src.utils.tracing import (
+    TracedLock,
+    bind,
+    configure_tracing,
+    critical_path,
+    load_trace,
+    percentile,
+    record_span,
+    summarize_trace,
+    trace_span,
+)
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    configure_tracing(path)
+    yield path
+    configure_tracing(None)
+
+
+def _by_name(path):
+    return {span["name"]: span for span in load_trace(path)}
+
+
+def test_spans_nest_and_inherit_trace_id(trace_file):
+    with trace_span("charity", "Helping Hands", trace="12-3456789"):
+        with trace_span("phase", "crawl") as phase:
+            phase.set(sources=6)
+            record_span("rate_limit", "bbb", time.time() - 0.01)
+        with pytest.raises(RuntimeError):
+            with trace_span("phase", "baseline"):
+                raise RuntimeError("boom")
+    configure_tracing(None)
+
+    spans = _by_name(trace_file)
+    root = spans["Helping Hands"]
+    assert root["parent"] is None and root["trace"] == "12-3456789"
+    assert spans["crawl"]["parent"] == root["id"]
+    assert spans["crawl"]["attrs"] == {"sources": 6}
+    assert spans["bbb"]["parent"] == spans["crawl"]["id"] and spans["bbb"]["ms"] >= 10
+    assert spans["baseline"]["status"] == "error" and spans["baseline"]["attrs"]["error"] == "RuntimeError"
+    assert {span["trace"] for span in spans.values()} == {"12-3456789"}
+
+
+def test_tracing_off_is_a_no_op(tmp_path):
+    configure_tracing(None)
+    span = trace_span("phase", "crawl")
+    with span:
+        span.set(x=1)
+    record_span("lock", "x", time.time())
+    assert trace_span("db", "SELECT") is span
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_bind_carries_parent_into_worker_threads(trace_file):
+    with trace_span("phase", "crawl"):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pool.submit(bind(lambda: trace_span("source", "bound").end())).result()
+            pool.submit(lambda: trace_span("source", "unbound").end()).result()
+    configure_tracing(None)
+
+    spans = _by_name(trace_file)
+    assert spans["bound"]["parent"] == spans["crawl"]["id"]
+    assert spans["unbound"]["parent"] is None
+
+
+def test_traced_lock_records_only_contended_acquires(trace_file):
+    lock = TracedLock("crawler_cache")
+    with lock:
+        pass
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with lock:
+            held.set()
+            release.wait()
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait()
+    threading.Timer(0.02, release.set).start()
+    with lock:
+        pass
+    thread.join()
+    configure_tracing(None)
+
+    spans = load_trace(trace_file)
+    assert [(s["kind"], s["name"]) for s in spans] == [("lock", "crawler_cache")]
+    assert spans[0]["ms"] >= 10
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def _span(id, parent, kind, name, start, ms, trace="12-3456789", **attrs):
+    return {
+        "trace": trace,
+        "id": id,
+        "parent": parent,
+        "kind": kind,
+        "name": name,
+        "start": start,
+        "ms": ms,
+        "status": "ok",
+        "attrs": attrs,
+    }
+
+
+def test_critical_path_skips_parallel_children():
+    # crawl runs bbb (0-2s) and website (0-5s) in parallel, then extract (5-6s)
+    spans = [
+        _span(1, None, "charity", "Helping Hands", 0.0, 6500),
+        _span(2, 1, "phase", "crawl", 0.0, 5000),
+        _span(3, 2, "source", "bbb", 0.0, 2000),
+        _span(4, 2, "source", "website", 0.0, 4800),
+        _span(5, 1, "phase", "extract", 5.0, 1000),
+        _span(6, 1, "phase", "judge", 6.0, 10, skipped=True),
+    ]
+    children = {}
+    for span in spans[1:]:
+        children.setdefault(span["parent"], []).append(span)
+
+    path = critical_path(spans[0], children)
+
+    assert [(step["name"], step["ms"]) for step in path] == [
+        ("Helping Hands", 490),
+        ("crawl", 200),
+        ("website", 4800),
+        ("extract", 1000),
+        ("judge", 10),
+    ]
+
+    summary = summarize_trace(spans)
+    assert summary["latency"]["source"]["website"]["p50"] == 4800
+    assert "judge" not in summary["latency"]["phase"]
+    assert summary["skipped"] == {"phase:judge": 1}
+    top = summary["charities"]["12-3456789"]["critical_path"][0]
+    assert (top["kind"], top["name"]) == ("source", "website")
+    assert next(iter(summary["critical_path_share"])) == "source:website"
+
+
+def test_process_charity_full_records_charity_span(trace_file, monkeypatch):
+    import streaming_runner
+    from src.llm.budget_tracker import set_budget
+
+    def no_resources(*args, **kwargs):
+        raise RuntimeError("no database")
+
+    monkeypatch.setattr(streaming_runner, "_get_worker_resources", no_resources)
+    set_budget(None)
+    charity = {"ein": "12-3456789", "name": "Helping Hands", "website": None}
+    logger = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None, error=lambda *a, **k: None)
+
+    result = streaming_runner.process_charity_full(charity, 1, 1, "test-model", logger)
+    configure_tracing(None)
+
+    assert result["success"] is False
+    spans = load_trace(trace_file)
+    assert [(s["kind"], s["trace"], s["status"]) for s in spans] == [("charity", "12-3456789", "error")]
@@ -0,0 +1,384 @@
+"""Leased work queue: claim order, expiry and reclaim, fenced phase-cache writes, finalize, and --queue draining."""
+
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from src.db.work_queue import (
+    DoltWorkQueue,
+    LeasedPhaseCache,
+    LeaseKeeper,
+    LeaseLostError,
+    LocalWorkQueue,
+    backoff_delay,
+)
+
+RUN = "run-test"
+CHARITIES = [{"ein": f"12-345678{n}", "name": f"Charity {n}", "website": None} for n in range(3)]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingCacheRepo:
+    def __init__(self):
+        self.upserts = []
+        self.deletes = []
+
+    def upsert(self, ein, phase, code_fingerprint, cost_usd=0.0):
+        self.upserts.append((ein, phase))
+
+    def delete(self, ein, phase):
+        self.deletes.append((ein, phase))
+
+    def delete_downstream(self, ein, phase):
+        self.deletes.append((ein, f"after {phase}"))
+        return []
+
+    def get(self, ein, phase):
+        return {"charity_ein": ein, "phase": phase}
+
+
+def _queue(**kwargs):
+    clock = FakeClock()
+    repo = RecordingCacheRepo()
+    queue = LocalWorkQueue(cache_repo=repo, clock=clock, **kwargs)
+    queue.enqueue(RUN, CHARITIES)
+    return queue, clock, repo
+
+
+def test_enqueue_is_idempotent_and_claims_follow_list_order():
+    queue, _, _ = _queue()
+    assert queue.enqueue(RUN, CHARITIES + [{"ein": "98-7654321", "name": "Late", "website": None}]) == 1
+
+    leases = [queue.claim(RUN, "host-a:1", lease_seconds=60) for _ in range(5)]
+    assert [lease.ein for lease in leases[:4]] == [c["ein"] for c in CHARITIES] + ["98-7654321"]
+    assert leases[4] is None
+    assert len({lease.token for lease in leases[:4]}) == 4
+    assert queue.get_stats(RUN) == {"pending": 0, "leased": 4, "done": 0, "failed": 0, "succeeded": 0, "total": 4}
+
+
+def test_concurrent_claims_never_share_a_charity():
+    queue = LocalWorkQueue()
+    queue.enqueue(RUN, [{"ein": f"10-00000{n:02d}", "name": str(n), "website": None} for n in range(40)])
+    claimed = []
+    lock = threading.Lock()
+
+    def claim_all(worker):
+        while (lease := queue.claim(RUN, worker)) is not None:
+            with lock:
+                claimed.append(lease.ein)
+
+    threads = [threading.Thread(target=claim_all, args=(f"w{n}",)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == sorted(set(claimed)) and len(claimed) == 40
+
+
+def test_expired_lease_is_reclaimed_and_the_old_holder_is_fenced():
+    queue, clock, repo = _queue()
+    stale = queue.claim(RUN, "host-a:1", lease_seconds=60)
+    assert queue.record_phase(stale, "crawl", "fp1") is True
+
+    clock.now += 61
+    fresh = queue.claim(RUN, "host-b:1", lease_seconds=60)
+    assert fresh.ein == stale.ein and fresh.attempts == 2
+
+    # The slow runner finishes its phase after the reclaim: nothing is written.
+    assert queue.record_phase(stale, "extract", "fp1") is False
+    assert queue.heartbeat(stale, 60) is False
+    assert queue.complete(stale, success=True) is False
+    assert queue.record_phase(fresh, "crawl", "fp1") is True
+    assert repo.upserts == [(stale.ein, "crawl"), (stale.ein, "crawl")]
+    assert queue.get_entry(RUN, fresh.ein)["phase_writes"] == 1
+
+
+def test_heartbeat_keeps_a_lease_from_expiring():
+    queue, clock, _ = _queue()
+    lease = queue.claim(RUN, "host-a:1", lease_seconds=60)
+    for _ in range(3):
+        clock.now += 40
+        assert queue.heartbeat(lease, 60) is True
+    others = [queue.claim(RUN, "host-b:1", lease_seconds=60) for _ in range(3)]
+    assert lease.ein not in [other.ein for other in others if other]
+
+
+def test_charity_fails_after_max_expired_leases():
+    queue, clock, _ = _queue(max_attempts=2)
+    queue.enqueue("solo", CHARITIES[:1])
+    for _ in range(2):
+        assert queue.claim("solo", "crashy:1", lease_seconds=10) is not None
+        clock.now += 11
+    assert queue.claim("solo", "host-b:1", lease_seconds=10) is None
+
+    entry = queue.get_entry("solo", CHARITIES[0]["ein"])
+    assert entry["state"] == "failed" and "lease expired 2 times" in entry["error"]
+    assert queue.finalize("solo", "host-b:1") is True
+
+
+def test_release_returns_the_charity_without_using_an_attempt():
+    queue, _, _ = _queue()
+    lease = queue.claim(RUN, "host-a:1")
+    assert queue.release(lease) is True
+    again = queue.claim(RUN, "host-b:1")
+    assert again.ein == lease.ein and again.attempts == 1
+
+
+def test_finalize_is_won_once_and_only_after_the_run_drains():
+    queue, _, _ = _queue()
+    leases = [queue.claim(RUN, "host-a:1") for _ in CHARITIES]
+    for lease in leases[:-1]:
+        assert queue.complete(lease, success=True)
+    assert queue.finalize(RUN, "host-a:1") is False
+
+    queue.complete(leases[-1], success=False, error="judge failed")
+    assert [queue.finalize(RUN, worker) for worker in ("host-b:1", "host-a:1", "host-b:1")] == [True, False, True]
+    assert queue.get_stats(RUN)["succeeded"] == 2
+
+
+def test_leased_phase_cache_raises_once_the_lease_is_gone():
+    queue, clock, repo = _queue()
+    lease = queue.claim(RUN, "host-a:1", lease_seconds=60)
+    cache = LeasedPhaseCache(repo, queue, lease)
+    cache.upsert(lease.ein, "crawl", "fp1")
+    cache.delete_downstream(lease.ein, "crawl")
+    assert cache.get(lease.ein, "crawl")["phase"] == "crawl"
+
+    clock.now += 61
+    queue.claim(RUN, "host-b:1", lease_seconds=60)
+    with pytest.raises(LeaseLostError):
+        cache.upsert(lease.ein, "extract", "fp1")
+    assert lease.lost
+    with pytest.raises(LeaseLostError):
+        cache.delete(lease.ein, "extract")
+    assert repo.upserts == [(lease.ein, "crawl")]
+
+
+def test_lease_keeper_extends_held_leases_and_flags_lost_ones():
+    queue, clock, _ = _queue()
+    held = queue.claim(RUN, "host-a:1", lease_seconds=60)
+    stolen = queue.claim(RUN, "host-a:1", lease_seconds=60)
+    keeper = LeaseKeeper(queue, lease_seconds=60)
+    keeper.track(held)
+    keeper.track(stolen)
+
+    clock.now += 61
+    queue.heartbeat(held, 60)  # held renewed just in time; stolen expires and is reclaimed
+    queue.claim(RUN, "host-b:1", lease_seconds=60)
+    keeper.beat()
+
+    assert not held.lost and stolen.lost
+    assert queue.get_entry(RUN, held.ein)["heartbeats"] == 2
+
+
+# ---------------------------------------------------------------------------
+# DoltWorkQueue / dolt_client
+# ---------------------------------------------------------------------------
+
+
+class FakeCursor:
+    def __init__(self, calls, rowcount):
+        self.calls = calls
+        self.rowcount = 0
+        self._rowcount = rowcount
+
+    def execute(self, sql, params=None):
+        self.calls.append(" ".join(sql.split()))
+        self.rowcount = self._rowcount if sql.strip().startswith("UPDATE work_queue") else 1
+
+
+def test_dolt_record_phase_writes_phase_cache_only_inside_a_held_lease(monkeypatch):
+    from src.db.work_queue import Lease
+
+    lease = Lease(RUN, "12-3456780", "token-1", "host-a:1", CHARITIES[0], 0, 1)
+    for rowcount, expected in ((1, True), (0, False)):
+        calls = []
+
+        @contextmanager
+        def fake_get_cursor():
+            yield FakeCursor(calls, rowcount)
+
+        monkeypatch.setattr("src.db.work_queue.get_cursor", fake_get_cursor)
+        assert DoltWorkQueue().record_phase(lease, "crawl", "fp1") is expected
+
+        assert calls[0] == "START TRANSACTION"
+        assert calls[1].startswith("UPDATE work_queue SET last_phase")
+        if expected:
+            assert calls[2].startswith("INSERT INTO phase_cache") and calls[3] == "COMMIT"
+        else:
+            assert calls[2:] == ["ROLLBACK"]
+
+
+def test_queue_tables_never_make_the_dolt_working_set_dirty(monkeypatch):
+    from src.db.dolt_client import DoltVersionControl
+
+    def fake_execute_query(sql, params=None, fetch="all"):
+        if "COUNT(*)" in sql:
+            return {"n": 2}
+        if "DISTINCT table_name" in sql:
+            return [{"table_name": "work_queue"}, {"table_name": "work_queue_runs"}]
+        return {"commit_hash": "cleanhead1"}
+
+    monkeypatch.setattr("src.db.dolt_client.execute_query", fake_execute_query)
+    assert DoltVersionControl(author="test", email="test@test").head_commit_if_clean() == "cleanhead1"
+
+
+# ---------------------------------------------------------------------------
+# streaming_runner --queue
+# ---------------------------------------------------------------------------
+
+_LOGGER = SimpleNamespace(info=lambda *a, **k: None, warning=lambda *a, **k: None, error=lambda *a, **k: None)
+
+
+def test_two_runners_drain_one_queue_exactly_once(monkeypatch):
+    import streaming_runner
+
+    queue = LocalWorkQueue()
+    charities = [{"ein": f"20-00000{n:02d}", "name": f"Charity {n}", "website": None} for n in range(12)]
+    queue.enqueue(RUN, charities)
+    processed = []
+    lock = threading.Lock()
+
+    def fake_process(run):
+        assert run.lease is not None and isinstance(run.cache_repo(), LeasedPhaseCache)
+        with lock:
+            processed.append((run.ein, threading.current_thread().name))
+        return {"ein": run.ein, "name": run.name, "success": True}
+
+    monkeypatch.setattr(streaming_runner, "_process_charity", fake_process)
+    monkeypatch.setattr(streaming_runner, "_get_worker_resources", lambda logger, model: {"cache_repo": None})
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=_LOGGER, work_queue=queue)
+
+    results = {}
+
+    def runner(worker_id):
+        results[worker_id] = list(streaming_runner.run_leased(queue, RUN, options, 3, worker_id, poll_seconds=0.01))
+
+    threads = [threading.Thread(target=runner, args=(f"host-{n}:1",)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(ein for ein, _ in processed) == sorted(c["ein"] for c in charities)
+    assert sum(len(r) for r in results.values()) == 12
+    assert queue.get_stats(RUN)["succeeded"] == 12
+    assert [queue.finalize(RUN, worker) for worker in results] == [True, False]
+
+
+def test_budget_exhausted_charity_goes_back_to_the_queue(monkeypatch):
+    import streaming_runner
+
+    queue = LocalWorkQueue()
+    queue.enqueue(RUN, CHARITIES)
+
+    def out_of_budget(run):
+        return {"ein": run.ein, "name": run.name, "success": False, "budget_exhausted": True}
+
+    monkeypatch.setattr(streaming_runner, "_process_charity", out_of_budget)
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=_LOGGER, work_queue=queue)
+
+    results = list(streaming_runner.run_leased(queue, RUN, options, 1, "host-a:1", poll_seconds=0.01))
+    assert len(results) == 1
+    assert queue.get_stats(RUN)["pending"] == 3
+
+
+def test_charity_run_stops_without_failing_once_its_lease_is_lost():
+    import streaming_runner
+    from src.llm.budget_tracker import set_budget
+
+    set_budget(None)
+    queue, _, _ = _queue()
+    lease = queue.claim(RUN, "host-a:1")
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=_LOGGER, work_queue=queue)
+    run = streaming_runner.CharityRun(lease.charity, 1, 1, options, lease=lease)
+    failed_before = streaming_runner.progress["failed"]
+    calls = []
+
+    def step(r):
+        calls.append(r.ein)
+        lease.lost = True
+        return True
+
+    assert run.step([step, step]) is False
+    assert calls == [lease.ein]
+    assert run.result["lease_lost"] and run.done
+    assert streaming_runner.progress["failed"] == failed_before
+
+
+class FlakyQueue(LocalWorkQueue):
+    """LocalWorkQueue whose claim/complete calls fail a set number of times first."""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = dict(failures)
+
+    def _maybe_fail(self, name):
+        if self.failures.get(name, 0) > 0:
+            self.failures[name] -= 1
+            raise ConnectionError(f"{name}: lost connection to Dolt")
+
+    def claim(self, *args, **kwargs):
+        self._maybe_fail("claim")
+        return super().claim(*args, **kwargs)
+
+    def complete(self, *args, **kwargs):
+        self._maybe_fail("complete")
+        return super().complete(*args, **kwargs)
+
+
+def _fast_retries(monkeypatch, streaming_runner):
+    monkeypatch.setattr(streaming_runner, "WORK_QUEUE_RETRY_SECONDS", 0.001)
+    monkeypatch.setattr(streaming_runner, "WORK_QUEUE_RETRY_MAX_SECONDS", 0.001)
+
+
+def test_queue_errors_are_retried_instead_of_killing_workers(monkeypatch):
+    import streaming_runner
+
+    _fast_retries(monkeypatch, streaming_runner)
+    queue = FlakyQueue({"claim": 3, "complete": 2})
+    queue.enqueue(RUN, CHARITIES)
+    monkeypatch.setattr(
+        streaming_runner, "_process_charity", lambda run: {"ein": run.ein, "name": run.name, "success": True}
+    )
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=_LOGGER, work_queue=queue)
+
+    results = list(streaming_runner.run_leased(queue, RUN, options, 2, "host-a:1", poll_seconds=0.01))
+
+    assert sorted(r["ein"] for r in results) == sorted(c["ein"] for c in CHARITIES)
+    assert not any(r.get("queue_error") or r.get("lease_lost") for r in results)
+    assert queue.get_stats(RUN)["succeeded"] == 3
+
+
+def test_unreachable_queue_ends_the_workers_without_raising(monkeypatch):
+    import streaming_runner
+
+    _fast_retries(monkeypatch, streaming_runner)
+    queue = FlakyQueue({"complete": 1000})
+    queue.enqueue(RUN, CHARITIES[:1])
+    monkeypatch.setattr(
+        streaming_runner, "_process_charity", lambda run: {"ein": run.ein, "name": run.name, "success": True}
+    )
+    options = streaming_runner.RunOptions(llm_model="test-model", logger=_LOGGER, work_queue=queue)
+
+    runner = streaming_runner.run_leased(queue, RUN, options, 1, "host-a:1", poll_seconds=0.01)
+    first = next(runner)
+    assert "lost connection" in first["queue_error"]
+    # The charity stays leased (it will expire and be reclaimed); the worker now fails to claim and stops.
+    queue.failures["claim"] = 1000
+    assert list(runner) == []
+
+
+def test_claim_backoff_is_jittered_and_capped():
+    delays = [backoff_delay(attempt, 0.05, 2.0) for attempt in range(10) for _ in range(20)]
+    assert all(0 <= d <= 2.0 for d in delays)
+    assert len({round(d, 6) for d in delays}) > 100
+    assert max(backoff_delay(1, 0.05, 2.0) for _ in range(50)) <= 0.1
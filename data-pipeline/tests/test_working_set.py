@@ -0,0 +1,138 @@
+"""CharityWorkingSet: one read per table, invalidation on writes and phases, copies and the memory cap."""
+
+from src.db.repository import RawDataRow
+from src.db.working_set import CharityWorkingSet
+
+EIN = "12-3456789"
+
+
+class CountingRepo:
+    """Fake repository that counts reads per method."""
+
+    def __init__(self, row=None, rows=None):
+        self.row = row
+        self.rows = rows or []
+        self.reads = 0
+        self.writes = []
+
+    def get(self, ein):
+        self.reads += 1
+        return dict(self.row) if self.row is not None and ein == EIN else None
+
+    def get_for_charity(self, ein, include_raw_content=False, columns=None):
+        self.reads += 1
+        return [RawDataRow(dict(r), lambda: "<html>") for r in self.rows] if ein == EIN else []
+
+    def get_by_source(self, ein, source, include_raw_content=False, columns=None):
+        self.reads += 1
+        return next((dict(r) for r in self.rows if r["source"] == source), None)
+
+    def upsert(self, record):
+        self.writes.append(record)
+        self.row = {**(self.row or {}), **record}
+
+    def update_judge_result(self, ein, judge_score, *args, **kwargs):
+        self.writes.append(judge_score)
+        self.row = {**(self.row or {}), "judge_score": judge_score}
+
+    def exists(self, ein):
+        return ein == EIN
+
+
+def _working_set(max_bytes=1_000_000):
+    repos = {
+        "charity": CountingRepo(row={"ein": EIN, "name": "Helping Hands"}),
+        "raw": CountingRepo(
+            rows=[
+                {"charity_ein": EIN, "source": "propublica", "success": True, "parsed_json": {"revenue": 100}},
+                {"charity_ein": EIN, "source": "bbb", "success": False, "parsed_json": None},
+            ]
+        ),
+        "data": CountingRepo(row={"charity_ein": EIN, "metrics_json": {"revenue": 100}}),
+        "evaluation": CountingRepo(row={"charity_ein": EIN, "amal_score": 72}),
+    }
+    ws = CharityWorkingSet(EIN, repos["charity"], repos["raw"], repos["data"], repos["evaluation"], max_bytes)
+    return ws, repos
+
+
+def test_each_table_is_read_once_across_phases():
+    ws, repos = _working_set()
+
+    for _ in range(5):
+        assert ws.charity_repo.get(EIN)["name"] == "Helping Hands"
+        assert len(ws.raw_repo.get_for_charity(EIN)) == 2
+        assert ws.raw_repo.get_for_charity(EIN, columns=("success", "parsed_json"))[0]["source"] == "propublica"
+        assert ws.raw_repo.get_by_source(EIN, "propublica")["parsed_json"] == {"revenue": 100}
+        assert ws.raw_repo.get_successful_sources(EIN) == ["propublica"]
+        assert ws.data_repo.get(EIN)["metrics_json"] == {"revenue": 100}
+        assert ws.eval_repo.get(EIN)["amal_score"] == 72
+
+    assert {name: repo.reads for name, repo in repos.items()} == {"charity": 1, "raw": 1, "data": 1, "evaluation": 1}
+    stats = ws.get_stats()
+    assert stats["loads"] == 4 and stats["hits"] == 31 and stats["cached_bytes"] > 0
+
+
+def test_reads_hand_out_copies():
+    ws, _ = _working_set()
+    ws.data_repo.get(EIN)["metrics_json"]["revenue"] = 0
+    ws.raw_repo.get_for_charity(EIN)[0]["parsed_json"]["revenue"] = 0
+
+    assert ws.data_repo.get(EIN)["metrics_json"] == {"revenue": 100}
+    row = ws.raw_repo.get_for_charity(EIN)[0]
+    assert row["parsed_json"] == {"revenue": 100}
+    # raw_content stays lazy on the copies
+    assert isinstance(row, RawDataRow) and row["raw_content"] == "<html>"
+
+
+def test_writes_through_views_reload_only_their_table():
+    ws, repos = _working_set()
+    ws.eval_repo.get(EIN)
+    ws.data_repo.get(EIN)
+
+    ws.eval_repo.update_judge_result(EIN, 88)
+    assert ws.eval_repo.get(EIN)["judge_score"] == 88
+    ws.data_repo.get(EIN)
+
+    assert repos["evaluation"].reads == 2
+    assert repos["data"].reads == 1
+    # Non-write attributes pass straight through
+    assert ws.charity_repo.exists(EIN) is True
+
+
+def test_after_phase_invalidates_tables_written_behind_the_views():
+    ws, repos = _working_set()
+    ws.raw_repo.get_for_charity(EIN)
+    ws.charity_repo.get(EIN)
+    ws.eval_repo.get(EIN)
+
+    repos["raw"].rows.append({"charity_ein": EIN, "source": "website", "success": True, "parsed_json": {}})
+    ws.after_phase("extract")
+
+    assert [r["source"] for r in ws.raw_repo.get_for_charity(EIN)] == ["propublica", "bbb", "website"]
+    ws.charity_repo.get(EIN)
+    ws.eval_repo.get(EIN)
+    assert (repos["raw"].reads, repos["charity"].reads, repos["evaluation"].reads) == (2, 1, 1)
+
+
+def test_other_eins_and_raw_content_reads_go_to_the_database():
+    ws, repos = _working_set()
+    ws.raw_repo.get_for_charity(EIN, include_raw_content=True)
+    ws.raw_repo.get_for_charity("98-7654321")
+    ws.eval_repo.get("98-7654321")
+    ws.eval_repo.get("98-7654321")
+
+    assert repos["raw"].reads == 2 and repos["evaluation"].reads == 2
+    assert ws.get_stats()["loads"] == 0
+
+
+def test_tables_over_the_memory_cap_are_read_through():
+    ws, repos = _working_set(max_bytes=150)
+    ws.charity_repo.get(EIN)
+    ws.raw_repo.get_for_charity(EIN)
+    ws.raw_repo.get_for_charity(EIN)
+    ws.charity_repo.get(EIN)
+
+    assert repos["charity"].reads == 1
+    assert repos["raw"].reads == 2
+    stats = ws.get_stats()
+    assert stats["read_through"] == 2 and stats["cached_bytes"] <= 150